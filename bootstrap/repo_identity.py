@@ -1,14 +1,14 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Tuple, cast
+from typing import Any, Mapping, Optional, Tuple, cast
 import hashlib
-import os
 import re
 import subprocess
 
 from governance_runtime.application.use_cases.bootstrap_session import evaluate_bootstrap_identity
 from governance_runtime.engine.adapters import LocalHostAdapter
 from governance_runtime.infrastructure.path_contract import normalize_absolute_path, normalize_for_fingerprint
+from governance_runtime.infrastructure.stage_environment import stage_environ
 from governance_runtime.infrastructure.wiring import configure_gateway_registry
 
 
@@ -25,7 +25,7 @@ class _RepoIdentityAdapter(LocalHostAdapter):
         super().__init__()
         resolved = normalize_absolute_path(str(repo_root), purpose="repo_root")
         self._repo_root = resolved
-        env = dict(os.environ)
+        env = dict(stage_environ())
         env["OPENCODE_REPO_ROOT"] = str(resolved)
         self._env = env
 
@@ -97,14 +97,18 @@ def derive_repo_identity(start_path: Optional[Path] = None) -> Optional[RepoIden
     )
 
 
-def resolve_repo_root_ssot(explicit_root: Optional[Path] = None) -> Tuple[Optional[Path], str]:
+def resolve_repo_root_ssot(
+    explicit_root: Optional[Path] = None,
+    *,
+    env: Optional[Mapping[str, str]] = None,
+) -> Tuple[Optional[Path], str]:
     if explicit_root is not None:
         try:
             return normalize_absolute_path(str(explicit_root), purpose="explicit_repo_root"), "explicit"
         except Exception:
             return None, "invalid-explicit"
 
-    env_root = os.environ.get("OPENCODE_REPO_ROOT", "").strip()
+    env_root = (stage_environ() if env is None else env).get("OPENCODE_REPO_ROOT", "").strip()
     if env_root:
         try:
             return normalize_absolute_path(env_root, purpose="OPENCODE_REPO_ROOT"), "env"
@@ -17,6 +17,13 @@ from governance_runtime.application.use_cases.repo_policy_setup import (
     write_governance_mode_config,
     write_repo_operating_mode_policy,
 )
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    ISOLATION_ENV_KEY,
+    ISOLATION_INPROCESS,
+    ISOLATION_PROCESS,
+    ExecutionContext,
+    InProcessRunner,
+)
 
 try:
     from governance_runtime.infrastructure.path_contract import normalize_absolute_path
@@ -118,6 +125,11 @@ def main() -> int:
         help="Compliance framework for regulated mode (default: DEFAULT)",
     )
     parser.add_argument("--verbose", action="store_true", help="Show step-by-step bootstrap flow details")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each bootstrap stage in its own Python interpreter (process isolation)",
+    )
     args = parser.parse_args()
 
     if args.profile and args.command != "init":
@@ -132,22 +144,24 @@ def main() -> int:
         print(f"invalid --repo-root: {exc}", file=sys.stderr)
         return 2
 
-    env = os.environ.copy()
+    overrides: dict[str, str | None] = {}
     if args.config_root:
         try:
             config_root = _validate_config_root(args.config_root)
         except Exception as exc:
             print(f"invalid --config-root: {exc}", file=sys.stderr)
             return 2
-        env["OPENCODE_CONFIG_ROOT"] = str(config_root)
+        overrides["OPENCODE_CONFIG_ROOT"] = str(config_root)
 
-    env["OPENCODE_REPO_ROOT"] = str(repo_root)
-    existing_pythonpath = env.get("PYTHONPATH", "").strip()
+    overrides["OPENCODE_REPO_ROOT"] = str(repo_root)
+    isolated = args.isolated or os.environ.get(ISOLATION_ENV_KEY, "").strip().lower() == ISOLATION_PROCESS
+    overrides[ISOLATION_ENV_KEY] = ISOLATION_PROCESS if isolated else ISOLATION_INPROCESS
+    existing_pythonpath = os.environ.get("PYTHONPATH", "").strip()
     real_repo_root = str(REPO_ROOT)
     if existing_pythonpath:
-        env["PYTHONPATH"] = os.pathsep.join((real_repo_root, existing_pythonpath))
+        overrides["PYTHONPATH"] = os.pathsep.join((real_repo_root, existing_pythonpath))
     else:
-        env["PYTHONPATH"] = real_repo_root
+        overrides["PYTHONPATH"] = real_repo_root
     if selected_profile is not None:
         now_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
         try:
@@ -178,16 +192,21 @@ def main() -> int:
                 print(f"failed to set regulated mode: {exc}", file=sys.stderr)
                 return 2
     if args.verbose:
-        env["OPENCODE_BOOTSTRAP_VERBOSE"] = "1"
-        env["OPENCODE_BOOTSTRAP_OUTPUT"] = "full"
-
-    ret = subprocess.run(
-        [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_preflight_readonly"],
-        env=env,
-        cwd=str(repo_root),
-        text=True,
-        capture_output=True,
-    )
+        overrides["OPENCODE_BOOTSTRAP_VERBOSE"] = "1"
+        overrides["OPENCODE_BOOTSTRAP_OUTPUT"] = "full"
+
+    preflight_argv = [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_preflight_readonly"]
+    context = ExecutionContext(env_overrides=overrides, cwd=repo_root)
+    if isolated:
+        ret = subprocess.run(
+            preflight_argv,
+            env=context.environment(),
+            cwd=str(repo_root),
+            text=True,
+            capture_output=True,
+        )
+    else:
+        ret = InProcessRunner().run_with_context(preflight_argv, context)
 
     stdout_text = ret.stdout or ""
     stderr_text = ret.stderr or ""
@@ -142,6 +142,29 @@ def parse_rulebook_content(
     )
 
 
+_PARSED_BY_CONTENT: dict[tuple[str, str, str, str], RulebookContent] = {}
+
+
+def parse_rulebook_content_cached(
+    identifier: str,
+    source_kind: str,
+    path: str,
+    raw_text: str,
+) -> RulebookContent:
+    """``parse_rulebook_content`` memoized by identity and content hash.
+
+    Phase 5, Phase 6 and /implement rebuild the effective policy from the same
+    rulebook files; each distinct rulebook text is parsed once per process.
+    """
+    sha = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+    key = (identifier, source_kind, path, sha)
+    parsed = _PARSED_BY_CONTENT.get(key)
+    if parsed is None:
+        parsed = parse_rulebook_content(identifier, source_kind, path, raw_text)
+        _PARSED_BY_CONTENT[key] = parsed
+    return parsed
+
+
 def _normalize_lines(lines: list[str]) -> list[str]:
     result: list[str] = []
     for line in lines:
@@ -32,6 +32,14 @@ def _parse_session_pointer_document_proxy(payload: object) -> dict[str, str]:
     return parse_session_pointer_document(payload)
 
 
+def _tail_log_events_proxy(path: Path, count: int, accept) -> list[dict[str, object]]:
+    from governance_runtime.infrastructure.adapters.logging.log_segments import read_log_events, tail_log_events
+
+    if count <= 0:
+        return [event for event in read_log_events(path) if accept(event)]
+    return tail_log_events(path, count, accept=accept)
+
+
 def _resolve_active_session_state_path_proxy(pointer: Mapping[str, object], *, config_root: Path) -> Path:
     from governance_runtime.infrastructure.session_pointer import resolve_active_session_state_path
 
@@ -90,23 +98,6 @@ def _extract_updated_at(state: Mapping[str, object], *, session_path: Path) -> s
     return _as_rfc3339_z(mtime)
 
 
-def _parse_jsonl(path: Path) -> list[dict[str, object]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, object]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        row = line.strip()
-        if not row:
-            continue
-        try:
-            item = json.loads(row)
-        except Exception:
-            continue
-        if isinstance(item, dict):
-            rows.append(item)
-    return rows
-
-
 def _event_with_required_fields(event: Mapping[str, object]) -> dict[str, object] | None:
     required = ("event", "observed_at", "repo_fingerprint", "session_id", "run_id")
     for key in required:
@@ -467,13 +458,17 @@ def build_audit_readout(
         "verify_policy_version": active_verify_policy_version,
     }
 
-    events_raw = _parse_jsonl(session_path.parent / "logs" / "events.jsonl")
-    normalized_events: list[dict[str, object]] = []
+    # Only the newest log segments needed to fill the tail are opened.
+    events_raw = _tail_log_events_proxy(
+        session_path.parent / "logs" / "events.jsonl",
+        int(tail_count),
+        lambda event: _event_with_required_fields(event) is not None,
+    )
+    tail: list[dict[str, object]] = []
     for event in events_raw:
         normalized = _event_with_required_fields(event)
         if normalized is not None:
-            normalized_events.append(normalized)
-    tail = normalized_events[-max(0, int(tail_count)):]
+            tail.append(normalized)
 
     pointer_run_id, pointer_notes = _read_current_run_pointer(session_path.parent)
     run_archives, archive_notes = _list_run_archives(session_path.parent)
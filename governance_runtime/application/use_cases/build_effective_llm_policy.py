@@ -21,11 +21,12 @@ from governance_runtime.application.policy.effective_policy_compiler import (
     EffectiveLLMPolicy,
     ReviewPolicy,
     compute_policy_digest,
-    parse_rulebook_content,
+    parse_rulebook_content_cached,
     resolve_authoring_policy,
     resolve_review_policy,
     to_serializable,
 )
+from governance_runtime.shared.perf_trace import count_parse, count_read, traced
 
 
 class EffectivePolicyError(Exception):
@@ -73,7 +74,10 @@ def _load_schema(schema_path: Path) -> dict[str, Any]:
         if not schema_path.exists():
             msg = f"effective_llm_policy schema not found at {schema_path}"
             raise BLOCKED_EFFECTIVE_POLICY_SCHEMA_INVALID(msg)
-        _SCHEMA_CACHE[schema_path] = json.loads(schema_path.read_text(encoding="utf-8"))
+        raw = schema_path.read_text(encoding="utf-8")
+        count_read(len(raw))
+        _SCHEMA_CACHE[schema_path] = json.loads(raw)
+        count_parse("json")
     return _SCHEMA_CACHE[schema_path]
 
 
@@ -141,6 +145,7 @@ def _resolve_content_path(
     return None
 
 
+@traced("policy.build_effective_llm_policy")
 def build_effective_llm_policy(input: EffectivePolicyInput) -> EffectivePolicyOutput:
     """Build effective LLM policy from loaded rulebooks and addons.
 
@@ -176,6 +181,7 @@ def build_effective_llm_policy(input: EffectivePolicyInput) -> EffectivePolicyOu
             )
         try:
             raw_text = content_path.read_text(encoding="utf-8")
+            count_read(len(raw_text))
         except Exception as exc:
             errors.append(f"read failed for {identifier}: {exc}")
             raise BLOCKED_RULEBOOK_CONTENT_UNLOADABLE(
@@ -189,7 +195,7 @@ def build_effective_llm_policy(input: EffectivePolicyInput) -> EffectivePolicyOu
             )
 
         try:
-            parsed = parse_rulebook_content(identifier, source_kind, str(content_path), raw_text)
+            parsed = parse_rulebook_content_cached(identifier, source_kind, str(content_path), raw_text)
         except Exception as exc:
             errors.append(f"parse failed for {identifier}: {exc}")
             raise BLOCKED_RULEBOOK_CONTENT_PARSE_FAILED(
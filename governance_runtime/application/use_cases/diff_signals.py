@@ -0,0 +1,235 @@
+"""Deterministic diff statistics for Phase 4 complexity classification.
+
+``ComplexitySignals`` must be derived from measurable inputs rather than LLM
+estimation. This module turns the combined output of
+``git diff --numstat -p -U0`` into those signals in a single streaming pass:
+
+- ``files_changed`` / ``loc_changed``: numstat rows (binary files count 0 LOC)
+- path classes: precompiled path rules per signal (api/routes/controllers,
+  migrations/schema, auth/security/crypto, permission/rbac, network/http/grpc)
+- content classes: one precompiled alternation over changed hunk lines
+  (test files only count toward ``files_changed``/``loc_changed``)
+- ``permissions_changed`` additionally fires on file mode changes
+
+Collection is pure: callers (infrastructure) own the git process and feed
+lines in. ``test_coverage_delta`` is not observable from a diff; it is taken
+from a caller-supplied coverage comparison and stays neutral (0.0) otherwise.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Mapping
+
+from governance_runtime.application.use_cases.phase4_self_review import (
+    ComplexitySignals,
+    classify_complexity_from_signals,
+)
+
+DIFF_SIGNALS_VERSION = "diff-signals.v1"
+
+_BOOLEAN_SIGNALS = (
+    "public_api_changed",
+    "schema_migration",
+    "security_paths_touched",
+    "permissions_changed",
+    "network_io_changed",
+)
+
+_PATH_RULES: tuple[tuple[str, re.Pattern[str]], ...] = (
+    (
+        "public_api_changed",
+        re.compile(r"(?:^|/)(?:api|apis|routes?|controllers?|endpoints?|openapi[^/]*|[^/]+\.proto)(?:/|\.|$)", re.I),
+    ),
+    (
+        "schema_migration",
+        re.compile(r"(?:^|/)(?:migrations?|alembic|flyway|liquibase|schemas?)(?:/|$)|\.sql$|schema[^/]*\.(?:json|ya?ml|sql)$", re.I),
+    ),
+    (
+        "security_paths_touched",
+        re.compile(r"(?:^|/|_|-)(?:auth\w*|security|crypto\w*|secrets?|oauth\w*|jwt|tls|ssl)(?:/|\.|_|-|$)", re.I),
+    ),
+    (
+        "permissions_changed",
+        re.compile(r"(?:^|/|_|-)(?:permissions?|rbac|acls?|roles?)(?:/|\.|_|-|$)", re.I),
+    ),
+    (
+        "network_io_changed",
+        re.compile(r"(?:^|/|_|-)(?:network\w*|https?|grpc|sockets?|websockets?|transport)(?:/|\.|_|-|$)", re.I),
+    ),
+)
+
+_CONTENT_RULES = re.compile(
+    r"(?P<public_api_changed>^(?:(?:async\s+)?def|class)\s+[A-Za-z]\w*|^export\s+(?:default\s+)?(?:async\s+)?(?:function|class|const|interface|type)\b)"
+    r"|(?P<schema_migration>\b(?:create|alter|drop)\s+(?:table|index|column|schema|view)\b|\bop\.(?:add|drop|alter)_column\b)"
+    r"|(?P<security_paths_touched>\b(?:hashlib|hmac|secrets|bcrypt|jwt|cryptography|ssl|verify\s*=\s*False)\b)"
+    r"|(?P<permissions_changed>\b(?:os\.chmod|chmod|chown|setuid|setgid|umask)\b)"
+    r"|(?P<network_io_changed>\b(?:urllib|http\.client|requests\.(?:get|post|put|patch|delete|request|Session)|socket\.socket|grpc|aiohttp|httpx)\b)",
+    re.IGNORECASE,
+)
+
+_TEST_PATH = re.compile(
+    r"(?:^|/)(?:tests?|__tests__|spec)/|(?:^|/)test_[^/]*\.py$|_test\.(?:py|go)$|\.(?:spec|test)\.[jt]sx?$"
+)
+_PUBLIC_API_SOURCE = re.compile(r"\.(?:py|pyi|[jt]sx?|mjs|cjs)$")
+_NUMSTAT = re.compile(r"^(\d+|-)\t(\d+|-)\t")
+
+
+def _strip_quotes(token: str) -> str:
+    token = token.strip()
+    if len(token) >= 2 and token[0] == token[-1] == '"':
+        return token[1:-1]
+    return token
+
+
+@dataclass(frozen=True)
+class DiffSignalReport:
+    """Signals for one commit range plus the paths that triggered each signal."""
+
+    signals: ComplexitySignals
+    evidence: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def complexity_class(self) -> str:
+        return classify_complexity_from_signals(self.signals)
+
+    def with_coverage_delta(self, delta: float) -> "DiffSignalReport":
+        return replace(self, signals=replace(self.signals, test_coverage_delta=float(delta)))
+
+    def to_dict(self) -> dict[str, object]:
+        s = self.signals
+        return {
+            "version": DIFF_SIGNALS_VERSION,
+            "complexity_class": self.complexity_class,
+            "files_changed": s.files_changed,
+            "loc_changed": s.loc_changed,
+            "public_api_changed": s.public_api_changed,
+            "schema_migration": s.schema_migration,
+            "security_paths_touched": s.security_paths_touched,
+            "permissions_changed": s.permissions_changed,
+            "network_io_changed": s.network_io_changed,
+            "test_coverage_delta": s.test_coverage_delta,
+            "evidence": {name: list(paths) for name, paths in sorted(self.evidence.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> "DiffSignalReport":
+        evidence_raw = payload.get("evidence")
+        evidence = (
+            {str(k): tuple(str(p) for p in v) for k, v in evidence_raw.items() if isinstance(v, list)}
+            if isinstance(evidence_raw, Mapping)
+            else {}
+        )
+        return cls(
+            signals=ComplexitySignals(
+                files_changed=int(payload.get("files_changed") or 0),  # type: ignore[arg-type]
+                loc_changed=int(payload.get("loc_changed") or 0),  # type: ignore[arg-type]
+                public_api_changed=bool(payload.get("public_api_changed")),
+                schema_migration=bool(payload.get("schema_migration")),
+                security_paths_touched=bool(payload.get("security_paths_touched")),
+                permissions_changed=bool(payload.get("permissions_changed")),
+                network_io_changed=bool(payload.get("network_io_changed")),
+                test_coverage_delta=float(payload.get("test_coverage_delta") or 0.0),  # type: ignore[arg-type]
+            ),
+            evidence=evidence,
+        )
+
+
+class DiffSignalCollector:
+    """Streaming consumer for ``git diff --numstat -p -U0`` output lines."""
+
+    def __init__(self) -> None:
+        self._files = 0
+        self._loc = 0
+        self._in_patch = False
+        self._in_hunk = False
+        self._path = ""
+        self._old_mode = ""
+        self._scan_api = False
+        self._scan_content = True
+        self._evidence: dict[str, set[str]] = {name: set() for name in _BOOLEAN_SIGNALS}
+
+    def _hit(self, signal: str, path: str) -> None:
+        self._evidence[signal].add(path or "<unknown>")
+
+    def _enter_path(self, path: str) -> None:
+        path = _strip_quotes(path)
+        if not path or path == "/dev/null":
+            return
+        self._path = path
+        is_test = bool(_TEST_PATH.search(path))
+        self._scan_api = not is_test and bool(_PUBLIC_API_SOURCE.search(path))
+        self._scan_content = not is_test
+        if is_test:
+            return
+        for signal, rule in _PATH_RULES:
+            if rule.search(path):
+                self._hit(signal, path)
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\r\n")
+        if not self._in_patch:
+            match = _NUMSTAT.match(line)
+            if match:
+                self._files += 1
+                for count in match.groups():
+                    if count != "-":
+                        self._loc += int(count)
+                return
+        if line.startswith("diff --git "):
+            self._in_patch = True
+            self._in_hunk = False
+            self._path = ""
+            self._old_mode = ""
+            rest = line[len("diff --git ") :]
+            marker = rest.rfind(" b/")
+            if marker != -1:
+                self._enter_path(rest[marker + 3 :])
+            return
+        if not self._in_patch:
+            return
+        if line.startswith("@@"):
+            self._in_hunk = True
+            return
+        if self._in_hunk:
+            if self._scan_content and line[:1] in {"+", "-"}:
+                for match in _CONTENT_RULES.finditer(line[1:]):
+                    signal = match.lastgroup or ""
+                    if signal == "public_api_changed" and not self._scan_api:
+                        continue
+                    if signal:
+                        self._hit(signal, self._path)
+            return
+        if line.startswith("+++ b/"):
+            self._enter_path(line[6:])
+        elif line.startswith("--- a/"):
+            self._enter_path(line[6:])
+        elif line.startswith(("rename from ", "rename to ", "copy from ", "copy to ")):
+            self._enter_path(line.split(" ", 2)[2])
+        elif line.startswith("old mode "):
+            self._old_mode = line[len("old mode ") :].strip()
+        elif line.startswith("new mode ") and self._old_mode:
+            if self._old_mode != line[len("new mode ") :].strip():
+                self._hit("permissions_changed", self._path)
+
+    def feed_all(self, lines: Iterable[str]) -> "DiffSignalCollector":
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def report(self, *, coverage_delta: float = 0.0) -> DiffSignalReport:
+        evidence = {name: tuple(sorted(paths)) for name, paths in self._evidence.items() if paths}
+        signals = ComplexitySignals(
+            files_changed=self._files,
+            loc_changed=self._loc,
+            test_coverage_delta=float(coverage_delta),
+            **{name: name in evidence for name in _BOOLEAN_SIGNALS},
+        )
+        return DiffSignalReport(signals=signals, evidence=evidence)
+
+
+def collect_signals_from_diff(lines: Iterable[str], *, coverage_delta: float = 0.0) -> DiffSignalReport:
+    """Collect signals from an iterable of ``git diff --numstat -p -U0`` lines."""
+
+    return DiffSignalCollector().feed_all(lines).report(coverage_delta=coverage_delta)
@@ -12,15 +12,23 @@ Schema: governance_runtime/assets/schemas/governance_mandates.v1.schema.json
 
 Schema loading is done by callers (infrastructure/entrypoint layer) to respect
 the architecture constraint that application-layer code must not perform filesystem I/O.
+
+Output schemas are compiled once per schema content hash by a
+SchemaValidatorRegistry (a jsonschema Draft7Validator, or the fallback check
+tree when jsonschema is not installed). The module-level default registry is
+shared by the Phase-5 plan, Phase-6 review and implementation paths, which all
+import this module as ``llm_response_validator``.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
 
 _ALLOWED_REVIEW_VERDICTS = {"approve", "changes_requested"}
 _ALLOWED_SEVERITIES = {"critical", "high", "medium", "low"}
@@ -65,53 +73,211 @@ def _extract_output_schema(schema: dict[str, Any], name: str) -> dict[str, Any]
 
 def _validate_json_schema(data: Any, schema: dict[str, Any]) -> list[str]:
     """Validate data against a JSON Schema definition using the jsonschema library."""
-    try:
-        import jsonschema
-
-        validator = jsonschema.Draft7Validator(schema)
-        errors = list(validator.iter_errors(data))
-        return [f"{'.'.join(str(p) for p in e.path)}: {e.message}" if e.path else e.message for e in errors]
-    except ImportError:
-        return _validate_without_library(data, schema)
-    except Exception as e:
-        return [f"schema-validation-error: {e}"]
+    return _DEFAULT_REGISTRY.compile(schema).validate(data)
 
 
 def _validate_without_library(data: Any, schema: dict[str, Any]) -> list[str]:
     """Fallback manual validator when jsonschema library is unavailable."""
     errors: list[str] = []
+    _compile_fallback(schema)(data, "$root", errors)
+    return errors
+
 
-    def check(value: Any, s: dict[str, Any], path: str) -> None:
-        stype = s.get("type")
-        if stype == "object":
+_FallbackCheck = Callable[[Any, str, list[str]], None]
+
+
+def _fallback_noop(value: Any, path: str, errors: list[str]) -> None:
+    return None
+
+
+def _compile_fallback(s: Any) -> _FallbackCheck:
+    """Compile a schema node into a check closure (type/required/minLength/enum subset)."""
+    if not isinstance(s, dict):
+        return _fallback_noop
+    stype = s.get("type")
+    if stype == "object":
+        required = s.get("required", [])
+        props = [
+            (prop, prop in required, _compile_fallback(prop_schema))
+            for prop, prop_schema in s.get("properties", {}).items()
+        ]
+
+        def check_object(value: Any, path: str, errors: list[str]) -> None:
             if not isinstance(value, dict):
                 errors.append(f"{path}: expected object, got {type(value).__name__}")
                 return
-            for prop, prop_schema in s.get("properties", {}).items():
-                if prop not in value and prop in s.get("required", []):
+            for prop, is_required, child in props:
+                if prop in value:
+                    child(value[prop], f"{path}.{prop}", errors)
+                elif is_required:
                     errors.append(f"{path}.{prop}: required field missing")
-                elif prop in value:
-                    check(value[prop], prop_schema, f"{path}.{prop}")
-        elif stype == "array":
+
+        return check_object
+    if stype == "array":
+        item_check = _compile_fallback(s.get("items", {}))
+
+        def check_array(value: Any, path: str, errors: list[str]) -> None:
             if not isinstance(value, list):
                 errors.append(f"{path}: expected array, got {type(value).__name__}")
                 return
-            items_schema = s.get("items", {})
             for i, item in enumerate(value):
-                check(item, items_schema, f"{path}[{i}]")
-        elif stype == "string":
+                item_check(item, f"{path}[{i}]", errors)
+
+        return check_array
+    if stype == "string":
+        min_length = s.get("minLength")
+        has_enum = "enum" in s
+        allowed = s.get("enum")
+
+        def check_string(value: Any, path: str, errors: list[str]) -> None:
             if not isinstance(value, str):
                 errors.append(f"{path}: expected string, got {type(value).__name__}")
-            elif "minLength" in s and len(value) < s["minLength"]:
-                errors.append(f"{path}: string too short (min {s['minLength']}, got {len(value)})")
-            elif "enum" in s and value not in s["enum"]:
-                errors.append(f"{path}: value '{value}' not in allowed set {s['enum']}")
-        elif stype == "number":
+            elif min_length is not None and len(value) < min_length:
+                errors.append(f"{path}: string too short (min {min_length}, got {len(value)})")
+            elif has_enum and value not in allowed:
+                errors.append(f"{path}: value '{value}' not in allowed set {allowed}")
+
+        return check_string
+    if stype == "number":
+
+        def check_number(value: Any, path: str, errors: list[str]) -> None:
             if not isinstance(value, (int, float)):
                 errors.append(f"{path}: expected number, got {type(value).__name__}")
 
-    check(data, schema, "$root")
-    return errors
+        return check_number
+    return _fallback_noop
+
+
+# ---------------------------------------------------------------------------
+# Validator registry
+# ---------------------------------------------------------------------------
+
+_JSONSCHEMA_UNRESOLVED = object()
+_jsonschema_module: Any = _JSONSCHEMA_UNRESOLVED
+
+
+def _jsonschema() -> Any:
+    """Import jsonschema once; None when it is not installed."""
+    global _jsonschema_module
+    if _jsonschema_module is _JSONSCHEMA_UNRESOLVED:
+        try:
+            import jsonschema
+        except ImportError:
+            _jsonschema_module = None
+        else:
+            _jsonschema_module = jsonschema
+    return _jsonschema_module
+
+
+def schema_fingerprint(schema: Mapping[str, Any]) -> str:
+    """Content hash identifying a schema independent of dict identity and key order."""
+    text = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledOutputSchema:
+    """A schema compiled once; ``validate`` returns error strings (empty = valid)."""
+
+    fingerprint: str
+    validate: Callable[[Any], list[str]]
+    uses_library: bool
+
+
+def _compile_schema(schema: dict[str, Any], fingerprint: str) -> CompiledOutputSchema:
+    jsonschema = _jsonschema()
+    if jsonschema is None:
+        fallback = _compile_fallback(schema)
+
+        def validate_fallback(data: Any) -> list[str]:
+            errors: list[str] = []
+            fallback(data, "$root", errors)
+            return errors
+
+        return CompiledOutputSchema(fingerprint=fingerprint, validate=validate_fallback, uses_library=False)
+
+    try:
+        validator = jsonschema.Draft7Validator(schema)
+    except Exception as e:
+        failure = [f"schema-validation-error: {e}"]
+        return CompiledOutputSchema(
+            fingerprint=fingerprint, validate=lambda data: list(failure), uses_library=True
+        )
+
+    def validate_library(data: Any) -> list[str]:
+        try:
+            errors = list(validator.iter_errors(data))
+        except Exception as e:
+            return [f"schema-validation-error: {e}"]
+        return [f"{'.'.join(str(p) for p in e.path)}: {e.message}" if e.path else e.message for e in errors]
+
+    return CompiledOutputSchema(fingerprint=fingerprint, validate=validate_library, uses_library=True)
+
+
+class SchemaValidatorRegistry:
+    """Caches compiled output-schema validators by schema content hash.
+
+    Lookups first try the identity of the schema dict (callers usually pass
+    the same loaded mandates schema repeatedly), then its content hash, so
+    each distinct schema is compiled once. Both caches are LRU-bounded.
+    Schemas are treated as immutable once they have been validated against.
+    """
+
+    def __init__(self, *, max_entries: int = 32) -> None:
+        self._max_entries = max(1, max_entries)
+        self._by_fingerprint: OrderedDict[str, CompiledOutputSchema] = OrderedDict()
+        # id(schema) -> (schema, compiled); holding the schema keeps the id stable.
+        self._by_identity: OrderedDict[int, tuple[Any, CompiledOutputSchema]] = OrderedDict()
+        self._output_schemas: OrderedDict[tuple[int, str], tuple[Any, dict[str, Any] | None]] = OrderedDict()
+        self.compilations = 0
+
+    def _remember(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self._max_entries:
+            cache.popitem(last=False)
+
+    def compile(self, schema: dict[str, Any]) -> CompiledOutputSchema:
+        """Return the compiled validator for ``schema``, building it on first use."""
+        cached = self._by_identity.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            self._by_identity.move_to_end(id(schema))
+            return cached[1]
+        fingerprint = schema_fingerprint(schema)
+        compiled = self._by_fingerprint.get(fingerprint)
+        if compiled is None:
+            compiled = _compile_schema(schema, fingerprint)
+            self.compilations += 1
+        self._remember(self._by_fingerprint, fingerprint, compiled)
+        self._remember(self._by_identity, id(schema), (schema, compiled))
+        return compiled
+
+    def output_schema(self, mandates_schema: dict[str, Any], name: str) -> CompiledOutputSchema | None:
+        """Compiled validator for ``$defs[name]`` of a mandates schema, or None."""
+        key = (id(mandates_schema), name)
+        cached = self._output_schemas.get(key)
+        if cached is not None and cached[0] is mandates_schema:
+            definition = cached[1]
+        else:
+            definition = _extract_output_schema(mandates_schema, name)
+            self._remember(self._output_schemas, key, (mandates_schema, definition))
+        if not definition:
+            return None
+        return self.compile(definition)
+
+    def clear(self) -> None:
+        self._by_fingerprint.clear()
+        self._by_identity.clear()
+        self._output_schemas.clear()
+        self.compilations = 0
+
+
+_DEFAULT_REGISTRY = SchemaValidatorRegistry()
+
+
+def default_validator_registry() -> SchemaValidatorRegistry:
+    """The process-wide registry used by the validate_* functions."""
+    return _DEFAULT_REGISTRY
 
 
 def _validate_review_decision_rules(data: dict[str, Any]) -> list[str]:
@@ -238,9 +404,9 @@ def validate_review_response(
     all_errors: list[str] = []
 
     if use_json_schema and mandates_schema is not None:
-        output_schema = _extract_output_schema(mandates_schema, "reviewOutputSchema")
-        if output_schema:
-            all_errors.extend(_validate_json_schema(data, output_schema))
+        compiled = _DEFAULT_REGISTRY.output_schema(mandates_schema, "reviewOutputSchema")
+        if compiled is not None:
+            all_errors.extend(compiled.validate(data))
 
     if use_decision_rules:
         all_errors.extend(_validate_review_decision_rules(data))
@@ -294,9 +460,9 @@ def validate_developer_response(
     all_errors: list[str] = []
 
     if use_json_schema and mandates_schema is not None:
-        output_schema = _extract_output_schema(mandates_schema, "developerOutputSchema")
-        if output_schema:
-            all_errors.extend(_validate_json_schema(data, output_schema))
+        compiled = _DEFAULT_REGISTRY.output_schema(mandates_schema, "developerOutputSchema")
+        if compiled is not None:
+            all_errors.extend(compiled.validate(data))
 
     if use_decision_rules:
         all_errors.extend(_validate_developer_decision_rules(data))
@@ -383,6 +549,40 @@ def validate_plan_response(
     )
 
 
+_BATCH_KINDS = ("review", "developer", "plan")
+
+
+def validate_response_batch(
+    kind: str,
+    responses: Iterable[Any],
+    schema: dict[str, Any] | None = None,
+    *,
+    use_json_schema: bool = True,
+    use_decision_rules: bool = True,
+) -> list[LLMResponseValidationResult]:
+    """Validate many parsed responses of one kind against one schema.
+
+    ``kind`` is "review", "developer" or "plan"; ``schema`` is the mandates
+    schema for review/developer and the planOutputSchema for plan. The schema
+    is compiled once for the whole batch (multi-reviewer runs, replayed
+    evidence). Results are returned in input order.
+    """
+    if kind not in _BATCH_KINDS:
+        raise ValueError(f"unknown response kind '{kind}', expected one of {list(_BATCH_KINDS)}")
+    if kind == "plan":
+        return [validate_plan_response(item, plan_schema=schema) for item in responses]
+    validate = validate_review_response if kind == "review" else validate_developer_response
+    return [
+        validate(
+            item,
+            mandates_schema=schema,
+            use_json_schema=use_json_schema,
+            use_decision_rules=use_decision_rules,
+        )
+        for item in responses
+    ]
+
+
 def _extract_field_from_error(err: str) -> str:
     if ":" in err:
         prefix = err.split(":")[0].strip()
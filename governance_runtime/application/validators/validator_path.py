@@ -0,0 +1,23 @@
+"""Import path for the LLM response validators.
+
+``llm_response_validator`` is imported as a top-level module (this directory
+on ``sys.path``) by the entrypoints, the Phase 6 review orchestrator and the
+tests. Adding the directory once per process keeps every caller on the same
+module object, so its compiled ``SchemaValidatorRegistry`` is shared.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+VALIDATORS_DIR = str(Path(__file__).absolute().parent)
+
+
+def ensure_validators_importable() -> None:
+    """Make ``import llm_response_validator`` resolve to this directory."""
+    if VALIDATORS_DIR not in sys.path:
+        sys.path.insert(0, VALIDATORS_DIR)
+
+
+__all__ = ["VALIDATORS_DIR", "ensure_validators_importable"]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+from itertools import islice
 import json
-from typing import Any
+from typing import Any, Mapping
 
 
 def _normalize_string_newlines(value: str) -> str:
@@ -10,14 +11,32 @@ def _normalize_string_newlines(value: str) -> str:
 
 
 def _normalize_payload_strings(payload: Any) -> Any:
+    """Return ``payload`` with newline-normalized strings and string keys.
+
+    Unchanged subtrees are returned as-is (structurally shared), so hashing an
+    already-canonical document does not materialize a copy of it.
+    """
+
     if isinstance(payload, str):
-        return _normalize_string_newlines(payload)
-    if isinstance(payload, list):
-        return [_normalize_payload_strings(item) for item in payload]
-    if isinstance(payload, tuple):
-        return [_normalize_payload_strings(item) for item in payload]
-    if isinstance(payload, dict):
-        return {str(key): _normalize_payload_strings(value) for key, value in payload.items()}
+        return _normalize_string_newlines(payload) if "\r" in payload else payload
+    if isinstance(payload, (list, tuple)):
+        items: list[Any] | None = None if isinstance(payload, list) else []
+        for index, item in enumerate(payload):
+            normalized = _normalize_payload_strings(item)
+            if items is None and normalized is not item:
+                items = list(payload[:index])
+            if items is not None:
+                items.append(normalized)
+        return payload if items is None else items
+    if isinstance(payload, Mapping):
+        mapping: dict[str, Any] | None = None if isinstance(payload, dict) else {}
+        for index, (key, value) in enumerate(payload.items()):
+            normalized = _normalize_payload_strings(value)
+            if mapping is None and (normalized is not value or not isinstance(key, str)):
+                mapping = {str(k): v for k, v in islice(payload.items(), index)}
+            if mapping is not None:
+                mapping[str(key)] = normalized
+        return payload if mapping is None else mapping
     return payload
 
 
@@ -40,6 +59,16 @@ def canonical_json_hash(payload: Any) -> str:
     return hashlib.sha256(canonical_json_bytes(payload)).hexdigest()
 
 
+def canonical_json_normalized(payload: Any) -> Any:
+    """Return the canonical JSON value of ``payload`` without cloning it.
+
+    Equal to ``canonical_json_clone(payload)`` but shares every subtree that
+    is already canonical; treat the result as read-only.
+    """
+
+    return _normalize_payload_strings(payload)
+
+
 def canonical_json_clone(payload: Any) -> Any:
     """Return deep JSON clone using canonical serialization."""
 
@@ -190,6 +190,51 @@ def classify_field(artifact: str, field_path: str) -> FieldClassification:
     return FIELD_CLASSIFICATIONS.get(key, DEFAULT_CLASSIFICATION)
 
 
+#: Rank of each level; a field is redacted when its rank exceeds the export's.
+LEVEL_RANK: Mapping[ClassificationLevel, int] = {
+    ClassificationLevel.PUBLIC: 0,
+    ClassificationLevel.INTERNAL: 1,
+    ClassificationLevel.CONFIDENTIAL: 2,
+    ClassificationLevel.RESTRICTED: 3,
+}
+
+
+@dataclass(frozen=True)
+class ClassificationNode:
+    """One path segment of the compiled classification trie.
+
+    ``classification`` is set when the path ending here is catalogued;
+    ``children`` holds only segments that lead to catalogued descendants, so
+    a missing child means the whole subtree is unclassified.
+    """
+    classification: Optional[FieldClassification]
+    children: Mapping[str, "ClassificationNode"]
+
+
+def compile_classification_trie(
+    catalog: Mapping[str, FieldClassification],
+) -> Mapping[str, ClassificationNode]:
+    """Compile a catalog into one path trie per artifact (dotted paths split on ".")."""
+    raw: dict[str, dict] = {}
+    for classification in catalog.values():
+        node = raw.setdefault(classification.artifact, {"children": {}})
+        for segment in classification.field_path.split("."):
+            node = node["children"].setdefault(segment, {"children": {}})
+        node["classification"] = classification
+
+    def freeze(node: dict) -> ClassificationNode:
+        return ClassificationNode(
+            classification=node.get("classification"),
+            children={key: freeze(child) for key, child in node["children"].items()},
+        )
+
+    return {artifact: freeze(root) for artifact, root in raw.items()}
+
+
+#: FIELD_CLASSIFICATIONS compiled once at import; see compile_classification_trie
+CLASSIFICATION_TRIE: Mapping[str, ClassificationNode] = compile_classification_trie(FIELD_CLASSIFICATIONS)
+
+
 def get_fields_by_level(level: ClassificationLevel) -> list[FieldClassification]:
     """Return all fields classified at a given level."""
     return [f for f in FIELD_CLASSIFICATIONS.values() if f.level == level]
@@ -229,6 +274,10 @@ __all__ = [
     "FieldClassification",
     "FIELD_CLASSIFICATIONS",
     "DEFAULT_CLASSIFICATION",
+    "LEVEL_RANK",
+    "ClassificationNode",
+    "CLASSIFICATION_TRIE",
+    "compile_classification_trie",
     "classify_field",
     "get_fields_by_level",
     "get_fields_requiring_redaction",
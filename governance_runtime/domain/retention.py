@@ -52,9 +52,15 @@ class DeletionDecision(Enum):
 
 
 class ArchiveFormat(Enum):
-    """Supported archive export formats."""
+    """Supported archive export formats.
+
+    ZIP, TAR_GZ and TAR_ZST produce a single bundle file; TAR_ZST needs a
+    Python whose tarfile supports zstd (3.14+).
+    """
     DIRECTORY = "directory"
     ZIP = "zip"
+    TAR_GZ = "tar.gz"
+    TAR_ZST = "tar.zst"
 
 
 # ---------------------------------------------------------------------------
@@ -221,9 +227,13 @@ def evaluate_deletion(
     regulated_mode_active: bool = False,
     regulated_mode_minimum_days: int = 0,
     legal_holds: Sequence[LegalHold] = (),
+    hold_index: Optional["LegalHoldIndex"] = None,
 ) -> DeletionEvaluation:
     """Evaluate whether a run archive may be deleted.
 
+    ``hold_index`` (see index_legal_holds) replaces the linear scan of
+    ``legal_holds`` when many runs are evaluated against the same holds.
+
     Checks in order:
     1. Active legal holds (block unconditionally)
     2. Regulated mode minimum (block if within minimum)
@@ -233,15 +243,23 @@ def evaluate_deletion(
     Fail-closed: if evaluation fails, deletion is blocked.
     """
     # Check legal holds
-    for hold in legal_holds:
-        if hold.status != LegalHoldStatus.ACTIVE:
-            continue
-        if _hold_applies(hold, run_id=run_id, repo_fingerprint=repo_fingerprint):
-            return DeletionEvaluation(
-                decision=DeletionDecision.BLOCKED_LEGAL_HOLD,
-                reason=f"Active legal hold: {hold.hold_id} — {hold.reason}",
-                blocking_hold_id=hold.hold_id,
-            )
+    if hold_index is not None:
+        blocking = hold_index.blocking_hold(run_id=run_id, repo_fingerprint=repo_fingerprint)
+    else:
+        blocking = next(
+            (
+                hold for hold in legal_holds
+                if hold.status == LegalHoldStatus.ACTIVE
+                and _hold_applies(hold, run_id=run_id, repo_fingerprint=repo_fingerprint)
+            ),
+            None,
+        )
+    if blocking is not None:
+        return DeletionEvaluation(
+            decision=DeletionDecision.BLOCKED_LEGAL_HOLD,
+            reason=f"Active legal hold: {blocking.hold_id} — {blocking.reason}",
+            blocking_hold_id=blocking.hold_id,
+        )
 
     # Check regulated mode
     if regulated_mode_active and regulated_mode_minimum_days > 0:
@@ -292,6 +310,54 @@ def _hold_applies(
     return False
 
 
+@dataclass(frozen=True)
+class LegalHoldIndex:
+    """Active legal holds bucketed by scope for constant-time lookup per run.
+
+    Each bucket keeps (position, hold) pairs in the original hold order so
+    blocking_hold returns the same hold as a linear scan would.
+    """
+    global_holds: Tuple[Tuple[int, LegalHold], ...]
+    by_repo: Mapping[str, Tuple[Tuple[int, LegalHold], ...]]
+    by_run: Mapping[str, Tuple[Tuple[int, LegalHold], ...]]
+
+    def blocking_hold(self, *, run_id: str, repo_fingerprint: str) -> Optional[LegalHold]:
+        """Return the first active hold (in original order) covering the run."""
+        candidates = [
+            bucket[0]
+            for bucket in (
+                self.global_holds,
+                self.by_repo.get(repo_fingerprint, ()),
+                self.by_run.get(run_id, ()),
+            )
+            if bucket
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda item: item[0])[1]
+
+
+def index_legal_holds(legal_holds: Sequence[LegalHold]) -> LegalHoldIndex:
+    """Build a LegalHoldIndex over the active holds in ``legal_holds``."""
+    global_holds: list[Tuple[int, LegalHold]] = []
+    by_repo: dict[str, list[Tuple[int, LegalHold]]] = {}
+    by_run: dict[str, list[Tuple[int, LegalHold]]] = {}
+    for position, hold in enumerate(legal_holds):
+        if hold.status != LegalHoldStatus.ACTIVE:
+            continue
+        if hold.scope_type == "all":
+            global_holds.append((position, hold))
+        elif hold.scope_type == "repo":
+            by_repo.setdefault(hold.scope_value, []).append((position, hold))
+        elif hold.scope_type == "run":
+            by_run.setdefault(hold.scope_value, []).append((position, hold))
+    return LegalHoldIndex(
+        global_holds=tuple(global_holds),
+        by_repo={key: tuple(value) for key, value in by_repo.items()},
+        by_run={key: tuple(value) for key, value in by_run.items()},
+    )
+
+
 def validate_legal_hold(hold: LegalHold) -> list[str]:
     """Validate a legal hold record for consistency.
 
@@ -411,6 +477,7 @@ __all__ = [
     "RetentionPolicy",
     "ArchiveExportManifest",
     "RestoreValidation",
+    "LegalHoldIndex",
     "RETENTION_PERIODS",
     "FRAMEWORK_RETENTION_OVERRIDES",
     "DEFAULT_RETENTION_DAYS",
@@ -418,6 +485,7 @@ __all__ = [
     "get_retention_period",
     "get_effective_retention_days",
     "evaluate_deletion",
+    "index_legal_holds",
     "validate_legal_hold",
     "validate_retention_policy",
     "build_retention_policy",
@@ -7,5 +7,6 @@ from governance_runtime.domain.canonical_json import (  # noqa: F401
     canonical_json_bytes,
     canonical_json_clone,
     canonical_json_hash,
+    canonical_json_normalized,
     canonical_json_text,
 )
@@ -9,10 +9,15 @@ Gate checks implemented:
 - P5.5 Technical Debt Gate: Always checked — approved or not-applicable pass
 - P5.6 Rollback Safety: If schema/contracts touched, verify rollback strategy
 - P6 Prerequisites: Verify all upstream gates passed before Phase 6
+
+Each gate declares the SESSION_STATE paths it reads; while a
+``engine.gate_memo.GateMemo`` is active, results are reused until that slice
+changes.
 """
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Literal, Mapping
 
@@ -39,6 +44,8 @@ from governance_runtime.application.use_cases.validate_plan_compliance import (
     validate_plan_compliance,
 )
 from governance_runtime.engine.business_rules_hydration import has_br_signal
+from governance_runtime.engine.gate_memo import decode_dataclass, memoized_gate
+from governance_runtime.shared.perf_trace import traced
 
 GateStatus = Literal["blocked", "warn", "ok", "not_verified"]
 P53Status = Literal["pending", "pass", "pass-with-exceptions", "fail", "not-applicable"]
@@ -209,6 +216,51 @@ class P6PlanComplianceEvaluation:
     blocked: bool
 
 
+# ---------------------------------------------------------------------------
+# Gate read-sets (SESSION_STATE paths each gate depends on)
+# ---------------------------------------------------------------------------
+# Keep in sync with the ``session_state`` lookups in each evaluator: a path
+# missing here would let a memoized result go stale.
+P53_READ_SET: tuple[tuple[str, ...], ...] = (
+    ("TicketRecordDigest",),
+    ("NFRChecklist",),
+    ("TestStrategy",),
+    ("Gates", "P5.3-TestQuality"),
+)
+P54_READ_SET: tuple[tuple[str, ...], ...] = (
+    ("BusinessRules",),
+    ("Gates", "P5.4-BusinessRules"),
+)
+P55_READ_SET: tuple[tuple[str, ...], ...] = (
+    ("TechnicalDebtProposed",),
+    ("technical_debt_proposed",),
+    ("TechnicalDebt",),
+    ("Gates", "P5.5-TechnicalDebt"),
+)
+P56_READ_SET: tuple[tuple[str, ...], ...] = (
+    ("TouchedSurface",),
+    ("RollbackStrategy",),
+    ("RollbackSafetySteps",),
+    ("Gates", "P5.6-RollbackSafety"),
+)
+P6_PREREQUISITES_READ_SET: tuple[tuple[str, ...], ...] = (
+    ("Gates",),
+    ("BusinessRules",),
+)
+
+
+def _decode_plan_compliance(data: Mapping[str, object]) -> P6PlanComplianceEvaluation:
+    report = data.get("report")
+    if not isinstance(report, Mapping):
+        raise ValueError("plan compliance report missing")
+    return P6PlanComplianceEvaluation(
+        status=data["status"],  # type: ignore[arg-type]
+        reason_code=str(data["reason_code"]),
+        report=decode_dataclass(PlanComplianceReport, report),
+        blocked=bool(data["blocked"]),
+    )
+
+
 def evaluate_gate(
     *,
     gate_key: str,
@@ -231,6 +283,8 @@ def evaluate_gate(
     return GateEvaluation(gate_key=normalized_key, status="ok", reason_code=REASON_CODE_NONE)
 
 
+@memoized_gate("p53_test_quality", P53_READ_SET, functools.partial(decode_dataclass, P53GateEvaluation))
+@traced("gate.p53_test_quality_gate")
 def evaluate_p53_test_quality_gate(
     *,
     session_state: Mapping[str, object],
@@ -294,6 +348,8 @@ def evaluate_p53_test_quality_gate(
     )
 
 
+@memoized_gate("p54_business_rules", P54_READ_SET, functools.partial(decode_dataclass, P54GateEvaluation))
+@traced("gate.p54_business_rules_gate")
 def evaluate_p54_business_rules_gate(
     *,
     session_state: Mapping[str, object],
@@ -706,6 +762,8 @@ def evaluate_p54_business_rules_gate(
     )
 
 
+@memoized_gate("p56_rollback_safety", P56_READ_SET, functools.partial(decode_dataclass, P56GateEvaluation))
+@traced("gate.p56_rollback_safety_gate")
 def evaluate_p56_rollback_safety_gate(
     *,
     session_state: Mapping[str, object],
@@ -805,6 +863,8 @@ def evaluate_p56_rollback_safety_gate(
     )
 
 
+@memoized_gate("p55_technical_debt", P55_READ_SET, functools.partial(decode_dataclass, P55GateEvaluation))
+@traced("gate.p55_technical_debt_gate")
 def evaluate_p55_technical_debt_gate(
     *,
     session_state: Mapping[str, object],
@@ -876,6 +936,12 @@ def evaluate_p55_technical_debt_gate(
     )
 
 
+@memoized_gate(
+    "p6_prerequisites",
+    P6_PREREQUISITES_READ_SET,
+    functools.partial(decode_dataclass, P6PrerequisiteEvaluation),
+)
+@traced("gate.p6_prerequisites")
 def evaluate_p6_prerequisites(
     *,
     session_state: Mapping[str, object],
@@ -1021,6 +1087,8 @@ def can_promote_to_phase6(
     return evaluation.passed, evaluation
 
 
+@memoized_gate("p6_plan_compliance", None, _decode_plan_compliance)
+@traced("gate.p6_plan_compliance")
 def evaluate_p6_plan_compliance(
     *,
     plan_record: Mapping[str, object] | None,
@@ -1097,6 +1165,7 @@ def evaluate_p6_plan_compliance(
     )
 
 
+@traced("gate.strict_exit_gate")
 def evaluate_strict_exit_gate(
     *,
     pass_criteria: list[Mapping[str, object]],
@@ -0,0 +1,215 @@
+"""Memoized gate evaluation keyed by the SESSION_STATE slice each gate reads.
+
+Every gate in ``engine.gate_evaluator`` declares its read-set: the
+SESSION_STATE paths it looks at. While a ``GateMemo`` is active, a gate call
+hashes only that slice (plus its other keyword arguments, ``GATE_MEMO_VERSION``
+and the memo's ``logic_digest``) and returns the stored evaluation when the hash is
+unchanged, so repeated ``/continue`` calls at Phase 5-6 skip re-normalizing
+business rules and gate lists.
+
+This module is pure: it performs no IO. Infrastructure loads the memo from
+the workspace, activates it for one command and persists it afterwards; see
+``governance_runtime.infrastructure.gate_memo_store``, which also supplies the
+``logic_digest`` (runtime version plus gate evaluator sources) so a runtime
+upgrade or gate logic change invalidates persisted results. Without an active
+memo every gate calls straight through.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Sequence, TypeVar
+
+from governance_runtime.domain.canonical_json import canonical_json_hash
+
+GATE_MEMO_SCHEMA = "governance.gate-memo.v1"
+
+# Bump whenever gate logic changes so persisted results are discarded.
+GATE_MEMO_VERSION = 1
+
+# Distinct keyword-argument combinations remembered per gate.
+MAX_ENTRIES_PER_GATE = 4
+
+StatePath = tuple[str, ...]
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ABSENT = "__absent__"
+
+
+class GateMemo:
+    """Per-gate evaluation results keyed by the hash of their inputs."""
+
+    def __init__(self, *, logic_digest: str = "") -> None:
+        self.logic_digest = logic_digest
+        self._entries: dict[str, OrderedDict[str, Any]] = {}
+        self._encoded: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def lookup(self, gate: str, key: str, decode: Callable[[Mapping[str, Any]], Any]) -> Any | None:
+        bucket = self._entries.get(gate)
+        if bucket is not None and key in bucket:
+            bucket.move_to_end(key)
+            return bucket[key]
+        encoded = self._encoded.get(gate, {}).pop(key, None)
+        if isinstance(encoded, Mapping):
+            try:
+                result = decode(encoded)
+            except (TypeError, ValueError, KeyError):
+                return None
+            self._remember(gate, key, result)
+            return result
+        return None
+
+    def store(self, gate: str, key: str, result: Any) -> None:
+        self._remember(gate, key, result)
+        self.dirty = True
+
+    def _remember(self, gate: str, key: str, result: Any) -> None:
+        bucket = self._entries.setdefault(gate, OrderedDict())
+        bucket[key] = result
+        bucket.move_to_end(key)
+        while len(bucket) > MAX_ENTRIES_PER_GATE:
+            bucket.popitem(last=False)
+
+    def to_document(self) -> dict[str, object]:
+        entries: dict[str, dict[str, Any]] = {}
+        for gate, pending in self._encoded.items():
+            entries.setdefault(gate, {}).update(pending)
+        for gate, bucket in self._entries.items():
+            target = entries.setdefault(gate, {})
+            for key, result in bucket.items():
+                target[key] = dataclasses.asdict(result)
+        for gate, target in entries.items():
+            while len(target) > MAX_ENTRIES_PER_GATE:
+                target.pop(next(iter(target)))
+        return {
+            "schema": GATE_MEMO_SCHEMA,
+            "version": GATE_MEMO_VERSION,
+            "logic_digest": self.logic_digest,
+            "entries": entries,
+        }
+
+    @classmethod
+    def from_document(cls, document: object, *, logic_digest: str = "") -> "GateMemo":
+        """Rebuild a memo; anything from another schema, version or logic digest is dropped."""
+        memo = cls(logic_digest=logic_digest)
+        if not isinstance(document, Mapping):
+            return memo
+        if document.get("schema") != GATE_MEMO_SCHEMA or document.get("version") != GATE_MEMO_VERSION:
+            return memo
+        if document.get("logic_digest") != logic_digest:
+            return memo
+        entries = document.get("entries")
+        if isinstance(entries, Mapping):
+            for gate, bucket in entries.items():
+                if isinstance(bucket, Mapping):
+                    memo._encoded[str(gate)] = {str(k): v for k, v in bucket.items() if isinstance(v, Mapping)}
+        return memo
+
+
+_ACTIVE: GateMemo | None = None
+
+
+def activate(memo: GateMemo) -> GateMemo:
+    global _ACTIVE
+    _ACTIVE = memo
+    return memo
+
+
+def deactivate() -> None:
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def active_memo() -> GateMemo | None:
+    return _ACTIVE
+
+
+def state_slice(session_state: Mapping[str, object], read_set: Sequence[StatePath]) -> list[object]:
+    """Return the values at ``read_set`` paths; missing paths are marked absent."""
+    values: list[object] = []
+    for path in read_set:
+        node: object = session_state
+        for segment in path:
+            if isinstance(node, Mapping) and segment in node:
+                node = node[segment]
+            else:
+                node = _ABSENT
+                break
+        values.append(node)
+    return values
+
+
+def decode_dataclass(cls: type, data: Mapping[str, Any]) -> Any:
+    """Rebuild a flat frozen result dataclass from ``dataclasses.asdict`` output."""
+    kwargs: dict[str, Any] = {}
+    for item in dataclasses.fields(cls):
+        if item.name not in data:
+            continue
+        value = data[item.name]
+        if isinstance(value, list) and "tuple" in str(item.type):
+            value = tuple(value)
+        kwargs[item.name] = value
+    return cls(**kwargs)
+
+
+def memoized_gate(
+    name: str,
+    read_set: Sequence[StatePath] | None,
+    decode: Callable[[Mapping[str, Any]], Any],
+) -> Callable[[F], F]:
+    """Memoize a keyword-only gate function while a ``GateMemo`` is active.
+
+    ``read_set`` lists the ``session_state`` paths the gate reads; ``None``
+    means the gate takes no session state and is keyed by its arguments only.
+    Inputs that are not JSON-serializable bypass the memo.
+    """
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(**kwargs: Any) -> Any:
+            memo = _ACTIVE
+            if memo is None:
+                return func(**kwargs)
+            arguments = dict(kwargs)
+            if read_set is not None:
+                session_state = arguments.pop("session_state", None)
+                if not isinstance(session_state, Mapping):
+                    return func(**kwargs)
+                arguments["__slice__"] = state_slice(session_state, read_set)
+            try:
+                key = canonical_json_hash(
+                    {"version": GATE_MEMO_VERSION, "logic": memo.logic_digest, "inputs": arguments}
+                )
+            except (TypeError, ValueError):
+                return func(**kwargs)
+            cached = memo.lookup(name, key, decode)
+            if cached is not None:
+                memo.hits += 1
+                return cached
+            memo.misses += 1
+            result = func(**kwargs)
+            memo.store(name, key, result)
+            return result
+
+        wrapper.read_set = tuple(read_set) if read_set is not None else None  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+__all__ = [
+    "GATE_MEMO_SCHEMA",
+    "GATE_MEMO_VERSION",
+    "GateMemo",
+    "activate",
+    "active_memo",
+    "deactivate",
+    "decode_dataclass",
+    "memoized_gate",
+    "state_slice",
+]
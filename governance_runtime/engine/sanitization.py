@@ -24,6 +24,12 @@ def _sanitize_string(value: str) -> str:
     return redacted
 
 
+def is_secret_key(key: str) -> bool:
+    """Return True when values under ``key`` are replaced by ``***`` on output."""
+
+    return _SECRET_KEY.search(key) is not None
+
+
 def sanitize_for_output(payload: Any) -> Any:
     """Recursively sanitize values for user-visible output payloads."""
 
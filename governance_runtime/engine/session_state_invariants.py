@@ -2,12 +2,23 @@
 
 These validators check constraints that cannot be expressed in JSON Schema alone,
 such as conditional requirements based on other field values.
+
+Every invariant is registered in ``INVARIANTS`` with the top-level
+SESSION_STATE keys it reads (nested keys are covered by their top-level
+parent). ``validate_session_state_invariants_incremental`` uses those
+declarations and a per-subtree digest map from the last validated revision
+to re-run only the invariants whose inputs changed; the canonical path check
+is re-run per changed subtree. ``validate_session_state_invariants`` always
+runs everything and remains the entry point for migrations and audit reads.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from typing import Mapping
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
 
 from governance_runtime.domain.phase_state_machine import normalize_phase_token, phase_rank
 
@@ -166,20 +177,8 @@ def validate_session_state_invariants(session_state_document: Mapping[str, objec
         return ("missing_session_state_key",)
 
     errors: list[str] = []
-    errors.extend(validate_blocked_next_invariant(state))
-    errors.extend(validate_confidence_mode_invariant(state))
-    errors.extend(validate_profile_source_blocked_invariant(state))
-    errors.extend(validate_ticket_intake_ready_invariant(state))
-    errors.extend(validate_reason_payloads_required(state))
-    errors.extend(validate_next_field_sync(state))
-    errors.extend(validate_output_mode_architect_invariant(state))
-    errors.extend(validate_rulebook_evidence_mirror(state))
-    errors.extend(validate_addon_evidence_mirror(state))
-    errors.extend(validate_canonical_path_invariants(state))
-    errors.extend(validate_p5_approved_architecture_decisions(state))
-    errors.extend(validate_phase_gate_prerequisites(state))
-    errors.extend(validate_gate_artifacts_integrity(state))
-    errors.extend(validate_fresh_phase4_start_business_rules(state))
+    for spec in INVARIANTS:
+        errors.extend(spec.validate(state))
 
     return tuple(errors)
 
@@ -286,17 +285,25 @@ def validate_canonical_path_invariants(state: Mapping[str, object]) -> tuple[str
       drive root token, drive-relative path, and single-segment paths without ${...}
     """
     errors: list[str] = []
+    for key, value in state.items():
+        errors.extend(_canonical_path_errors_for_subtree(key, value))
+    return tuple(errors)
+
+
+def _canonical_path_errors_for_subtree(key: str, value: object) -> tuple[str, ...]:
+    """Canonical path violations for one top-level SESSION_STATE entry."""
+    errors: list[str] = []
 
     def check_object(obj: Mapping[str, object], prefix: str) -> None:
-        for key, value in obj.items():
-            field_path = f"{prefix}.{key}" if prefix else key
+        for child_key, child_value in obj.items():
+            field_path = f"{prefix}.{child_key}"
 
-            if _is_path_field(key) and isinstance(value, str):
-                errors.extend(_validate_path_value(value, field_path))
-            elif isinstance(value, dict):
-                check_object(value, field_path)
+            if _is_path_field(child_key) and isinstance(child_value, str):
+                errors.extend(_validate_path_value(child_value, field_path))
+            elif isinstance(child_value, dict):
+                check_object(child_value, field_path)
 
-    check_object(state, "SESSION_STATE")
+    check_object({key: value}, "SESSION_STATE")
     return tuple(errors)
 
 
@@ -474,3 +481,182 @@ def validate_fresh_phase4_start_business_rules(state: Mapping[str, object]) -> t
         errors.append("fresh_phase4_evidence_references_present")
 
     return tuple(errors)
+
+
+# ---------------------------------------------------------------------------
+# Invariant registry and incremental validation
+# ---------------------------------------------------------------------------
+
+# Bump when any invariant changes so stored checkpoints are discarded.
+INVARIANT_ENGINE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class InvariantSpec:
+    """One cross-field invariant and the top-level keys it depends on."""
+
+    name: str
+    validate: Callable[[Mapping[str, object]], tuple[str, ...]]
+    inputs: tuple[str, ...]
+
+
+INVARIANTS: tuple[InvariantSpec, ...] = (
+    InvariantSpec("blocked_next", validate_blocked_next_invariant, ("Mode", "next", "Next")),
+    InvariantSpec("confidence_mode", validate_confidence_mode_invariant, ("ConfidenceLevel", "Mode")),
+    InvariantSpec("profile_source_blocked", validate_profile_source_blocked_invariant, ("ProfileSource", "Mode")),
+    InvariantSpec(
+        "ticket_intake_ready",
+        validate_ticket_intake_ready_invariant,
+        (
+            "ticket_intake_ready",
+            "phase_ready",
+            "phase",
+            "Phase",
+            "PersistenceCommitted",
+            "persistence_committed",
+            "WorkspaceReadyGateCommitted",
+            "workspace_ready_gate_committed",
+            "Bootstrap",
+        ),
+    ),
+    InvariantSpec("reason_payloads", validate_reason_payloads_required, ("Mode", "Next", "Diagnostics")),
+    InvariantSpec("next_field_sync", validate_next_field_sync, ("next", "Next")),
+    InvariantSpec("output_mode_architect", validate_output_mode_architect_invariant, ("OutputMode", "DecisionSurface")),
+    InvariantSpec("rulebook_evidence_mirror", validate_rulebook_evidence_mirror, ("LoadedRulebooks", "RulebookLoadEvidence")),
+    InvariantSpec("addon_evidence_mirror", validate_addon_evidence_mirror, ("LoadedRulebooks", "AddonsEvidence")),
+    # Reads every subtree; validated per top-level key (see _canonical_path_errors_for_subtree).
+    InvariantSpec("canonical_paths", validate_canonical_path_invariants, ()),
+    InvariantSpec("p5_approved_architecture_decisions", validate_p5_approved_architecture_decisions, ("Gates", "ArchitectureDecisions")),
+    InvariantSpec("phase_gate_prerequisites", validate_phase_gate_prerequisites, ("phase", "Phase", "Gates", "PhaseRouterFacts")),
+    InvariantSpec("gate_artifacts_integrity", validate_gate_artifacts_integrity, ("GateArtifacts", "Gates")),
+    InvariantSpec(
+        "fresh_phase4_start_business_rules",
+        validate_fresh_phase4_start_business_rules,
+        (
+            "phase",
+            "Phase",
+            "active_gate",
+            "ActiveGate",
+            "phase4_intake_source",
+            "Ticket",
+            "Task",
+            "TicketRecordDigest",
+            "TaskRecordDigest",
+            "phase_transition_evidence",
+            "Scope",
+            "BusinessRules",
+        ),
+    ),
+)
+
+_PER_SUBTREE_INVARIANT = "canonical_paths"
+
+
+@dataclass(frozen=True)
+class InvariantCheckpoint:
+    """Validated revision: subtree digests plus the results derived from them."""
+
+    digests: Mapping[str, str]
+    results: Mapping[str, tuple[str, ...]]
+    path_results: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def document_digest(self) -> str:
+        """Digest of the SESSION_STATE revision this checkpoint was computed for."""
+        return _subtree_digest(dict(self.digests))
+
+    def _body(self) -> dict[str, object]:
+        return {
+            "version": INVARIANT_ENGINE_VERSION,
+            "document_digest": self.document_digest,
+            "digests": dict(self.digests),
+            "results": {name: list(errors) for name, errors in self.results.items()},
+            "path_results": {key: list(errors) for key, errors in self.path_results.items()},
+        }
+
+    def to_document(self) -> dict[str, object]:
+        body = self._body()
+        return {**body, "seal": _subtree_digest(body)}
+
+    @classmethod
+    def from_document(cls, document: object) -> "InvariantCheckpoint | None":
+        """Rebuild a checkpoint; returns None for foreign, outdated or altered documents."""
+        if not isinstance(document, Mapping) or document.get("version") != INVARIANT_ENGINE_VERSION:
+            return None
+        digests = document.get("digests")
+        results = document.get("results")
+        path_results = document.get("path_results")
+        if not isinstance(digests, Mapping) or not isinstance(results, Mapping) or not isinstance(path_results, Mapping):
+            return None
+
+        def _errors(value: object) -> tuple[str, ...]:
+            return tuple(str(item) for item in value) if isinstance(value, list) else ()
+
+        checkpoint = cls(
+            digests={str(k): str(v) for k, v in digests.items()},
+            results={str(k): _errors(v) for k, v in results.items()},
+            path_results={str(k): _errors(v) for k, v in path_results.items()},
+        )
+        body = checkpoint._body()
+        if document.get("document_digest") != body["document_digest"] or document.get("seal") != _subtree_digest(body):
+            return None
+        return checkpoint
+
+
+def _subtree_digest(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def subtree_digests(state: Mapping[str, object]) -> dict[str, str]:
+    """Digest of every top-level SESSION_STATE entry."""
+    return {str(key): _subtree_digest(value) for key, value in state.items()}
+
+
+def validate_session_state_invariants_incremental(
+    session_state_document: Mapping[str, object],
+    previous: InvariantCheckpoint | None = None,
+    *,
+    same_revision_only: bool = False,
+) -> tuple[tuple[str, ...], InvariantCheckpoint | None]:
+    """Validate invariants, re-running only those whose inputs changed.
+
+    Returns the violations (same content and order as
+    ``validate_session_state_invariants``) and the checkpoint for this
+    revision. Without ``previous`` every invariant runs. With
+    ``same_revision_only`` (untrusted, persisted checkpoints) ``previous`` is
+    used only when it was computed for exactly this revision.
+    """
+    state = session_state_document.get("SESSION_STATE")
+    if not isinstance(state, Mapping):
+        return ("missing_session_state_key",), None
+
+    digests = subtree_digests(state)
+    if previous is not None and same_revision_only and dict(previous.digests) != digests:
+        previous = None
+    if previous is None:
+        changed: set[str] | None = None
+    else:
+        changed = {key for key in digests.keys() | previous.digests.keys() if digests.get(key) != previous.digests.get(key)}
+
+    results: dict[str, tuple[str, ...]] = {}
+    path_results: dict[str, tuple[str, ...]] = {}
+    errors: list[str] = []
+    for spec in INVARIANTS:
+        if spec.name == _PER_SUBTREE_INVARIANT:
+            for key, value in state.items():
+                cached = None if changed is None or key in changed else previous.path_results.get(key)  # type: ignore[union-attr]
+                subtree_errors = cached if cached is not None else _canonical_path_errors_for_subtree(key, value)
+                path_results[key] = subtree_errors
+                errors.extend(subtree_errors)
+            continue
+        reuse = (
+            changed is not None
+            and spec.name in previous.results  # type: ignore[union-attr]
+            and not changed.intersection(spec.inputs)
+        )
+        spec_errors = previous.results[spec.name] if reuse else spec.validate(state)  # type: ignore[union-attr]
+        results[spec.name] = spec_errors
+        errors.extend(spec_errors)
+
+    return tuple(errors), InvariantCheckpoint(digests=digests, results=results, path_results=path_results)
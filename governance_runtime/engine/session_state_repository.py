@@ -15,7 +15,11 @@ import os
 from pathlib import Path
 from typing import Any
 
-from governance_runtime.engine.canonical_json import canonical_json_clone, canonical_json_hash
+from governance_runtime.engine.canonical_json import (
+    canonical_json_clone,
+    canonical_json_hash,
+    canonical_json_normalized,
+)
 from governance_runtime.engine.reason_codes import (
     BLOCKED_SESSION_STATE_LEGACY_UNSUPPORTED,
     BLOCKED_STATE_OUTDATED,
@@ -25,8 +29,13 @@ from governance_runtime.engine.reason_codes import (
 )
 from governance_runtime.engine.schema_validator import validate_against_schema
 from governance_runtime.engine._embedded_session_state_schema import SESSION_STATE_CORE_SCHEMA
-from governance_runtime.engine.session_state_invariants import validate_session_state_invariants
+from governance_runtime.engine.session_state_invariants import (
+    InvariantCheckpoint,
+    validate_session_state_invariants,
+    validate_session_state_invariants_incremental,
+)
 from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+from governance_runtime.shared.perf_trace import count_parse, count_read, traced
 
 CURRENT_SESSION_STATE_VERSION = 1
 ROLLOUT_PHASE_DUAL_READ = 1
@@ -92,6 +101,41 @@ class SessionStateRepository:
         # `load_with_result()`.
         self.last_warning_reason_code = REASON_CODE_NONE
         self.last_atomic_replace_retries = 0
+        # Checkpoint computed in this process (trusted) and the persisted one
+        # (used only for the exact revision it was computed for).
+        self._invariant_checkpoint: InvariantCheckpoint | None = None
+        self._stored_invariant_checkpoint: InvariantCheckpoint | None = None
+        self._invariant_checkpoint_loaded = False
+
+    @property
+    def invariant_checkpoint_path(self) -> Path:
+        """Sidecar holding the subtree digests of the last validated revision."""
+        return self.path.with_name(f"{self.path.stem}.invariants.json")
+
+    def _stored_checkpoint(self) -> InvariantCheckpoint | None:
+        if not self._invariant_checkpoint_loaded:
+            self._invariant_checkpoint_loaded = True
+            try:
+                raw = json.loads(self.invariant_checkpoint_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = None
+            self._stored_invariant_checkpoint = InvariantCheckpoint.from_document(raw)
+        return self._stored_invariant_checkpoint
+
+    def _validate_invariants(self, document: dict[str, Any], *, full: bool) -> tuple[str, ...]:
+        if full:
+            return validate_session_state_invariants(document)
+        if self._invariant_checkpoint is not None:
+            errors, checkpoint = validate_session_state_invariants_incremental(document, self._invariant_checkpoint)
+        else:
+            errors, checkpoint = validate_session_state_invariants_incremental(
+                document,
+                self._stored_checkpoint(),
+                same_revision_only=True,
+            )
+        if checkpoint is not None:
+            self._invariant_checkpoint = checkpoint
+        return errors
 
     def load(self, *, validate: bool = True) -> dict[str, Any] | None:
         """Load a JSON document, returning None when the file is absent.
@@ -106,11 +150,17 @@ class SessionStateRepository:
         self.last_warning_reason_code = result.warning_reason_code
         return result.document
 
-    def load_with_result(self, *, validate: bool = True) -> SessionStateLoadResult:
+    @traced("session_state.load")
+    def load_with_result(self, *, validate: bool = True, full_validation: bool = False) -> SessionStateLoadResult:
         """Load one document and return structured warning metadata.
 
+        Invariants are checked incrementally against the last validated
+        revision (see ``session_state_invariants.INVARIANTS``).
+
         Args:
             validate: If True (default), validate against schema and invariants.
+            full_validation: Re-run every invariant regardless of the stored
+                checkpoint (migrations and audit-grade reads).
         """
 
         self.last_warning_reason_code = REASON_CODE_NONE
@@ -120,7 +170,10 @@ class SessionStateRepository:
                 warning_reason_code=REASON_CODE_NONE,
                 warning_detail="",
             )
-        payload = json.loads(self.path.read_text(encoding="utf-8"))
+        raw = self.path.read_text(encoding="utf-8")
+        count_read(len(raw))
+        payload = json.loads(raw)
+        count_parse("json")
         if not isinstance(payload, dict):
             raise ValueError("session state payload must be a JSON object")
 
@@ -169,7 +222,7 @@ class SessionStateRepository:
                 schema=SESSION_STATE_CORE_SCHEMA,
                 value=document,
             ))
-            invariant_errors = validate_session_state_invariants(document)
+            invariant_errors = self._validate_invariants(document, full=full_validation)
 
             if schema_errors or invariant_errors:
                 detail = f"schema_errors={len(schema_errors)} invariant_errors={len(invariant_errors)}"
@@ -187,6 +240,7 @@ class SessionStateRepository:
             warning_detail="",
         )
 
+    @traced("session_state.save")
     def save(self, document: dict[str, Any], *, now_utc: datetime | None = None) -> None:
         """Persist one JSON document in deterministic formatting.
 
@@ -206,6 +260,27 @@ class SessionStateRepository:
             attempts=ATOMIC_REPLACE_RETRIES,
             backoff_ms=ATOMIC_RETRY_DELAY_MILLISECONDS,
         )
+        self._save_invariant_checkpoint(canonical)
+
+    def _save_invariant_checkpoint(self, document: dict[str, Any]) -> None:
+        """Persist the checkpoint of the just-written revision (best-effort).
+
+        Only repositories that validated a revision in this process write a
+        checkpoint; it is recomputed incrementally for ``document`` so it is
+        keyed to exactly what was saved.
+        """
+        if self._invariant_checkpoint is None:
+            return
+        _, checkpoint = validate_session_state_invariants_incremental(document, self._invariant_checkpoint)
+        if checkpoint is None:
+            return
+        self._invariant_checkpoint = checkpoint
+        self._stored_invariant_checkpoint = checkpoint
+        payload = json.dumps(checkpoint.to_document(), sort_keys=True, ensure_ascii=True) + "\n"
+        try:
+            atomic_write_text(self.invariant_checkpoint_path, payload, newline_lf=True)
+        except OSError:
+            pass
 
 
 def session_state_hash(document: dict[str, Any]) -> str:
@@ -216,12 +291,19 @@ def session_state_hash(document: dict[str, Any]) -> str:
 
 
 def _normalize_dual_read_aliases(document: dict[str, Any]) -> dict[str, Any]:
-    """Normalize legacy aliases into canonical fields for phase-1 dual-read."""
+    """Normalize legacy aliases into canonical fields for phase-1 dual-read.
+
+    Copy-on-write: only the document root and the ``SESSION_STATE`` object are
+    copied; all other subtrees are shared with ``document`` and must not be
+    mutated in place by callers of the result.
+    """
 
-    normalized = canonical_json_clone(document)
+    normalized = dict(canonical_json_normalized(document))
     state = normalized.get("SESSION_STATE")
     if not isinstance(state, dict):
         return normalized
+    state = dict(state)
+    normalized["SESSION_STATE"] = state
 
     repo_model = state.get("RepoModel")
     if "RepoMapDigest" not in state and isinstance(repo_model, dict):
@@ -315,10 +397,10 @@ def _record_migration_event(
         "engine_version": engine_version,
     }
     events = state.get("migration_events")
-    if not isinstance(events, list):
-        events = []
-        state["migration_events"] = events
+    # Copy-on-write: the list may be shared with the caller's document.
+    events = list(events) if isinstance(events, list) else []
     events.append(event)
+    state["migration_events"] = events
 
 
 def migrate_session_state_document(
@@ -383,8 +465,9 @@ def migrate_session_state_document(
             detail="no migration required",
         )
 
-    migrated = canonical_json_clone(document)
-    migrated_state = migrated["SESSION_STATE"]
+    migrated = dict(canonical_json_normalized(document))
+    migrated_state = dict(migrated["SESSION_STATE"])
+    migrated["SESSION_STATE"] = migrated_state
     migrated_state["ruleset_hash"] = target_ruleset_hash
     migrated_state["Migration"] = {
         "fromVersion": version,
@@ -12,6 +12,7 @@ Copyright 2026 Benjamin Fuchs. All rights reserved. See LICENSE.
 """
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 
@@ -20,9 +21,12 @@ from pathlib import Path
 STATE_PATTERNS: frozenset = frozenset({
     # Workspace state files
     "SESSION_STATE.json",
+    "SESSION_STATE.invariants.json",
     "events.jsonl",
     "flow.log.jsonl",
     "error.log.jsonl",
+    "perf.jsonl",
+    "gate-memo.json",
     "targeted_checks.log",
     "repo-identity-map.yaml",
     "repo-cache.yaml",
@@ -48,6 +52,7 @@ STATE_DIR_PATTERNS: frozenset = frozenset({
     "plan-record-archive",
     "evidence",
     "runs",
+    "governance-jobs",
 })
 
 # Log file patterns
@@ -55,9 +60,15 @@ LOG_PATTERNS: frozenset = frozenset({
     "flow.log.jsonl",
     "error.log.jsonl",
     "boot.log.jsonl",
+    "perf.jsonl",
     "targeted_checks.log",
 })
 
+# Sealed log segments and their index (logs/segments/, see log_segments.py)
+LOG_SEGMENT_PATTERN = re.compile(
+    r"^(?:events|flow\.log|boot\.log|error\.log|perf)\.(?:\d{6}\.jsonl(?:\.gz)?|index\.json|rotate\.lock)$"
+)
+
 
 def is_state_file(path: Path | str) -> bool:
     """
@@ -75,7 +86,7 @@ def is_state_file(path: Path | str) -> bool:
     """
     if isinstance(path, Path):
         path = path.name
-    return path in STATE_PATTERNS
+    return path in STATE_PATTERNS or bool(LOG_SEGMENT_PATTERN.match(path))
 
 
 def is_state_directory(path: Path | str) -> bool:
@@ -100,7 +111,7 @@ def is_log_file(path: Path | str) -> bool:
     """
     if isinstance(path, Path):
         path = path.name
-    return path in LOG_PATTERNS
+    return path in LOG_PATTERNS or bool(LOG_SEGMENT_PATTERN.match(path))
 
 
 def is_workspace_path(path: Path | str) -> bool:
@@ -14,6 +14,11 @@ except Exception:
     except Exception:
         run_backfill_subprocess = None
 
+    from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+        InProcessRunner,
+        inprocess_enabled,
+    )
+
     def run_workspace_artifact_backfill(
         *,
         skip_artifact_backfill: bool,
@@ -71,7 +76,10 @@ except Exception:
                 "--skip-lock",
                 "--quiet",
             ]
-            run = subprocess.run(cmd, text=True, capture_output=True, check=False, env=env)
+            if inprocess_enabled():
+                run = InProcessRunner().run(cmd, env)
+            else:
+                run = subprocess.run(cmd, text=True, capture_output=True, check=False, env=env)
 
             summary = None
             if run.stdout.strip():
@@ -11,6 +11,13 @@ from governance_runtime.application.use_cases.repo_policy_setup import (
     write_governance_mode_config,
     write_repo_operating_mode_policy,
 )
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    ISOLATION_ENV_KEY,
+    ISOLATION_INPROCESS,
+    ISOLATION_PROCESS,
+    ExecutionContext,
+    InProcessRunner,
+)
 
 try:
     from governance_runtime.infrastructure.path_contract import normalize_absolute_path
@@ -69,6 +76,11 @@ def main() -> int:
         default="DEFAULT",
         help="Compliance framework for regulated mode (default: DEFAULT)",
     )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each bootstrap stage in its own Python interpreter (process isolation)",
+    )
     args = parser.parse_args()
 
     if args.profile and args.command != "init":
@@ -84,17 +96,19 @@ def main() -> int:
         print(f"invalid --repo-root: {exc}", file=sys.stderr)
         return 2
 
-    env = os.environ.copy()
+    overrides: dict[str, str | None] = {}
     if args.config_root:
         try:
             config_root = _validate_config_root(args.config_root)
         except Exception as exc:
             print(f"invalid --config-root: {exc}", file=sys.stderr)
             return 2
-        env["OPENCODE_CONFIG_ROOT"] = str(config_root)
-        env["COMMANDS_HOME"] = str(config_root / "commands")
+        overrides["OPENCODE_CONFIG_ROOT"] = str(config_root)
+        overrides["COMMANDS_HOME"] = str(config_root / "commands")
 
-    env["OPENCODE_REPO_ROOT"] = str(repo_root)
+    overrides["OPENCODE_REPO_ROOT"] = str(repo_root)
+    isolated = args.isolated or os.environ.get(ISOLATION_ENV_KEY, "").strip().lower() == ISOLATION_PROCESS
+    overrides[ISOLATION_ENV_KEY] = ISOLATION_PROCESS if isolated else ISOLATION_INPROCESS
 
     if selected_profile is not None:
         now_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -126,13 +140,20 @@ def main() -> int:
                 print(f"failed to set regulated mode: {exc}", file=sys.stderr)
                 return 2
 
+    preflight_argv = [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_preflight_readonly"]
+    context = ExecutionContext(env_overrides=overrides, cwd=repo_root, capture_output=False)
+    if not isolated:
+        return InProcessRunner().run_with_context(preflight_argv, context).returncode
+
     ret = subprocess.run(
-        [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_preflight_readonly"],
-        env=env,
+        preflight_argv,
+        env=context.environment(),
         cwd=str(repo_root),
     )
     return ret.returncode
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from governance_runtime.infrastructure.perf_profile import run_profiled
+
+    raise SystemExit(run_profiled("bootstrap", main))
@@ -26,7 +26,7 @@ import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Mapping, cast
 
 from governance_runtime.entrypoints.write_policy import EFFECTIVE_MODE, writes_allowed
 
@@ -70,6 +70,12 @@ try:
     from governance_runtime.infrastructure.wiring import configure_gateway_registry
     from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
     from governance_runtime.infrastructure.logging.global_error_handler import resolve_log_path
+    from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+        ExecutionContext,
+        InProcessRunner,
+        inprocess_enabled,
+    )
+    from governance_runtime.infrastructure.stage_environment import stage_environ
 except ImportError as exc:
     print(json.dumps({
         "persistence_hook": "failed",
@@ -120,16 +126,19 @@ except ImportError:
     pass
 
 
-def _resolve_bindings(*, mode: str) -> tuple[Path | None, Path | None, bool, Path | None, str]:
+def _resolve_bindings(
+    *, mode: str, env: Mapping[str, str] | None = None
+) -> tuple[Path | None, Path | None, bool, Path | None, str]:
     """Resolve binding evidence paths for the current mode.
     
     Args:
         mode: The effective mode ('pipeline' or 'user').
+        env: Stage environment; defaults to the process environment.
     
     Returns:
         Tuple of (commands_home, workspaces_home, binding_ok, paths_file, python_command).
     """
-    resolver = BindingEvidenceResolver(env=os.environ)
+    resolver = BindingEvidenceResolver(env=stage_environ() if env is None else env)
     evidence = resolver.resolve(mode=mode)
     python_command = evidence.python_command.strip() if evidence.python_command else ""
     if not python_command:
@@ -168,6 +177,14 @@ def _python_command_argv(python_command: str) -> list[str]:
 
 COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND = _resolve_bindings(mode=EFFECTIVE_MODE)
 
+
+def _bind_environment(env: Mapping[str, str]) -> None:
+    """Re-resolve the module bindings for the stage environment ``env``."""
+    global COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND
+    COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND = _resolve_bindings(
+        mode=EFFECTIVE_MODE, env=env
+    )
+
 # Final safety check - should rarely trigger since we have fallback
 if COMMANDS_HOME is None or str(COMMANDS_HOME).strip() == "" or not COMMANDS_HOME.is_absolute():
     print(json.dumps({
@@ -187,16 +204,17 @@ class _RepoIdentityAdapter(LocalHostAdapter):
     from the correct location.
     """
     
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, env: Mapping[str, str] | None = None):
         """Initialize the adapter for a specific repo root.
         
         Args:
             repo_root: The absolute path to the repository root.
+            env: Stage environment; defaults to the process environment.
         """
         super().__init__()
         resolved = normalize_absolute_path(str(repo_root), purpose="repo_root")
         self._repo_root = resolved
-        env = dict(os.environ)
+        env = dict(stage_environ() if env is None else env)
         env["OPENCODE_REPO_ROOT"] = str(resolved)
         self._env = env
 
@@ -217,7 +235,7 @@ class _RepoIdentityAdapter(LocalHostAdapter):
         return self._repo_root
 
 
-def derive_repo_fingerprint(repo_root: Path) -> str | None:
+def derive_repo_fingerprint(repo_root: Path, *, env: Mapping[str, str] | None = None) -> str | None:
     """Derive the canonical 24-hex fingerprint for a repository.
     
     The fingerprint is derived in the following order:
@@ -226,6 +244,7 @@ def derive_repo_fingerprint(repo_root: Path) -> str | None:
     
     Args:
         repo_root: The path to the repository root.
+        env: Stage environment; defaults to the process environment.
     
     Returns:
         A 24-character hex string fingerprint, or None if derivation fails.
@@ -246,7 +265,7 @@ def derive_repo_fingerprint(repo_root: Path) -> str | None:
     fp = None
     try:
         configure_gateway_registry()
-        identity = evaluate_bootstrap_identity(adapter=cast(Any, _RepoIdentityAdapter(normalized_repo_root)))
+        identity = evaluate_bootstrap_identity(adapter=cast(Any, _RepoIdentityAdapter(normalized_repo_root, env)))
         fp = (identity.repo_fingerprint or "").strip()
     except Exception:
         pass
@@ -306,7 +325,9 @@ def _resolve_git_repo_root(start_dir: Path) -> Path | None:
     return None
 
 
-def _resolve_repo_root_ssot(explicit_root: Path | None = None) -> tuple[Path | None, str]:
+def _resolve_repo_root_ssot(
+    explicit_root: Path | None = None, *, env: Mapping[str, str] | None = None
+) -> tuple[Path | None, str]:
     """Resolve repository root using SSOT approach.
     
     Priority:
@@ -318,13 +339,14 @@ def _resolve_repo_root_ssot(explicit_root: Path | None = None) -> tuple[Path | N
     
     Args:
         explicit_root: Optional explicit repo root path.
+        env: Stage environment; defaults to the process environment.
     
     Returns:
         Tuple of (resolved_path, source). Path may be None if resolution fails.
     """
     if _resolve_repo_root_from_bootstrap is not None:
         try:
-            result = _resolve_repo_root_from_bootstrap(explicit_root)
+            result = _resolve_repo_root_from_bootstrap(explicit_root, env=env)
             if isinstance(result, tuple) and len(result) == 2:
                 path, source = result
                 if path is None:
@@ -339,7 +361,7 @@ def _resolve_repo_root_ssot(explicit_root: Path | None = None) -> tuple[Path | N
         except Exception:
             return None, "invalid-explicit"
     
-    env_root = os.environ.get("OPENCODE_REPO_ROOT", "").strip()
+    env_root = (stage_environ() if env is None else env).get("OPENCODE_REPO_ROOT", "").strip()
     if env_root:
         try:
             return normalize_absolute_path(env_root, purpose="OPENCODE_REPO_ROOT"), "env"
@@ -420,8 +442,11 @@ def _verify_workspace_session_exists(workspaces_home: Path, repo_fingerprint: st
     return True, "ok"
 
 
-def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
+def run_persistence_hook(
+    *, repo_root: Path | None = None, env: Mapping[str, str] | None = None
+) -> dict[str, object]:
     install_global_handlers()
+    stage_env = stage_environ() if env is None else env
     commands_home = COMMANDS_HOME
     
     if commands_home is None or str(commands_home).strip() == "" or not commands_home.is_absolute():
@@ -480,7 +505,7 @@ def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
             "writes_allowed": False,
         })
 
-    resolved_root, root_source = _resolve_repo_root_ssot(repo_root)
+    resolved_root, root_source = _resolve_repo_root_ssot(repo_root, env=stage_env)
     
     if resolved_root is None:
         emit_gate_failure(
@@ -519,7 +544,7 @@ def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
         )
         return _with_log_path(result)
 
-    repo_fp = derive_repo_fingerprint(resolved_root)
+    repo_fp = derive_repo_fingerprint(resolved_root, env=stage_env)
 
     set_error_context(ErrorContext(
         repo_fingerprint=repo_fp,
@@ -575,7 +600,7 @@ def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
     if workspaces_home is None:
         workspaces_home = commands_home.parent / "workspaces"
 
-    local_root_env = os.environ.get("OPENCODE_LOCAL_ROOT", "").strip()
+    local_root_env = stage_env.get("OPENCODE_LOCAL_ROOT", "").strip()
     bootstrap_candidates: list[Path] = []
     if local_root_env:
         bootstrap_candidates.append(Path(local_root_env) / "governance_runtime" / "entrypoints" / "bootstrap_session_state.py")
@@ -629,7 +654,10 @@ def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
     ]
 
     try:
-        proc = _run_bootstrap_dispatch(command=cmd, cwd=resolved_root)
+        if inprocess_enabled(stage_env):
+            proc = InProcessRunner(base_env=stage_env).run_with_context(cmd, ExecutionContext(cwd=resolved_root))
+        else:
+            proc = _run_bootstrap_dispatch(command=cmd, cwd=resolved_root)
         if proc.returncode == 0:
             pointer_ok, pointer_reason = _verify_pointer_exists(commands_home.parent, repo_fp)
             if not pointer_ok:
@@ -784,8 +812,10 @@ def run_persistence_hook(*, repo_root: Path | None = None) -> dict[str, object]:
     return _with_log_path(result, repo_fingerprint=repo_fp if isinstance(locals().get("repo_fp"), str) else None)
 
 
-def main() -> int:
-    result = run_persistence_hook()
+def main(env: Mapping[str, str] | None = None) -> int:
+    stage_env = stage_environ() if env is None else env
+    _bind_environment(stage_env)
+    result = run_persistence_hook(env=stage_env)
     print(json.dumps(result, ensure_ascii=True))
     
     if result.get("workspacePersistenceHook") == "failed":
@@ -38,6 +38,12 @@ from governance_runtime.engine.business_rules_hydration import (
 )
 from governance_runtime.kernel.phase_kernel import api_in_scope
 from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
+from governance_runtime.infrastructure.stage_environment import stage_environ
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    ExecutionContext,
+    InProcessRunner,
+    inprocess_enabled,
+)
 
 try:
     from bootstrap.repo_identity import derive_fingerprint as _derive_fingerprint_ssot
@@ -65,8 +71,8 @@ def _effective_mode() -> str:
     return EFFECTIVE_MODE
 
 
-def _resolve_bindings() -> tuple[Path | None, Path | None, bool, Path | None, str]:
-    resolver = BindingEvidenceResolver(env=os.environ)
+def _resolve_bindings(env: Mapping[str, str] | None = None) -> tuple[Path | None, Path | None, bool, Path | None, str]:
+    resolver = BindingEvidenceResolver(env=stage_environ() if env is None else env)
     effective_mode = _effective_mode()
     evidence = resolver.resolve(mode=effective_mode)
     python_command = evidence.python_command.strip() if evidence.python_command else ""
@@ -81,12 +87,21 @@ def _resolve_bindings() -> tuple[Path | None, Path | None, bool, Path | None, st
     )
 
 
+def _tool_catalog_path(commands_home: Path | None) -> Path | None:
+    if commands_home is None:
+        return None
+    return commands_home / "governance" / "assets" / "catalogs" / "tool_requirements.json"
+
+
 COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND = _resolve_bindings()
-TOOL_CATALOG = (
-    COMMANDS_HOME / "governance" / "assets" / "catalogs" / "tool_requirements.json"
-    if COMMANDS_HOME is not None
-    else None
-)
+TOOL_CATALOG = _tool_catalog_path(COMMANDS_HOME)
+
+
+def _bind_environment(env: Mapping[str, str]) -> None:
+    """Re-resolve the module bindings for the stage environment ``env``."""
+    global COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND, TOOL_CATALOG
+    COMMANDS_HOME, WORKSPACES_HOME, BINDING_OK, BINDING_EVIDENCE_PATH, PYTHON_COMMAND = _resolve_bindings(env)
+    TOOL_CATALOG = _tool_catalog_path(COMMANDS_HOME)
 
 HOOK_STATUS_OK = "ok"
 HOOK_STATUS_BLOCKED = "blocked"
@@ -354,8 +369,8 @@ def _preflight_build_toolchain_snapshot() -> dict[str, object]:
     }
 
 
-def emit_preflight() -> None:
-    if os.getenv("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
+def emit_preflight(env: Mapping[str, str] | None = None) -> None:
+    if (stage_environ() if env is None else env).get("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
         return
     required_now, required_later, _required_later_entries = _tool_inventory()
 
@@ -405,8 +420,8 @@ def emit_preflight() -> None:
     print(json.dumps(payload, ensure_ascii=True))
 
 
-def emit_permission_probes() -> None:
-    if os.getenv("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
+def emit_permission_probes(env: Mapping[str, str] | None = None) -> None:
+    if (stage_environ() if env is None else env).get("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
         return
     checks = [
         {
@@ -467,8 +482,9 @@ def bootstrap_command(repo_fp: str | None) -> str:
     return str(render_command_profiles(bootstrap_command_argv(repo_fp)).get("bash") or "")
 
 
-def _resolve_repo_root_for_hook() -> tuple[Path | None, str, dict[str, object]]:
-    env_root = os.environ.get("OPENCODE_REPO_ROOT", "").strip()
+def _resolve_repo_root_for_hook(env: Mapping[str, str] | None = None) -> tuple[Path | None, str, dict[str, object]]:
+    source_env = stage_environ() if env is None else env
+    env_root = source_env.get("OPENCODE_REPO_ROOT", "").strip()
     if env_root:
         try:
             resolved_env_root = _normalize_abs_path(env_root, purpose="OPENCODE_REPO_ROOT")
@@ -635,8 +651,9 @@ def _clear_stale_failure_metadata(payload: dict[str, object]) -> None:
         payload.pop(key, None)
 
 
-def run_persistence_hook() -> dict[str, object]:
-    output_mode = os.getenv("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower()
+def run_persistence_hook(env: Mapping[str, str] | None = None) -> dict[str, object]:
+    stage_env = stage_environ() if env is None else env
+    output_mode = stage_env.get("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower()
     mode = _effective_mode()
     hook_argv = [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_persistence_hook"]
     _hook_profiles = render_command_profiles(hook_argv)
@@ -672,7 +689,7 @@ def run_persistence_hook() -> dict[str, object]:
             print(json.dumps(result, ensure_ascii=True))
         return result
 
-    repo_root, repo_root_source, git_probe = _resolve_repo_root_for_hook()
+    repo_root, repo_root_source, git_probe = _resolve_repo_root_for_hook(stage_env)
     base_payload = {
         "cwd": str(Path.cwd()),
         "repo_root_detected": str(repo_root) if repo_root else "",
@@ -706,23 +723,33 @@ def run_persistence_hook() -> dict[str, object]:
             print(json.dumps(result, ensure_ascii=True))
         return result
 
-    env = dict(os.environ)
-    env["OPENCODE_REPO_ROOT"] = str(repo_root)
-    existing_pythonpath = env.get("PYTHONPATH", "").strip()
     repo_root_token = str(repo_root)
     commands_home_token = str(COMMANDS_HOME)
-    if existing_pythonpath:
-        env["PYTHONPATH"] = os.pathsep.join((repo_root_token, commands_home_token, existing_pythonpath))
+    if inprocess_enabled(stage_env):
+        proc = InProcessRunner(base_env=stage_env).run_with_context(
+            hook_argv,
+            ExecutionContext(
+                env_overrides={"OPENCODE_REPO_ROOT": repo_root_token},
+                cwd=repo_root,
+                sys_path=(repo_root_token, commands_home_token),
+            ),
+        )
     else:
-        env["PYTHONPATH"] = os.pathsep.join((repo_root_token, commands_home_token))
-    proc = subprocess.run(
-        hook_argv,
-        capture_output=True,
-        text=True,
-        check=False,
-        cwd=str(repo_root),
-        env=env,
-    )
+        hook_env = dict(stage_env)
+        hook_env["OPENCODE_REPO_ROOT"] = repo_root_token
+        existing_pythonpath = hook_env.get("PYTHONPATH", "").strip()
+        if existing_pythonpath:
+            hook_env["PYTHONPATH"] = os.pathsep.join((repo_root_token, commands_home_token, existing_pythonpath))
+        else:
+            hook_env["PYTHONPATH"] = os.pathsep.join((repo_root_token, commands_home_token))
+        proc = subprocess.run(
+            hook_argv,
+            capture_output=True,
+            text=True,
+            check=False,
+            cwd=str(repo_root),
+            env=hook_env,
+        )
 
     stdout_lines = [(line or "").strip() for line in (proc.stdout or "").splitlines() if (line or "").strip()]
     parsed_payload: dict[str, object] | None = None
@@ -798,9 +825,10 @@ def run_persistence_hook() -> dict[str, object]:
     return result
 
 
-def emit_start_receipt() -> None:
+def emit_start_receipt(env: Mapping[str, str] | None = None) -> None:
     """Emit forensic receipt for desktop dispatch debugging."""
-    repo_root, repo_root_source, _probe = _resolve_repo_root_for_hook()
+    stage_env = stage_environ() if env is None else env
+    repo_root, repo_root_source, _probe = _resolve_repo_root_for_hook(stage_env)
     repo_fp = derive_repo_fingerprint(repo_root) if repo_root is not None else None
     planned_pointer_path = (COMMANDS_HOME.parent / "SESSION_STATE.json") if COMMANDS_HOME is not None else None
     planned_workspace_path = (WORKSPACES_HOME / repo_fp / "SESSION_STATE.json") if (repo_fp and WORKSPACES_HOME is not None) else None
@@ -812,8 +840,8 @@ def emit_start_receipt() -> None:
             "file": __file__,
             "executable": sys.executable,
             "sys_path_0_3": sys.path[:3],
-            "env_opencode_config_root": os.environ.get("OPENCODE_CONFIG_ROOT", ""),
-            "env_opencode_home": os.environ.get("OPENCODE_HOME", ""),
+            "env_opencode_config_root": stage_env.get("OPENCODE_CONFIG_ROOT", ""),
+            "env_opencode_home": stage_env.get("OPENCODE_HOME", ""),
             "computed_opencode_home": str(COMMANDS_HOME.parent) if COMMANDS_HOME is not None else None,
             "computed_commands_home": str(COMMANDS_HOME) if COMMANDS_HOME is not None else None,
             "computed_workspaces_home": str(WORKSPACES_HOME) if WORKSPACES_HOME is not None else None,
@@ -1176,7 +1204,7 @@ def _hydrate_transition_state(
         profile_id = DEFAULT_ACTIVE_PROFILE_ID
     state["ActiveProfile"] = f"profile.{profile_id}"
     if profile_override:
-        source = "workspace-config" if os.environ.get("OPENCODE_WORKSPACE_CONFIG") else "tenant-config"
+        source = "workspace-config" if stage_environ().get("OPENCODE_WORKSPACE_CONFIG") else "tenant-config"
         tenant = load_tenant_config()
         state["ProfileSource"] = source
         state["ProfileEvidence"] = f"{source}://{tenant.tenant_id if tenant else 'unknown'}/profile.{profile_id}"
@@ -1477,23 +1505,25 @@ def run_kernel_continuation(hook_result: Mapping[str, object]) -> dict[str, obje
     return payload
 
 
-def main() -> int:
-    if os.getenv("OPENCODE_FORCE_READ_ONLY", "").strip() == "1":
+def main(env: Mapping[str, str] | None = None) -> int:
+    stage_env = stage_environ() if env is None else env
+    if stage_env.get("OPENCODE_FORCE_READ_ONLY", "").strip() == "1":
         raise SystemExit(2)
-    if os.getenv("OPENCODE_BOOTSTRAP_VERBOSE", "").strip() == "1":
-        emit_start_receipt()
-    emit_preflight()
-    emit_permission_probes()
-    hook_result = run_persistence_hook()
+    _bind_environment(stage_env)
+    if stage_env.get("OPENCODE_BOOTSTRAP_VERBOSE", "").strip() == "1":
+        emit_start_receipt(stage_env)
+    emit_preflight(stage_env)
+    emit_permission_probes(stage_env)
+    hook_result = run_persistence_hook(stage_env)
     payload = run_kernel_continuation(hook_result)
-    if os.getenv("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
+    if stage_env.get("OPENCODE_BOOTSTRAP_OUTPUT", "final").strip().lower() != "full":
         print(json.dumps(payload, ensure_ascii=True))
     hook_status = str(hook_result.get("workspacePersistenceHook") or "").strip().lower()
     if hook_status and hook_status != HOOK_STATUS_OK:
         raise SystemExit(2)
     if payload.get("kernelContinuation") != "ok":
         raise SystemExit(2)
-    if os.getenv("OPENCODE_ENGINE_SHADOW_EMIT") == "1":
+    if stage_env.get("OPENCODE_ENGINE_SHADOW_EMIT") == "1":
         print(json.dumps({"engineRuntimeShadow": build_engine_shadow_snapshot()}, ensure_ascii=True))
     return 0
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import Mapping
 
 SCRIPT_DIR = Path(os.path.abspath(__file__)).parent
 if str(SCRIPT_DIR) not in sys.path:
@@ -50,8 +51,8 @@ _BOOTSTRAP_REQUIRED_TOKENS = (
 )
 
 
-def main() -> int:
-    return _service_main()
+def main(env: Mapping[str, str] | None = None) -> int:
+    return _service_main(env=env)
 
 
 if __name__ == "__main__":
@@ -30,6 +30,8 @@ Exit Codes:
 Environment Variables:
     OPENCODE_FORCE_READ_ONLY: Set to "1" to block all writes
     OPENCODE_CONFIG_ROOT: Override config root location
+    OPENCODE_BOOTSTRAP_ISOLATION: "inprocess" runs the artifact backfill
+        inside this interpreter instead of a child process
 """
 from __future__ import annotations
 
@@ -47,6 +49,7 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Mapping
 
 SCRIPT_DIR = Path(os.path.abspath(__file__)).parent
 if str(SCRIPT_DIR) not in sys.path:
@@ -59,14 +62,16 @@ from governance_runtime.entrypoints.write_policy import EFFECTIVE_MODE, is_write
 try:
     from bootstrap.repo_identity import resolve_repo_root_ssot
 except Exception:
-    def resolve_repo_root_ssot(explicit_root: Path | None = None) -> tuple[Path | None, str]:
+    def resolve_repo_root_ssot(
+        explicit_root: Path | None = None, *, env: Mapping[str, str] | None = None
+    ) -> tuple[Path | None, str]:
         if explicit_root is not None:
             try:
                 return normalize_absolute_path(str(explicit_root), purpose="explicit_repo_root"), "explicit"
             except Exception:
                 return None, "invalid-explicit"
 
-        env_root = os.environ.get("OPENCODE_REPO_ROOT", "").strip()
+        env_root = (stage_environ() if env is None else env).get("OPENCODE_REPO_ROOT", "").strip()
         if env_root:
             try:
                 return normalize_absolute_path(env_root, purpose="OPENCODE_REPO_ROOT"), "env"
@@ -119,6 +124,11 @@ from governance_runtime.infrastructure.logging.global_error_handler import (
     install_global_handlers,
     set_error_context,
 )
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    InProcessRunner,
+    inprocess_enabled,
+)
+from governance_runtime.infrastructure.stage_environment import stage_environ
 
 
 def _writes_allowed() -> bool:
@@ -212,7 +222,7 @@ def _load_binding_paths(paths_file: Path, *, expected_config_root: Path | None =
     return config_root, paths
 
 
-def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
+def resolve_binding_config(explicit: Path | None, *, env: Mapping[str, str] | None = None) -> tuple[Path, dict, Path]:
     """Resolve the binding configuration paths.
     
     Searches for governance.paths.json in the following order:
@@ -223,6 +233,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
     
     Args:
         explicit: Optional explicit config root path from --config-root.
+        env: Stage environment; defaults to the process environment.
     
     Returns:
         Tuple of (config_root, paths_dict, binding_file_path).
@@ -230,6 +241,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
     Raises:
         ValueError: If binding file not found or invalid.
     """
+    source_env = stage_environ() if env is None else env
     if explicit is not None:
         root = normalize_absolute_path(str(explicit), purpose="explicit_config_root")
         candidate = root / "governance.paths.json"
@@ -238,7 +250,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
         config_root, paths = _load_binding_paths(candidate, expected_config_root=root)
         return config_root, paths, candidate
 
-    env_commands_home = os.environ.get("COMMANDS_HOME")
+    env_commands_home = source_env.get("COMMANDS_HOME")
     if env_commands_home:
         try:
             commands_home = normalize_absolute_path(env_commands_home, purpose="COMMANDS_HOME env")
@@ -252,7 +264,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
         except Exception:
             pass
 
-    internal_root = os.environ.get("OPENCODE_INTERNAL_BOOTSTRAP_CONFIG_ROOT")
+    internal_root = source_env.get("OPENCODE_INTERNAL_BOOTSTRAP_CONFIG_ROOT")
     if internal_root:
         root = normalize_absolute_path(internal_root, purpose="env:OPENCODE_INTERNAL_BOOTSTRAP_CONFIG_ROOT")
         candidate = root / "governance.paths.json"
@@ -261,7 +273,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict, Path]:
         config_root, paths = _load_binding_paths(candidate, expected_config_root=root)
         return config_root, paths, candidate
 
-    env_value = os.environ.get("OPENCODE_CONFIG_ROOT")
+    env_value = source_env.get("OPENCODE_CONFIG_ROOT")
     if env_value:
         root = normalize_absolute_path(env_value, purpose="env:OPENCODE_CONFIG_ROOT")
         candidate = root / "governance.paths.json"
@@ -405,11 +417,12 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
+def main(env: Mapping[str, str] | None = None) -> int:
     install_global_handlers()
+    stage_env = stage_environ() if env is None else env
     args = parse_args()
     allow_internal_skip = (
-        os.environ.get("OPENCODE_INTERNAL_ALLOW_SKIP_ARTIFACT_BACKFILL", "0") == "1"
+        stage_env.get("OPENCODE_INTERNAL_ALLOW_SKIP_ARTIFACT_BACKFILL", "0") == "1"
         or args.no_commit
     )
     
@@ -427,7 +440,7 @@ def main() -> int:
         return 2
     
     try:
-        config_root, binding_paths, _binding_file = resolve_binding_config(args.config_root)
+        config_root, binding_paths, _binding_file = resolve_binding_config(args.config_root, env=stage_env)
     except ValueError as exc:
         emit_gate_failure(
             gate="BOOTSTRAP",
@@ -450,7 +463,7 @@ def main() -> int:
         purpose="paths.commandsHome",
     )
 
-    repo_root, _repo_root_source = resolve_repo_root_ssot(args.repo_root)
+    repo_root, _repo_root_source = resolve_repo_root_ssot(args.repo_root, env=stage_env)
     if repo_root is None:
         emit_gate_failure(
             gate="BOOTSTRAP",
@@ -648,7 +661,7 @@ def main() -> int:
     created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
     service = BootstrapPersistenceService(
         fs=_GovernanceFSAdapter(),
-        runner=_GovernanceRunnerAdapter(),  # type: ignore[arg-type]
+        runner=InProcessRunner(base_env=stage_env) if inprocess_enabled(stage_env) else _GovernanceRunnerAdapter(),  # type: ignore[arg-type]
         logger=_GovernanceLoggerAdapter(
             config_root=config_root,
             workspaces_home=workspaces_home,
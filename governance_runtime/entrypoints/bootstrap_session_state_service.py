@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Mapping
 
 if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
@@ -44,8 +45,8 @@ except Exception:  # pragma: no cover
     from bootstrap_session_state_orchestrator import main as _orchestrator_main  # type: ignore
 
 
-def main() -> int:
-    return _orchestrator_main()
+def main(env: Mapping[str, str] | None = None) -> int:
+    return _orchestrator_main(env=env)
 
 
 if __name__ == "__main__":
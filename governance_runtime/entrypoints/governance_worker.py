@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Governance Worker — drain deferred post-archive governance jobs.
+
+``/new`` only enqueues the post-archive governance pipeline (see
+``infrastructure/governance_job_queue``). This entrypoint runs the queued
+jobs for one workspace, or reports the queue status.
+
+Usage:
+    python -m governance_runtime.entrypoints.governance_worker \\
+        [--workspace /path/to/workspaces/<fingerprint>] \\
+        [--max-jobs N] [--status]
+
+Without ``--workspace`` the workspace of the active session is used.
+Output is JSON on stdout; the exit code is non-zero only when the workspace
+cannot be resolved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
+
+from governance_runtime.infrastructure.governance_job_queue import (
+    drain_governance_jobs,
+    governance_queue_status,
+)
+from governance_runtime.infrastructure.workspace_paths import governance_jobs_dir
+
+
+def _active_workspace_dir() -> Path:
+    from governance_runtime.infrastructure.session_locator import resolve_active_session_paths
+
+    session_path, _, _, _ = resolve_active_session_paths()
+    return session_path.parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run deferred post-archive governance jobs")
+    parser.add_argument("--workspace", default="", help="Workspace directory (default: active session workspace)")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Stop after this many jobs")
+    parser.add_argument("--status", action="store_true", help="Only report queue status")
+    args = parser.parse_args(argv)
+
+    try:
+        workspace = Path(args.workspace) if args.workspace else _active_workspace_dir()
+    except Exception as exc:
+        print(json.dumps({"status": "error", "error": str(exc)}, ensure_ascii=True))
+        return 2
+
+    queue_dir = governance_jobs_dir(workspace.parent, workspace.name)
+    payload: dict[str, object] = {"status": "ok"}
+    if not args.status:
+        payload["drain"] = asdict(drain_governance_jobs(queue_dir, max_jobs=args.max_jobs))
+    payload["queue"] = governance_queue_status(queue_dir)
+    print(json.dumps(payload, ensure_ascii=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
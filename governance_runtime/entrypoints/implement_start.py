@@ -12,7 +12,6 @@ events). Domain/source changes must come from the external LLM executor.
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import os
 import shlex
@@ -27,6 +26,7 @@ if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
 
 from governance_runtime.application.services.state_accessor import get_active_gate, get_phase
+from governance_runtime.application.validators.validator_path import ensure_validators_importable
 from governance_runtime.contracts.enforcement import require_complete_contracts
 from governance_runtime.engine.implementation_validation import (
     CheckResult,
@@ -57,6 +57,12 @@ from governance_runtime.infrastructure.governance_config_loader import get_pipel
 from governance_runtime.infrastructure.plan_record_state import resolve_plan_record_signal
 from governance_runtime.infrastructure.session_locator import resolve_active_session_paths
 from governance_runtime.infrastructure.time_utils import now_iso as _now_iso
+from governance_runtime.infrastructure.workspace_change_tracker import (
+    WorkspaceChangeTracker,
+    normalize_rel_path,
+    open_change_watcher,
+)
+from governance_runtime.shared.perf_trace import subprocess_span
 
 
 def _resolve_active_session_path() -> tuple[Path, Path]:
@@ -355,40 +361,70 @@ def _repo_root(session_path: Path, state: Mapping[str, object]) -> Path:
 
 def _parse_changed_files_from_git_status(repo_root: Path) -> list[str]:
     try:
-        probe = subprocess.run(
-            ["git", "-C", str(repo_root), "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        with subprocess_span("implement.git_status"):
+            probe = subprocess.run(
+                ["git", "-C", str(repo_root), "status", "--porcelain", "--untracked-files=all"],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
     except OSError:
         return []
     if probe.returncode != 0:
         return []
+    return _porcelain_paths(str(probe.stdout or ""))
+
+
+def _porcelain_paths(stdout: str) -> list[str]:
     changed_files: list[str] = []
-    for raw in str(probe.stdout or "").splitlines():
+    for raw in stdout.splitlines():
         if len(raw) < 4:
             continue
         changed_files.append(raw[3:].strip().replace("\\", "/"))
     return sorted(set(changed_files))
 
 
-def _file_sha256(path: Path) -> str:
-    try:
-        data = path.read_bytes()
-    except Exception:
-        return ""
-    return hashlib.sha256(data).hexdigest()
+def _git_status_of_paths(repo_root: Path, paths: list[str]) -> list[str]:
+    """Return the subset of ``paths`` that ``git status`` reports as changed.
 
+    Watcher events only say a path was written; restricting ``git status`` to
+    those paths applies the same ignore rules and index comparison as the
+    full-tree probe, so touched, ignored or rewritten-unchanged files drop out.
+    """
+
+    changed_files: list[str] = []
+    for start in range(0, len(paths), 256):
+        try:
+            with subprocess_span("implement.git_status"):
+                probe = subprocess.run(
+                    [
+                        "git",
+                        "--literal-pathspecs",
+                        "-C",
+                        str(repo_root),
+                        "status",
+                        "--porcelain",
+                        "--untracked-files=all",
+                        "--",
+                        *paths[start : start + 256],
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+        except OSError:
+            return []
+        if probe.returncode != 0:
+            return []
+        changed_files.extend(_porcelain_paths(str(probe.stdout or "")))
+    return sorted(set(changed_files))
 
-def _capture_hotspot_hashes(repo_root: Path, hotspots: list[str]) -> dict[str, str]:
-    out: dict[str, str] = {}
-    for token in hotspots:
-        rel = str(token or "").strip().replace("\\", "/")
-        if not rel or rel.startswith(".."):
-            continue
-        out[rel] = _file_sha256(repo_root / rel)
-    return out
+
+def _change_tracker(repo_root: Path) -> WorkspaceChangeTracker:
+    return WorkspaceChangeTracker(
+        repo_root,
+        cache_path=repo_root / ".governance" / "implementation" / "change_tracker_cache.json",
+    )
 
 
 def _has_active_desktop_llm_binding() -> bool:
@@ -561,7 +597,11 @@ def _run_llm_edit_step(
     _write_text_atomic(context_file, json.dumps(context, ensure_ascii=True, indent=2) + "\n")
 
     before_changed = set(_parse_changed_files_from_git_status(repo_root))
-    before_hotspot_hashes = _capture_hotspot_hashes(repo_root, required_hotspots)
+    tracker = _change_tracker(repo_root)
+    tracked_surface = sorted(
+        {normalize_rel_path(token) for token in [*required_hotspots, *before_changed]} - {""}
+    )
+    before_snapshot = tracker.snapshot(tracked_surface)
 
     bridge_mode = False
     if not executor_cmd:
@@ -612,14 +652,21 @@ def _run_llm_edit_step(
     if "{context_file}" in final_cmd:
         final_cmd = final_cmd.replace("{context_file}", shlex.quote(str(context_file)))
 
-    result = subprocess.run(
-        final_cmd,
-        shell=True,
-        cwd=str(repo_root),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    watcher = open_change_watcher(repo_root, os.environ)
+    try:
+        with subprocess_span("implement.executor"):
+            result = subprocess.run(
+                final_cmd,
+                shell=True,
+                cwd=str(repo_root),
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+    finally:
+        watched_changes = watcher.close() if watcher is not None else None
+    if watcher is not None and not watcher.complete:
+        watched_changes = None
     _write_text_atomic(stdout_file, str(result.stdout or ""))
     _write_text_atomic(stderr_file, str(result.stderr or ""))
 
@@ -630,7 +677,7 @@ def _run_llm_edit_step(
     if bridge_mode:
         response_valid = True
     elif response_text and response_text.startswith("{"):
-        sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "governance_runtime" / "application" / "validators"))
+        ensure_validators_importable()
         try:
             from llm_response_validator import validate_developer_response
             parsed = json.loads(response_text)
@@ -645,15 +692,20 @@ def _run_llm_edit_step(
         if response_text:
             validation_violations = ["response-not-structured-json"]
 
-    after_changed = set(_parse_changed_files_from_git_status(repo_root))
-    delta_changed = sorted(after_changed - before_changed)
-    after_hotspot_hashes = _capture_hotspot_hashes(repo_root, required_hotspots)
-    hotspot_changed = sorted(
-        path
-        for path in sorted(set(before_hotspot_hashes).union(after_hotspot_hashes))
-        if before_hotspot_hashes.get(path, "") != after_hotspot_hashes.get(path, "")
+    if watched_changes is not None:
+        watched = sorted(
+            {normalize_rel_path(path) for path in watched_changes if not path.startswith(".governance/")} - {""}
+        )
+        after_changed = set(_git_status_of_paths(repo_root, watched)) if watched else set()
+    else:
+        after_changed = set(_parse_changed_files_from_git_status(repo_root))
+    delta_changed = sorted(
+        path for path in after_changed - before_changed if not path.startswith(".governance/")
     )
-    changed_files = sorted(set(delta_changed).union(hotspot_changed))
+    after_snapshot = tracker.snapshot([*tracked_surface, *delta_changed])
+    content_changes = tracker.diff(before_snapshot, after_snapshot)
+    tracker.save()
+    changed_files = [change.path for change in content_changes]
     return {
         "executor_invoked": True,
         "exit_code": int(result.returncode),
@@ -662,6 +714,7 @@ def _run_llm_edit_step(
         "stdout_path": str(stdout_file),
         "stderr_path": str(stderr_file),
         "changed_files": changed_files,
+        "change_stats": {change.path: change.to_dict() for change in content_changes},
         "response_valid": response_valid,
         "validation_violations": validation_violations,
         "bridge_mode": bridge_mode,
@@ -688,7 +741,8 @@ def _run_targeted_checks(repo_root: Path, requirements: list[dict[str, object]])
         return (), False
 
     command = ["python3", "-m", "pytest", "-q", *tests]
-    result = subprocess.run(command, cwd=str(repo_root), capture_output=True, text=True, check=False)
+    with subprocess_span("implement.targeted_checks"):
+        result = subprocess.run(command, cwd=str(repo_root), capture_output=True, text=True, check=False)
     output_file = repo_root / ".governance" / "implementation" / "targeted_checks.log"
     output = (result.stdout or "") + ("\n" if result.stdout and result.stderr else "") + (result.stderr or "")
     _write_text_atomic(output_file, output)
@@ -1107,6 +1161,8 @@ def start_implementation(
     state["implementation_changed_files"] = list(report.changed_files)
     state["implementation_domain_changed_files"] = list(report.domain_changed_files)
     state["implementation_required_hotspots"] = required_hotspots
+    change_stats = llm_result.get("change_stats")
+    state["implementation_change_stats"] = dict(change_stats) if isinstance(change_stats, Mapping) else {}
     state["implementation_llm_step_executed"] = report.executor_invoked
     state["implementation_execution_status"] = "review_complete" if report.is_compliant else "blocked"
     state["implementation_status"] = "ready_for_review" if report.is_compliant else "blocked"
@@ -1218,4 +1274,6 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from governance_runtime.infrastructure.perf_profile import run_profiled
+
+    raise SystemExit(run_profiled("implement-start", main))
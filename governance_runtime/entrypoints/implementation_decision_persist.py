@@ -344,4 +344,6 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from governance_runtime.infrastructure.perf_profile import run_profiled
+
+    raise SystemExit(run_profiled("implementation-decision-persist", main))
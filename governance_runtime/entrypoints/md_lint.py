@@ -24,14 +24,22 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import fnmatch
 import hashlib
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Sequence
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
+
+from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -59,6 +67,20 @@ class Finding:
             "message": self.message,
         }
 
+    @classmethod
+    def from_dict(cls, payload: dict) -> "Finding":
+        return cls(
+            rule_id=payload["rule_id"],
+            severity=payload["severity"],
+            file_path=payload["file"],
+            line=int(payload["line"]),
+            column=int(payload["col"]),
+            match=payload["match"],
+            snippet_hash=payload["snippet_hash"],
+            context_hash=payload["context_hash"],
+            message=payload["message"],
+        )
+
 
 @dataclass
 class Rule:
@@ -363,98 +385,259 @@ def should_check_file(file_path: Path) -> bool:
     return True
 
 
-def lint_file(file_path: Path, rules: Sequence[Rule] = RULES) -> list[Finding]:
-    """Lint a single file and return findings."""
-    findings: list[Finding] = []
-    
-    if not should_check_file(file_path):
-        return findings
-    
+LINT_ENGINE_VERSION = "2"
+LINT_CACHE_SCHEMA = "md-lint-cache.v1"
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A rule with its patterns and exceptions precompiled."""
+    rule: Rule
+    prefilter: re.Pattern[str]
+    patterns: tuple[re.Pattern[str], ...]
+    exceptions: re.Pattern[str] | None
+
+
+@dataclass(frozen=True)
+class CompiledRuleset:
+    """All rules compiled once; ``prefilter`` matches a line iff any rule pattern does."""
+    rules: tuple[CompiledRule, ...]
+    prefilter: re.Pattern[str]
+    digest: str
+
+
+def _alternation(patterns: Sequence[str]) -> str:
+    return "|".join(f"(?:{pattern})" for pattern in patterns)
+
+
+def ruleset_hash(rules: Sequence[Rule]) -> str:
+    """Stable hash of rule definitions, used to invalidate cached results."""
+    payload = [
+        [r.rule_id, r.severity, r.message, list(r.patterns), list(r.exceptions)]
+        for r in rules
+    ]
+    blob = json.dumps([LINT_ENGINE_VERSION, payload], sort_keys=True, ensure_ascii=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def compile_rules(rules: Sequence[Rule]) -> CompiledRuleset:
+    """Compile rules into a per-line prefilter plus per-rule patterns."""
+    compiled = tuple(
+        CompiledRule(
+            rule=rule,
+            prefilter=re.compile(_alternation(rule.patterns), re.IGNORECASE),
+            patterns=tuple(re.compile(p, re.IGNORECASE) for p in rule.patterns),
+            exceptions=re.compile(_alternation(rule.exceptions), re.IGNORECASE) if rule.exceptions else None,
+        )
+        for rule in rules
+    )
+    all_patterns = [p for rule in rules for p in rule.patterns]
+    return CompiledRuleset(
+        rules=compiled,
+        prefilter=re.compile(_alternation(all_patterns), re.IGNORECASE),
+        digest=ruleset_hash(rules),
+    )
+
+
+_DEFAULT_RULESET: CompiledRuleset | None = None
+
+
+def _ruleset_for(rules: Sequence[Rule]) -> CompiledRuleset:
+    global _DEFAULT_RULESET
+    if rules is RULES:
+        if _DEFAULT_RULESET is None:
+            _DEFAULT_RULESET = compile_rules(RULES)
+        return _DEFAULT_RULESET
+    return compile_rules(rules)
+
+
+def _parse_failure(file_path: Path, exc: Exception) -> list[Finding]:
+    return [Finding(
+        rule_id="PARSE",
+        severity="error",
+        file_path=str(file_path),
+        line=0,
+        column=0,
+        match="",
+        snippet_hash="",
+        context_hash="",
+        message=f"Failed to read file: {exc}",
+    )]
+
+
+def _decode(file_path: Path, data: bytes) -> str:
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception as exc:
-        findings.append(Finding(
-            rule_id="PARSE",
-            severity="error",
-            file_path=str(file_path),
-            line=0,
-            column=0,
-            match="",
-            snippet_hash="",
-            context_hash="",
-            message=f"Failed to read file: {exc}",
-        ))
-        return findings
-    
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        # Re-read through the text layer so the reported error is unchanged.
+        return file_path.read_text(encoding="utf-8")
+    # Universal newlines, as Path.read_text applies them.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def lint_text(file_path: Path, content: str, ruleset: CompiledRuleset) -> list[Finding]:
+    """Lint already-read file content."""
     # Remove fenced blocks and comments
     checkable = remove_fenced_blocks(content)
     checkable = remove_html_comments(checkable)
-    
+
     lines = checkable.split("\n")
-    
-    for rule in rules:
-        for i, line in enumerate(lines):
-            line_num = i + 1
-            
-            for pattern in rule.patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+    per_rule: list[list[Finding]] = [[] for _ in ruleset.rules]
+    hashes: dict[int, tuple[str, str]] = {}
+
+    for i, line in enumerate(lines):
+        if not ruleset.prefilter.search(line):
+            continue
+        for slot, compiled in enumerate(ruleset.rules):
+            if not compiled.prefilter.search(line):
+                continue
+            if compiled.exceptions is not None and compiled.exceptions.search(line):
+                continue
+            for pattern in compiled.patterns:
+                match = pattern.search(line)
                 if not match:
                     continue
-                
-                # Check exceptions
-                is_exception = False
-                for exc_pattern in rule.exceptions:
-                    if re.search(exc_pattern, line, re.IGNORECASE):
-                        is_exception = True
-                        break
-                
-                if is_exception:
-                    continue
-                
-                # Get context
-                prev_line = lines[i - 1] if i > 0 else ""
-                next_line = lines[i + 1] if i < len(lines) - 1 else ""
-                
-                findings.append(Finding(
-                    rule_id=rule.rule_id,
-                    severity=rule.severity,
+                if i not in hashes:
+                    prev_line = lines[i - 1] if i > 0 else ""
+                    next_line = lines[i + 1] if i < len(lines) - 1 else ""
+                    hashes[i] = (hash_text(line), hash_context(prev_line, line, next_line))
+                snippet_hash, context_hash = hashes[i]
+                per_rule[slot].append(Finding(
+                    rule_id=compiled.rule.rule_id,
+                    severity=compiled.rule.severity,
                     file_path=str(file_path),
-                    line=line_num,
+                    line=i + 1,
                     column=match.start() + 1,
                     match=match.group(),
-                    snippet_hash=hash_text(line),
-                    context_hash=hash_context(prev_line, line, next_line),
-                    message=rule.message,
+                    snippet_hash=snippet_hash,
+                    context_hash=context_hash,
+                    message=compiled.rule.message,
                 ))
-    
-    return findings
+
+    # Report rule by rule, then by line and pattern.
+    return [finding for findings in per_rule for finding in findings]
+
+
+def _lint_path(
+    file_path: Path,
+    rules: Sequence[Rule] | None = None,
+    cached: tuple[str, list[Finding]] | None = None,
+) -> tuple[str | None, list[Finding]]:
+    """Lint one file, returning its content sha256 alongside the findings.
+
+    When ``cached`` carries a matching sha256 its findings are reused.
+    """
+    if not should_check_file(file_path):
+        return None, []
+    try:
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if cached is not None and cached[0] == digest:
+            return digest, cached[1]
+        content = _decode(file_path, data)
+    except Exception as exc:
+        return None, _parse_failure(file_path, exc)
+    return digest, lint_text(file_path, content, _ruleset_for(RULES if rules is None else rules))
+
+
+def lint_file(file_path: Path, rules: Sequence[Rule] = RULES) -> list[Finding]:
+    """Lint a single file and return findings."""
+    return _lint_path(file_path, rules)[1]
+
+
+class LintCache:
+    """Per-file lint results keyed on file sha256 and ruleset hash."""
+
+    def __init__(self, path: Path, ruleset_digest: str) -> None:
+        self.path = path
+        self.ruleset_digest = ruleset_digest
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(payload, dict)
+            and payload.get("schema") == LINT_CACHE_SCHEMA
+            and payload.get("ruleset") == ruleset_digest
+            and isinstance(payload.get("files"), dict)
+        ):
+            self._entries = payload["files"]
+
+    def get(self, file_path: Path) -> tuple[str, list[Finding]] | None:
+        entry = self._entries.get(str(file_path))
+        if not isinstance(entry, dict) or not isinstance(entry.get("sha256"), str):
+            return None
+        try:
+            findings = [Finding.from_dict(item) for item in entry.get("findings", [])]
+        except (KeyError, TypeError, ValueError):
+            return None
+        return entry["sha256"], findings
+
+    def put(self, file_path: Path, digest: str, findings: Sequence[Finding]) -> None:
+        entry = {"sha256": digest, "findings": [f.to_dict() for f in findings]}
+        if self._entries.get(str(file_path)) != entry:
+            self._entries[str(file_path)] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {"schema": LINT_CACHE_SCHEMA, "ruleset": self.ruleset_digest, "files": self._entries}
+        atomic_write_text(self.path, json.dumps(payload, sort_keys=True) + "\n")
+        self._dirty = False
 
 
 def lint_files(
     files: Sequence[Path],
     rules: Sequence[Rule] = RULES,
+    *,
+    jobs: int = 1,
+    cache: LintCache | None = None,
 ) -> list[Finding]:
-    """Lint multiple files and return all findings."""
+    """Lint multiple files and return all findings (in input order)."""
+    rule_arg = None if rules is RULES else tuple(rules)
+    cached = [cache.get(path) if cache is not None else None for path in files]
+
+    if jobs > 1 and len(files) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(
+                _lint_path, files, [rule_arg] * len(files), cached,
+                chunksize=max(1, len(files) // (jobs * 4)),
+            ))
+    else:
+        results = [_lint_path(path, rule_arg, hit) for path, hit in zip(files, cached)]
+
     all_findings: list[Finding] = []
-    
-    for file_path in files:
-        findings = lint_file(file_path, rules)
+    for file_path, (digest, findings) in zip(files, results):
+        if cache is not None and digest is not None:
+            cache.put(file_path, digest, findings)
         all_findings.extend(findings)
-    
+    if cache is not None:
+        cache.save()
     return all_findings
 
 
 def discover_md_files(root: Path, exclude: Sequence[str] = ()) -> list[Path]:
     """Discover all .md files in root."""
     files: list[Path] = []
-    exclude_set = set(exclude)
-    
-    for md_file in root.rglob("*.md"):
-        rel_path = str(md_file.relative_to(root))
-        if any(exc in rel_path for exc in exclude_set):
-            continue
-        files.append(md_file)
-    
+    exclude_set = tuple(set(exclude))
+    root_str = str(root)
+
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        rel_dir = os.path.relpath(dirpath, root_str)
+        rel_dir = "" if rel_dir == os.curdir else rel_dir + os.sep
+        # A file's relative path contains its directory's, so excluded
+        # directories can be pruned without visiting their files.
+        dirnames[:] = [d for d in dirnames if not any(exc in rel_dir + d for exc in exclude_set)]
+        for name in filenames:
+            if not fnmatch.fnmatch(name, "*.md"):
+                continue
+            if any(exc in rel_dir + name for exc in exclude_set):
+                continue
+            files.append(Path(dirpath) / name)
+
     return sorted(files)
 
 
@@ -490,6 +673,18 @@ def main() -> int:
         action="store_true",
         help="CI mode: fail-closed, JSON output, no colors",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Lint files in N parallel worker processes",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="Result cache file; unchanged files (same sha256 and ruleset) are skipped",
+    )
     
     args = parser.parse_args()
     
@@ -509,7 +704,8 @@ def main() -> int:
         return 3
     
     # Run linter
-    findings = lint_files(files)
+    cache = LintCache(args.cache, ruleset_hash(RULES)) if args.cache is not None else None
+    findings = lint_files(files, jobs=max(1, args.jobs), cache=cache)
     
     # Output
     if args.ci or args.output == "json":
@@ -7,7 +7,6 @@ import json
 import os
 import sys
 import uuid
-from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
@@ -23,7 +22,7 @@ from governance_runtime.infrastructure.session_pointer import (
     resolve_active_session_state_path,
 )
 from governance_runtime.infrastructure.work_run_archive import archive_active_run
-from governance_runtime.infrastructure.workspace_paths import run_dir
+from governance_runtime.infrastructure.workspace_paths import governance_jobs_dir, run_dir
 from governance_runtime.infrastructure.time_utils import now_iso as _now_iso
 from governance_runtime.infrastructure.json_store import load_json as _load_json
 from governance_runtime.infrastructure.json_store import append_jsonl as _append_jsonl
@@ -32,10 +31,12 @@ from governance_runtime.infrastructure.session_locator import resolve_active_ses
 from governance_runtime.application.services.state_accessor import get_next, get_phase
 
 try:
-    from governance_runtime.infrastructure.governance_hooks import run_post_archive_governance as _run_post_archive_governance
+    from governance_runtime.infrastructure.governance_job_queue import (
+        enqueue_post_archive_governance as _enqueue_post_archive_governance,
+    )
     _GOVERNANCE_AVAILABLE = True
 except Exception:
-    _run_post_archive_governance = None  # type: ignore[assignment]
+    _enqueue_post_archive_governance = None  # type: ignore[assignment]
     _GOVERNANCE_AVAILABLE = False
 try:
     from governance_runtime.entrypoints.workspace_lock import acquire_workspace_lock
@@ -302,15 +303,17 @@ def main(argv: list[str] | None = None) -> int:
             repo_fingerprint=repo_fingerprint,
             run_id=archive_id,
             observed_at=observed_at,
-            session_state_document=deepcopy(document),
-            state_view=deepcopy(state),
+            session_state_document=document,
+            state_view=state,
             write_json_atomic=_write_json_atomic,
         )
 
         # --- Governance pipeline hook (post-archive, pre-purge) ---
-        if _GOVERNANCE_AVAILABLE and _run_post_archive_governance is not None:
+        # Only enqueued here; the governance worker runs the pipeline later.
+        if _GOVERNANCE_AVAILABLE and _enqueue_post_archive_governance is not None:
             try:
-                _gov_result = _run_post_archive_governance(
+                _enqueue_post_archive_governance(
+                    governance_jobs_dir(workspaces_home, repo_fingerprint),
                     archive_path=run_dir(workspaces_home, repo_fingerprint, archive_id),
                     repo_fingerprint=repo_fingerprint,
                     run_id=archive_id,
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Mapping
 
 if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
@@ -70,8 +71,8 @@ _PERSISTENCE_FORMAT_TOKENS = """cmd = [
 """
 
 
-def main() -> int:
-    return _orchestrator_main()
+def main(env: Mapping[str, str] | None = None) -> int:
+    return _orchestrator_main(env=env)
 
 
 if __name__ == "__main__":
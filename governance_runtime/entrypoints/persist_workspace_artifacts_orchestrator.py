@@ -54,7 +54,7 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 SCRIPT_DIR = Path(os.path.abspath(__file__)).parent
 if str(SCRIPT_DIR) not in sys.path:
@@ -87,6 +87,12 @@ from governance_runtime.infrastructure.session_pointer import (
     is_session_pointer_document,
     parse_session_pointer_document,
 )
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    ExecutionContext,
+    InProcessRunner,
+    inprocess_enabled,
+)
+from governance_runtime.infrastructure.stage_environment import stage_environ
 try:
     from artifacts.backfill import (
         ArtifactSpec as ArtifactSpec,  # type: ignore[no-redef]
@@ -622,6 +628,7 @@ def _resolve_repo_root_strict(
     explicit: Path | None,
     *,
     require_git_marker: bool = True,
+    env: Mapping[str, str] | None = None,
 ) -> tuple[Path | None, str, dict[str, object]]:
     if explicit is not None:
         try:
@@ -633,7 +640,7 @@ def _resolve_repo_root_strict(
         except Exception as exc:
             return None, "explicit-invalid", {"ok": False, "source": "explicit", "error": str(exc)[:200]}
 
-    env_root = os.environ.get("OPENCODE_REPO_ROOT", "").strip()
+    env_root = (stage_environ() if env is None else env).get("OPENCODE_REPO_ROOT", "").strip()
     if env_root:
         try:
             normalized = normalize_absolute_path(env_root, purpose="OPENCODE_REPO_ROOT")
@@ -695,7 +702,9 @@ def _preferred_shell_command(profiles: dict[str, object]) -> str:
     return str(profiles.get("bash") or profiles.get("json") or "")
 
 
-def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict[str, Any], Path]:
+def resolve_binding_config(
+    explicit: Path | None, *, env: Mapping[str, str] | None = None
+) -> tuple[Path, dict[str, Any], Path]:
     """Resolve the binding configuration paths.
     
     Searches for governance.paths.json in the following order:
@@ -706,6 +715,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict[str, Any],
     
     Args:
         explicit: Optional explicit config root path from --config-root.
+        env: Stage environment; defaults to the process environment.
     
     Returns:
         Tuple of (config_root, paths_dict, binding_file_path).
@@ -713,7 +723,8 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict[str, Any],
     Raises:
         ValueError: If binding file not found or invalid.
     """
-    env_commands_home = os.environ.get("COMMANDS_HOME")
+    source_env = stage_environ() if env is None else env
+    env_commands_home = source_env.get("COMMANDS_HOME")
     if env_commands_home:
         try:
             commands_home = normalize_absolute_path(env_commands_home, purpose="COMMANDS_HOME env")
@@ -735,7 +746,7 @@ def resolve_binding_config(explicit: Path | None) -> tuple[Path, dict[str, Any],
         config_root, paths = _load_binding_paths(candidate, expected_config_root=root)
         return config_root, paths, candidate
 
-    env_value = os.environ.get("OPENCODE_CONFIG_ROOT")
+    env_value = source_env.get("OPENCODE_CONFIG_ROOT")
     if env_value:
         root = normalize_absolute_path(env_value, purpose="env:OPENCODE_CONFIG_ROOT")
         candidate = root / "governance.paths.json"
@@ -1455,6 +1466,7 @@ def _bootstrap_missing_session_state(
     python_cmd: str,
     dry_run: bool,
     read_only: bool,
+    env: Mapping[str, str] | None = None,
 ) -> tuple[bool, str]:
     """Ensure repo-scoped SESSION_STATE exists before persistence update."""
 
@@ -1482,9 +1494,16 @@ def _bootstrap_missing_session_state(
         "--skip-artifact-backfill",
         "--no-commit",
     ]
-    env = os.environ.copy()
-    env["OPENCODE_INTERNAL_ALLOW_SKIP_ARTIFACT_BACKFILL"] = "1"
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False, env=env)
+    source_env = stage_environ() if env is None else env
+    if inprocess_enabled(source_env):
+        proc = InProcessRunner(base_env=source_env).run_with_context(
+            cmd,
+            ExecutionContext(env_overrides={"OPENCODE_INTERNAL_ALLOW_SKIP_ARTIFACT_BACKFILL": "1"}),
+        )
+    else:
+        child_env = dict(source_env)
+        child_env["OPENCODE_INTERNAL_ALLOW_SKIP_ARTIFACT_BACKFILL"] = "1"
+        proc = subprocess.run(cmd, text=True, capture_output=True, check=False, env=child_env)
     if proc.returncode != 0:
         return False, f"bootstrap-failed:{proc.returncode}"
     return True, "bootstrap-created"
@@ -1520,12 +1539,13 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def main() -> int:
+def main(env: Mapping[str, str] | None = None) -> int:
     install_global_handlers()
+    stage_env = stage_environ() if env is None else env
     read_only = _read_only()
     args = parse_args()
     try:
-        config_root, binding_paths, binding_file = resolve_binding_config(args.config_root)
+        config_root, binding_paths, binding_file = resolve_binding_config(args.config_root, env=stage_env)
     except Exception as exc:
         emit_gate_failure(
             gate="PERSISTENCE",
@@ -1567,6 +1587,7 @@ def main() -> int:
     repo_root, repo_root_source, git_probe = _resolve_repo_root_strict(
         args.repo_root,
         require_git_marker=not bool(args.no_session_update),
+        env=stage_env,
     )
     if repo_root is None:
         cmd_profiles = render_command_profiles(
@@ -1768,6 +1789,7 @@ def main() -> int:
             python_cmd=python_cmd,
             dry_run=args.dry_run,
             read_only=read_only,
+            env=stage_env,
         )
         if not bootstrap_ok:
             emit_gate_failure(
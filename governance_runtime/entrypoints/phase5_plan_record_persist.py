@@ -19,6 +19,7 @@ from governance_runtime.application.use_cases.phase_router import route_phase
 from governance_runtime.application.use_cases.rework_clarification import consume_rework_clarification_state
 from governance_runtime.application.use_cases.session_state_helpers import with_kernel_result
 from governance_runtime.application.services.state_accessor import get_phase
+from governance_runtime.application.validators.validator_path import ensure_validators_importable
 from governance_runtime.application.services.phase5_presentation_contract import (
     TITLE as PHASE5_PRESENTATION_TITLE,
     build_presentation_contract,
@@ -560,7 +561,7 @@ def _parse_plan_generation_response(response_text: str, *, re_review: bool = Fal
     Validator must be importable — no fallback to manual field check.
     planOutputSchema must be present and non-empty.
     """
-    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "governance_runtime" / "application" / "validators"))
+    ensure_validators_importable()
     try:
         from llm_response_validator import validate_plan_response
     except Exception as exc:
@@ -937,7 +938,7 @@ def _parse_llm_review_response(
     Fail-closed: only structured, schema-valid JSON responses proceed.
     Non-JSON and schema-violating responses are hard-blocked with changes_requested.
     """
-    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "governance_runtime" / "application" / "validators"))
+    ensure_validators_importable()
     try:
         from llm_response_validator import validate_review_response
     except Exception:
@@ -1859,4 +1860,6 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from governance_runtime.infrastructure.perf_profile import run_profiled
+
+    raise SystemExit(run_profiled("plan-persist", main))
@@ -1,17 +1,23 @@
 #!/usr/bin/env python3
+"""Prepare the comparison basis (base/head/merge-base SHAs, diff signals) for /review.
+
+Analysis never checks out a working tree: base and head are fetched into refs
+and merge-base/diff run over the object database only. When the remote is not
+reachable directly, the fetch goes into a private ``refs/governance/review/``
+namespace ("isolated-local" mode) that is deleted afterwards.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
-import shutil
 import subprocess
-import tempfile
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from governance_runtime.contracts.enforcement import require_complete_contracts
+from governance_runtime.infrastructure.adapters.git.diff_stats import collect_diff_signals
 
 
 REASON_REMOTE_UNAVAILABLE = "BLOCKED-REVIEW-REMOTE-UNAVAILABLE"
@@ -20,6 +26,9 @@ REASON_BASE_UNRESOLVED = "BLOCKED-REVIEW-BASE-UNRESOLVED"
 REASON_HEAD_UNRESOLVED = "BLOCKED-REVIEW-HEAD-UNRESOLVED"
 REASON_MERGE_BASE_UNRESOLVED = "BLOCKED-REVIEW-MERGE-BASE-UNRESOLVED"
 
+#: Private ref namespace for object-only isolated analysis
+REVIEW_REF_NAMESPACE = "refs/governance/review"
+
 
 @dataclass(frozen=True)
 class ReviewResult:
@@ -31,6 +40,8 @@ class ReviewResult:
     files_changed: int
     reason_code: str
     message: str
+    complexity_class: str = ""
+    diff_signals: dict[str, object] = field(default_factory=dict)
 
 
 def _run_git(args: list[str], *, cwd: Path) -> subprocess.CompletedProcess[str]:
@@ -64,6 +75,11 @@ def _count_changed_files(*, repo_root: Path, base_sha: str, head_sha: str) -> in
     return len(lines)
 
 
+def _delete_refs(*, repo_root: Path, refs: list[str]) -> None:
+    for ref in refs:
+        _run_git(["update-ref", "-d", ref], cwd=repo_root)
+
+
 def _analyze_repo(*, repo_root: Path, base_ref: str, head_ref: str, mode: str) -> ReviewResult:
     base_sha = _resolve_ref(repo_root=repo_root, ref=base_ref)
     if not base_sha:
@@ -105,6 +121,7 @@ def _analyze_repo(*, repo_root: Path, base_ref: str, head_ref: str, mode: str) -
 
     merge_base_sha = merge_base.stdout.strip()
     files_changed = _count_changed_files(repo_root=repo_root, base_sha=base_sha, head_sha=head_sha)
+    signals = collect_diff_signals(repo_root, merge_base_sha, head_sha) if merge_base_sha else None
     return ReviewResult(
         status="ok",
         mode=mode,
@@ -114,6 +131,8 @@ def _analyze_repo(*, repo_root: Path, base_ref: str, head_ref: str, mode: str) -
         files_changed=files_changed,
         reason_code="none",
         message="review comparison prepared",
+        complexity_class=signals.complexity_class if signals is not None else "",
+        diff_signals=signals.to_dict() if signals is not None else {},
     )
 
 
@@ -145,6 +164,7 @@ def analyze_pr(*, repo_root: Path, remote: str, base_branch: str, head_ref: str)
             cwd=repo_root,
         )
         if fetch.returncode != 0:
+            _delete_refs(repo_root=repo_root, refs=[head_tracking])
             return ReviewResult(
                 status="blocked",
                 mode="remote",
@@ -155,29 +175,26 @@ def analyze_pr(*, repo_root: Path, remote: str, base_branch: str, head_ref: str)
                 reason_code=REASON_FETCH_FAILED,
                 message=fetch.stderr.strip() or "remote fetch failed",
             )
-        return _analyze_repo(repo_root=repo_root, base_ref=remote_base, head_ref=head_tracking, mode="remote")
-
-    temp_dir = Path(tempfile.mkdtemp(prefix="governance-review-"))
-    worktree_path = temp_dir / "worktree"
-    add = _run_git(["worktree", "add", "--detach", str(worktree_path), "HEAD"], cwd=repo_root)
-    if add.returncode != 0:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        return ReviewResult(
-            status="blocked",
-            mode="isolated-local",
-            base_sha="",
-            head_sha="",
-            merge_base_sha="",
-            files_changed=0,
-            reason_code=REASON_REMOTE_UNAVAILABLE,
-            message="remote unavailable and isolated worktree could not be created",
-        )
+        try:
+            return _analyze_repo(repo_root=repo_root, base_ref=remote_base, head_ref=head_tracking, mode="remote")
+        finally:
+            _delete_refs(repo_root=repo_root, refs=[head_tracking])
+
+    # Isolated analysis: fetch into a private ref namespace and compare objects
+    # only, so no working tree is checked out and no user-visible ref moves.
+    namespace = f"{REVIEW_REF_NAMESPACE}/{uuid.uuid4().hex[:12]}"
+    local_base = f"{namespace}/base"
+    local_head = f"{namespace}/head"
     try:
-        local_base = f"refs/remotes/{remote}/{base_branch}"
-        local_head = f"refs/remotes/{remote}/_review_head_fallback"
         fetch = _run_git(
-            ["fetch", "--prune", remote, f"+refs/heads/{base_branch}:{local_base}", f"+{head_ref}:{local_head}"],
-            cwd=worktree_path,
+            [
+                "fetch",
+                "--no-tags",
+                remote,
+                f"+refs/heads/{base_branch}:{local_base}",
+                f"+{head_ref}:{local_head}",
+            ],
+            cwd=repo_root,
         )
         if fetch.returncode != 0:
             return ReviewResult(
@@ -191,14 +208,13 @@ def analyze_pr(*, repo_root: Path, remote: str, base_branch: str, head_ref: str)
                 message=fetch.stderr.strip() or "isolated local fetch failed",
             )
         return _analyze_repo(
-            repo_root=worktree_path,
+            repo_root=repo_root,
             base_ref=local_base,
             head_ref=local_head,
             mode="isolated-local",
         )
     finally:
-        _run_git(["worktree", "remove", "--force", str(worktree_path)], cwd=repo_root)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        _delete_refs(repo_root=repo_root, refs=[local_base, local_head])
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -224,6 +240,8 @@ def main(argv: list[str] | None = None) -> int:
         "files_changed": result.files_changed,
         "reason_code": result.reason_code,
         "message": result.message,
+        "complexity_class": result.complexity_class,
+        "diff_signals": result.diff_signals,
     }
     print(json.dumps(payload, ensure_ascii=True))
     return 0 if result.status == "ok" else 2
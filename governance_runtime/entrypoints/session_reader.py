@@ -45,6 +45,9 @@ from governance_runtime.receipts.store import build_presentation_receipt
 # ---------------------------------------------------------------------------
 POINTER_SCHEMA = CANONICAL_POINTER_SCHEMA
 
+# Set to 0/off to disable the opportunistic governance job drain.
+GOVERNANCE_WORKER_ENV = "OPENCODE_GOVERNANCE_WORKER"
+
 
 # ---------------------------------------------------------------------------
 # Governance config helpers
@@ -875,7 +878,6 @@ def read_session_snapshot(commands_home: Path | None = None, *, materialize: boo
     if commands_home is None:
         commands_home = _derive_commands_home()
     _ensure_commands_home_on_syspath(commands_home)
-    from governance_runtime.infrastructure.plan_record_state import resolve_plan_record_signal
 
     try:
         config_root, pointer, session_path, state = _resolve_session_document(commands_home)
@@ -886,6 +888,31 @@ def read_session_snapshot(commands_home: Path | None = None, *, materialize: boo
             "error": str(exc),
         }
 
+    from governance_runtime.infrastructure.gate_memo_store import workspace_gate_memo
+
+    # Gate results are memoized per state slice; only the materializing
+    # (/continue) path writes the memo back.
+    with workspace_gate_memo(session_path.parent, persist=materialize):
+        return _snapshot_from_session_document(
+            commands_home=commands_home,
+            config_root=config_root,
+            pointer=pointer,
+            session_path=session_path,
+            state=state,
+            materialize=materialize,
+        )
+
+
+def _snapshot_from_session_document(
+    *,
+    commands_home: Path,
+    config_root: Path,
+    pointer: dict,
+    session_path: Path,
+    state: dict,
+    materialize: bool,
+) -> dict:
+    from governance_runtime.infrastructure.plan_record_state import resolve_plan_record_signal
     from governance_runtime.application.services.state_document_validator import validate_state_document
 
     validation_result = validate_state_document(state)
@@ -1339,10 +1366,40 @@ def read_session_snapshot(commands_home: Path | None = None, *, materialize: boo
     return snapshot
 
 
+def _governance_jobs_dir(session_path: Path) -> Path:
+    from governance_runtime.infrastructure.workspace_paths import governance_jobs_dir
+
+    workspace = session_path.parent
+    return governance_jobs_dir(workspace.parent, workspace.name)
+
+
+def _drain_governance_jobs_opportunistically(commands_home: Path) -> None:
+    """Run at most one due post-archive governance job after the readout.
+
+    Never raises and never changes the exit code; the explicit
+    ``governance_worker`` entrypoint drains whatever is left.
+    """
+    if os.environ.get(GOVERNANCE_WORKER_ENV, "").strip().lower() in {"0", "off", "false", "no"}:
+        return
+    try:
+        _, _, session_path, _ = _resolve_session_document(commands_home)
+        queue_dir = _governance_jobs_dir(session_path)
+        if not queue_dir.is_dir():
+            return
+        from governance_runtime.infrastructure.governance_job_queue import drain_governance_jobs, has_due_jobs
+
+        if has_due_jobs(queue_dir):
+            drain_governance_jobs(queue_dir, max_jobs=1)
+    except Exception:
+        return
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point."""
     commands_home: Path | None = None
     audit_mode = False
+    perf_summary_mode = False
+    governance_queue_mode = False
     debug_mode = False
     diagnose_mode = False
     materialize_mode = False
@@ -1365,6 +1422,14 @@ def main(argv: list[str] | None = None) -> int:
             audit_mode = True
             idx += 1
             continue
+        if arg == "--perf-summary":
+            perf_summary_mode = True
+            idx += 1
+            continue
+        if arg == "--governance-queue":
+            governance_queue_mode = True
+            idx += 1
+            continue
         if arg == "--debug":
             debug_mode = True
             idx += 1
@@ -1410,6 +1475,36 @@ def main(argv: list[str] | None = None) -> int:
         sys.stdout.write(json.dumps(payload, ensure_ascii=True, indent=2) + "\n")
         return 0
 
+    if perf_summary_mode:
+        home = commands_home if commands_home is not None else _derive_commands_home()
+        _ensure_commands_home_on_syspath(home)
+        try:
+            from governance_runtime.infrastructure.perf_profile import summarize_perf_log
+
+            _, _, session_path, _ = _resolve_session_document(home)
+            payload = summarize_perf_log(session_path.parent, last=tail_count)
+        except Exception as exc:
+            print("status: ERROR", file=sys.stdout)
+            print(f"error: {exc}", file=sys.stdout)
+            return 1
+        sys.stdout.write(json.dumps(payload, ensure_ascii=True, indent=2) + "\n")
+        return 0
+
+    if governance_queue_mode:
+        home = commands_home if commands_home is not None else _derive_commands_home()
+        _ensure_commands_home_on_syspath(home)
+        try:
+            from governance_runtime.infrastructure.governance_job_queue import governance_queue_status
+
+            _, _, session_path, _ = _resolve_session_document(home)
+            payload = governance_queue_status(_governance_jobs_dir(session_path))
+        except Exception as exc:
+            print("status: ERROR", file=sys.stdout)
+            print(f"error: {exc}", file=sys.stdout)
+            return 1
+        sys.stdout.write(json.dumps(payload, ensure_ascii=True, indent=2) + "\n")
+        return 0
+
     raw_snapshot = read_session_snapshot(commands_home=commands_home, materialize=materialize_mode)
     # Cast to typed Snapshot for renderer contract
     snapshot: Snapshot = {k: v for k, v in raw_snapshot.items()}
@@ -1428,8 +1523,15 @@ def main(argv: list[str] | None = None) -> int:
             if action_line:
                 rendered = rendered + action_line + "\n"
     sys.stdout.write(rendered)
+    if materialize_mode and snapshot.get("status") != "ERROR":
+        sys.stdout.flush()
+        _drain_governance_jobs_opportunistically(
+            commands_home if commands_home is not None else _derive_commands_home()
+        )
     return 0 if snapshot.get("status") != "ERROR" else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    from governance_runtime.infrastructure.perf_profile import run_profiled
+
+    raise SystemExit(run_profiled("session-reader", main))
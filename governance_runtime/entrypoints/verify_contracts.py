@@ -14,6 +14,7 @@ from governance_runtime.infrastructure.session_pointer import (
 )
 from governance_runtime.verification.runner import run_contract_verification
 from governance_runtime.infrastructure.time_utils import now_iso as _now_iso
+from governance_runtime.infrastructure.json_store import append_jsonl
 from governance_runtime.infrastructure.json_store import load_json as _load_json
 from governance_runtime.infrastructure.session_locator import resolve_active_session_paths
 
@@ -22,9 +23,7 @@ def _write_json(path: Path, payload: dict[str, object]) -> None:
     atomic_write_text(path, json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":")) + "\n")
 
 def _append_event(path: Path, event: dict[str, object]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, ensure_ascii=True, separators=(",", ":")) + "\n")
+    append_jsonl(path, event)
 
 
 def _payload(status: str, **kwargs: object) -> dict[str, object]:
@@ -36,6 +35,11 @@ def _payload(status: str, **kwargs: object) -> dict[str, object]:
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Persist contract verification completion matrix")
     parser.add_argument("--quiet", action="store_true", help="Emit JSON payload only")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-verify every requirement instead of carrying forward unchanged PASS rows",
+    )
     args = parser.parse_args(argv)
 
     try:
@@ -46,7 +50,13 @@ def main(argv: list[str] | None = None) -> int:
         state = state_obj if isinstance(state_obj, dict) else state_doc
         repo_root = Path(__file__).absolute().parents[2]
 
-        result = run_contract_verification(repo_root=repo_root)
+        previous = state.get("completion_matrix")
+        if isinstance(previous, dict) and not args.full:
+            result = run_contract_verification(repo_root=repo_root, previous_matrix=previous)
+            verification_mode = "incremental"
+        else:
+            result = run_contract_verification(repo_root=repo_root)
+            verification_mode = "full"
         ts = _now_iso()
         event_id = f"verify-{uuid.uuid4().hex}"
 
@@ -73,6 +83,7 @@ def main(argv: list[str] | None = None) -> int:
             "state_revision": str(state.get("session_materialization_event_id") or event_id),
             "source_command": "/verify-contracts",
             "status": str(result.get("status") or "FAIL"),
+            "verification_mode": verification_mode,
         }
 
         _write_json(session_path, state_doc)
@@ -87,6 +98,8 @@ def main(argv: list[str] | None = None) -> int:
                 "overall_status": str(matrix.get("overall_status") or "FAIL"),
                 "merge_allowed": bool(result.get("merge_allowed")),
                 "merge_reason": str(result.get("merge_reason") or "unknown"),
+                "verification_mode": verification_mode,
+                "carried_forward": list(result.get("carried_forward") or []),
             },
         )
 
@@ -36,7 +36,7 @@ if __package__ in {None, ""}:
     sys.path.insert(0, str(Path(__file__).absolute().parents[2]))
 
 
-import os
+from governance_runtime.infrastructure.stage_environment import stage_environ
 
 try:
     from governance_runtime.domain.policies.write_policy import compute_write_policy
@@ -55,7 +55,7 @@ except Exception:
 
 
 def effective_mode() -> str:
-    primary = os.environ.get("OPENCODE_MODE", "").strip()
+    primary = stage_environ().get("OPENCODE_MODE", "").strip()
     if primary:
         return primary
     return "user"
@@ -67,7 +67,7 @@ EFFECTIVE_MODE = effective_mode()
 def write_policy_reasons() -> tuple[str, ...]:
     reasons: list[str] = [f"mode:{effective_mode()}"]
     force_read_only = (
-        str(os.environ.get("OPENCODE_FORCE_READ_ONLY", "")).strip() == "1"
+        str(stage_environ().get("OPENCODE_FORCE_READ_ONLY", "")).strip() == "1"
     )
     policy = compute_write_policy(
         force_read_only=force_read_only,
@@ -87,7 +87,7 @@ def writes_allowed() -> bool:
         Writes are allowed by default, unless FORCE_READ_ONLY=1
     """
     force_read_only = (
-        str(os.environ.get("OPENCODE_FORCE_READ_ONLY", "")).strip() == "1"
+        str(stage_environ().get("OPENCODE_FORCE_READ_ONLY", "")).strip() == "1"
     )
     return compute_write_policy(
         force_read_only=force_read_only,
@@ -0,0 +1,119 @@
+"""Git-backed diff statistics for deterministic complexity signals.
+
+Runs a single ``git diff --numstat -p -U0`` per commit range and streams its
+output through :class:`DiffSignalCollector`. Results are cached per resolved
+``(base_sha, head_sha)`` pair in memory and, when ``cache_dir`` is given, on
+disk, so repeated classification of the same range never re-reads the diff.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+from pathlib import Path
+
+from governance_runtime.application.use_cases.diff_signals import (
+    DIFF_SIGNALS_VERSION,
+    DiffSignalCollector,
+    DiffSignalReport,
+)
+from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+
+_SHA = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+_MEMORY_CACHE: dict[tuple[str, str], DiffSignalReport] = {}
+
+
+def _resolve_commits(repo_root: Path, base: str, head: str) -> tuple[str, str] | None:
+    completed = subprocess.run(
+        ["git", "rev-parse", f"{base}^{{commit}}", f"{head}^{{commit}}"],
+        cwd=str(repo_root),
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    shas = completed.stdout.split()
+    if completed.returncode != 0 or len(shas) != 2 or not all(_SHA.fullmatch(sha) for sha in shas):
+        return None
+    return shas[0], shas[1]
+
+
+def _stream_diff(repo_root: Path, base_sha: str, head_sha: str) -> DiffSignalReport | None:
+    collector = DiffSignalCollector()
+    with subprocess.Popen(
+        [
+            "git",
+            "-c",
+            "core.quotepath=false",
+            "diff",
+            "--numstat",
+            "-p",
+            "-U0",
+            "-M",
+            "--no-color",
+            "--no-ext-diff",
+            base_sha,
+            head_sha,
+        ],
+        cwd=str(repo_root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            collector.feed(line)
+    if proc.returncode != 0:
+        return None
+    return collector.report()
+
+
+def _cache_file(cache_dir: Path, base_sha: str, head_sha: str) -> Path:
+    return cache_dir / f"{base_sha}-{head_sha}.json"
+
+
+def collect_diff_signals(
+    repo_root: Path,
+    base: str,
+    head: str,
+    *,
+    cache_dir: Path | None = None,
+    coverage_delta: float = 0.0,
+) -> DiffSignalReport | None:
+    """Return diff signals for ``base..head`` or ``None`` when git cannot answer."""
+
+    try:
+        resolved = _resolve_commits(repo_root, base, head)
+    except OSError:
+        return None
+    if resolved is None:
+        return None
+    key = resolved
+    report = _MEMORY_CACHE.get(key)
+    if report is None and cache_dir is not None:
+        try:
+            payload = json.loads(_cache_file(cache_dir, *key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if isinstance(payload, dict) and payload.get("version") == DIFF_SIGNALS_VERSION:
+            report = DiffSignalReport.from_dict(payload)
+    if report is None:
+        try:
+            report = _stream_diff(repo_root, *key)
+        except OSError:
+            return None
+        if report is None:
+            return None
+        if cache_dir is not None:
+            atomic_write_text(
+                _cache_file(cache_dir, *key),
+                json.dumps(report.to_dict(), ensure_ascii=True, sort_keys=True) + "\n",
+            )
+    _MEMORY_CACHE[key] = report
+    return report.with_coverage_delta(coverage_delta) if coverage_delta else report
+
+
+def clear_diff_signal_cache() -> None:
+    _MEMORY_CACHE.clear()
@@ -1,76 +1,86 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 from pathlib import Path
 import time
-from typing import Any
+from typing import IO, Any
 
 from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+from governance_runtime.infrastructure.adapters.logging.log_segments import (
+    handle_is_stale,
+    is_rotated_log,
+    lock_handle,
+    rotate_if_needed,
+    segment_max_bytes,
+    unlock_handle,
+)
+from governance_runtime.shared.perf_trace import count_fsync, count_write
 
 
-def _append_line_with_lock(path: Path, line: str) -> None:
+def _open_locked(path: Path, *, attempts: int, backoff_sec: float) -> IO[str]:
+    for attempt in range(attempts):
+        try:
+            handle = path.open("a+", encoding="utf-8", newline="\n")
+        except OSError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff_sec)
+            continue
+        try:
+            lock_handle(handle)
+        except OSError:
+            handle.close()
+            if attempt == attempts - 1:
+                raise
+            time.sleep(backoff_sec)
+            continue
+        if handle_is_stale(handle, path):
+            # The file was sealed into a log segment while we waited for the lock.
+            with contextlib.suppress(OSError):
+                unlock_handle(handle)
+            handle.close()
+            continue
+        return handle
+    raise OSError("unable to open jsonl target for append")
+
+
+def _append_line_with_lock(path: Path, line: str, *, fsync: bool = True) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     lock_attempts = 10
     lock_backoff_sec = 0.03
-    lock_length = 0x7FFFFFFF
-    handle = None
+    rotate_at = segment_max_bytes() if is_rotated_log(path) else 0
+    rotation_due = False
+    handle = _open_locked(path, attempts=lock_attempts, backoff_sec=lock_backoff_sec)
     try:
-        for attempt in range(lock_attempts):
-            try:
-                handle = path.open("a+", encoding="utf-8", newline="\n")
-                break
-            except OSError:
-                if attempt == lock_attempts - 1:
-                    raise
-                time.sleep(lock_backoff_sec)
-
-        if handle is None:
-            raise OSError("unable to open jsonl target for append")
-
-        for attempt in range(lock_attempts):
-            try:
-                if os.name == "nt":
-                    import msvcrt
-
-                    handle.seek(0)
-                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, lock_length)
-                else:
-                    import fcntl
-
-                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
-                break
-            except OSError:
-                if attempt == lock_attempts - 1:
-                    raise
-                time.sleep(lock_backoff_sec)
-
         for attempt in range(lock_attempts):
             try:
                 handle.seek(0, os.SEEK_END)
                 handle.write(line)
                 handle.flush()
-                os.fsync(handle.fileno())
+                count_write(len(line))
+                if fsync:
+                    os.fsync(handle.fileno())
+                    count_fsync()
+                rotation_due = rotate_at > 0 and handle.tell() >= rotate_at
                 break
             except OSError:
                 if attempt == lock_attempts - 1:
                     raise
                 time.sleep(lock_backoff_sec)
     finally:
-        if handle is not None:
-            try:
-                if os.name == "nt":
-                    import msvcrt
+        with contextlib.suppress(OSError):
+            unlock_handle(handle)
+        handle.close()
+    if rotation_due:
+        rotate_if_needed(path, max_bytes=rotate_at)
 
-                    handle.seek(0)
-                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, lock_length)
-                else:
-                    import fcntl
 
-                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
-            except OSError:
-                pass
-            handle.close()
+def append_jsonl_line(path: Path, line: str, *, fsync: bool = True) -> None:
+    """Append one JSONL line under the shared log lock (rotating workspace logs when due)."""
+
+    _append_line_with_lock(path, line, fsync=fsync)
 
 
 def write_jsonl_event(path: Path, event: dict[str, Any], *, append: bool) -> None:
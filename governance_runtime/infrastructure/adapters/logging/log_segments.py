@@ -0,0 +1,436 @@
+"""Size-based segmentation for workspace JSONL logs.
+
+``events.jsonl``, ``flow.log.jsonl``, ``boot.log.jsonl``, ``error.log.jsonl``
+and ``perf.jsonl`` stay the *active* segment that writers append to. Once an
+active file reaches the size threshold it is sealed into
+``logs/segments/<stem>.<seq>.jsonl[.gz]`` and a small per-log index records,
+for every sealed segment, the first/last timestamp, event count, run ids and
+a hash-chain link over the segment contents. Readers consult the index and
+open only the segments that overlap the requested window; the hash chain
+keeps tamper evidence across rotations.
+
+Writers and the rotator share the append lock on the active file; a writer
+that acquired the lock on a handle whose file was rotated away reopens the
+path before writing (see :func:`handle_is_stale`).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Mapping
+
+from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+
+ROTATED_LOG_NAMES: frozenset[str] = frozenset({"events.jsonl", "flow.log.jsonl", "boot.log.jsonl", "error.log.jsonl", "perf.jsonl"})
+SEGMENT_MAX_BYTES_ENV = "OPENCODE_LOG_SEGMENT_MAX_BYTES"
+SEGMENT_GZIP_ENV = "OPENCODE_LOG_SEGMENT_GZIP"
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+INDEX_SCHEMA = "governance-log-segments.v1"
+GENESIS_HASH = "0" * 64
+SEGMENTS_DIR_NAME = "segments"
+_MAX_INDEXED_RUN_IDS = 64
+_TIMESTAMP_KEYS = ("ts_utc", "observed_at", "timestamp", "ts")
+_LOCK_LENGTH = 0x7FFFFFFF
+
+
+def is_rotated_log(path: Path) -> bool:
+    return path.name in ROTATED_LOG_NAMES
+
+
+def segment_max_bytes(env: Mapping[str, str] | None = None) -> int:
+    """Rotation threshold in bytes; ``0`` disables rotation."""
+
+    raw = (env if env is not None else os.environ).get(SEGMENT_MAX_BYTES_ENV, "")
+    try:
+        value = int(str(raw).strip()) if str(raw).strip() else DEFAULT_SEGMENT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_SEGMENT_MAX_BYTES
+    return max(0, value)
+
+
+def segment_gzip_enabled(env: Mapping[str, str] | None = None) -> bool:
+    raw = str((env if env is not None else os.environ).get(SEGMENT_GZIP_ENV, "1")).strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def _stem(path: Path) -> str:
+    return path.name[: -len(".jsonl")] if path.name.endswith(".jsonl") else path.name
+
+
+def segments_dir(path: Path) -> Path:
+    return path.parent / SEGMENTS_DIR_NAME
+
+
+def index_path(path: Path) -> Path:
+    return segments_dir(path) / f"{_stem(path)}.index.json"
+
+
+def handle_is_stale(handle: IO[Any], path: Path) -> bool:
+    """True when ``handle`` no longer refers to the file at ``path`` (rotated away)."""
+
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return True
+    opened = os.fstat(handle.fileno())
+    return (opened.st_ino, opened.st_dev) != (current.st_ino, current.st_dev)
+
+
+def lock_handle(handle: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, _LOCK_LENGTH)
+    else:
+        import fcntl
+
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+
+def unlock_handle(handle: IO[Any]) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, _LOCK_LENGTH)
+    else:
+        import fcntl
+
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _locked_file(path: Path) -> Iterator[IO[bytes]]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as handle:
+        lock_handle(handle)
+        try:
+            yield handle
+        finally:
+            with contextlib.suppress(OSError):
+                unlock_handle(handle)
+
+
+def load_segment_index(path: Path) -> list[dict[str, Any]]:
+    """Return sealed segment entries for the log at ``path`` (oldest first)."""
+
+    try:
+        payload = json.loads(index_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    if not isinstance(payload, dict) or payload.get("schema") != INDEX_SCHEMA:
+        return []
+    segments = payload.get("segments")
+    return [entry for entry in segments if isinstance(entry, dict)] if isinstance(segments, list) else []
+
+
+def _write_index(path: Path, segments: list[dict[str, Any]]) -> None:
+    payload = {"schema": INDEX_SCHEMA, "log": path.name, "segments": segments}
+    atomic_write_text(index_path(path), json.dumps(payload, ensure_ascii=True, indent=2) + "\n")
+
+
+def event_timestamp(event: Mapping[str, object]) -> str:
+    for key in _TIMESTAMP_KEYS:
+        value = event.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return ""
+
+
+def _chain_link(prev_chain: str, *, seq: int, sha256: str, events: int) -> str:
+    return hashlib.sha256(f"{prev_chain}:{seq}:{sha256}:{events}".encode("ascii")).hexdigest()
+
+
+def _describe_segment(raw_path: Path) -> dict[str, Any]:
+    digest = hashlib.sha256()
+    events = 0
+    first_ts = last_ts = ""
+    run_ids: list[str] | None = []
+    first_run = last_run = ""
+    with _open_segment(raw_path) as handle:
+        for raw_line in handle:
+            digest.update(raw_line)
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+            events += 1
+            ts = event_timestamp(event)
+            if ts:
+                first_ts = first_ts or ts
+                last_ts = ts
+            run_id = str(event.get("run_id") or event.get("session_run_id") or "").strip()
+            if run_id:
+                first_run = first_run or run_id
+                last_run = run_id
+                if run_ids is not None and run_id not in run_ids:
+                    run_ids = run_ids + [run_id] if len(run_ids) < _MAX_INDEXED_RUN_IDS else None
+    return {
+        "sha256": digest.hexdigest(),
+        "events": events,
+        "first_ts": first_ts,
+        "last_ts": last_ts,
+        "first_run_id": first_run,
+        "last_run_id": last_run,
+        "run_ids": run_ids,
+    }
+
+
+def _segment_seq(name: str, stem: str) -> int | None:
+    """Sequence number of a segment file of ``stem`` (raw, gzip or gzip temp)."""
+
+    prefix = f"{stem}."
+    if not name.startswith(prefix):
+        return None
+    token, _, suffix = name[len(prefix):].partition(".")
+    if suffix not in {"jsonl", "jsonl.gz", "jsonl.gz.tmp"} or not token.isdigit():
+        return None
+    return int(token)
+
+
+def _seal_segment(seg_dir: Path, stem: str, seq: int, segments: list[dict[str, Any]], *, use_gzip: bool) -> dict[str, Any]:
+    """Describe, optionally compress and chain segment ``seq``; appends and returns its index entry.
+
+    The raw ``.jsonl`` file is the source of truth while it exists: a crash
+    before it is unlinked leaves at most a partial ``.gz``/``.gz.tmp`` that is
+    rebuilt from it. Without a raw file the ``.gz`` is complete, because the
+    raw file is only removed after the compressed copy was renamed into place.
+    """
+
+    raw_path = seg_dir / f"{stem}.{seq:06d}.jsonl"
+    gz_path = raw_path.with_name(raw_path.name + ".gz")
+    tmp_path = gz_path.with_name(gz_path.name + ".tmp")
+    with contextlib.suppress(FileNotFoundError):
+        tmp_path.unlink()
+    if raw_path.exists():
+        with contextlib.suppress(FileNotFoundError):
+            gz_path.unlink()
+        source = raw_path
+    else:
+        source = gz_path
+    entry: dict[str, Any] = {"seq": seq, **_describe_segment(source)}
+    segment_path = source
+    if use_gzip and source == raw_path:
+        segment_path = gz_path
+        with raw_path.open("rb") as src, tmp_path.open("wb") as out:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=out, mtime=0) as dst:
+                for chunk in iter(lambda: src.read(1 << 20), b""):
+                    dst.write(chunk)
+        os.replace(tmp_path, segment_path)
+        raw_path.unlink()
+    prev_chain = str(segments[-1].get("chain") or GENESIS_HASH) if segments else GENESIS_HASH
+    entry["segment"] = segment_path.name
+    entry["prev_chain"] = prev_chain
+    entry["chain"] = _chain_link(prev_chain, seq=seq, sha256=entry["sha256"], events=entry["events"])
+    segments.append(entry)
+    return entry
+
+
+def _recover_orphan_segments(path: Path, segments: list[dict[str, Any]], *, use_gzip: bool) -> bool:
+    """Index segment files a crashed rotation left behind; True when any were recovered."""
+
+    seg_dir = segments_dir(path)
+    stem = _stem(path)
+    indexed = {int(entry.get("seq") or 0) for entry in segments}
+    orphans: set[int] = set()
+    for candidate in seg_dir.iterdir():
+        seq = _segment_seq(candidate.name, stem)
+        if seq is not None and seq not in indexed:
+            orphans.add(seq)
+    for seq in sorted(orphans):
+        raw_path = seg_dir / f"{stem}.{seq:06d}.jsonl"
+        if not raw_path.exists() and not raw_path.with_name(raw_path.name + ".gz").exists():
+            with contextlib.suppress(FileNotFoundError):
+                raw_path.with_name(raw_path.name + ".gz.tmp").unlink()
+            continue
+        _seal_segment(seg_dir, stem, seq, segments, use_gzip=use_gzip)
+    return bool(orphans)
+
+
+def rotate_if_needed(
+    path: Path,
+    *,
+    max_bytes: int | None = None,
+    compress: bool | None = None,
+) -> dict[str, Any] | None:
+    """Seal the active log into a new segment once it reaches ``max_bytes``.
+
+    Segments a crashed earlier rotation left unindexed are recovered first,
+    and the next sequence number is past every indexed or on-disk segment,
+    so a rotation never overwrites an orphan. Returns the new index entry,
+    or ``None`` when no rotation happened.
+    """
+
+    if not is_rotated_log(path):
+        return None
+    limit = segment_max_bytes() if max_bytes is None else max_bytes
+    if limit <= 0:
+        return None
+    try:
+        if path.stat().st_size < limit:
+            return None
+    except OSError:
+        return None
+    use_gzip = segment_gzip_enabled() if compress is None else compress
+    seg_dir = segments_dir(path)
+    seg_dir.mkdir(parents=True, exist_ok=True)
+    stem = _stem(path)
+
+    with _locked_file(seg_dir / f"{stem}.rotate.lock"):
+        segments = load_segment_index(path)
+        if _recover_orphan_segments(path, segments, use_gzip=use_gzip):
+            _write_index(path, segments)
+        seq = max((int(entry.get("seq") or 0) for entry in segments), default=0) + 1
+        raw_path = seg_dir / f"{stem}.{seq:06d}.jsonl"
+        try:
+            with path.open("rb") as active:
+                lock_handle(active)
+                try:
+                    if handle_is_stale(active, path) or os.fstat(active.fileno()).st_size < limit:
+                        return None
+                    os.replace(path, raw_path)
+                finally:
+                    with contextlib.suppress(OSError):
+                        unlock_handle(active)
+        except OSError:
+            return None
+
+        entry = _seal_segment(seg_dir, stem, seq, segments, use_gzip=use_gzip)
+        _write_index(path, segments)
+        return entry
+
+
+def _open_segment(path: Path) -> IO[bytes]:
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    return path.open("rb")
+
+
+def _iter_file_events(path: Path) -> Iterator[dict[str, Any]]:
+    try:
+        handle = _open_segment(path)
+    except OSError:
+        return
+    with handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict):
+                yield event
+
+
+def _overlaps(entry: Mapping[str, Any], *, since: str, until: str, run_id: str) -> bool:
+    first_ts = str(entry.get("first_ts") or "")
+    last_ts = str(entry.get("last_ts") or "")
+    if since and last_ts and last_ts < since:
+        return False
+    if until and first_ts and first_ts > until:
+        return False
+    run_ids = entry.get("run_ids")
+    if run_id and isinstance(run_ids, list) and run_id not in run_ids:
+        return False
+    return True
+
+
+def _event_matches(event: Mapping[str, Any], *, since: str, until: str, run_id: str) -> bool:
+    if since or until:
+        ts = event_timestamp(event)
+        if since and ts and ts < since:
+            return False
+        if until and ts and ts > until:
+            return False
+    if run_id and str(event.get("run_id") or event.get("session_run_id") or "") != run_id:
+        return False
+    return True
+
+
+def read_log_events(
+    path: Path,
+    *,
+    since: str = "",
+    until: str = "",
+    run_id: str = "",
+) -> Iterator[dict[str, Any]]:
+    """Yield events of a segmented log in write order, restricted to a window.
+
+    Only sealed segments whose index entry overlaps ``since``/``until`` (ISO
+    timestamps) and ``run_id`` are opened; the active file is always read.
+    """
+
+    seg_dir = segments_dir(path)
+    for entry in load_segment_index(path):
+        if _overlaps(entry, since=since, until=until, run_id=run_id):
+            for event in _iter_file_events(seg_dir / str(entry.get("segment") or "")):
+                if _event_matches(event, since=since, until=until, run_id=run_id):
+                    yield event
+    for event in _iter_file_events(path):
+        if _event_matches(event, since=since, until=until, run_id=run_id):
+            yield event
+
+
+def tail_log_events(
+    path: Path,
+    count: int,
+    *,
+    accept: Callable[[Mapping[str, Any]], bool] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the last ``count`` accepted events, reading segments newest-first only as needed."""
+
+    if count <= 0:
+        return []
+    chunks: list[list[dict[str, Any]]] = []
+    found = 0
+    sources = [path, *(segments_dir(path) / str(e.get("segment") or "") for e in reversed(load_segment_index(path)))]
+    for source in sources:
+        rows = [event for event in _iter_file_events(source) if accept is None or accept(event)]
+        chunks.append(rows)
+        found += len(rows)
+        if found >= count:
+            break
+    ordered = [event for chunk in reversed(chunks) for event in chunk]
+    return ordered[-count:]
+
+
+def verify_segment_chain(path: Path) -> list[str]:
+    """Re-hash sealed segments and check the chain; returns problem notes (empty when intact)."""
+
+    problems: list[str] = []
+    prev_chain = GENESIS_HASH
+    seg_dir = segments_dir(path)
+    for entry in load_segment_index(path):
+        name = str(entry.get("segment") or "")
+        seq = int(entry.get("seq") or 0)
+        if entry.get("prev_chain") != prev_chain:
+            problems.append(f"segment-chain-broken:{name}")
+        digest = hashlib.sha256()
+        try:
+            with _open_segment(seg_dir / name) as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            problems.append(f"segment-missing:{name}")
+            prev_chain = str(entry.get("chain") or "")
+            continue
+        if digest.hexdigest() != entry.get("sha256"):
+            problems.append(f"segment-hash-mismatch:{name}")
+        expected = _chain_link(prev_chain, seq=seq, sha256=str(entry.get("sha256")), events=int(entry.get("events") or 0))
+        if entry.get("chain") != expected:
+            problems.append(f"segment-chain-hash-mismatch:{name}")
+        prev_chain = str(entry.get("chain") or "")
+    return problems
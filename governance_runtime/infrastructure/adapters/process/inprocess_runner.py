@@ -0,0 +1,229 @@
+"""In-process execution of governance entrypoint modules.
+
+Bootstrap stages historically call each other through ``python -m <module>``
+or ``python <script>.py`` subprocesses, paying an interpreter start-up and a
+full runtime re-import per hop. ``InProcessRunner`` resolves such an argv to
+the entrypoint module and calls its ``main()`` inside the current interpreter.
+
+The stage's environment overrides, working directory, ``sys.argv`` and extra
+``sys.path`` entries are carried by an explicit ``ExecutionContext``. The
+merged stage environment is handed to ``main(env=...)`` rather than written
+into ``os.environ``, so entrypoints are imported once and never reloaded;
+library readers below ``main`` see the same mapping through
+``stage_environment.stage_environ()``. Only the working directory,
+``sys.argv`` and ``sys.path`` are swapped for the duration of the call. Stdout/stderr are captured so callers that parse the
+JSON stdout contract observe exactly what the child process would have
+printed. Argv that cannot be mapped onto a module of the running
+governance_runtime package, or whose ``main()`` does not take ``env``, falls
+back to a real subprocess.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import inspect
+import io
+import os
+import subprocess
+import sys
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, Mapping, Sequence
+
+from governance_runtime.application.ports.process_runner import ProcessResult
+from governance_runtime.infrastructure.stage_environment import stage_environment
+
+ISOLATION_ENV_KEY = "OPENCODE_BOOTSTRAP_ISOLATION"
+ISOLATION_PROCESS = "process"
+ISOLATION_INPROCESS = "inprocess"
+
+_PACKAGE_PREFIX = "governance_runtime."
+_ENTRYPOINT_PACKAGE = "governance_runtime.entrypoints"
+
+
+def inprocess_enabled(env: Mapping[str, str] | None = None) -> bool:
+    """Return True when nested bootstrap stages should run in-process."""
+    source = os.environ if env is None else env
+    return str(source.get(ISOLATION_ENV_KEY, "")).strip().lower() == ISOLATION_INPROCESS
+
+
+@dataclass(frozen=True)
+class ExecutionContext:
+    """Explicit per-stage execution context.
+
+    ``env_overrides`` maps variable names to values; a ``None`` value unsets
+    the variable for the stage. ``sys_path`` entries are prepended, mirroring
+    a ``PYTHONPATH`` prefix in process mode.
+    """
+
+    env_overrides: Mapping[str, str | None] = field(default_factory=dict)
+    cwd: Path | None = None
+    sys_path: tuple[str, ...] = ()
+    capture_output: bool = True
+
+    def environment(self, base: Mapping[str, str] | None = None) -> dict[str, str]:
+        merged = dict(os.environ if base is None else base)
+        for key, value in self.env_overrides.items():
+            if value is None:
+                merged.pop(key, None)
+            else:
+                merged[key] = value
+        return merged
+
+
+def _module_for_script(script: str) -> str | None:
+    path = Path(script)
+    if path.suffix != ".py":
+        return None
+    name = f"{_ENTRYPOINT_PACKAGE}.{path.stem}"
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin:
+        return None
+    try:
+        if not os.path.samefile(spec.origin, str(path)):
+            return None
+    except OSError:
+        return None
+    return name
+
+
+def resolve_entry_module(argv: Sequence[str]) -> tuple[str, list[str]] | None:
+    """Map a python argv onto ``(module_name, args)`` or None if not resolvable.
+
+    Only modules of the running governance_runtime package qualify; scripts
+    are accepted when they are the very file backing the importable module,
+    so an installed payload that differs from the running code still gets a
+    real subprocess.
+    """
+    tokens = [str(token) for token in argv]
+    for index, token in enumerate(tokens):
+        if token == "-m":
+            if index + 1 >= len(tokens):
+                return None
+            module = tokens[index + 1]
+            if not module.startswith(_PACKAGE_PREFIX):
+                return None
+            return module, tokens[index + 2:]
+        if token.endswith(".py"):
+            module = _module_for_script(token)
+            if module is None:
+                return None
+            return module, tokens[index + 1:]
+    return None
+
+
+@contextlib.contextmanager
+def _applied(context: ExecutionContext, argv: list[str]) -> Iterator[None]:
+    saved_argv = list(sys.argv)
+    saved_path = list(sys.path)
+    saved_cwd = os.getcwd()
+    try:
+        sys.argv = argv
+        if context.sys_path:
+            sys.path[:0] = [entry for entry in context.sys_path if entry]
+        if context.cwd is not None:
+            os.chdir(str(context.cwd))
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+
+
+def _exit_code(exc: SystemExit) -> int:
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _stage_entry(module_name: str, context: ExecutionContext) -> Callable[..., object] | None:
+    """Return the module's ``main`` if it accepts the stage environment."""
+    try:
+        with _applied(context, [module_name]):
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    except (Exception, SystemExit):
+        return None
+    entry = getattr(module, "main", None)
+    if not callable(entry):
+        return None
+    try:
+        parameters = inspect.signature(entry).parameters
+    except (TypeError, ValueError):
+        return None
+    return entry if "env" in parameters else None
+
+
+def _call_main(entry: Callable[..., object], env: Mapping[str, str]) -> int:
+    try:
+        with stage_environment(env):
+            result = entry(env=env)
+    except SystemExit as exc:
+        return _exit_code(exc)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return result if isinstance(result, int) else 0
+
+
+class InProcessRunner:
+    """ProcessRunnerPort implementation executing entrypoints in-process.
+
+    ``base_env`` is the environment nested stages inherit; it defaults to the
+    process environment and should be the caller's own stage environment when
+    the caller itself runs in-process.
+    """
+
+    def __init__(self, base_env: Mapping[str, str] | None = None) -> None:
+        self._base_env = base_env
+
+    def run(self, argv: Sequence[str], env: dict[str, str] | None = None) -> ProcessResult:
+        base = os.environ if self._base_env is None else self._base_env
+        overrides: dict[str, str | None] = {}
+        if env is not None:
+            overrides = {key: value for key, value in env.items() if base.get(key) != value}
+            overrides.update({key: None for key in base if key not in env})
+        return self.run_with_context(argv, ExecutionContext(env_overrides=overrides))
+
+    def run_with_context(self, argv: Sequence[str], context: ExecutionContext) -> ProcessResult:
+        env = context.environment(self._base_env)
+        resolved = resolve_entry_module(argv)
+        entry = _stage_entry(resolved[0], context) if resolved is not None else None
+        if resolved is None or entry is None:
+            return self._run_subprocess(argv, context, env)
+        module_name, args = resolved
+        stage_argv = [module_name, *args]
+        if not context.capture_output:
+            with _applied(context, stage_argv):
+                returncode = _call_main(entry, env)
+            return ProcessResult(returncode=returncode, stdout="", stderr="")
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with _applied(context, stage_argv), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            returncode = _call_main(entry, env)
+        return ProcessResult(returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+
+    @staticmethod
+    def _run_subprocess(argv: Sequence[str], context: ExecutionContext, env: dict[str, str]) -> ProcessResult:
+        if context.sys_path:
+            prefix = [entry for entry in context.sys_path if entry]
+            existing = env.get("PYTHONPATH", "").strip()
+            env["PYTHONPATH"] = os.pathsep.join([*prefix, existing] if existing else prefix)
+        proc = subprocess.run(
+            [str(token) for token in argv],
+            text=True,
+            capture_output=context.capture_output,
+            check=False,
+            cwd=str(context.cwd) if context.cwd is not None else None,
+            env=env,
+        )
+        return ProcessResult(returncode=proc.returncode, stdout=proc.stdout or "", stderr=proc.stderr or "")
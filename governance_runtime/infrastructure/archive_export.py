@@ -11,18 +11,28 @@ Design:
     - Pure validation functions (no I/O) alongside I/O functions
     - Uses retention.py domain model for retention/hold decisions
     - Uses io_verify.verify_run_archive() for integrity checks
-    - Uses fs_atomic for safe writes
+    - Uses fs_atomic for safe writes; single-file bundles (zip, tar.gz,
+      tar.zst) are written to a temp file and atomically renamed
+    - Bundle members are serialized once and hashed as they are written;
+      restore/validation read single-file bundles without extracting them
     - Fail-closed: export refuses to proceed on failed verification
     - Zero external dependencies (stdlib only + governance)
 """
 
 from __future__ import annotations
 
+import concurrent.futures
+import io
 import json
+import os
 import shutil
 import hashlib
+import tarfile
+import tempfile
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Iterator, Mapping, Optional, Sequence
 
 from governance_runtime.domain.classification import ClassificationLevel
 from governance_runtime.engine.sanitization import sanitize_for_output
@@ -34,8 +44,12 @@ from governance_runtime.domain.retention import (
     LegalHoldStatus,
     RestoreValidation,
 )
-from governance_runtime.infrastructure.fs_atomic import atomic_write_json, atomic_write_text
-from governance_runtime.infrastructure.redaction import redact_archive
+from governance_runtime.infrastructure.fs_atomic import (
+    atomic_write_json,
+    atomic_write_text,
+    safe_replace_with_retries,
+)
+from governance_runtime.infrastructure.redaction import sanitize_and_redact_document
 
 
 # ---------------------------------------------------------------------------
@@ -69,17 +83,173 @@ OPTIONAL_EXPORT_FILES = frozenset({
 ALL_EXPORT_FILES = REQUIRED_EXPORT_FILES | OPTIONAL_EXPORT_FILES
 
 
-def _compute_bundle_manifest_hash(export_path: Path, files_included: Sequence[str]) -> str:
-    file_digests: dict[str, str] = {}
-    for name in sorted(files_included):
-        payload = (export_path / name).read_bytes()
-        file_digests[name] = "sha256:" + hashlib.sha256(payload).hexdigest()
+#: Bundle formats written as one file, mapped to their tarfile write mode
+_TAR_MODES = {
+    ArchiveFormat.TAR_GZ: "w:gz",
+    ArchiveFormat.TAR_ZST: "w:zst",
+}
+
+#: Fixed member timestamp so identical exports produce identical members
+_ZIP_MEMBER_DATE = (1980, 1, 1, 0, 0, 0)
+
+#: Default bound for concurrent batch exports
+DEFAULT_EXPORT_WORKERS = 4
+
+
+def _bundle_manifest_hash(file_digests: Mapping[str, str]) -> str:
     bundle_manifest = {
-        "files": file_digests,
+        "files": dict(sorted(file_digests.items())),
     }
     return "sha256:" + hashlib.sha256(canonical_json_text(bundle_manifest).encode("utf-8")).hexdigest()
 
 
+def _json_member_text(doc: Any) -> str:
+    # Same serialization as atomic_write_json so every format carries identical bytes.
+    return json.dumps(doc, indent=2, ensure_ascii=True) + "\n"
+
+
+class _BundleReader:
+    """Read-only view over a bundle directory, zip file or tarball."""
+
+    def __init__(self, bundle_path: Path) -> None:
+        self.path = bundle_path
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._tar_members: dict[str, tarfile.TarInfo] = {}
+        if bundle_path.is_dir():
+            self.names = frozenset(p.name for p in bundle_path.iterdir() if p.is_file())
+        elif zipfile.is_zipfile(bundle_path):
+            self._zip = zipfile.ZipFile(bundle_path)
+            self.names = frozenset(info.filename for info in self._zip.infolist() if not info.is_dir())
+        else:
+            self._tar = tarfile.open(bundle_path, mode="r:*")
+            self._tar_members = {member.name: member for member in self._tar.getmembers() if member.isfile()}
+            self.names = frozenset(self._tar_members)
+
+    def restore_member(self, name: str, target: Path) -> None:
+        if self._zip is not None:
+            target.write_bytes(self._zip.read(name))
+        elif self._tar is not None:
+            handle = self._tar.extractfile(self._tar_members[name])
+            if handle is None:
+                raise RuntimeError(f"Bundle member is not a regular file: {name}")
+            with handle, target.open("wb") as out:
+                shutil.copyfileobj(handle, out)
+        else:
+            shutil.copy2(self.path / name, target)
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+
+
+def _open_bundle(bundle_path: Path) -> Optional[_BundleReader]:
+    """Open a bundle directory or single-file bundle; None if it is neither."""
+    if not bundle_path.is_dir() and not bundle_path.is_file():
+        return None
+    try:
+        return _BundleReader(bundle_path)
+    except (tarfile.TarError, zipfile.BadZipFile, OSError):
+        return None
+
+
+class _DirectoryBundleWriter:
+    def __init__(self, export_path: Path) -> None:
+        self._root = export_path
+        self._root.mkdir(parents=True, exist_ok=False)
+
+    def add(self, name: str, payload: bytes) -> None:
+        atomic_write_text(self._root / name, payload.decode("utf-8"), newline_lf=True)
+
+    def commit(self) -> None:
+        return None
+
+    def abort(self) -> None:
+        if self._root.exists():
+            shutil.rmtree(self._root, ignore_errors=True)
+
+
+class _SingleFileBundleWriter:
+    """Streams members into a zip/tar temp file next to the target."""
+
+    def __init__(self, export_path: Path, export_format: ArchiveFormat) -> None:
+        self._target = export_path
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = tempfile.NamedTemporaryFile(dir=export_path.parent, prefix=".", suffix=".tmp", delete=False)
+        self._tmp = Path(handle.name)
+        self._file = handle
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        try:
+            if export_format == ArchiveFormat.ZIP:
+                self._zip = zipfile.ZipFile(handle, mode="w", compression=zipfile.ZIP_DEFLATED)
+            else:
+                self._tar = tarfile.open(fileobj=handle, mode=_TAR_MODES[export_format])
+        except (tarfile.CompressionError, ValueError) as exc:
+            self.abort()
+            raise RuntimeError(f"Export format not supported by this Python: {export_format.value}") from exc
+
+    def add(self, name: str, payload: bytes) -> None:
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=_ZIP_MEMBER_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, payload)
+        elif self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(payload))
+
+    def _close_archive(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+
+    def commit(self) -> None:
+        self._close_archive()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        safe_replace_with_retries(self._tmp, self._target)
+
+    def abort(self) -> None:
+        try:
+            self._close_archive()
+        except (OSError, tarfile.TarError, zipfile.BadZipFile):
+            pass
+        self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def _iter_export_members(
+    archive_path: Path,
+    *,
+    apply_redaction: bool,
+    redaction_max_level: ClassificationLevel,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield (filename, payload) for each archive file in bundle order."""
+    for filename in sorted(ALL_EXPORT_FILES):
+        src = archive_path / filename
+        if not src.is_file():
+            continue
+        if filename.endswith(".json"):
+            doc = json.loads(src.read_text(encoding="utf-8"))
+            if apply_redaction:
+                # Sanitize + redact in one pass
+                doc = sanitize_and_redact_document(filename, doc, max_level=redaction_max_level)
+            else:
+                doc = sanitize_for_output(doc)
+            yield filename, _json_member_text(doc).encode("utf-8")
+        else:
+            yield filename, src.read_bytes()
+
+
 # ---------------------------------------------------------------------------
 # Pure validation functions
 # ---------------------------------------------------------------------------
@@ -130,7 +300,8 @@ def validate_restored_bundle(bundle_path: Path) -> RestoreValidation:
     - Export manifest present
     - Basic structural validity
 
-    Does NOT recompute checksums (caller should use io_verify for that).
+    ``bundle_path`` may be a bundle directory or a single-file zip/tar
+    bundle, which is inspected in place. Does NOT recompute checksums (caller should use io_verify for that).
 
     Returns:
         RestoreValidation result
@@ -139,25 +310,27 @@ def validate_restored_bundle(bundle_path: Path) -> RestoreValidation:
     manifest_present = False
     files_complete = True
 
-    if not bundle_path.is_dir():
+    reader = _open_bundle(bundle_path)
+    if reader is None:
         return RestoreValidation(
             is_valid=False,
             manifest_present=False,
             checksums_verified=False,
             files_complete=False,
-            errors=("Bundle path is not a directory",),
+            errors=("Bundle path is not a directory or a zip/tar bundle file",),
         )
+    names = reader.names
+    reader.close()
 
     # Check export manifest
-    export_manifest_path = bundle_path / "export-manifest.json"
-    if export_manifest_path.is_file():
+    if "export-manifest.json" in names:
         manifest_present = True
     else:
         errors.append("export-manifest.json missing from bundle")
 
     # Check required archive files
     for filename in sorted(REQUIRED_EXPORT_FILES):
-        if not (bundle_path / filename).is_file():
+        if filename not in names:
             errors.append(f"Required file missing: {filename}")
             files_complete = False
 
@@ -188,9 +361,9 @@ def export_finalized_bundle(
 ) -> ArchiveExportManifest:
     """Export a finalized run archive into a self-contained bundle.
 
-    The export produces a directory containing all archive files plus an
-    export-manifest.json. Optionally applies redaction based on the
-    classification policy.
+    The export produces a directory (or, for ZIP/TAR_GZ/TAR_ZST, a single
+    bundle file) containing all archive files plus an export-manifest.json.
+    Optionally applies redaction based on the classification policy.
 
     Fails if:
     - Archive is not valid for export (missing files, not finalized)
@@ -198,12 +371,12 @@ def export_finalized_bundle(
 
     Args:
         archive_path: Source finalized archive directory
-        export_path: Destination directory for the bundle
+        export_path: Destination directory, or bundle file for single-file formats
         repo_fingerprint: Repository fingerprint
         run_id: Run identifier
         exported_at: RFC3339 UTC Z timestamp
         exported_by: Identity of the exporter
-        export_format: Output format (currently only DIRECTORY supported)
+        export_format: Output format
         apply_redaction: Whether to apply field-level redaction
         redaction_max_level: Maximum classification level in output
 
@@ -211,7 +384,8 @@ def export_finalized_bundle(
         ArchiveExportManifest describing the export
 
     Raises:
-        RuntimeError: If validation fails or export path exists
+        RuntimeError: If validation fails, export path exists or the format
+            is not supported by this Python
     """
     # Validate source
     is_valid, validation_errors = validate_archive_for_export(archive_path)
@@ -224,29 +398,23 @@ def export_finalized_bundle(
     if export_path.exists():
         raise RuntimeError(f"Export path already exists: {export_path}")
 
-    export_path.mkdir(parents=True, exist_ok=False)
+    writer: _DirectoryBundleWriter | _SingleFileBundleWriter
+    if export_format == ArchiveFormat.DIRECTORY:
+        writer = _DirectoryBundleWriter(export_path)
+    else:
+        writer = _SingleFileBundleWriter(export_path, export_format)
 
     try:
-        # Copy archive files
-        files_included: list[str] = []
-        for filename in sorted(ALL_EXPORT_FILES):
-            src = archive_path / filename
-            if src.is_file():
-                if apply_redaction and filename.endswith(".json"):
-                    # Load, redact, write
-                    doc = json.loads(src.read_text(encoding="utf-8"))
-                    sanitized_doc = sanitize_for_output(doc)
-                    redacted = redact_archive(
-                        {filename: sanitized_doc},
-                        max_level=redaction_max_level,
-                    )
-                    atomic_write_json(export_path / filename, redacted[filename])
-                elif filename.endswith(".json"):
-                    doc = json.loads(src.read_text(encoding="utf-8"))
-                    atomic_write_json(export_path / filename, sanitize_for_output(doc))
-                else:
-                    shutil.copy2(src, export_path / filename)
-                files_included.append(filename)
+        # Write archive members, hashing each payload as it is written
+        file_digests: dict[str, str] = {}
+        for filename, payload in _iter_export_members(
+            archive_path,
+            apply_redaction=apply_redaction,
+            redaction_max_level=redaction_max_level,
+        ):
+            writer.add(filename, payload)
+            file_digests[filename] = "sha256:" + hashlib.sha256(payload).hexdigest()
+        files_included = list(file_digests)
 
         # Write export manifest
         manifest = ArchiveExportManifest(
@@ -261,7 +429,7 @@ def export_finalized_bundle(
             checksums_verified=True,
             redaction_applied=apply_redaction,
             redaction_max_level=redaction_max_level.value,
-            bundle_manifest_hash=_compute_bundle_manifest_hash(export_path, files_included),
+            bundle_manifest_hash=_bundle_manifest_hash(file_digests),
         )
 
         manifest_dict = {
@@ -279,17 +447,77 @@ def export_finalized_bundle(
             "bundle_manifest_hash": manifest.bundle_manifest_hash,
         }
 
-        atomic_write_json(export_path / "export-manifest.json", manifest_dict)
+        writer.add("export-manifest.json", _json_member_text(manifest_dict).encode("utf-8"))
+        writer.commit()
 
         return manifest
 
     except Exception:
         # Clean up partial export on failure
-        if export_path.exists():
-            shutil.rmtree(export_path, ignore_errors=True)
+        writer.abort()
         raise
 
 
+@dataclass(frozen=True)
+class BundleExportRequest:
+    """One finalized run to export in a batch."""
+    archive_path: Path
+    export_path: Path
+    repo_fingerprint: str
+    run_id: str
+
+
+@dataclass(frozen=True)
+class BundleExportResult:
+    """Outcome of one batch export; ``manifest`` is None when it failed."""
+    run_id: str
+    export_path: Path
+    manifest: Optional[ArchiveExportManifest]
+    error: str = ""
+
+
+def export_finalized_bundles(
+    requests: Sequence[BundleExportRequest],
+    *,
+    exported_at: str,
+    exported_by: str,
+    export_format: ArchiveFormat = ArchiveFormat.DIRECTORY,
+    apply_redaction: bool = False,
+    redaction_max_level: ClassificationLevel = ClassificationLevel.INTERNAL,
+    max_workers: int = DEFAULT_EXPORT_WORKERS,
+) -> list[BundleExportResult]:
+    """Export many finalized runs concurrently with a bounded thread pool.
+
+    Each run goes through export_finalized_bundle unchanged; a failing run is
+    reported in its result and does not abort the others. Results are
+    returned in request order.
+    """
+    def _export(request: BundleExportRequest) -> BundleExportResult:
+        try:
+            manifest = export_finalized_bundle(
+                archive_path=request.archive_path,
+                export_path=request.export_path,
+                repo_fingerprint=request.repo_fingerprint,
+                run_id=request.run_id,
+                exported_at=exported_at,
+                exported_by=exported_by,
+                export_format=export_format,
+                apply_redaction=apply_redaction,
+                redaction_max_level=redaction_max_level,
+            )
+        except (RuntimeError, OSError, ValueError) as exc:
+            return BundleExportResult(
+                run_id=request.run_id, export_path=request.export_path, manifest=None, error=str(exc)
+            )
+        return BundleExportResult(run_id=request.run_id, export_path=request.export_path, manifest=manifest)
+
+    if not requests:
+        return []
+    workers = max(1, min(max_workers, len(requests)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_export, requests))
+
+
 def restore_from_bundle(
     *,
     bundle_path: Path,
@@ -298,10 +526,11 @@ def restore_from_bundle(
     """Restore an archive from an exported bundle.
 
     Copies all recognized archive files from the bundle to the restore path.
-    Validates the bundle before restoring.
+    Validates the bundle before restoring. Single-file bundles are read
+    member by member; nothing else from them is extracted.
 
     Args:
-        bundle_path: Source bundle directory
+        bundle_path: Source bundle directory or zip/tar bundle file
         restore_path: Destination restore directory
 
     Returns:
@@ -317,14 +546,16 @@ def restore_from_bundle(
     if restore_path.exists():
         raise RuntimeError(f"Restore path already exists: {restore_path}")
 
+    reader = _open_bundle(bundle_path)
+    if reader is None:
+        raise RuntimeError(f"Bundle became unreadable during restore: {bundle_path}")
+
     restore_path.mkdir(parents=True, exist_ok=False)
 
     try:
         errors: list[str] = []
-        for filename in sorted(ALL_EXPORT_FILES):
-            src = bundle_path / filename
-            if src.is_file():
-                shutil.copy2(src, restore_path / filename)
+        for filename in sorted(ALL_EXPORT_FILES & reader.names):
+            reader.restore_member(filename, restore_path / filename)
 
         # Verify required files arrived
         files_complete = True
@@ -345,6 +576,8 @@ def restore_from_bundle(
         if restore_path.exists():
             shutil.rmtree(restore_path, ignore_errors=True)
         raise
+    finally:
+        reader.close()
 
 
 # ---------------------------------------------------------------------------
@@ -425,7 +658,11 @@ __all__ = [
     "ALL_EXPORT_FILES",
     "validate_archive_for_export",
     "validate_restored_bundle",
+    "DEFAULT_EXPORT_WORKERS",
+    "BundleExportRequest",
+    "BundleExportResult",
     "export_finalized_bundle",
+    "export_finalized_bundles",
     "restore_from_bundle",
     "write_legal_hold_record",
     "load_legal_holds",
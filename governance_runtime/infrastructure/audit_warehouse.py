@@ -0,0 +1,610 @@
+"""Audit Warehouse — incremental SQLite index over workspace audit artifacts.
+
+Cross-run audit questions ("which runs were blocked by reason X this month",
+"median Phase-6 review iterations per repo") otherwise need a glob and a full
+JSON parse of every run summary, archive and log on each call. This module
+ingests those artifacts into a stdlib ``sqlite3`` database once and keeps it
+current incrementally; ``scripts/audit_warehouse.py`` is the CLI.
+
+Sources (below a workspaces home):
+    - ``<fp>/evidence/runs/<run_id>.json``           run summaries
+    - ``governance-records/<fp>/runs/**/metadata.json`` run archive metadata
+      (+ Phase-6 review iterations from the archived SESSION_STATE snapshot)
+    - ``<fp>/logs/events.jsonl`` and its sealed segments
+    - ``<fp>/plan-record.json`` and ``<fp>/plan-record-archive/*.json``
+
+Schema (``WAREHOUSE_SCHEMA_VERSION``; a version change rebuilds the database):
+    ingested_files(path PK, kind, size, mtime_ns, offset, inode, ingested_at)
+        Watermark. JSON files are re-read only when size/mtime change; sealed
+        log segments are read once; the active events.jsonl is read from the
+        stored byte offset (from 0 again once rotation replaced the file).
+    run_summaries(repo_fingerprint, run_id PK, timestamp, mode, phase, result,
+        reason_code, path, raw_json)
+    archived_runs(repo_fingerprint, run_id PK, archived_at, archive_status,
+        source_phase, source_next, phase6_review_iterations, path, raw_json)
+    events(id PK, repo_fingerprint, source, event, ts, run_id, line_sha256,
+        raw_json) — unique per (repo_fingerprint, line_sha256), so lines seen
+        again after a rotation are not duplicated
+    plan_versions(repo_fingerprint, source, version PK, supersedes,
+        content_hash, recorded_at, raw_json)
+
+``raw_json`` columns keep the full record for ad-hoc ``json_extract`` queries.
+Zero external dependencies (stdlib + governance modules).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import statistics
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+from governance_runtime.application.services.state_accessor import get_review_iterations
+from governance_runtime.infrastructure.adapters.logging.log_segments import (
+    event_timestamp,
+    load_segment_index,
+    segments_dir,
+)
+from governance_runtime.infrastructure.retention_sweep import iter_archived_runs
+
+WAREHOUSE_SCHEMA_VERSION = 1
+DEFAULT_DB_NAME = "audit-warehouse.sqlite3"
+
+KIND_RUN_SUMMARY = "run_summary"
+KIND_RUN_ARCHIVE = "run_archive"
+KIND_EVENT_SEGMENT = "event_segment"
+KIND_EVENT_LOG = "event_log"
+KIND_PLAN_RECORD = "plan_record"
+
+_RECORDS_DIR_NAME = "governance-records"
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL DEFAULT 0,
+    inode INTEGER NOT NULL DEFAULT 0,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_summaries (
+    repo_fingerprint TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    result TEXT NOT NULL,
+    reason_code TEXT NOT NULL,
+    path TEXT NOT NULL,
+    raw_json TEXT NOT NULL,
+    PRIMARY KEY (repo_fingerprint, run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_run_summaries_reason_ts ON run_summaries (reason_code, timestamp);
+CREATE INDEX IF NOT EXISTS idx_run_summaries_repo_ts ON run_summaries (repo_fingerprint, timestamp);
+CREATE TABLE IF NOT EXISTS archived_runs (
+    repo_fingerprint TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    archived_at TEXT NOT NULL,
+    archive_status TEXT NOT NULL,
+    source_phase TEXT NOT NULL,
+    source_next TEXT NOT NULL,
+    phase6_review_iterations INTEGER,
+    path TEXT NOT NULL,
+    raw_json TEXT NOT NULL,
+    PRIMARY KEY (repo_fingerprint, run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_archived_runs_ts ON archived_runs (archived_at);
+CREATE INDEX IF NOT EXISTS idx_archived_runs_repo_phase ON archived_runs (repo_fingerprint, source_phase);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    repo_fingerprint TEXT NOT NULL,
+    source TEXT NOT NULL,
+    event TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    line_sha256 TEXT NOT NULL,
+    raw_json TEXT NOT NULL,
+    UNIQUE (repo_fingerprint, line_sha256)
+);
+CREATE INDEX IF NOT EXISTS idx_events_repo_ts ON events (repo_fingerprint, ts);
+CREATE INDEX IF NOT EXISTS idx_events_event_ts ON events (event, ts);
+CREATE INDEX IF NOT EXISTS idx_events_run ON events (run_id);
+CREATE TABLE IF NOT EXISTS plan_versions (
+    repo_fingerprint TEXT NOT NULL,
+    source TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    supersedes INTEGER,
+    content_hash TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    raw_json TEXT NOT NULL,
+    PRIMARY KEY (repo_fingerprint, source, version)
+);
+CREATE INDEX IF NOT EXISTS idx_plan_versions_repo ON plan_versions (repo_fingerprint, recorded_at);
+"""
+
+_TABLES = ("ingested_files", "run_summaries", "archived_runs", "events", "plan_versions")
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+@dataclass
+class IngestResult:
+    """Counts from one incremental ingestion pass."""
+    files_scanned: int = 0
+    files_ingested: int = 0
+    rows: dict[str, int] = field(default_factory=dict)
+
+    def add_rows(self, table: str, count: int) -> None:
+        self.rows[table] = self.rows.get(table, 0) + count
+
+
+# ---------------------------------------------------------------------------
+# Connection / schema
+# ---------------------------------------------------------------------------
+
+def default_db_path(workspaces_home: Path) -> Path:
+    return workspaces_home / DEFAULT_DB_NAME
+
+
+def connect_warehouse(db_path: Path) -> sqlite3.Connection:
+    """Open (creating or rebuilding on version change) the warehouse database."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA_SQL)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None or row["value"] != str(WAREHOUSE_SCHEMA_VERSION):
+        with conn:
+            for table in _TABLES:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.executescript(SCHEMA_SQL)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(WAREHOUSE_SCHEMA_VERSION),),
+            )
+    return conn
+
+
+def open_warehouse_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open an existing warehouse for queries; nothing can be written."""
+    if not db_path.is_file():
+        raise FileNotFoundError(f"audit warehouse not found: {db_path}")
+    conn = sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _text(payload: Mapping[str, Any], key: str) -> str:
+    value = payload[key] if key in payload else None
+    return str(value) if value is not None else ""
+
+
+def _load_json_object(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _watermark(conn: sqlite3.Connection, path: Path) -> Optional[sqlite3.Row]:
+    return conn.execute("SELECT * FROM ingested_files WHERE path = ?", (str(path),)).fetchone()
+
+
+def _unchanged(conn: sqlite3.Connection, path: Path, stat: os.stat_result) -> bool:
+    row = _watermark(conn, path)
+    return row is not None and row["size"] == stat.st_size and row["mtime_ns"] == stat.st_mtime_ns
+
+
+def _record_watermark(
+    conn: sqlite3.Connection, path: Path, kind: str, stat: os.stat_result, offset: int = 0
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO ingested_files (path, kind, size, mtime_ns, offset, inode, ingested_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (str(path), kind, stat.st_size, stat.st_mtime_ns, offset, stat.st_ino, _utc_now()),
+    )
+
+
+def _iter_workspace_dirs(workspaces_home: Path) -> Iterator[Path]:
+    try:
+        entries = sorted(os.scandir(workspaces_home), key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".") and entry.name != _RECORDS_DIR_NAME:
+            yield Path(entry.path)
+
+
+def _sorted_json_files(directory: Path) -> list[Path]:
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return []
+    return sorted(Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file())
+
+
+# ---------------------------------------------------------------------------
+# Ingestion per source
+# ---------------------------------------------------------------------------
+
+def _ingest_run_summary(conn: sqlite3.Connection, fingerprint: str, path: Path) -> int:
+    summary = _load_json_object(path)
+    if summary is None:
+        return 0
+    raw_reason = summary["reason"] if "reason" in summary else None
+    reason = raw_reason if isinstance(raw_reason, Mapping) else {}
+    conn.execute(
+        "INSERT OR REPLACE INTO run_summaries "
+        "(repo_fingerprint, run_id, timestamp, mode, phase, result, reason_code, path, raw_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            fingerprint,
+            _text(summary, "run_id") or path.stem,
+            _text(summary, "timestamp"),
+            _text(summary, "mode"),
+            _text(summary, "phase"),
+            _text(summary, "result"),
+            _text(reason, "code"),
+            str(path),
+            json.dumps(summary, sort_keys=True, ensure_ascii=True),
+        ),
+    )
+    return 1
+
+
+def _ingest_run_archive(conn: sqlite3.Connection, fingerprint: str, run_id: str, run_path: Path) -> int:
+    metadata = _load_json_object(run_path / "metadata.json")
+    if metadata is None:
+        return 0
+    iterations: Optional[int] = None
+    snapshot = _load_json_object(run_path / "SESSION_STATE.json")
+    if snapshot is not None:
+        nested = snapshot["SESSION_STATE"] if "SESSION_STATE" in snapshot else None
+        iterations = get_review_iterations(nested if isinstance(nested, Mapping) else snapshot)
+    conn.execute(
+        "INSERT OR REPLACE INTO archived_runs "
+        "(repo_fingerprint, run_id, archived_at, archive_status, source_phase, source_next, "
+        "phase6_review_iterations, path, raw_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            fingerprint,
+            run_id,
+            _text(metadata, "archived_at"),
+            _text(metadata, "archive_status"),
+            _text(metadata, "source_phase"),
+            _text(metadata, "source_next"),
+            iterations,
+            str(run_path),
+            json.dumps(metadata, sort_keys=True, ensure_ascii=True),
+        ),
+    )
+    return 1
+
+
+def _insert_event_lines(conn: sqlite3.Connection, fingerprint: str, source: str, lines: list[bytes]) -> int:
+    rows = []
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        run_id = _text(event, "run_id") or _text(event, "session_run_id")
+        rows.append(
+            (
+                fingerprint,
+                source,
+                _text(event, "event"),
+                event_timestamp(event),
+                run_id,
+                hashlib.sha256(line).hexdigest(),
+                line.decode("utf-8", errors="replace"),
+            )
+        )
+    before = conn.total_changes
+    conn.executemany(
+        "INSERT OR IGNORE INTO events (repo_fingerprint, source, event, ts, run_id, line_sha256, raw_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return conn.total_changes - before
+
+
+def _ingest_event_segment(conn: sqlite3.Connection, fingerprint: str, path: Path) -> int:
+    opener: Callable[[], Any] = (lambda: gzip.open(path, "rb")) if path.name.endswith(".gz") else (lambda: path.open("rb"))
+    try:
+        with opener() as handle:
+            lines = handle.readlines()
+    except OSError:
+        return 0
+    return _insert_event_lines(conn, fingerprint, path.name, lines)
+
+
+def _ingest_active_event_log(
+    conn: sqlite3.Connection, fingerprint: str, path: Path, stat: os.stat_result
+) -> tuple[int, int]:
+    """Read complete lines after the stored offset; return ``(rows, new_offset)``."""
+    row = _watermark(conn, path)
+    offset = int(row["offset"]) if row is not None else 0
+    if row is not None and (stat.st_size < offset or int(row["inode"]) != stat.st_ino):
+        # Rotation renamed the previous active file into a segment.
+        offset = 0
+    try:
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            chunk = handle.read(stat.st_size - offset)
+    except OSError:
+        return 0, offset
+    complete = chunk.rfind(b"\n") + 1
+    if complete == 0:
+        return 0, offset
+    rows = _insert_event_lines(conn, fingerprint, path.name, chunk[:complete].splitlines())
+    return rows, offset + complete
+
+
+def _ingest_plan_record(conn: sqlite3.Connection, fingerprint: str, path: Path) -> int:
+    document = _load_json_object(path)
+    if document is None:
+        return 0
+    raw_versions = document["versions"] if "versions" in document else None
+    versions = [item for item in raw_versions if isinstance(item, dict)] if isinstance(raw_versions, list) else []
+    conn.execute("DELETE FROM plan_versions WHERE repo_fingerprint = ? AND source = ?", (fingerprint, path.name))
+    for index, version in enumerate(versions, start=1):
+        number = version["version"] if isinstance(version.get("version"), int) else index
+        supersedes = version["supersedes"] if isinstance(version.get("supersedes"), int) else None
+        recorded_at = _text(version, "created_at") or _text(version, "timestamp") or _text(document, "finalized_at")
+        conn.execute(
+            "INSERT OR REPLACE INTO plan_versions "
+            "(repo_fingerprint, source, version, supersedes, content_hash, recorded_at, raw_json) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                fingerprint,
+                path.name,
+                number,
+                supersedes,
+                _text(version, "content_hash"),
+                recorded_at,
+                json.dumps(version, sort_keys=True, ensure_ascii=True),
+            ),
+        )
+    return len(versions)
+
+
+# ---------------------------------------------------------------------------
+# Ingestion driver
+# ---------------------------------------------------------------------------
+
+def ingest_workspaces(workspaces_home: Path, db_path: Optional[Path] = None) -> IngestResult:
+    """Bring the warehouse up to date with ``workspaces_home``.
+
+    Only files that are new or changed since the stored watermark are read.
+    Each file is committed together with its watermark, so an interrupted
+    pass resumes without duplicates.
+    """
+    result = IngestResult()
+    with contextlib.closing(connect_warehouse(db_path or default_db_path(workspaces_home))) as conn:
+
+        def ingest_file(path: Path, kind: str, load: Callable[[], int], table: str) -> None:
+            stat = _stat(path)
+            if stat is None:
+                return
+            result.files_scanned += 1
+            if _unchanged(conn, path, stat):
+                return
+            with conn:
+                result.add_rows(table, load())
+                _record_watermark(conn, path, kind, stat)
+            result.files_ingested += 1
+
+        for workspace in _iter_workspace_dirs(workspaces_home):
+            fingerprint = workspace.name
+            for path in _sorted_json_files(workspace / "evidence" / "runs"):
+                if path.name != "latest.json":
+                    ingest_file(
+                        path, KIND_RUN_SUMMARY,
+                        lambda path=path: _ingest_run_summary(conn, fingerprint, path), "run_summaries",
+                    )
+
+            events_path = workspace / "logs" / "events.jsonl"
+            seg_dir = segments_dir(events_path)
+            for entry in load_segment_index(events_path):
+                segment = seg_dir / str(entry.get("segment") or "")
+                stat = _stat(segment)
+                if stat is None or not segment.is_file():
+                    continue
+                result.files_scanned += 1
+                if _watermark(conn, segment) is not None:
+                    continue
+                with conn:
+                    result.add_rows("events", _ingest_event_segment(conn, fingerprint, segment))
+                    _record_watermark(conn, segment, KIND_EVENT_SEGMENT, stat)
+                result.files_ingested += 1
+            stat = _stat(events_path)
+            if stat is not None:
+                result.files_scanned += 1
+                if not _unchanged(conn, events_path, stat):
+                    with conn:
+                        rows, offset = _ingest_active_event_log(conn, fingerprint, events_path, stat)
+                        result.add_rows("events", rows)
+                        _record_watermark(conn, events_path, KIND_EVENT_LOG, stat, offset)
+                    result.files_ingested += 1
+
+            plan_paths = [workspace / "plan-record.json", *_sorted_json_files(workspace / "plan-record-archive")]
+            for path in plan_paths:
+                ingest_file(
+                    path, KIND_PLAN_RECORD,
+                    lambda path=path: _ingest_plan_record(conn, fingerprint, path), "plan_versions",
+                )
+
+        for run in iter_archived_runs(workspaces_home / _RECORDS_DIR_NAME):
+            ingest_file(
+                run.path / "metadata.json", KIND_RUN_ARCHIVE,
+                lambda run=run: _ingest_run_archive(conn, run.repo_fingerprint, run.run_id, run.path),
+                "archived_runs",
+            )
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Canned reports
+# ---------------------------------------------------------------------------
+
+def _window(column: str, since: str, until: str) -> tuple[str, list[str]]:
+    clauses: list[str] = []
+    params: list[str] = []
+    if since:
+        clauses.append(f"{column} >= ?")
+        params.append(since)
+    if until:
+        clauses.append(f"{column} <= ?")
+        params.append(until)
+    return " AND ".join(clauses), params
+
+
+def _where(*parts: str) -> str:
+    active = [part for part in parts if part]
+    return (" WHERE " + " AND ".join(active)) if active else ""
+
+
+def report_blocked_by_reason(
+    conn: sqlite3.Connection, *, since: str = "", until: str = "", reason: str = ""
+) -> list[dict[str, Any]]:
+    """Blocked run summaries grouped by reason (or the runs of one reason)."""
+    window, params = _window("timestamp", since, until)
+    if reason:
+        rows = conn.execute(
+            "SELECT repo_fingerprint, run_id, timestamp, phase FROM run_summaries"
+            + _where("result = 'BLOCKED'", "reason_code = ?", window)
+            + " ORDER BY timestamp",
+            [reason, *params],
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT reason_code, COUNT(*) AS runs, COUNT(DISTINCT repo_fingerprint) AS repos, "
+            "MIN(timestamp) AS first_seen, MAX(timestamp) AS last_seen FROM run_summaries"
+            + _where("result = 'BLOCKED'", window)
+            + " GROUP BY reason_code ORDER BY runs DESC, reason_code",
+            params,
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def report_phase6_iterations(
+    conn: sqlite3.Connection, *, since: str = "", until: str = "", reason: str = ""
+) -> list[dict[str, Any]]:
+    """Median/max Phase-6 review iterations of archived Phase-6 runs per repo."""
+    window, params = _window("archived_at", since, until)
+    per_repo: dict[str, list[int]] = {}
+    rows = conn.execute(
+        "SELECT repo_fingerprint, phase6_review_iterations FROM archived_runs"
+        + _where("source_phase LIKE '6%'", "phase6_review_iterations IS NOT NULL", window),
+        params,
+    )
+    for row in rows:
+        per_repo.setdefault(row["repo_fingerprint"], []).append(int(row["phase6_review_iterations"]))
+    return [
+        {
+            "repo_fingerprint": repo,
+            "runs": len(values),
+            "median_iterations": statistics.median(values),
+            "max_iterations": max(values),
+        }
+        for repo, values in sorted(per_repo.items())
+    ]
+
+
+def report_runs_per_repo(
+    conn: sqlite3.Connection, *, since: str = "", until: str = "", reason: str = ""
+) -> list[dict[str, Any]]:
+    """Run summary outcomes per repository."""
+    window, params = _window("timestamp", since, until)
+    rows = conn.execute(
+        "SELECT repo_fingerprint, COUNT(*) AS runs, "
+        "SUM(result = 'OK') AS ok, SUM(result = 'BLOCKED') AS blocked, "
+        "MAX(timestamp) AS last_run FROM run_summaries"
+        + _where(window)
+        + " GROUP BY repo_fingerprint ORDER BY repo_fingerprint",
+        params,
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def report_event_counts(
+    conn: sqlite3.Connection, *, since: str = "", until: str = "", reason: str = ""
+) -> list[dict[str, Any]]:
+    """Logged events grouped by event name."""
+    window, params = _window("ts", since, until)
+    rows = conn.execute(
+        "SELECT event, COUNT(*) AS events, COUNT(DISTINCT repo_fingerprint) AS repos, "
+        "MIN(ts) AS first_seen, MAX(ts) AS last_seen FROM events"
+        + _where(window)
+        + " GROUP BY event ORDER BY events DESC, event",
+        params,
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+REPORTS: dict[str, Callable[..., list[dict[str, Any]]]] = {
+    "blocked-by-reason": report_blocked_by_reason,
+    "phase6-iterations": report_phase6_iterations,
+    "runs-per-repo": report_runs_per_repo,
+    "event-counts": report_event_counts,
+}
+
+
+def run_query(conn: sqlite3.Connection, sql: str) -> list[dict[str, Any]]:
+    """Run an ad-hoc query (use a read-only connection)."""
+    return [dict(row) for row in conn.execute(sql).fetchall()]
+
+
+__all__ = [
+    "DEFAULT_DB_NAME",
+    "IngestResult",
+    "REPORTS",
+    "SCHEMA_SQL",
+    "WAREHOUSE_SCHEMA_VERSION",
+    "connect_warehouse",
+    "default_db_path",
+    "ingest_workspaces",
+    "open_warehouse_readonly",
+    "report_blocked_by_reason",
+    "report_event_counts",
+    "report_phase6_iterations",
+    "report_runs_per_repo",
+    "run_query",
+]
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
 import json
 from pathlib import Path
 from typing import Any, Callable, Literal, Mapping
 
 from governance_runtime.infrastructure.path_contract import canonical_config_root, normalize_absolute_path
+from governance_runtime.infrastructure.stage_environment import stage_environ
 
 
 _SUPPORTED_BINDING_SCHEMAS: tuple[str, ...] = (
@@ -47,7 +47,7 @@ class BindingEvidenceResolver:
         cwd_provider: Callable[[], Path] | None = None,
     ):
         self._env = env if env is not None else {}
-        env_config_root = os.environ.get("OPENCODE_CONFIG_ROOT")
+        env_config_root = self._env.get("OPENCODE_CONFIG_ROOT") or stage_environ().get("OPENCODE_CONFIG_ROOT")
         if env_config_root:
             configured_root = Path(env_config_root).resolve()
         else:
@@ -75,7 +75,7 @@ class BindingEvidenceResolver:
         _ = host_caps
         _ = self._cwd_provider
 
-        env_commands_home = self._env.get("COMMANDS_HOME") or os.environ.get("COMMANDS_HOME")
+        env_commands_home = self._env.get("COMMANDS_HOME") or stage_environ().get("COMMANDS_HOME")
         if env_commands_home:
             try:
                 commands_home = normalize_absolute_path(env_commands_home, purpose="COMMANDS_HOME env")
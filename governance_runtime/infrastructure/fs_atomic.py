@@ -13,6 +13,8 @@ import tempfile
 import time
 from typing import Any, Callable, TypeVar
 
+from governance_runtime.shared.perf_trace import count_fsync, count_write
+
 T = TypeVar("T")
 
 
@@ -53,6 +55,7 @@ def fsync_dir(path: Path) -> None:
         return
     try:
         os.fsync(fd)
+        count_fsync()
     except OSError:
         pass
     finally:
@@ -99,6 +102,8 @@ def atomic_write_text(path: Path, text: str, newline_lf: bool = True, attempts:
             tmp.write(payload)
             tmp.flush()
             os.fsync(tmp.fileno())
+            count_write(len(payload))
+            count_fsync()
             temp_path = Path(tmp.name)
         return safe_replace_with_retries(temp_path, path, attempts=attempts, backoff_ms=backoff_ms)
     finally:
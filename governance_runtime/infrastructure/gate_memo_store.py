@@ -0,0 +1,109 @@
+"""Workspace persistence for memoized gate evaluations.
+
+The memo lives next to SESSION_STATE as ``<workspace>/gate-memo.json`` so
+gate results survive process restarts. It is a pure cache: a missing,
+unreadable or outdated file simply yields an empty memo, and results are
+keyed by the content hash of the state slice they were computed from.
+
+Results are also bound to ``gate_logic_digest()``: the runtime ``VERSION``
+plus the source of ``engine.gate_evaluator`` and every ``governance_runtime``
+module it imports from. Upgrading the runtime or editing gate logic therefore
+discards persisted results without a manual ``GATE_MEMO_VERSION`` bump.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import governance_runtime
+from governance_runtime.engine import gate_evaluator, gate_memo
+from governance_runtime.engine.gate_memo import GateMemo
+from governance_runtime.infrastructure.fs_atomic import atomic_write_json
+
+GATE_MEMO_FILE = "gate-memo.json"
+
+
+def gate_memo_path(workspace_dir: Path) -> Path:
+    return workspace_dir / GATE_MEMO_FILE
+
+
+def _gate_logic_modules() -> list[str]:
+    names = {gate_evaluator.__name__, gate_memo.__name__}
+    for value in vars(gate_evaluator).values():
+        module = value.__name__ if isinstance(value, type(sys)) else getattr(value, "__module__", None)
+        if isinstance(module, str) and module.startswith("governance_runtime."):
+            names.add(module)
+    return sorted(names)
+
+
+@functools.lru_cache(maxsize=1)
+def gate_logic_digest() -> str:
+    """Digest of the runtime version and the gate evaluation sources."""
+    digest = hashlib.sha256()
+    version_file = Path(governance_runtime.__file__).parent / "VERSION"
+    try:
+        digest.update(version_file.read_bytes().strip())
+    except OSError:
+        pass
+    for name in _gate_logic_modules():
+        source = getattr(sys.modules.get(name), "__file__", None)
+        digest.update(b"\0" + name.encode("utf-8") + b"\0")
+        if source:
+            try:
+                digest.update(Path(source).read_bytes())
+            except OSError:
+                pass
+    return digest.hexdigest()
+
+
+def load_gate_memo(workspace_dir: Path) -> GateMemo:
+    logic_digest = gate_logic_digest()
+    try:
+        document = json.loads(gate_memo_path(workspace_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return GateMemo(logic_digest=logic_digest)
+    return GateMemo.from_document(document, logic_digest=logic_digest)
+
+
+def save_gate_memo(workspace_dir: Path, memo: GateMemo) -> bool:
+    """Persist ``memo`` when it gained results; best-effort, never raises."""
+    if not memo.dirty:
+        return False
+    try:
+        atomic_write_json(gate_memo_path(workspace_dir), memo.to_document())
+    except OSError:
+        return False
+    memo.dirty = False
+    return True
+
+
+@contextmanager
+def workspace_gate_memo(workspace_dir: Path, *, persist: bool) -> Iterator[GateMemo]:
+    """Activate the workspace gate memo for one command.
+
+    With ``persist=False`` (read-only surfaces) cached results are used but
+    nothing is written back.
+    """
+    memo = gate_memo.activate(load_gate_memo(workspace_dir))
+    try:
+        yield memo
+    finally:
+        gate_memo.deactivate()
+        if persist:
+            save_gate_memo(workspace_dir, memo)
+
+
+__all__ = [
+    "GATE_MEMO_FILE",
+    "gate_logic_digest",
+    "gate_memo_path",
+    "load_gate_memo",
+    "save_gate_memo",
+    "workspace_gate_memo",
+]
@@ -2,8 +2,8 @@
 
 This module provides the integration seam between the existing production
 runtime (archive_active_run → purge_runtime_artifacts) and the governance
-pipeline. It is designed to be called from new_work_session.py after
-archiving completes.
+pipeline. new_work_session.py does not call it inline: archiving enqueues a
+job (governance_job_queue.py) and the governance worker runs this hook later.
 
 Design:
     - Fail-open for the archive path: governance failures are logged but do NOT
@@ -42,6 +42,11 @@ from governance_runtime.infrastructure.governance_orchestrator import (
 from governance_runtime.infrastructure.fs_atomic import atomic_write_json
 
 
+# Bump when the post-archive pipeline changes in a way that should re-run it
+# for runs that were already processed (it is part of the job key).
+GOVERNANCE_PIPELINE_VERSION = 1
+
+
 # ---------------------------------------------------------------------------
 # Result type
 # ---------------------------------------------------------------------------
@@ -247,6 +252,7 @@ def _append_governance_event(
 
 
 __all__ = [
+    "GOVERNANCE_PIPELINE_VERSION",
     "GovernanceHookResult",
     "detect_regulated_mode",
     "run_post_archive_governance",
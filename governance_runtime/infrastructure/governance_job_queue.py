@@ -0,0 +1,374 @@
+"""Governance Job Queue — deferred post-archive governance pipeline runs.
+
+Running the governance pipeline inline after ``archive_active_run`` makes
+``/new`` wait for archive validation, contract validation, access/retention
+checks and legal-hold loading. Instead, archive completion enqueues one small
+JSON job file and a worker drains the queue later — opportunistically from the
+next ``--materialize`` session-reader call, or explicitly via
+``python -m governance_runtime.entrypoints.governance_worker``.
+
+Design:
+    - One file per job under ``<workspace>/governance-jobs/<job_key>.json``
+    - Job keys are ``<run_id>--v<pipeline version>``: re-enqueueing the same
+      run is a no-op, while a pipeline version bump schedules a fresh run
+    - A worker claims a job with an ``O_CREAT | O_EXCL`` ``.lock`` file, so
+      concurrent workers never run the same job; stale locks are reclaimed
+    - Failed attempts are retried with exponential backoff and the job is
+      marked ``failed`` after ``MAX_ATTEMPTS``
+    - Job files are kept after completion as the idempotency record
+    - Zero external dependencies (stdlib + governance modules)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from governance_runtime.infrastructure.fs_atomic import atomic_write_json
+from governance_runtime.infrastructure.governance_hooks import (
+    GOVERNANCE_PIPELINE_VERSION,
+    GovernanceHookResult,
+    run_post_archive_governance,
+)
+from governance_runtime.infrastructure.time_utils import now_iso
+
+JOB_SCHEMA = "governance.post-archive-job.v1"
+QUEUE_STATUS_SCHEMA = "governance.job-queue-status.v1"
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+STALE_LOCK_SECONDS = 15 * 60
+
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+JobRunner = Callable[..., GovernanceHookResult]
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class EnqueueResult:
+    """Outcome of enqueueing a post-archive governance job."""
+    job_key: str
+    job_path: Path
+    enqueued: bool
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    """Summary of one worker pass over the queue."""
+    processed: int
+    succeeded: int
+    retried: int
+    failed: int
+    skipped_locked: int
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def job_key(run_id: str, pipeline_version: int = GOVERNANCE_PIPELINE_VERSION) -> str:
+    """Return the idempotent queue key for a run and pipeline version."""
+    safe_run_id = _UNSAFE_KEY_CHARS.sub("_", run_id.strip()) or "_"
+    return f"{safe_run_id}--v{int(pipeline_version)}"
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    """Exponential backoff after ``attempts`` failed attempts (capped)."""
+    exponent = max(attempts - 1, 0)
+    return min(RETRY_BASE_SECONDS * (2 ** exponent), RETRY_MAX_SECONDS)
+
+
+def _utc(now: Optional[datetime]) -> datetime:
+    return now if now is not None else datetime.now(timezone.utc)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _parse_iso(value: object) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _load_job(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema") != JOB_SCHEMA:
+        return None
+    return payload
+
+
+def _is_due(job: Mapping[str, Any], now: datetime) -> bool:
+    if job.get("status") != STATUS_PENDING:
+        return False
+    not_before = _parse_iso(job.get("next_attempt_at"))
+    return not_before is None or not_before <= now
+
+
+def _lock_path(job_path: Path) -> Path:
+    return job_path.with_suffix(".lock")
+
+
+def _claim(job_path: Path) -> bool:
+    lock = _lock_path(job_path)
+    for _ in range(2):
+        try:
+            fd = os.open(str(lock), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                age = time.time() - lock.stat().st_mtime
+            except OSError:
+                continue
+            if age < STALE_LOCK_SECONDS:
+                return False
+            lock.unlink(missing_ok=True)
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(str(os.getpid()))
+        return True
+    return False
+
+
+def _iter_job_paths(queue_dir: Path) -> list[Path]:
+    try:
+        entries = list(os.scandir(queue_dir))
+    except OSError:
+        return []
+    return sorted(Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file())
+
+
+# ---------------------------------------------------------------------------
+# Enqueue
+# ---------------------------------------------------------------------------
+
+def enqueue_post_archive_governance(
+    queue_dir: Path,
+    *,
+    archive_path: Path,
+    repo_fingerprint: str,
+    run_id: str,
+    observed_at: str,
+    workspace_root: Path,
+    events_path: Optional[Path] = None,
+    pipeline_version: int = GOVERNANCE_PIPELINE_VERSION,
+) -> EnqueueResult:
+    """Record a post-archive governance job; a no-op if the key already exists.
+
+    This is the only governance work on the interactive archive path: one
+    existence check and one atomic JSON write.
+    """
+    key = job_key(run_id, pipeline_version)
+    path = queue_dir / f"{key}.json"
+    if path.exists():
+        return EnqueueResult(job_key=key, job_path=path, enqueued=False)
+    atomic_write_json(
+        path,
+        {
+            "schema": JOB_SCHEMA,
+            "job_key": key,
+            "pipeline_version": int(pipeline_version),
+            "status": STATUS_PENDING,
+            "attempts": 0,
+            "enqueued_at": now_iso(),
+            "next_attempt_at": "",
+            "completed_at": "",
+            "last_error": "",
+            "governance_passed": None,
+            "summary_path": "",
+            "params": {
+                "archive_path": str(archive_path),
+                "repo_fingerprint": repo_fingerprint,
+                "run_id": run_id,
+                "observed_at": observed_at,
+                "workspace_root": str(workspace_root),
+                "events_path": str(events_path) if events_path is not None else "",
+            },
+        },
+    )
+    return EnqueueResult(job_key=key, job_path=path, enqueued=True)
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+def has_due_jobs(queue_dir: Path, *, now: Optional[datetime] = None) -> bool:
+    """Cheap check used before an opportunistic drain."""
+    moment = _utc(now)
+    for path in _iter_job_paths(queue_dir):
+        job = _load_job(path)
+        if job is not None and _is_due(job, moment):
+            return True
+    return False
+
+
+def _run_job(job: Mapping[str, Any], runner: JobRunner) -> GovernanceHookResult:
+    raw_params = job.get("params")
+    params = raw_params if isinstance(raw_params, Mapping) else {}
+
+    def param(name: str) -> str:
+        return str(params.get(name) or "")
+
+    events_path = param("events_path")
+    return runner(
+        archive_path=Path(param("archive_path")),
+        repo_fingerprint=param("repo_fingerprint"),
+        run_id=param("run_id"),
+        observed_at=param("observed_at"),
+        workspace_root=Path(param("workspace_root")),
+        events_path=Path(events_path) if events_path else None,
+    )
+
+
+def drain_governance_jobs(
+    queue_dir: Path,
+    *,
+    max_jobs: Optional[int] = None,
+    now: Optional[datetime] = None,
+    runner: Optional[JobRunner] = None,
+) -> DrainResult:
+    """Run due jobs in key order until the queue or ``max_jobs`` is exhausted.
+
+    This function NEVER raises for job failures — they are recorded in the
+    job file and retried after ``retry_delay_seconds``.
+    """
+    run = runner if runner is not None else run_post_archive_governance
+    moment = _utc(now)
+    processed = succeeded = retried = failed = skipped_locked = 0
+
+    for path in _iter_job_paths(queue_dir):
+        if max_jobs is not None and processed >= max_jobs:
+            break
+        job = _load_job(path)
+        if job is None or not _is_due(job, moment):
+            continue
+        if not _claim(path):
+            skipped_locked += 1
+            continue
+        try:
+            # Re-read under the lock: another worker may have finished it.
+            job = _load_job(path)
+            if job is None or not _is_due(job, moment):
+                continue
+            processed += 1
+            attempts = int(job.get("attempts") or 0) + 1
+            try:
+                result = _run_job(job, run)
+                error = result.error if not result.executed else ""
+            except Exception as exc:
+                result = None
+                error = str(exc) or exc.__class__.__name__
+            job["attempts"] = attempts
+            if result is not None and result.executed:
+                job["status"] = STATUS_DONE
+                job["completed_at"] = now_iso()
+                job["next_attempt_at"] = ""
+                job["last_error"] = ""
+                job["governance_passed"] = result.governance_passed
+                job["summary_path"] = str(result.summary_path or "")
+                succeeded += 1
+            elif attempts >= MAX_ATTEMPTS:
+                job["status"] = STATUS_FAILED
+                job["completed_at"] = now_iso()
+                job["next_attempt_at"] = ""
+                job["last_error"] = error
+                failed += 1
+            else:
+                job["next_attempt_at"] = _iso(moment + timedelta(seconds=retry_delay_seconds(attempts)))
+                job["last_error"] = error
+                retried += 1
+            atomic_write_json(path, job)
+        finally:
+            _lock_path(path).unlink(missing_ok=True)
+
+    return DrainResult(
+        processed=processed,
+        succeeded=succeeded,
+        retried=retried,
+        failed=failed,
+        skipped_locked=skipped_locked,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Status
+# ---------------------------------------------------------------------------
+
+def governance_queue_status(queue_dir: Path, *, now: Optional[datetime] = None) -> dict[str, object]:
+    """Summarize the queue for the session reader and the worker CLI."""
+    moment = _utc(now)
+    counts = {STATUS_PENDING: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+    due = running = 0
+    oldest_pending = ""
+    problems: list[dict[str, object]] = []
+    for path in _iter_job_paths(queue_dir):
+        job = _load_job(path)
+        if job is None:
+            continue
+        status = str(job.get("status") or "")
+        counts[status] = counts.get(status, 0) + 1
+        if _lock_path(path).exists():
+            running += 1
+        if status == STATUS_PENDING:
+            due += 1 if _is_due(job, moment) else 0
+            enqueued_at = str(job.get("enqueued_at") or "")
+            if enqueued_at and (not oldest_pending or enqueued_at < oldest_pending):
+                oldest_pending = enqueued_at
+        if job.get("last_error"):
+            problems.append(
+                {
+                    "job_key": job.get("job_key"),
+                    "status": status,
+                    "attempts": job.get("attempts"),
+                    "next_attempt_at": job.get("next_attempt_at"),
+                    "last_error": job.get("last_error"),
+                }
+            )
+    return {
+        "schema": QUEUE_STATUS_SCHEMA,
+        "queue_dir": str(queue_dir),
+        "pipeline_version": GOVERNANCE_PIPELINE_VERSION,
+        "counts": counts,
+        "due": due,
+        "running": running,
+        "oldest_pending_enqueued_at": oldest_pending,
+        "errors": problems,
+    }
+
+
+__all__ = [
+    "DrainResult",
+    "EnqueueResult",
+    "JOB_SCHEMA",
+    "MAX_ATTEMPTS",
+    "QUEUE_STATUS_SCHEMA",
+    "drain_governance_jobs",
+    "enqueue_post_archive_governance",
+    "governance_queue_status",
+    "has_due_jobs",
+    "job_key",
+    "retry_delay_seconds",
+]
@@ -63,6 +63,7 @@ from governance_runtime.domain.regulated_mode import (
     regulated_mode_summary,
 )
 from governance_runtime.domain.retention import (
+    ArchiveFormat,
     DeletionDecision,
     DeletionEvaluation,
     LegalHold,
@@ -377,6 +378,7 @@ def governance_export(
     apply_redaction: bool = False,
     redaction_max_level: ClassificationLevel = ClassificationLevel.INTERNAL,
     legal_holds_dir: Optional[Path] = None,
+    export_format: ArchiveFormat = ArchiveFormat.DIRECTORY,
 ) -> tuple[GovernancePipelineResult, Optional[ArchiveExportManifest]]:
     """Governance-gated export: validates all governance rules before exporting.
 
@@ -395,6 +397,7 @@ def governance_export(
         apply_redaction: Whether to apply redaction
         redaction_max_level: Maximum classification level in output
         legal_holds_dir: Directory containing legal hold records
+        export_format: Bundle format (directory, zip, tar.gz, tar.zst)
 
     Returns:
         Tuple of (GovernancePipelineResult, ArchiveExportManifest or None)
@@ -440,6 +443,7 @@ def governance_export(
         run_id=run_id,
         exported_at=exported_at,
         exported_by=exported_by,
+        export_format=export_format,
         apply_redaction=apply_redaction,
         redaction_max_level=redaction_max_level,
     )
@@ -29,8 +29,10 @@ from governance_runtime.domain.retention import (
     DeletionDecision,
     DeletionEvaluation,
     LegalHold,
+    LegalHoldIndex,
     LegalHoldStatus,
     evaluate_deletion,
+    index_legal_holds,
 )
 from governance_runtime.domain.regulated_mode import (
     DEFAULT_CONFIG,
@@ -66,6 +68,7 @@ def check_archive_retention(
     compliance_framework: str = "",
     regulated_mode_config: RegulatedModeConfig = DEFAULT_CONFIG,
     legal_holds: Sequence[LegalHold] = (),
+    hold_index: Optional[LegalHoldIndex] = None,
 ) -> RetentionGuardResult:
     """Check whether an archive run may be purged.
 
@@ -80,6 +83,7 @@ def check_archive_retention(
         compliance_framework: Active compliance framework (e.g. 'DATEV')
         regulated_mode_config: Regulated mode configuration
         legal_holds: Active legal holds to check
+        hold_index: Prebuilt index of legal_holds (used instead of the list)
 
     Returns:
         RetentionGuardResult with purge_allowed=True/False
@@ -107,6 +111,7 @@ def check_archive_retention(
         regulated_mode_active=regulated_eval.is_active,
         regulated_mode_minimum_days=regulated_mode_config.minimum_retention_days,
         legal_holds=legal_holds,
+        hold_index=hold_index,
     )
 
     return RetentionGuardResult(
@@ -129,8 +134,10 @@ def check_batch_archive_retention(
     Each entry in archive_runs must have: run_id, repo_fingerprint,
     classification_level, archived_at. Optional: compliance_framework.
 
-    Returns a list of RetentionGuardResult in the same order.
+    Returns a list of RetentionGuardResult in the same order. The holds are
+    indexed once, so each run costs a constant number of hold lookups.
     """
+    hold_index = index_legal_holds(legal_holds)
     results: list[RetentionGuardResult] = []
     for entry in archive_runs:
         result = check_archive_retention(
@@ -140,18 +147,24 @@ def check_batch_archive_retention(
             archived_at=entry.get("archived_at", ""),
             compliance_framework=entry.get("compliance_framework", ""),
             regulated_mode_config=regulated_mode_config,
-            legal_holds=legal_holds,
+            hold_index=hold_index,
         )
         results.append(result)
     return results
 
 
+#: Parsed hold files keyed by path, validated by (st_mtime_ns, st_size)
+_HOLD_FILE_CACHE: dict[Path, tuple[tuple[int, int], Optional[LegalHold]]] = {}
+
+
 def load_legal_holds_from_dir(holds_dir: Path) -> list[LegalHold]:
     """Load legal hold records from a directory.
 
     Each JSON file in the directory is expected to be a legal hold record
     with the governance.legal-hold-record.v1 schema. Invalid files are
     silently skipped (fail-open for loading, fail-closed for evaluation).
+    Files whose mtime and size are unchanged since the last call are not
+    re-read, so repeated sweeps only parse new or edited hold records.
 
     Returns a list of parsed LegalHold records.
     """
@@ -163,35 +176,49 @@ def load_legal_holds_from_dir(holds_dir: Path) -> list[LegalHold]:
         if not path.is_file() or not path.suffix == ".json":
             continue
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
-        if not isinstance(payload, dict):
+            stat = path.stat()
+        except OSError:
             continue
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _HOLD_FILE_CACHE.get(path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, _parse_legal_hold_file(path))
+            _HOLD_FILE_CACHE[path] = cached
+        if cached[1] is not None:
+            holds.append(cached[1])
 
-        status_str = str(payload.get("status", "none")).strip().lower()
-        try:
-            status = LegalHoldStatus(status_str)
-        except ValueError:
-            status = LegalHoldStatus.NONE
+    return holds
 
-        try:
-            hold = LegalHold(
-                hold_id=str(payload.get("hold_id", "")),
-                scope_type=str(payload.get("scope_type", "")),
-                scope_value=str(payload.get("scope_value", "")),
-                reason=str(payload.get("reason", "")),
-                status=status,
-                created_at=str(payload.get("created_at", "")),
-                created_by=str(payload.get("created_by", "")),
-                released_at=str(payload.get("released_at", "")),
-                released_by=str(payload.get("released_by", "")),
-            )
-            holds.append(hold)
-        except Exception:
-            continue
 
-    return holds
+def _parse_legal_hold_file(path: Path) -> Optional[LegalHold]:
+    """Parse one hold record file; None when it is unreadable or malformed."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    status_str = str(payload.get("status", "none")).strip().lower()
+    try:
+        status = LegalHoldStatus(status_str)
+    except ValueError:
+        status = LegalHoldStatus.NONE
+
+    try:
+        return LegalHold(
+            hold_id=str(payload.get("hold_id", "")),
+            scope_type=str(payload.get("scope_type", "")),
+            scope_value=str(payload.get("scope_value", "")),
+            reason=str(payload.get("reason", "")),
+            status=status,
+            created_at=str(payload.get("created_at", "")),
+            created_by=str(payload.get("created_by", "")),
+            released_at=str(payload.get("released_at", "")),
+            released_by=str(payload.get("released_by", "")),
+        )
+    except Exception:
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -12,11 +12,16 @@ import tempfile
 from pathlib import Path
 from typing import Mapping
 
+from governance_runtime.infrastructure.adapters.logging.event_sink import append_jsonl_line
+from governance_runtime.shared.perf_trace import count_parse, count_read, count_write
+
 
 def load_json(path: Path) -> dict[str, object]:
     """Read and parse a JSON file. Raises on any failure."""
     raw = path.read_text(encoding="utf-8")
+    count_read(len(raw))
     data = json.loads(raw)
+    count_parse("json")
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}, got {type(data).__name__}")
     return data
@@ -30,6 +35,7 @@ def write_json_atomic(path: Path, payload: Mapping[str, object]) -> None:
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as handle:
             handle.write(text)
+        count_write(len(text))
         os.replace(temp_path, path)
     finally:
         if os.path.exists(temp_path):
@@ -37,7 +43,9 @@ def write_json_atomic(path: Path, payload: Mapping[str, object]) -> None:
 
 
 def append_jsonl(path: Path, event: Mapping[str, object]) -> None:
-    """Append a JSON object as a single line to a JSONL file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, ensure_ascii=True, separators=(",", ":")) + "\n")
+    """Append a JSON object as a single line to a JSONL file.
+
+    Appends take the shared log lock so workspace logs can be rotated into
+    segments safely; see ``infrastructure.adapters.logging.log_segments``.
+    """
+    append_jsonl_line(path, json.dumps(event, ensure_ascii=True, separators=(",", ":")) + "\n", fsync=False)
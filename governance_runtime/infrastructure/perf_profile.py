@@ -0,0 +1,140 @@
+"""Per-command performance profiles for governance entrypoints.
+
+Profiling is opt-in: set ``OPENCODE_PROFILE=1`` (the launcher's ``--profile``
+flag does this) and every launcher-routed command records nested spans and
+I/O counters through ``governance_runtime.shared.perf_trace``. When the
+command finishes, one ``opencode.perf.v1`` record is appended to
+``<workspace>/logs/perf.jsonl`` of the active session. ``perf.jsonl`` rotates
+into indexed segments like the other workspace logs.
+
+``summarize_perf_log`` aggregates the newest records for the session reader's
+``--perf-summary`` readout.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+from governance_runtime.infrastructure.adapters.logging.log_segments import tail_log_events
+from governance_runtime.infrastructure.json_store import append_jsonl
+from governance_runtime.infrastructure.time_utils import now_iso
+from governance_runtime.shared import perf_trace
+
+PROFILE_ENV = "OPENCODE_PROFILE"
+PERF_LOG_NAME = "perf.jsonl"
+PERF_SUMMARY_SCHEMA = "opencode.perf-summary.v1"
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def profiling_enabled(env: Mapping[str, str] | None = None) -> bool:
+    source = os.environ if env is None else env
+    return str(source.get(PROFILE_ENV, "")).strip().lower() in _TRUTHY
+
+
+def perf_log_path(workspace_dir: Path) -> Path:
+    return workspace_dir / "logs" / PERF_LOG_NAME
+
+
+def _active_workspace_dir(env: Mapping[str, str] | None) -> Path | None:
+    from governance_runtime.infrastructure.session_locator import resolve_active_session_paths
+
+    try:
+        session_path, _, _, _ = resolve_active_session_paths(env=env)
+    except Exception:
+        return None
+    return session_path.parent
+
+
+def run_profiled(
+    command: str,
+    main: Callable[[], int],
+    *,
+    env: Mapping[str, str] | None = None,
+    workspace_dir: Path | None = None,
+) -> int:
+    """Run an entrypoint ``main`` and persist its profile when profiling is enabled.
+
+    Without ``OPENCODE_PROFILE`` this is a plain call. Profile persistence is
+    best-effort and never changes the command's exit code.
+    """
+
+    if not profiling_enabled(env):
+        return main()
+    recorder = perf_trace.activate(command)
+    exit_code: int | None = None
+    try:
+        exit_code = main()
+        return exit_code
+    finally:
+        perf_trace.deactivate()
+        record = recorder.to_record()
+        record["ts_utc"] = now_iso()
+        record["exit_code"] = exit_code
+        record["argv"] = list(sys.argv[1:])
+        target = workspace_dir if workspace_dir is not None else _active_workspace_dir(env)
+        if target is not None:
+            try:
+                append_jsonl(perf_log_path(target), record)
+            except OSError:
+                pass
+
+
+def _flatten(nodes: Sequence[Mapping[str, Any]], totals: dict[str, dict[str, float]]) -> None:
+    for node in nodes:
+        name = str(node.get("name") or "")
+        bucket = totals.setdefault(name, {"calls": 0, "ms": 0.0})
+        bucket["calls"] += int(node.get("calls") or 0)
+        bucket["ms"] += float(node.get("ms") or 0.0)
+        children = node.get("children")
+        if isinstance(children, list):
+            _flatten(children, totals)
+
+
+def summarize_perf_log(workspace_dir: Path, *, last: int = 25, top: int = 10) -> dict[str, object]:
+    """Aggregate the newest ``last`` perf records of a workspace."""
+
+    records = tail_log_events(
+        perf_log_path(workspace_dir),
+        last,
+        accept=lambda event: event.get("schema") == perf_trace.PERF_RECORD_SCHEMA,
+    )
+    commands: dict[str, dict[str, float]] = {}
+    counters: dict[str, float] = {name: 0 for name in perf_trace.COUNTER_NAMES}
+    spans: dict[str, dict[str, float]] = {}
+    for record in records:
+        entry = commands.setdefault(str(record.get("command") or ""), {"runs": 0, "total_ms": 0.0, "max_ms": 0.0})
+        duration = float(record.get("duration_ms") or 0.0)
+        entry["runs"] += 1
+        entry["total_ms"] += duration
+        entry["max_ms"] = max(entry["max_ms"], duration)
+        raw_counters = record.get("counters")
+        if isinstance(raw_counters, Mapping):
+            for key, value in raw_counters.items():
+                if isinstance(value, (int, float)):
+                    counters[str(key)] = counters.get(str(key), 0) + value
+        raw_spans = record.get("spans")
+        if isinstance(raw_spans, list):
+            _flatten(raw_spans, spans)
+
+    hottest = sorted(spans.items(), key=lambda item: (-item[1]["ms"], item[0]))[: max(top, 0)]
+    return {
+        "schema": PERF_SUMMARY_SCHEMA,
+        "perf_log": str(perf_log_path(workspace_dir)),
+        "records": len(records),
+        "commands": {
+            name: {
+                "runs": int(entry["runs"]),
+                "avg_ms": round(entry["total_ms"] / entry["runs"], 3),
+                "max_ms": round(entry["max_ms"], 3),
+            }
+            for name, entry in sorted(commands.items())
+        },
+        "counters": {key: round(value, 3) for key, value in counters.items()},
+        "hot_spans": [
+            {"name": name, "calls": int(bucket["calls"]), "ms": round(bucket["ms"], 3)} for name, bucket in hottest
+        ],
+    }
@@ -6,12 +6,13 @@ resolution logic; this module provides the I/O to load phase_api.yaml.
 """
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Any, Mapping
 
+from governance_runtime.infrastructure.stage_environment import stage_environ
 
-def _candidate_phase_api_paths() -> list[Path]:
+
+def _candidate_phase_api_paths(env: Mapping[str, str] | None = None) -> list[Path]:
     """Resolve ordered candidates for phase_api.yaml.
 
     Priority:
@@ -22,12 +23,13 @@ def _candidate_phase_api_paths() -> list[Path]:
     5) Legacy repo root fallback (phase_api.yaml)
     """
 
+    source_env = stage_environ() if env is None else env
     candidates: list[Path] = []
 
     try:
         from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
 
-        binding_resolver = BindingEvidenceResolver()
+        binding_resolver = BindingEvidenceResolver(env=source_env)
         evidence = binding_resolver.resolve(mode="kernel")
         if evidence.spec_home is not None:
             candidates.append(evidence.spec_home / "phase_api.yaml")
@@ -36,15 +38,15 @@ def _candidate_phase_api_paths() -> list[Path]:
     except Exception:
         pass
 
-    env_local_root = os.environ.get("OPENCODE_LOCAL_ROOT", "").strip()
+    env_local_root = source_env.get("OPENCODE_LOCAL_ROOT", "").strip()
     if env_local_root:
         candidates.append(Path(env_local_root).expanduser() / "governance_spec" / "phase_api.yaml")
 
-    env_commands_home = os.environ.get("COMMANDS_HOME", "").strip()
+    env_commands_home = source_env.get("COMMANDS_HOME", "").strip()
     if env_commands_home:
         candidates.append(Path(env_commands_home).expanduser() / "phase_api.yaml")
 
-    env_config_root = os.environ.get("OPENCODE_CONFIG_ROOT", "").strip()
+    env_config_root = source_env.get("OPENCODE_CONFIG_ROOT", "").strip()
     if env_config_root:
         candidates.append(Path(env_config_root).expanduser() / "commands" / "phase_api.yaml")
 
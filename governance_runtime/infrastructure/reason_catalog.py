@@ -0,0 +1,243 @@
+"""Compiled blocked-reason catalog shared by every reason-metadata consumer.
+
+``assets/config/blocked_reason_catalog.yaml`` is the SSOT for remediation text
+of BLOCKED-* reason codes. Parsing it is the expensive part, so this module
+compiles it once per content hash into a frozen ``reason_code -> entry``
+mapping and hands the same object to every caller in the process (run
+summary writing, audit tooling).
+
+Design:
+    - ``load_reason_catalog`` re-reads the YAML only when the file's size or
+      mtime changed, and recompiles only when its SHA-256 changed
+    - If ``blocked_reason_catalog.compiled.json`` next to the YAML records the
+      same source hash, it is used instead and YAML is never parsed; the
+      installer emits it via ``write_compiled_reason_catalog``
+    - Schema refs come from the embedded reason registry at lookup time, so
+      the compiled artifact depends only on the catalog content
+    - Loading is stdlib only (PyYAML optional), so the installer can load
+      this file directly; writing the compiled artifact uses ``fs_atomic``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+try:
+    import yaml
+except Exception:  # pragma: no cover
+    yaml = None  # type: ignore
+
+CATALOG_FILENAME = "blocked_reason_catalog.yaml"
+COMPILED_FILENAME = "blocked_reason_catalog.compiled.json"
+COMPILED_SCHEMA = "governance.reason-catalog.compiled.v1"
+
+DEFAULT_HOW_TO_FIX = "Check SESSION_STATE.Diagnostics.ReasonPayloads for details."
+
+
+@dataclass(frozen=True)
+class ReasonEntry:
+    """Remediation metadata of one reason code."""
+    reason_code: str
+    surface: str
+    category: str
+    message_template: str
+    recovery_steps: tuple[str, ...]
+    quick_fix_commands: tuple[str, ...]
+    next_command_pointer: str
+
+    @property
+    def schema_ref(self) -> Optional[str]:
+        try:
+            from governance_runtime.engine._embedded_reason_registry import EMBEDDED_REASON_CODE_TO_SCHEMA_REF
+        except Exception:
+            return None
+        return EMBEDDED_REASON_CODE_TO_SCHEMA_REF.get(self.reason_code)
+
+    def remediation(self) -> dict[str, Any]:
+        """Return the run-summary remediation shape for this reason."""
+        return {
+            "summary": self.message_template or self.reason_code,
+            "how_to_fix": self.recovery_steps[0] if self.recovery_steps else DEFAULT_HOW_TO_FIX,
+            "copy_paste_command": self.quick_fix_commands[0] if self.quick_fix_commands else None,
+            "docs_link": None,
+        }
+
+
+def default_remediation(reason_code: str) -> dict[str, Any]:
+    return {
+        "summary": reason_code,
+        "how_to_fix": DEFAULT_HOW_TO_FIX,
+        "copy_paste_command": None,
+        "docs_link": None,
+    }
+
+
+@dataclass(frozen=True)
+class CompiledReasonCatalog:
+    """Frozen ``reason_code -> ReasonEntry`` mapping for one catalog content hash."""
+    content_hash: str
+    entries: Mapping[str, ReasonEntry]
+
+    def get(self, reason_code: str) -> Optional[ReasonEntry]:
+        return self.entries.get(reason_code.strip())
+
+    def remediation(self, reason_code: str) -> dict[str, Any]:
+        entry = self.get(reason_code)
+        return entry.remediation() if entry is not None else default_remediation(reason_code)
+
+    def to_document(self) -> dict[str, Any]:
+        return {
+            "schema": COMPILED_SCHEMA,
+            "source_sha256": self.content_hash,
+            "blocked_reasons": {
+                code: {
+                    "surface": entry.surface,
+                    "category": entry.category,
+                    "message_template": entry.message_template,
+                    "recovery_steps": list(entry.recovery_steps),
+                    "quick_fix_commands": list(entry.quick_fix_commands),
+                    "next_command_pointer": entry.next_command_pointer,
+                }
+                for code, entry in sorted(self.entries.items())
+            },
+        }
+
+    @classmethod
+    def from_document(cls, document: object) -> Optional["CompiledReasonCatalog"]:
+        if not isinstance(document, Mapping) or document.get("schema") != COMPILED_SCHEMA:
+            return None
+        source_hash = document.get("source_sha256")
+        if not isinstance(source_hash, str) or not source_hash:
+            return None
+        return compile_reason_catalog(document, content_hash=source_hash)
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def _strings(value: object) -> tuple[str, ...]:
+    if not isinstance(value, list):
+        return ()
+    return tuple(item for item in value if isinstance(item, str) and item.strip())
+
+
+def _string(value: object) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def compile_reason_catalog(payload: object, *, content_hash: str) -> CompiledReasonCatalog:
+    """Compile a parsed catalog (or compiled document) into a frozen mapping."""
+    blocked = payload.get("blocked_reasons") if isinstance(payload, Mapping) else None
+    entries: dict[str, ReasonEntry] = {}
+    if isinstance(blocked, Mapping):
+        for code, raw in blocked.items():
+            if not isinstance(raw, Mapping):
+                continue
+            reason_code = str(code).strip()
+            entries[reason_code] = ReasonEntry(
+                reason_code=reason_code,
+                surface=_string(raw.get("surface")),
+                category=_string(raw.get("category")),
+                message_template=_string(raw.get("message_template")),
+                recovery_steps=_strings(raw.get("recovery_steps")),
+                quick_fix_commands=_strings(raw.get("quick_fix_commands")),
+                next_command_pointer=_string(raw.get("next_command_pointer")),
+            )
+    return CompiledReasonCatalog(content_hash=content_hash, entries=MappingProxyType(entries))
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_BY_HASH: dict[str, CompiledReasonCatalog] = {}
+_BY_PATH: dict[str, tuple[int, int, str]] = {}
+
+
+def clear_reason_catalog_cache() -> None:
+    _BY_HASH.clear()
+    _BY_PATH.clear()
+
+
+def _compiled_sidecar(catalog_path: Path, content_hash: str) -> Optional[CompiledReasonCatalog]:
+    try:
+        document = json.loads((catalog_path.parent / COMPILED_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    compiled = CompiledReasonCatalog.from_document(document)
+    return compiled if compiled is not None and compiled.content_hash == content_hash else None
+
+
+def load_reason_catalog(catalog_path: Path) -> Optional[CompiledReasonCatalog]:
+    """Return the compiled catalog for ``catalog_path``, or ``None`` if unavailable."""
+    try:
+        stat = catalog_path.stat()
+    except OSError:
+        return None
+    key = str(catalog_path)
+    known = _BY_PATH.get(key)
+    if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns) and known[2] in _BY_HASH:
+        return _BY_HASH[known[2]]
+
+    try:
+        raw = catalog_path.read_bytes()
+    except OSError:
+        return None
+    content_hash = hashlib.sha256(raw).hexdigest()
+    compiled = _BY_HASH.get(content_hash) or _compiled_sidecar(catalog_path, content_hash)
+    if compiled is None:
+        if yaml is None:
+            return None
+        try:
+            payload = yaml.safe_load(raw.decode("utf-8"))
+        except Exception:
+            return None
+        compiled = compile_reason_catalog(payload, content_hash=content_hash)
+    _BY_HASH[content_hash] = compiled
+    _BY_PATH[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+    return compiled
+
+
+def catalog_path_for_runtime_home(runtime_home: Path) -> Optional[Path]:
+    """Locate the catalog below an installed or source ``governance_runtime`` root."""
+    for candidate in (runtime_home / "assets" / "config" / CATALOG_FILENAME, runtime_home / CATALOG_FILENAME):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def write_compiled_reason_catalog(catalog_path: Path) -> Optional[Path]:
+    """Emit ``blocked_reason_catalog.compiled.json`` next to ``catalog_path``.
+
+    Returns the written path, or ``None`` when the catalog cannot be loaded.
+    """
+    compiled = load_reason_catalog(catalog_path)
+    if compiled is None:
+        return None
+    # Imported here so loading the catalog stays stdlib only.
+    from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+
+    out_path = catalog_path.parent / COMPILED_FILENAME
+    atomic_write_text(out_path, json.dumps(compiled.to_document(), indent=2, sort_keys=True, ensure_ascii=True) + "\n")
+    return out_path
+
+
+__all__ = [
+    "CATALOG_FILENAME",
+    "COMPILED_FILENAME",
+    "COMPILED_SCHEMA",
+    "CompiledReasonCatalog",
+    "ReasonEntry",
+    "catalog_path_for_runtime_home",
+    "clear_reason_catalog_cache",
+    "compile_reason_catalog",
+    "default_remediation",
+    "load_reason_catalog",
+    "write_compiled_reason_catalog",
+]
@@ -6,7 +6,8 @@ that return new dicts (no mutation of inputs, no I/O).
 
 Design:
     - Pure functions operating on dicts
-    - Uses classification.py as SSOT for redaction rules
+    - Uses classification.py as SSOT for redaction rules, walked through
+      the precompiled CLASSIFICATION_TRIE
     - Deterministic: same input + same policy = same output
     - Fail-closed: unknown fields are redacted with HASH strategy
     - Zero external dependencies (stdlib only + governance.domain)
@@ -19,12 +20,14 @@ import re
 from typing import Any, Mapping, Optional
 
 from governance_runtime.domain.classification import (
+    CLASSIFICATION_TRIE,
     ClassificationLevel,
-    FieldClassification,
-    RedactionStrategy,
-    classify_field,
+    ClassificationNode,
     DEFAULT_CLASSIFICATION,
+    LEVEL_RANK,
+    RedactionStrategy,
 )
+from governance_runtime.engine.sanitization import is_secret_key, sanitize_for_output
 
 
 # ---------------------------------------------------------------------------
@@ -85,6 +88,56 @@ def apply_redaction(value: Any, strategy: RedactionStrategy) -> Any:
 # Document-level redaction
 # ---------------------------------------------------------------------------
 
+_NO_CHILDREN: Mapping[str, ClassificationNode] = {}
+
+
+def _rewrite_mapping(
+    mapping: Mapping[Any, Any],
+    children: Mapping[str, ClassificationNode],
+    *,
+    allowed_rank: int,
+    override_strategy: Optional[RedactionStrategy],
+    sanitize: bool,
+) -> dict[Any, Any]:
+    """Redact one mapping level, walking the classification trie alongside it.
+
+    Only keys with a trie child are classified individually; an unclassified
+    subtree is resolved in one step from DEFAULT_CLASSIFICATION. With
+    ``sanitize`` the output sanitization of ``sanitize_for_output`` is folded
+    into the same walk.
+    """
+    default_redacted = LEVEL_RANK[DEFAULT_CLASSIFICATION.level] > allowed_rank
+    default_strategy = override_strategy if override_strategy is not None else DEFAULT_CLASSIFICATION.redaction
+    result: dict[Any, Any] = {}
+    for key, value in mapping.items():
+        if sanitize:
+            key = str(key)
+            if is_secret_key(key):
+                value = "***"
+        node = children.get(key) if children else None
+        if node is None:
+            if default_redacted:
+                result[key] = apply_redaction(sanitize_for_output(value) if sanitize else value, default_strategy)
+            else:
+                result[key] = sanitize_for_output(value) if sanitize else value
+            continue
+        classification = node.classification if node.classification is not None else DEFAULT_CLASSIFICATION
+        if LEVEL_RANK.get(classification.level, 1) > allowed_rank:
+            strategy = override_strategy if override_strategy is not None else classification.redaction
+            result[key] = apply_redaction(sanitize_for_output(value) if sanitize else value, strategy)
+        elif isinstance(value, dict):
+            result[key] = _rewrite_mapping(
+                value,
+                node.children,
+                allowed_rank=allowed_rank,
+                override_strategy=override_strategy,
+                sanitize=sanitize,
+            )
+        else:
+            result[key] = sanitize_for_output(value) if sanitize else value
+    return result
+
+
 def redact_document(
     artifact_name: str,
     document: Mapping[str, Any],
@@ -96,7 +149,9 @@ def redact_document(
 
     Fields classified above max_level are redacted.
     The override_strategy, if provided, is used instead of each field's
-    configured strategy.
+    configured strategy. Nested dicts are classified with parent.child
+    paths; subtrees without any classified field are shared with the input
+    instead of being copied key by key.
 
     Args:
         artifact_name: The artifact filename (e.g. "metadata.json")
@@ -108,69 +163,35 @@ def redact_document(
     Returns:
         A new dict with redacted values.
     """
-    level_order = {
-        ClassificationLevel.PUBLIC: 0,
-        ClassificationLevel.INTERNAL: 1,
-        ClassificationLevel.CONFIDENTIAL: 2,
-        ClassificationLevel.RESTRICTED: 3,
-    }
-
-    result: dict[str, Any] = {}
-    for key, value in document.items():
-        classification = classify_field(artifact_name, key)
+    root = CLASSIFICATION_TRIE.get(artifact_name)
+    return _rewrite_mapping(
+        document,
+        root.children if root is not None else _NO_CHILDREN,
+        allowed_rank=LEVEL_RANK.get(max_level, 1),
+        override_strategy=override_strategy,
+        sanitize=False,
+    )
 
-        field_level = level_order.get(classification.level, 1)
-        allowed_level = level_order.get(max_level, 1)
 
-        if field_level > allowed_level:
-            strategy = override_strategy if override_strategy is not None else classification.redaction
-            result[key] = apply_redaction(value, strategy)
-        else:
-            # Recurse into nested dicts
-            if isinstance(value, dict):
-                result[key] = _redact_nested(
-                    artifact_name, key, value,
-                    max_level=max_level,
-                    level_order=level_order,
-                    override_strategy=override_strategy,
-                )
-            else:
-                result[key] = value
-
-    return result
-
-
-def _redact_nested(
+def sanitize_and_redact_document(
     artifact_name: str,
-    parent_key: str,
-    nested: Mapping[str, Any],
+    document: Mapping[str, Any],
     *,
-    max_level: ClassificationLevel,
-    level_order: dict[ClassificationLevel, int],
-    override_strategy: Optional[RedactionStrategy],
+    max_level: ClassificationLevel = ClassificationLevel.INTERNAL,
 ) -> dict[str, Any]:
-    """Redact nested dict fields using parent.child notation for classification lookup."""
-    result: dict[str, Any] = {}
-    for key, value in nested.items():
-        field_path = f"{parent_key}.{key}"
-        classification = classify_field(artifact_name, field_path)
-
-        field_level = level_order.get(classification.level, 1)
-        allowed_level = level_order.get(max_level, 1)
+    """Single-pass equivalent of ``redact_document(name, sanitize_for_output(doc))``.
 
-        if field_level > allowed_level:
-            strategy = override_strategy if override_strategy is not None else classification.redaction
-            result[key] = apply_redaction(value, strategy)
-        elif isinstance(value, dict):
-            result[key] = _redact_nested(
-                artifact_name, field_path, value,
-                max_level=max_level,
-                level_order=level_order,
-                override_strategy=override_strategy,
-            )
-        else:
-            result[key] = value
-    return result
+    Used by bundle export so each archive document is rewritten in one walk
+    instead of a full sanitized copy followed by a redacted copy.
+    """
+    root = CLASSIFICATION_TRIE.get(artifact_name)
+    return _rewrite_mapping(
+        document,
+        root.children if root is not None else _NO_CHILDREN,
+        allowed_rank=LEVEL_RANK.get(max_level, 1),
+        override_strategy=None,
+        sanitize=True,
+    )
 
 
 def redact_archive(
@@ -197,4 +218,5 @@ __all__ = [
     "apply_redaction",
     "redact_document",
     "redact_archive",
+    "sanitize_and_redact_document",
 ]
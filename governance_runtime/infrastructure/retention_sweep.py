@@ -0,0 +1,461 @@
+"""Retention Sweep — Enumerate archived runs and plan retention deletions.
+
+Walks ``governance-records/<fingerprint>/runs`` lazily, evaluates every
+archived run against the retention domain model and writes one deletion
+plan line per run. Approved (``allowed``) entries of a plan can then be
+executed, optionally in parallel.
+
+Design:
+    - Legal holds are indexed by scope once per sweep (index_legal_holds),
+      hold files are loaded through the stat-cached guard loader; execution
+      reloads them and re-evaluates each run right before deleting it
+    - Runs are discovered with os.scandir and evaluated as a stream; only
+      one run's metadata is held in memory at a time
+    - The plan is JSONL, written to a temp file and atomically renamed
+    - Fail-closed: unreadable metadata or timestamps block deletion, and
+      execution only removes directories that are still below the swept root
+    - Zero external dependencies (stdlib + governance)
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Sequence
+
+from governance_runtime.domain.regulated_mode import (
+    DEFAULT_CONFIG,
+    RegulatedModeConfig,
+    evaluate_mode,
+)
+from governance_runtime.domain.retention import (
+    DeletionDecision,
+    DeletionEvaluation,
+    LegalHold,
+    LegalHoldIndex,
+    evaluate_deletion,
+    index_legal_holds,
+)
+from governance_runtime.infrastructure.fs_atomic import safe_replace_with_retries
+from governance_runtime.infrastructure.governance_retention_guard import load_legal_holds_from_dir
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DELETION_PLAN_SCHEMA = "governance.retention-deletion-plan.v1"
+SWEEP_SUMMARY_SCHEMA = "governance.retention-sweep-summary.v1"
+EXECUTION_SUMMARY_SCHEMA = "governance.retention-deletion-execution.v1"
+
+#: Deepest run directory below a runs/ root: <slug>/YYYY/YYYY-MM/YYYY-MM-DD/<run_id>
+_MAX_RUN_DEPTH = 5
+
+#: Default bound for concurrent deletions
+DEFAULT_DELETE_WORKERS = 4
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ArchivedRun:
+    """One archived run directory discovered by the sweep."""
+    path: Path
+    run_id: str
+    repo_fingerprint: str
+    archived_at: str
+    classification_level: str
+    compliance_framework: str
+
+
+@dataclass(frozen=True)
+class SweepEntry:
+    """Retention decision for one archived run."""
+    run: ArchivedRun
+    evaluation: DeletionEvaluation
+    size_bytes: int
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+def _iter_run_dirs(directory: Path, depth: int) -> Iterator[Path]:
+    try:
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        candidate = Path(entry.path)
+        if (candidate / "metadata.json").is_file():
+            yield candidate
+        elif depth < _MAX_RUN_DEPTH:
+            yield from _iter_run_dirs(candidate, depth + 1)
+
+
+def _load_json_object(path: Path) -> dict:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def iter_archived_runs(
+    records_root: Path,
+    *,
+    classification_level: str = "internal",
+    compliance_framework: str = "",
+) -> Iterator[ArchivedRun]:
+    """Lazily yield archived runs below ``records_root``.
+
+    ``records_root`` is a ``governance-records`` directory; both the dated
+    layout and legacy ``runs/<run_id>`` directories are found, and the
+    repository fingerprint is taken from the records directory. Per-run
+    ``classification_level`` / ``compliance_framework`` in metadata.json
+    override the defaults.
+    """
+    if not records_root.is_dir():
+        return
+    for fingerprint_dir in sorted(p for p in records_root.iterdir() if p.is_dir()):
+        runs_root = fingerprint_dir / "runs"
+        if not runs_root.is_dir():
+            continue
+        for run_path in _iter_run_dirs(runs_root, 1):
+            yield _read_archived_run(
+                run_path,
+                fingerprint_dir.name,
+                classification_level=classification_level,
+                compliance_framework=compliance_framework,
+            )
+
+
+def _read_archived_run(
+    run_path: Path,
+    repo_fingerprint: str,
+    *,
+    classification_level: str,
+    compliance_framework: str,
+) -> ArchivedRun:
+    metadata = _load_json_object(run_path / "metadata.json")
+    archived_at = str(metadata.get("archived_at") or "")
+    if not archived_at:
+        manifest = _load_json_object(run_path / "run-manifest.json")
+        archived_at = str(manifest.get("materialized_at") or "")
+    return ArchivedRun(
+        path=run_path,
+        run_id=str(metadata.get("run_id") or run_path.name),
+        repo_fingerprint=repo_fingerprint,
+        archived_at=archived_at,
+        classification_level=str(metadata.get("classification_level") or classification_level),
+        compliance_framework=str(metadata.get("compliance_framework") or compliance_framework),
+    )
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+def _days_between(archived_at: str, now: datetime) -> int:
+    when = datetime.fromisoformat(archived_at.replace("Z", "+00:00"))
+    return max(0, int((now - when).total_seconds() // 86400))
+
+
+def _load_hold_index(legal_holds: Sequence[LegalHold], holds_dir: Optional[Path]) -> LegalHoldIndex:
+    holds = list(legal_holds)
+    if holds_dir is not None:
+        holds.extend(load_legal_holds_from_dir(holds_dir))
+    return index_legal_holds(holds)
+
+
+def _evaluate_run(
+    run: ArchivedRun,
+    *,
+    hold_index: LegalHoldIndex,
+    regulated_mode_active: bool,
+    regulated_mode_config: RegulatedModeConfig,
+    reference: datetime,
+) -> DeletionEvaluation:
+    try:
+        days_ago = _days_between(run.archived_at, reference)
+    except (ValueError, TypeError):
+        return DeletionEvaluation(
+            decision=DeletionDecision.BLOCKED_RETENTION,
+            reason="Cannot parse archived_at timestamp — fail-closed: deletion blocked",
+        )
+    return evaluate_deletion(
+        run_id=run.run_id,
+        repo_fingerprint=run.repo_fingerprint,
+        classification_level=run.classification_level,
+        archived_at_days_ago=days_ago,
+        compliance_framework=run.compliance_framework,
+        regulated_mode_active=regulated_mode_active,
+        regulated_mode_minimum_days=regulated_mode_config.minimum_retention_days,
+        hold_index=hold_index,
+    )
+
+
+def sweep_retention(
+    records_root: Path,
+    *,
+    legal_holds: Sequence[LegalHold] = (),
+    holds_dir: Optional[Path] = None,
+    regulated_mode_config: RegulatedModeConfig = DEFAULT_CONFIG,
+    classification_level: str = "internal",
+    compliance_framework: str = "",
+    now: Optional[datetime] = None,
+) -> Iterator[SweepEntry]:
+    """Stream a retention decision for every archived run below ``records_root``.
+
+    Holds from ``legal_holds`` and ``holds_dir`` are combined and indexed
+    once; regulated mode and the reference time are also resolved once.
+    """
+    hold_index = _load_hold_index(legal_holds, holds_dir)
+    regulated = evaluate_mode(regulated_mode_config)
+    reference = now if now is not None else datetime.now(timezone.utc)
+
+    for run in iter_archived_runs(
+        records_root,
+        classification_level=classification_level,
+        compliance_framework=compliance_framework,
+    ):
+        evaluation = _evaluate_run(
+            run,
+            hold_index=hold_index,
+            regulated_mode_active=regulated.is_active,
+            regulated_mode_config=regulated_mode_config,
+            reference=reference,
+        )
+        yield SweepEntry(run=run, evaluation=evaluation, size_bytes=_tree_size(run.path))
+
+
+# ---------------------------------------------------------------------------
+# Deletion plan
+# ---------------------------------------------------------------------------
+
+def _plan_line(entry: SweepEntry) -> dict[str, object]:
+    return {
+        "schema": DELETION_PLAN_SCHEMA,
+        "run_id": entry.run.run_id,
+        "repo_fingerprint": entry.run.repo_fingerprint,
+        "path": str(entry.run.path),
+        "archived_at": entry.run.archived_at,
+        "classification_level": entry.run.classification_level,
+        "decision": entry.evaluation.decision.value,
+        "reason": entry.evaluation.reason,
+        "blocking_hold_id": entry.evaluation.blocking_hold_id,
+        "remaining_retention_days": entry.evaluation.remaining_retention_days,
+        "size_bytes": entry.size_bytes,
+    }
+
+
+def write_deletion_plan(
+    entries: Iterator[SweepEntry],
+    plan_path: Path,
+    *,
+    records_root: Path,
+) -> dict[str, object]:
+    """Write ``entries`` as a JSONL deletion plan and return the dry-run summary.
+
+    Nothing is deleted. The summary counts runs per decision and reports
+    total and reclaimable (``allowed``) byte counts.
+    """
+    by_decision: dict[str, int] = {decision.value: 0 for decision in DeletionDecision}
+    bytes_by_decision: dict[str, int] = {decision.value: 0 for decision in DeletionDecision}
+    runs = 0
+    plan_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", newline="\n",
+        dir=plan_path.parent, prefix=".", suffix=".tmp", delete=False,
+    )
+    tmp_path = Path(handle.name)
+    try:
+        with handle:
+            for entry in entries:
+                line = _plan_line(entry)
+                handle.write(json.dumps(line, ensure_ascii=True, separators=(",", ":")) + "\n")
+                runs += 1
+                by_decision[entry.evaluation.decision.value] += 1
+                bytes_by_decision[entry.evaluation.decision.value] += entry.size_bytes
+            handle.flush()
+            os.fsync(handle.fileno())
+        safe_replace_with_retries(tmp_path, plan_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return {
+        "schema": SWEEP_SUMMARY_SCHEMA,
+        "dry_run": True,
+        "records_root": str(records_root),
+        "plan_path": str(plan_path),
+        "runs": runs,
+        "by_decision": by_decision,
+        "bytes_total": sum(bytes_by_decision.values()),
+        "bytes_by_decision": bytes_by_decision,
+        "bytes_reclaimable": bytes_by_decision[DeletionDecision.ALLOWED.value],
+    }
+
+
+def plan_retention_sweep(
+    records_root: Path,
+    plan_path: Path,
+    **sweep_options: object,
+) -> dict[str, object]:
+    """Sweep ``records_root`` into ``plan_path``; keyword options go to sweep_retention."""
+    entries = sweep_retention(records_root, **sweep_options)  # type: ignore[arg-type]
+    return write_deletion_plan(entries, plan_path, records_root=records_root)
+
+
+def _is_within(path: Path, root: Path) -> bool:
+    """Lexical containment check that also refuses traversal and symlinks."""
+    if ".." in path.parts:
+        return False
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return False
+    current = root
+    for part in rel.parts:
+        current = current / part
+        if current.is_symlink():
+            return False
+    return bool(rel.parts)
+
+
+def execute_deletion_plan(
+    plan_path: Path,
+    *,
+    records_root: Path,
+    legal_holds: Sequence[LegalHold] = (),
+    holds_dir: Optional[Path] = None,
+    regulated_mode_config: RegulatedModeConfig = DEFAULT_CONFIG,
+    compliance_framework: str = "",
+    now: Optional[datetime] = None,
+    max_workers: int = DEFAULT_DELETE_WORKERS,
+) -> dict[str, object]:
+    """Delete the run directories a plan marks ``allowed``.
+
+    Entries for other decisions are never touched. A directory is skipped
+    (fail-closed) when it lies outside ``records_root``, is gone, or has no
+    metadata.json any more. Right before each deletion the holds are
+    reloaded and the run is evaluated again, so a hold placed after the
+    plan was written still blocks it. Deletions run on a bounded thread
+    pool; ``skipped`` maps each skipped run path to the reason.
+    """
+    approved: list[Mapping[str, object]] = []
+    with plan_path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                line = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if (
+                isinstance(line, dict)
+                and line.get("schema") == DELETION_PLAN_SCHEMA
+                and line.get("decision") == DeletionDecision.ALLOWED.value
+            ):
+                approved.append(line)
+
+    regulated = evaluate_mode(regulated_mode_config)
+    reference = now if now is not None else datetime.now(timezone.utc)
+
+    def _delete(line: Mapping[str, object]) -> tuple[str, str, int, str]:
+        raw_path = str(line.get("path") or "")
+        target = Path(raw_path)
+        run_id = str(line.get("run_id") or "")
+        if not raw_path or not _is_within(target, records_root):
+            return raw_path, run_id, 0, "outside records root"
+        if not (target / "metadata.json").is_file():
+            return raw_path, run_id, 0, "run directory missing"
+        run = _read_archived_run(
+            target,
+            target.relative_to(records_root).parts[0],
+            classification_level=str(line.get("classification_level") or "internal"),
+            compliance_framework=compliance_framework,
+        )
+        evaluation = _evaluate_run(
+            run,
+            hold_index=_load_hold_index(legal_holds, holds_dir),
+            regulated_mode_active=regulated.is_active,
+            regulated_mode_config=regulated_mode_config,
+            reference=reference,
+        )
+        if evaluation.decision != DeletionDecision.ALLOWED:
+            return raw_path, run_id, 0, f"no longer allowed ({evaluation.decision.value}): {evaluation.reason}"
+        size = int(line.get("size_bytes") or 0)
+        try:
+            shutil.rmtree(target)
+        except OSError as exc:
+            return raw_path, run_id, 0, str(exc)
+        return raw_path, run_id, size, ""
+
+    deleted: list[str] = []
+    skipped: dict[str, str] = {}
+    bytes_deleted = 0
+    if approved:
+        workers = max(1, min(max_workers, len(approved)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for path, run_id, size, error in pool.map(_delete, approved):
+                if error:
+                    skipped[path] = error
+                else:
+                    deleted.append(run_id)
+                    bytes_deleted += size
+
+    return {
+        "schema": EXECUTION_SUMMARY_SCHEMA,
+        "dry_run": False,
+        "plan_path": str(plan_path),
+        "approved": len(approved),
+        "deleted": deleted,
+        "skipped": skipped,
+        "bytes_deleted": bytes_deleted,
+    }
+
+
+__all__ = [
+    "DELETION_PLAN_SCHEMA",
+    "SWEEP_SUMMARY_SCHEMA",
+    "EXECUTION_SUMMARY_SCHEMA",
+    "DEFAULT_DELETE_WORKERS",
+    "ArchivedRun",
+    "SweepEntry",
+    "iter_archived_runs",
+    "sweep_retention",
+    "write_deletion_plan",
+    "plan_retention_sweep",
+    "execute_deletion_plan",
+]
@@ -10,12 +10,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
-try:
-    import yaml
-except Exception:  # pragma: no cover
-    yaml = None  # type: ignore
-
 from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
+from governance_runtime.infrastructure.reason_catalog import (
+    catalog_path_for_runtime_home,
+    default_remediation,
+    load_reason_catalog,
+)
 from governance_runtime.application.services.state_normalizer import normalize_to_canonical
 
 
@@ -38,15 +38,6 @@ def compute_run_id(session_state: Mapping[str, Any], timestamp: str) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 
-def _default_reason_remediation(reason_code: str) -> dict[str, Any]:
-    return {
-        "summary": reason_code,
-        "how_to_fix": "Check SESSION_STATE.Diagnostics.ReasonPayloads for details.",
-        "copy_paste_command": None,
-        "docs_link": None,
-    }
-
-
 def _resolve_governance_root(mode: str) -> Path | None:
     resolver = BindingEvidenceResolver()
     evidence = resolver.resolve(mode=mode)
@@ -62,51 +53,16 @@ def _resolve_governance_root(mode: str) -> Path | None:
 
 
 def _load_reason_remediation(reason_code: str, mode: str = "user") -> dict[str, Any]:
-    """Load remediation guidance from canonical blocked reason catalog."""
-    if yaml is None:
-        return _default_reason_remediation(reason_code)
-
+    """Load remediation guidance from the compiled blocked reason catalog."""
     governance_root = _resolve_governance_root(mode)
     if governance_root is None:
-        return _default_reason_remediation(reason_code)
-
-    catalog_path = governance_root / "blocked_reason_catalog.yaml"
-    if not catalog_path.exists():
-        return _default_reason_remediation(reason_code)
-
-    try:
-        payload = yaml.safe_load(catalog_path.read_text(encoding="utf-8"))
-    except Exception:
-        return _default_reason_remediation(reason_code)
-
-    blocked = payload.get("blocked_reasons") if isinstance(payload, dict) else None
-    if not isinstance(blocked, dict):
-        return _default_reason_remediation(reason_code)
-
-    entry = blocked.get(reason_code)
-    if not isinstance(entry, dict):
-        return _default_reason_remediation(reason_code)
-
-    quick_fix_commands = entry.get("quick_fix_commands")
-    command = None
-    if isinstance(quick_fix_commands, list) and quick_fix_commands:
-        first = quick_fix_commands[0]
-        if isinstance(first, str) and first.strip():
-            command = first
-
-    recovery_steps = entry.get("recovery_steps")
-    how_to_fix = "Check SESSION_STATE.Diagnostics.ReasonPayloads for details."
-    if isinstance(recovery_steps, list) and recovery_steps:
-        first_step = recovery_steps[0]
-        if isinstance(first_step, str) and first_step.strip():
-            how_to_fix = first_step
+        return default_remediation(reason_code)
 
-    return {
-        "summary": entry.get("message_template", reason_code),
-        "how_to_fix": how_to_fix,
-        "copy_paste_command": command,
-        "docs_link": None,
-    }
+    catalog_path = catalog_path_for_runtime_home(governance_root)
+    catalog = load_reason_catalog(catalog_path) if catalog_path is not None else None
+    if catalog is None:
+        return default_remediation(reason_code)
+    return catalog.remediation(reason_code)
 
 
 def _extract_precedence_events(session_state: Mapping[str, Any]) -> list[dict[str, Any]]:
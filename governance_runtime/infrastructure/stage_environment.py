@@ -0,0 +1,37 @@
+"""Environment of the bootstrap stage currently running in-process.
+
+``InProcessRunner`` hands each stage its environment as ``main(env=...)``
+instead of writing it into ``os.environ``. Readers below the entrypoint that
+resolve configuration from environment variables (config root, binding
+evidence, phase_api lookup, write policy) call :func:`stage_environ` so they
+observe the same mapping during an in-process stage and the process
+environment otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from contextvars import ContextVar
+from typing import Iterator, Mapping
+
+_ACTIVE_STAGE_ENV: ContextVar[Mapping[str, str] | None] = ContextVar("active_stage_env", default=None)
+
+
+def stage_environ() -> Mapping[str, str]:
+    """Return the active stage environment, or ``os.environ`` outside a stage."""
+    active = _ACTIVE_STAGE_ENV.get()
+    return os.environ if active is None else active
+
+
+@contextlib.contextmanager
+def stage_environment(env: Mapping[str, str]) -> Iterator[None]:
+    """Make ``env`` the environment seen by :func:`stage_environ` for the block."""
+    token = _ACTIVE_STAGE_ENV.set(env)
+    try:
+        yield
+    finally:
+        _ACTIVE_STAGE_ENV.reset(token)
+
+
+__all__ = ["stage_environ", "stage_environment"]
@@ -10,11 +10,12 @@ Workspace-level overrides can be specified via OPENCODE_WORKSPACE_CONFIG.
 from __future__ import annotations
 
 import json
-import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from governance_runtime.infrastructure.stage_environment import stage_environ
+
 
 TENANT_CONFIG_ENV = "OPENCODE_TENANT_CONFIG"
 WORKSPACE_CONFIG_ENV = "OPENCODE_WORKSPACE_CONFIG"
@@ -51,7 +52,7 @@ def load_tenant_config() -> TenantConfig | None:
     - Missing required fields → None
     - Schema version mismatch → None
     """
-    config_path = os.environ.get(TENANT_CONFIG_ENV)
+    config_path = stage_environ().get(TENANT_CONFIG_ENV)
     if not config_path:
         return None
 
@@ -108,7 +109,7 @@ def load_workspace_config() -> TenantConfig | None:
         TenantConfig if OPENCODE_WORKSPACE_CONFIG is set and valid,
         None otherwise (fallback to tenant config or auto-detection).
     """
-    config_path = os.environ.get(WORKSPACE_CONFIG_ENV)
+    config_path = stage_environ().get(WORKSPACE_CONFIG_ENV)
     if not config_path:
         return None
 
@@ -0,0 +1,342 @@
+"""Stat-based change tracking for the implementation workspace.
+
+``/implement`` needs to know which files the executor touched. Hashing every
+hotspot before and after each run is wasteful on large trees, so the tracker
+snapshots ``(size, mtime_ns, inode)`` per tracked path and only reads files
+whose stat signature changed since the previous snapshot (or since the
+persisted digest cache). Each read records the SHA-256 and line count, so a
+diff of two snapshots also yields per-file line-delta statistics.
+
+On Linux an optional inotify watcher can report the paths written during a
+long-running executor session without rescanning the tree.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from governance_runtime.infrastructure.fs_atomic import atomic_write_text
+
+CACHE_SCHEMA = "workspace-change-tracker.v1"
+TRACKER_MODE_ENV = "OPENCODE_CHANGE_TRACKER"
+_PRUNED_DIRS = frozenset({".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv", ".tox"})
+
+
+def normalize_rel_path(token: object) -> str:
+    """Return a repo-relative POSIX path, or ``""`` for unsafe/empty input."""
+
+    rel = str(token or "").strip().replace("\\", "/")
+    while rel.startswith("./"):
+        rel = rel[2:]
+    if not rel or rel.startswith("/") or rel == ".." or rel.startswith("../") or "/../" in rel:
+        return ""
+    return rel
+
+
+@dataclass(frozen=True)
+class FileState:
+    size: int
+    mtime_ns: int
+    inode: int
+    sha256: str
+    lines: int
+
+    def same_stat(self, st: os.stat_result) -> bool:
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns and self.inode == st.st_ino
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "inode": self.inode,
+            "sha256": self.sha256,
+            "lines": self.lines,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> "FileState | None":
+        try:
+            return cls(
+                size=int(payload["size"]),  # type: ignore[arg-type]
+                mtime_ns=int(payload["mtime_ns"]),  # type: ignore[arg-type]
+                inode=int(payload["inode"]),  # type: ignore[arg-type]
+                sha256=str(payload["sha256"]),
+                lines=int(payload["lines"]),  # type: ignore[arg-type]
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True)
+class WorkspaceSnapshot:
+    """State of the tracked surface; ``None`` marks a missing file."""
+
+    entries: Mapping[str, FileState | None]
+
+    @property
+    def paths(self) -> frozenset[str]:
+        return frozenset(self.entries)
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """Content change of one path; ``*_before`` is None when the path was not tracked before."""
+
+    path: str
+    status: str
+    lines_before: int | None
+    lines_after: int
+    size_before: int | None
+    size_after: int
+
+    @property
+    def line_delta(self) -> int | None:
+        return None if self.lines_before is None else self.lines_after - self.lines_before
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "status": self.status,
+            "lines_before": self.lines_before,
+            "lines_after": self.lines_after,
+            "line_delta": self.line_delta,
+            "size_before": self.size_before,
+            "size_after": self.size_after,
+        }
+
+
+def _read_state(path: Path, st: os.stat_result) -> FileState:
+    digest = hashlib.sha256()
+    newlines = 0
+    last = b""
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+            newlines += chunk.count(b"\n")
+            last = chunk[-1:]
+    lines = newlines + (1 if last and last != b"\n" else 0)
+    return FileState(
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        inode=st.st_ino,
+        sha256=digest.hexdigest(),
+        lines=lines,
+    )
+
+
+class WorkspaceChangeTracker:
+    """Snapshot and diff a set of repo-relative paths.
+
+    ``cache_path`` persists the last known :class:`FileState` per path so the
+    first snapshot of a later run can also skip unchanged files.
+    """
+
+    def __init__(self, repo_root: Path, *, cache_path: Path | None = None) -> None:
+        self._root = repo_root
+        self._cache_path = cache_path
+        self._known: dict[str, FileState] = {}
+        self.files_hashed = 0
+        if cache_path is not None:
+            self._known.update(self._load_cache(cache_path))
+
+    @staticmethod
+    def _load_cache(path: Path) -> dict[str, FileState]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("schema") != CACHE_SCHEMA:
+            return {}
+        files = payload.get("files")
+        out: dict[str, FileState] = {}
+        if isinstance(files, dict):
+            for rel, raw in files.items():
+                state = FileState.from_dict(raw) if isinstance(raw, dict) else None
+                if state is not None:
+                    out[str(rel)] = state
+        return out
+
+    def snapshot(self, paths: Iterable[str]) -> WorkspaceSnapshot:
+        entries: dict[str, FileState | None] = {}
+        for token in paths:
+            rel = normalize_rel_path(token)
+            if not rel or rel in entries:
+                continue
+            path = self._root / rel
+            try:
+                st = path.stat()
+            except OSError:
+                entries[rel] = None
+                continue
+            if not path.is_file():
+                entries[rel] = None
+                continue
+            known = self._known.get(rel)
+            if known is None or not known.same_stat(st):
+                try:
+                    known = _read_state(path, st)
+                except OSError:
+                    entries[rel] = None
+                    continue
+                self.files_hashed += 1
+                self._known[rel] = known
+            entries[rel] = known
+        return WorkspaceSnapshot(entries=entries)
+
+    def diff(self, before: WorkspaceSnapshot, after: WorkspaceSnapshot) -> tuple[FileChange, ...]:
+        """Return content changes between two snapshots, sorted by path.
+
+        Paths that only appear in ``after`` were discovered during the run
+        (for example via ``git status``); their prior content is unknown, so
+        they are reported as ``changed`` (or ``deleted`` when missing) without
+        before-statistics.
+        """
+
+        changes: list[FileChange] = []
+        for rel in sorted(before.paths | after.paths):
+            new = after.entries.get(rel)
+            if rel not in before.entries:
+                if new is None:
+                    changes.append(FileChange(rel, "deleted", None, 0, None, 0))
+                else:
+                    changes.append(FileChange(rel, "changed", None, new.lines, None, new.size))
+                continue
+            old = before.entries[rel]
+            if old is None and new is None:
+                continue
+            if old is not None and new is not None and old.sha256 == new.sha256:
+                continue
+            status = "added" if old is None else "deleted" if new is None else "modified"
+            changes.append(
+                FileChange(
+                    path=rel,
+                    status=status,
+                    lines_before=old.lines if old else 0,
+                    lines_after=new.lines if new else 0,
+                    size_before=old.size if old else 0,
+                    size_after=new.size if new else 0,
+                )
+            )
+        return tuple(changes)
+
+    def save(self) -> None:
+        if self._cache_path is None:
+            return
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "files": {rel: state.to_dict() for rel, state in sorted(self._known.items())},
+        }
+        atomic_write_text(self._cache_path, json.dumps(payload, ensure_ascii=True, sort_keys=True) + "\n")
+
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyChangeWatcher:
+    """Collect paths written under ``repo_root`` while the watcher is open.
+
+    ``complete`` is False when the kernel queue overflowed or a directory
+    could not be watched; callers must then fall back to a full rescan.
+    """
+
+    def __init__(self, repo_root: Path, libc: ctypes.CDLL, fd: int) -> None:
+        self._root = repo_root
+        self._libc = libc
+        self._fd = fd
+        self._dirs: dict[int, str] = {}
+        self._changed: set[str] = set()
+        self.complete = True
+        self._watch_tree("")
+
+    @classmethod
+    def open(cls, repo_root: Path) -> "InotifyChangeWatcher | None":
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(repo_root, libc, fd)
+
+    def _watch_tree(self, rel_dir: str) -> None:
+        base = self._root / rel_dir if rel_dir else self._root
+        for dirpath, dirnames, _ in os.walk(base):
+            dirnames[:] = sorted(name for name in dirnames if name not in _PRUNED_DIRS)
+            rel = Path(dirpath).relative_to(self._root).as_posix()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd < 0:
+                self.complete = False
+                return
+            self._dirs[wd] = "" if rel == "." else rel
+
+    def _add_new_tree(self, rel_dir: str) -> None:
+        self._watch_tree(rel_dir)
+        for dirpath, dirnames, filenames in os.walk(self._root / rel_dir):
+            dirnames[:] = [name for name in dirnames if name not in _PRUNED_DIRS]
+            rel = Path(dirpath).relative_to(self._root).as_posix()
+            self._changed.update(f"{rel}/{name}" for name in filenames)
+
+    def drain(self) -> None:
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError:
+                self.complete = False
+                return
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                raw_name = buf[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length]
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    self.complete = False
+                    continue
+                parent = self._dirs.get(wd)
+                name = os.fsdecode(raw_name.rstrip(b"\0"))
+                if parent is None or not name or name in _PRUNED_DIRS:
+                    continue
+                rel = f"{parent}/{name}" if parent else name
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        self._add_new_tree(rel)
+                    continue
+                self._changed.add(rel)
+
+    def close(self) -> frozenset[str]:
+        """Drain pending events, release the inotify descriptor and return changed paths."""
+
+        self.drain()
+        os.close(self._fd)
+        return frozenset(self._changed)
+
+
+def open_change_watcher(repo_root: Path, env: Mapping[str, str]) -> InotifyChangeWatcher | None:
+    """Open an inotify watcher when ``OPENCODE_CHANGE_TRACKER=inotify`` is set."""
+
+    if str(env.get(TRACKER_MODE_ENV) or "").strip().lower() != "inotify":
+        return None
+    return InotifyChangeWatcher.open(repo_root)
@@ -165,6 +165,10 @@ def locks_dir(workspaces_home: Path, repo_fingerprint: str) -> Path:
     return workspaces_home / repo_fingerprint / "locks"
 
 
+def governance_jobs_dir(workspaces_home: Path, repo_fingerprint: str) -> Path:
+    return workspaces_home / repo_fingerprint / "governance-jobs"
+
+
 def runs_dir(workspaces_home: Path, repo_fingerprint: str) -> Path:
     return workspaces_home / "governance-records" / repo_fingerprint / "runs"
 
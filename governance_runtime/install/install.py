@@ -21,6 +21,7 @@ NOTE:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import hashlib
 import importlib.util
 import json
@@ -292,6 +293,9 @@ GOVERNANCE_PATHS_SCHEMA = "opencode-governance.paths.v1"
 # Runtime error logs (written by governance helpers; outside repository)
 ERROR_LOGS_DIR_NAME = "logs"
 
+# Bounded worker pool for source hashing and file copies (I/O bound).
+INSTALL_COPY_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
@@ -548,6 +552,9 @@ def _launcher_template_unix(*, python_exe: str, config_root: Path, local_root: P
       --implement-start [args]   -> implement_start entrypoint (canonical)
       --implementation-decision-persist [args] -> implementation_decision_persist entrypoint (canonical)
       (default / no subcommand)  -> bootstrap_executor
+
+    A leading ``--profile`` exports OPENCODE_PROFILE=1 so the routed command
+    appends a perf record to the workspace ``logs/perf.jsonl``.
     """
     return "\n".join(
         [
@@ -582,6 +589,11 @@ def _launcher_template_unix(*, python_exe: str, config_root: Path, local_root: P
             "fi",
             "export OPENCODE_PYTHON=\"${PYTHON_BIN}\"",
             "",
+            "if [ \"${1:-}\" = \"--profile\" ]; then",
+            "    export OPENCODE_PROFILE=1",
+            "    shift",
+            "fi",
+            "",
             "# --- Subcommand routing (python-binding-contract.v1 §4) ---",
             "case \"${1:-}\" in",
             "    --session-reader)",
@@ -635,6 +647,9 @@ def _launcher_template_windows(*, python_exe: str, config_root: Path, local_root
       --implement-start [args]   -> implement_start entrypoint (canonical)
       --implementation-decision-persist [args] -> implementation_decision_persist entrypoint (canonical)
       (default / no subcommand)  -> bootstrap_executor
+
+    Profiling is enabled by setting OPENCODE_PROFILE=1 before invoking the
+    launcher (``%*`` forwarding cannot drop a leading flag here).
     """
     return "\n".join(
         [
@@ -1638,13 +1653,24 @@ def copy_with_optional_backup(
     backup_root: Path,
     dry_run: bool,
     overwrite: bool,
+    *,
+    src_hash: str | None = None,
+    previous: "ManifestHashIndex | None" = None,
 ) -> dict:
     """
     Returns a manifest entry dict for this file if copied, else None-ish.
+
+    ``src_hash`` is the precomputed source content hash; when given it is used
+    as the installed hash instead of re-reading ``dst`` after the copy. With a
+    ``previous`` manifest index, files whose recorded hash matches the source
+    and whose installed copy is still present are reported as ``unchanged``.
     """
     if not src.exists():
         return {"status": "missing-source", "src": str(src), "dst": str(dst)}
 
+    if previous is not None and src_hash is not None and previous.unchanged(dst, src_hash):
+        return {"status": "unchanged", "src": str(src), "dst": str(dst), "backup": None, "sha256": src_hash}
+
     dst_exists = dst.exists()
     if dst_exists and not overwrite:
         return {"status": "skipped-exists", "src": str(src), "dst": str(dst)}
@@ -1657,7 +1683,7 @@ def copy_with_optional_backup(
     if dry_run:
         op = "cp" if not dst_exists else "cp --overwrite"
         print(f"  [DRY-RUN] {op} {src} -> {dst}")
-        dst_hash = sha256_file(src)  # predicted installed content hash
+        dst_hash = src_hash or sha256_file(src)  # predicted installed content hash
         return {
             "status": "planned-copy",
             "src": str(src),
@@ -1673,7 +1699,109 @@ def copy_with_optional_backup(
         "src": str(src),
         "dst": str(dst),
         "backup": backup_path,
-        "sha256": sha256_file(dst),
+        "sha256": src_hash or sha256_file(dst),
+    }
+
+
+def hash_files_parallel(paths: Iterable[Path], *, workers: int = INSTALL_COPY_WORKERS) -> dict[Path, str]:
+    """Hash each path once using a bounded thread pool."""
+
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return dict(zip(unique, pool.map(sha256_file, unique)))
+
+
+def copy_files_with_optional_backup(
+    pairs: list[tuple[Path, Path]],
+    *,
+    backup_enabled: bool,
+    backup_root: Path,
+    dry_run: bool,
+    overwrite: bool,
+    previous: "ManifestHashIndex | None" = None,
+    workers: int = INSTALL_COPY_WORKERS,
+) -> list[dict]:
+    """Batch form of ``copy_with_optional_backup``; entries keep input order.
+
+    Sources are hashed once up front. Live copies run on a bounded thread
+    pool, with repeated destinations kept on one worker in input order so they
+    behave exactly as in a sequential run; dry-run stays sequential so its
+    planned-operation output is stable.
+    """
+
+    hashes = hash_files_parallel((src for src, _ in pairs if src.is_file()), workers=workers)
+
+    def _copy(pair: tuple[Path, Path]) -> dict:
+        src, dst = pair
+        return copy_with_optional_backup(
+            src=src,
+            dst=dst,
+            backup_enabled=backup_enabled,
+            backup_root=backup_root,
+            dry_run=dry_run,
+            overwrite=overwrite,
+            src_hash=hashes.get(src),
+            previous=previous,
+        )
+
+    if dry_run or workers <= 1 or len(pairs) <= 1:
+        return [_copy(pair) for pair in pairs]
+
+    by_dst: dict[Path, list[int]] = {}
+    for position, (_, dst) in enumerate(pairs):
+        by_dst.setdefault(dst, []).append(position)
+    results: list[dict] = [{} for _ in pairs]
+
+    def _copy_group(positions: list[int]) -> None:
+        for position in positions:
+            results[position] = _copy(pairs[position])
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_copy_group, by_dst.values()))
+    return results
+
+
+def emit_compiled_reason_catalog(local_root: Path) -> dict | None:
+    """Precompile the installed blocked reason catalog to JSON.
+
+    Runtime reason lookups then skip YAML parsing. Returns a manifest entry,
+    or None when the catalog or its compiler is unavailable.
+    """
+    runtime_root = local_root / "governance_runtime"
+    catalog = runtime_root / "assets" / "config" / "blocked_reason_catalog.yaml"
+    helper = runtime_root / "infrastructure" / "reason_catalog.py"
+    if not catalog.is_file() or not helper.is_file():
+        return None
+    previous = runtime_root / "assets" / "config" / "blocked_reason_catalog.compiled.json"
+    previous_hash = sha256_file(previous) if previous.is_file() else None
+    try:
+        spec = importlib.util.spec_from_file_location("opencode_reason_catalog", helper)
+        if spec is None or spec.loader is None:
+            return None
+        mod = importlib.util.module_from_spec(spec)
+        # dataclasses resolve annotations through sys.modules while executing.
+        sys.modules[spec.name] = mod
+        try:
+            spec.loader.exec_module(mod)
+            out_path = mod.write_compiled_reason_catalog(catalog)
+        finally:
+            sys.modules.pop(spec.name, None)
+    except (ImportError, OSError, ValueError) as exc:
+        print(f"  ⚠️  blocked reason catalog not compiled ({type(exc).__name__}: {exc}); runtime falls back to YAML")
+        return None
+    if out_path is None:
+        return None
+    out_hash = sha256_file(out_path)
+    return {
+        "status": "unchanged" if out_hash == previous_hash else "copied",
+        "src": str(catalog),
+        "dst": str(out_path),
+        "backup": None,
+        "sha256": out_hash,
+        "rel": out_path.relative_to(local_root).as_posix(),
+        "rel_base": "local",
     }
 
 
@@ -1763,6 +1891,93 @@ def load_manifest(manifest_path: Path) -> dict | None:
     return data
 
 
+@dataclass(frozen=True)
+class ManifestHashIndex:
+    """Installed-file index built from one INSTALL_MANIFEST.json.
+
+    Maps each recorded destination path to its manifest entry so install,
+    uninstall and ``--status`` share one view of what is installed and with
+    which content hash, without re-hashing installed files.
+    """
+
+    entries: dict[str, dict]
+
+    @classmethod
+    def from_manifest(cls, manifest: dict | None) -> "ManifestHashIndex":
+        files = manifest.get("files") if isinstance(manifest, dict) else None
+        if isinstance(files, dict):
+            files = list(files.values())
+        entries: dict[str, dict] = {}
+        for entry in files or []:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("dst"):
+                entries[str(entry["dst"])] = entry
+            elif entry.get("rel"):
+                entries[f"{entry.get('rel_base') or 'commands'}:{entry['rel']}"] = entry
+        return cls(entries=entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def sha256(self, dst: Path) -> str | None:
+        entry = self.entries.get(str(dst))
+        value = entry.get("sha256") if entry else None
+        return value if isinstance(value, str) else None
+
+    def unchanged(self, dst: Path, src_hash: str) -> bool:
+        """True when ``dst`` was installed with ``src_hash`` and still holds it.
+
+        The recorded hash is trusted only while the installed file keeps the
+        recorded size and ``mtime_ns``; when either differs or was never
+        recorded, ``dst`` is re-hashed.
+        """
+
+        entry = self.entries.get(str(dst))
+        if not entry or entry.get("sha256") != src_hash:
+            return False
+        try:
+            st = dst.stat()
+        except OSError:
+            return False
+        size = entry.get("size")
+        mtime_ns = entry.get("mtime_ns")
+        if isinstance(size, int) and isinstance(mtime_ns, int) and size == st.st_size and mtime_ns == st.st_mtime_ns:
+            return True
+        try:
+            return sha256_file(dst) == src_hash
+        except OSError:
+            return False
+
+    def targets(self, plan: InstallPlan) -> list[Path]:
+        """Resolve recorded entries to installed paths under the plan's roots."""
+
+        targets: list[Path] = []
+        for entry in self.entries.values():
+            rel = entry.get("rel")
+            if rel:
+                rel_base = str(entry.get("rel_base") or "commands")
+                if rel_base == "commands" and str(rel).startswith("bin/"):
+                    # Backward compatibility for manifests created before rel_base.
+                    rel_base = "config"
+                if rel_base == "config":
+                    targets.append(plan.config_root / rel)
+                elif rel_base == "local":
+                    targets.append(plan.local_root / rel)
+                else:
+                    targets.append(plan.commands_dir / rel)
+            elif entry.get("dst"):
+                targets.append(Path(entry["dst"]))
+        return targets
+
+    def missing(self) -> list[str]:
+        """Recorded destinations that no longer exist (stat only, no hashing)."""
+
+        return sorted(
+            str(entry["dst"]) for entry in self.entries.values() if entry.get("dst") and not Path(entry["dst"]).exists()
+        )
+
+
 # ---------------------------------------------------------------------------
 # OpenCode Desktop bridge: opencode.json instructions + command template injection
 # ---------------------------------------------------------------------------
@@ -2050,6 +2265,7 @@ def install(
     backup_enabled: bool,
     *,
     include_legacy_command_files: bool = False,
+    incremental: bool = False,
 ) -> int:
     ok, missing, unsafe_symlinks = precheck_source(plan.source_dir)
     # Allow dry-run to bypass safety gating for unsafe symlinks to enable planning
@@ -2103,6 +2319,19 @@ def install(
 
     copied_entries: list[dict] = []
 
+    # --incremental: skip files whose source hash matches the previous manifest.
+    previous_index = ManifestHashIndex.from_manifest(load_manifest(plan.manifest_path)) if incremental else None
+
+    def _copy_batch(pairs: list[tuple[Path, Path]]) -> list[dict]:
+        return copy_files_with_optional_backup(
+            pairs,
+            backup_enabled=backup_enabled,
+            backup_root=backup_root,
+            dry_run=dry_run,
+            overwrite=force,
+            previous=previous_index,
+        )
+
     # governance paths bootstrap MUST run before create_launcher() because
     # _write_launcher_wrappers reads governance.paths.json for pythonCommand.
     # Single SSOT writer – see C1 fix.
@@ -2160,16 +2389,9 @@ def install(
 
     # copy main files
     print("\n📋 Copying governance files to commands/ ...")
-    for src in collect_command_root_files(plan.source_dir):
-        dst = plan.commands_dir / src.name
-        entry = copy_with_optional_backup(
-            src=src,
-            dst=dst,
-            backup_enabled=backup_enabled,
-            backup_root=backup_root,
-            dry_run=dry_run,
-            overwrite=force,
-        )
+    command_files = collect_command_root_files(plan.source_dir)
+    command_entries = _copy_batch([(src, plan.commands_dir / src.name) for src in command_files])
+    for src, entry in zip(command_files, command_entries):
         copied_entries.append(entry)
         status = entry["status"]
         name = src.name
@@ -2188,33 +2410,44 @@ def install(
     runtime_files = collect_governance_runtime_files(plan.source_dir)
     if runtime_files:
         print("\n📋 Copying governance runtime/compatibility packages to local root ...")
+        runtime_rels: list[Path] = []
+        runtime_pairs: list[tuple[Path, Path]] = []
         for rf in runtime_files:
             rel = rf.relative_to(plan.source_dir)
             dst = plan.local_root / rel
-            entry = copy_with_optional_backup(
-                src=rf,
-                dst=dst,
-                backup_enabled=backup_enabled,
-                backup_root=backup_root,
-                dry_run=dry_run,
-                overwrite=force,
-            )
+            runtime_rels.append(rel)
+            runtime_pairs.append((rf, dst))
+        runtime_entries = _copy_batch(runtime_pairs)
+        unchanged_count = 0
+        for rel, entry in zip(runtime_rels, runtime_entries):
             entry["rel"] = str(rel.as_posix())
             entry["rel_base"] = "local"
             copied_entries.append(entry)
             status = entry["status"]
-            if status in ("planned-copy", "copied"):
+            if status == "unchanged":
+                unchanged_count += 1
+            elif status in ("planned-copy", "copied"):
                 print(f"  ✅ {rel} ({status})")
             elif status == "skipped-exists":
                 print(f"  ⏭️  {rel} exists (use --force to overwrite)")
             else:
                 print(f"  ⚠️  {rel} missing (skipping)")
+        if unchanged_count:
+            print(f"  ⏭️  {unchanged_count} unchanged file(s) skipped (--incremental)")
     else:
         print("\nℹ️  No governance runtime package found (skipping).")
 
+    if not dry_run:
+        compiled_entry = emit_compiled_reason_catalog(plan.local_root)
+        if compiled_entry is not None:
+            if compiled_entry["status"] == "copied":
+                print(f"  ✅ {compiled_entry['rel']} (compiled)")
+            copied_entries.append(compiled_entry)
+
     # copy governance content + spec payloads to local root
     local_payload_roots = ["governance_content", "governance_spec"]
     print("\n📋 Copying governance content/spec payloads to local root ...")
+    payload_rels: list[Path] = []
     for local_dir_name in local_payload_roots:
         src_root = plan.source_dir / local_dir_name
         if not src_root.exists() or not src_root.is_dir():
@@ -2224,31 +2457,15 @@ def install(
                 continue
             if "archived" in lf.parts:
                 continue
-            rel = lf.relative_to(plan.source_dir)
-            dst = plan.local_root / rel
-            entry = copy_with_optional_backup(
-                src=lf,
-                dst=dst,
-                backup_enabled=backup_enabled,
-                backup_root=backup_root,
-                dry_run=dry_run,
-                overwrite=force,
-            )
-            entry["rel"] = str(rel.as_posix())
-            entry["rel_base"] = "local"
-            copied_entries.append(entry)
+            payload_rels.append(lf.relative_to(plan.source_dir))
 
     version_src = plan.source_dir / "VERSION"
     if version_src.exists() and version_src.is_file():
-        entry = copy_with_optional_backup(
-            src=version_src,
-            dst=plan.local_root / "VERSION",
-            backup_enabled=backup_enabled,
-            backup_root=backup_root,
-            dry_run=dry_run,
-            overwrite=force,
-        )
-        entry["rel"] = "VERSION"
+        payload_rels.append(Path("VERSION"))
+
+    payload_entries = _copy_batch([(plan.source_dir / rel, plan.local_root / rel) for rel in payload_rels])
+    for rel, entry in zip(payload_rels, payload_entries):
+        entry["rel"] = str(rel.as_posix())
         entry["rel_base"] = "local"
         copied_entries.append(entry)
 
@@ -2259,23 +2476,20 @@ def install(
     if plugin_files:
         print("\n📋 Copying OpenCode plugins to config/plugins/ ...")
         plugins_dst_root = plan.config_root / OPENCODE_PLUGINS_DIR_NAME
-        for pf in plugin_files:
-            rel = pf.relative_to(plan.source_dir)
+        plugin_rels = [pf.relative_to(plan.source_dir) for pf in plugin_files]
+        plugin_entries = _copy_batch(
+            [
+                (pf, plugins_dst_root / rel.relative_to(OPENCODE_PLUGIN_SOURCE_DIR))
+                for pf, rel in zip(plugin_files, plugin_rels)
+            ]
+        )
+        for rel, entry in zip(plugin_rels, plugin_entries):
             rel_plugin = rel.relative_to(OPENCODE_PLUGIN_SOURCE_DIR)
-            dst = plugins_dst_root / rel_plugin
-            entry = copy_with_optional_backup(
-                src=pf,
-                dst=dst,
-                backup_enabled=backup_enabled,
-                backup_root=backup_root,
-                dry_run=dry_run,
-                overwrite=force,
-            )
             entry["rel"] = str((Path(OPENCODE_PLUGINS_DIR_NAME) / rel_plugin).as_posix())
             entry["rel_base"] = "config"
             copied_entries.append(entry)
             status = entry["status"]
-            if status in ("planned-copy", "copied"):
+            if status in ("planned-copy", "copied", "unchanged"):
                 print(f"  ✅ {rel} -> {entry['rel']} ({status})")
             elif status == "skipped-exists":
                 print(f"  ⏭️  {rel} exists (use --force to overwrite)")
@@ -2414,7 +2628,7 @@ def install(
     # manifest: store only entries that were actually copied/planned
     installed_files = []
     for e in copied_entries:
-        if e["status"] not in ("copied", "planned-copy", "patched", "planned-patch"):
+        if e["status"] not in ("copied", "planned-copy", "patched", "planned-patch", "unchanged"):
             continue
         rel_base = str(e.get("rel_base") or "commands")
         rel_value = e.get("rel")
@@ -2443,17 +2657,23 @@ def install(
                         rel_value = dst_path.name
             else:
                 rel_value = None
-        installed_files.append(
-            {
-                "dst": e["dst"],
-                "rel": rel_value,
-                "rel_base": rel_base,
-                "src": e["src"],
-                "sha256": e.get("sha256", "unknown"),
-                "backup": e.get("backup"),
-                "status": e["status"],
-            }
-        )
+        record = {
+            "dst": e["dst"],
+            "rel": rel_value,
+            "rel_base": rel_base,
+            "src": e["src"],
+            "sha256": e.get("sha256", "unknown"),
+            "backup": e.get("backup"),
+            "status": e["status"],
+        }
+        try:
+            st = Path(e["dst"]).stat()
+        except OSError:
+            pass
+        else:
+            record["size"] = st.st_size
+            record["mtime_ns"] = st.st_mtime_ns
+        installed_files.append(record)
 
     # Add launcher entries to manifest
     for entry in launcher_entries:
@@ -2673,25 +2893,8 @@ def uninstall(
         return rc
 
     # manifest-based targets
-    files = manifest.get("files", [])
-    targets: list[Path] = []
-    for entry in files:
-        rel = entry.get("rel")
-        dst = entry.get("dst")
-        if rel:
-            rel_base = str(entry.get("rel_base") or "commands")
-            if rel_base == "commands" and str(rel).startswith("bin/"):
-                # Backward compatibility for manifests created before rel_base.
-                rel_base = "config"
-            if rel_base == "config":
-                targets.append(plan.config_root / rel)
-            elif rel_base == "local":
-                targets.append(plan.local_root / rel)
-            else:
-                targets.append(plan.commands_dir / rel)
-        elif dst:
-            targets.append(Path(dst))
-            
+    targets: list[Path] = ManifestHashIndex.from_manifest(manifest).targets(plan)
+
     if purge_paths_file:
         # Explicit operator request: remove machine-specific binding even if it pre-existed.
         targets.append(plan.governance_paths_path)
@@ -3049,6 +3252,7 @@ def purge_runtime_error_logs(config_root: Path, dry_run: bool) -> int:
       - <config_root>/workspaces/*/logs/error.log.jsonl
       - <config_root>/workspaces/*/logs/flow.log.jsonl
       - <config_root>/workspaces/*/logs/boot.log.jsonl
+      - sealed segments of those logs under <config_root>/workspaces/*/logs/segments/
       - legacy: <config_root>/logs/errors-*.jsonl
       - legacy: <config_root>/logs/errors-index.json
       - legacy: <config_root>/workspaces/*/logs/errors-*.jsonl
@@ -3073,6 +3277,11 @@ def purge_runtime_error_logs(config_root: Path, dry_run: bool) -> int:
                 *list((config_root / "workspaces").glob("*/logs/error.log.jsonl")),
                 *list((config_root / "workspaces").glob("*/logs/flow.log.jsonl")),
                 *list((config_root / "workspaces").glob("*/logs/boot.log.jsonl")),
+                *[
+                    p
+                    for stem in ("error.log", "flow.log", "boot.log")
+                    for p in (config_root / "workspaces").glob(f"*/logs/segments/{stem}.*")
+                ],
             ]
         )
     )
@@ -3386,8 +3595,13 @@ def show_status(source_dir: Path, config_root_arg: Path | None) -> int:
         print(f"Governance Version: {gov_ver}")
         installed_at = manifest.get("installed_at", "unknown")
         print(f"Installed At: {installed_at}")
-        files_count = len(manifest.get("files", []))
-        print(f"Installed Files: {files_count}")
+        index = ManifestHashIndex.from_manifest(manifest)
+        print(f"Installed Files: {len(index)}")
+        missing_installed = index.missing()
+        if missing_installed:
+            print(f"⚠️  Missing Installed Files: {len(missing_installed)}")
+            for dst in missing_installed[:10]:
+                print(f"  - {dst}")
     else:
         print("\n⚠️  Installation found but manifest missing (fallback mode).")
         print("Run '${PYTHON_COMMAND} install.py --force' to restore manifest.")
@@ -3718,6 +3932,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--dry-run", action="store_true", help="Show what would happen without writing anything.")
     p.add_argument("--force", action="store_true", help="Overwrite without prompting / uninstall without prompt.")
     p.add_argument("--no-backup", action="store_true", help="Disable backup on overwrite (install only).")
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Install only: skip files whose source hash matches INSTALL_MANIFEST.json and whose installed copy is present.",
+    )
     p.add_argument("--uninstall", action="store_true", help="Uninstall previously installed governance files (manifest-based).")
     p.add_argument("--skip-paths-file", action="store_true", help="Do not create/overwrite governance.paths.json in config root.")
     p.add_argument(
@@ -3827,6 +4046,7 @@ def main(argv: list[str]) -> int:
         dry_run=args.dry_run,
         force=args.force,
         backup_enabled=backup_enabled,
+        incremental=args.incremental,
     )
 
 
@@ -14,6 +14,7 @@ except Exception:  # pragma: no cover
     yaml = None  # type: ignore
 
 from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
+from governance_runtime.shared.perf_trace import count_parse, count_read, traced
 
 
 class PhaseApiSpecError(RuntimeError):
@@ -244,6 +245,7 @@ def _resolve_binding_homes(explicit_commands_home: Path | None) -> tuple[Path, P
     return evidence.commands_home, evidence.spec_home
 
 
+@traced("kernel.load_phase_api")
 def load_phase_api(commands_home: Path | None = None) -> PhaseApiSpec:
     if yaml is None:
         raise PhaseApiSpecError("phase_api.yaml cannot be loaded: yaml parser unavailable")
@@ -254,10 +256,12 @@ def load_phase_api(commands_home: Path | None = None) -> PhaseApiSpec:
         raise PhaseApiSpecError(f"phase_api.yaml missing at {phase_api_path}")
 
     raw_text = phase_api_path.read_text(encoding="utf-8")
+    count_read(len(raw_text))
     source_hash = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
 
     try:
         payload = yaml.safe_load(raw_text)
+        count_parse("yaml")
     except Exception as exc:
         raise PhaseApiSpecError(f"phase_api.yaml invalid yaml at {phase_api_path}: {exc}") from exc
     if not isinstance(payload, Mapping):
@@ -14,6 +14,7 @@ from governance_runtime.infrastructure.adapters.logging.event_sink import write_
 from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
 from governance_runtime.infrastructure.logging.global_error_handler import emit_error_event
 from governance_runtime.paths import get_workspace_logs_root
+from governance_runtime.shared.perf_trace import traced
 
 from governance_runtime.engine.gate_evaluator import evaluate_p6_prerequisites, can_promote_to_phase6, evaluate_strict_exit_gate
 from governance_runtime.engine import reason_codes
@@ -1459,6 +1460,7 @@ def evaluate_readonly(
     )
 
 
+@traced("kernel.execute")
 def execute(
     *,
     current_token: str,
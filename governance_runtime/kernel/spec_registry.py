@@ -22,6 +22,7 @@ except Exception:  # pragma: no cover
     yaml = None
 
 from governance_runtime.infrastructure.binding_evidence_resolver import BindingEvidenceResolver
+from governance_runtime.shared.perf_trace import count_parse, count_read, traced
 
 
 class SpecRegistryError(RuntimeError):
@@ -84,6 +85,7 @@ class SpecRegistry:
     _cached_bundle: SpecBundle | None = None
     
     @classmethod
+    @traced("kernel.spec_registry.load_all")
     def load_all(cls, spec_home: Path | None = None) -> SpecBundle:
         """Load all governance specs or fail with clear error.
         
@@ -211,7 +213,10 @@ class SpecRegistry:
         
         try:
             with open(path, encoding="utf-8") as f:
-                content = yaml.safe_load(f)
+                text = f.read()
+            count_read(len(text))
+            content = yaml.safe_load(text)
+            count_parse("yaml")
         except yaml.YAMLError as e:
             raise SpecValidationError(
                 f"Invalid YAML in {schema_name} spec ({path}): {e}. "
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import os
 from pathlib import Path
+from typing import Mapping
 
 from governance_runtime import layer_adapter
+from governance_runtime.infrastructure.stage_environment import stage_environ
 
 
-def get_config_root() -> Path:
-    env_root = os.environ.get("OPENCODE_CONFIG_ROOT")
+def get_config_root(env: Mapping[str, str] | None = None) -> Path:
+    env_root = (stage_environ() if env is None else env).get("OPENCODE_CONFIG_ROOT")
     if env_root:
         return Path(env_root)
     return Path.home() / ".config" / "opencode"
@@ -0,0 +1,222 @@
+"""Opt-in hot-path tracing and I/O accounting - stateless unless activated.
+
+This module belongs to the shared/support layer and can be imported by any
+layer including the kernel and application services. It performs no IO.
+
+While no recorder is active (the default) ``span`` returns a shared no-op
+context manager, ``traced`` wrappers call straight through and the counters
+return immediately, so instrumented hot paths pay one global lookup per call.
+Infrastructure activates a recorder for one governance command and persists
+its record; see ``governance_runtime.infrastructure.perf_profile``.
+
+Spans are aggregated into a call tree keyed by name: repeated calls of the
+same span under the same parent share one node with ``calls`` and summed
+``ms``. Each node also carries the counter deltas observed while it was open.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, TypeVar
+
+PERF_RECORD_SCHEMA = "opencode.perf.v1"
+
+COUNTER_NAMES = (
+    "file_reads",
+    "read_bytes",
+    "file_writes",
+    "write_bytes",
+    "fsyncs",
+    "subprocesses",
+    "subprocess_ms",
+    "json_parses",
+    "yaml_parses",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NULL_SPAN = nullcontext()
+
+
+class _SpanNode:
+    __slots__ = ("name", "calls", "ms", "counters", "children")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.ms = 0.0
+        self.counters: dict[str, float] = {}
+        self.children: dict[str, _SpanNode] = {}
+
+    def child(self, name: str) -> "_SpanNode":
+        node = self.children.get(name)
+        if node is None:
+            node = _SpanNode(name)
+            self.children[name] = node
+        return node
+
+    def to_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {"name": self.name, "calls": self.calls, "ms": round(self.ms, 3)}
+        if self.counters:
+            payload["counters"] = {key: _round(value) for key, value in sorted(self.counters.items())}
+        if self.children:
+            payload["children"] = [node.to_dict() for node in self.children.values()]
+        return payload
+
+
+def _round(value: float) -> float | int:
+    return int(value) if float(value).is_integer() else round(value, 3)
+
+
+class PerfRecorder:
+    """Collects spans and counters for one command invocation."""
+
+    def __init__(self, command: str, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.command = command
+        self._clock = clock
+        self._started = clock()
+        self._root = _SpanNode(command)
+        self._stack: list[_SpanNode] = [self._root]
+        self.counters: dict[str, float] = {name: 0 for name in COUNTER_NAMES}
+
+    def add(self, counter: str, amount: float = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def enter(self, name: str) -> tuple[_SpanNode, float, dict[str, float]]:
+        node = self._stack[-1].child(name)
+        self._stack.append(node)
+        return node, self._clock(), dict(self.counters)
+
+    def exit(self, frame: tuple[_SpanNode, float, dict[str, float]]) -> float:
+        node, started, before = frame
+        elapsed_ms = (self._clock() - started) * 1000.0
+        if self._stack and self._stack[-1] is node:
+            self._stack.pop()
+        node.calls += 1
+        node.ms += elapsed_ms
+        for key, value in self.counters.items():
+            delta = value - before.get(key, 0)
+            if delta:
+                node.counters[key] = node.counters.get(key, 0) + delta
+        return elapsed_ms
+
+    def to_record(self) -> dict[str, object]:
+        """Return the JSON-safe ``opencode.perf.v1`` record for this command."""
+
+        return {
+            "schema": PERF_RECORD_SCHEMA,
+            "command": self.command,
+            "duration_ms": round((self._clock() - self._started) * 1000.0, 3),
+            "counters": {key: _round(value) for key, value in self.counters.items()},
+            "spans": [node.to_dict() for node in self._root.children.values()],
+        }
+
+
+_active: PerfRecorder | None = None
+
+
+def activate(command: str) -> PerfRecorder:
+    """Start recording for ``command``; replaces any recorder already active."""
+
+    global _active
+    _active = PerfRecorder(command)
+    return _active
+
+
+def deactivate() -> PerfRecorder | None:
+    """Stop recording and return the recorder that was active, if any."""
+
+    global _active
+    recorder, _active = _active, None
+    return recorder
+
+
+def active_recorder() -> PerfRecorder | None:
+    return _active
+
+
+class _Span:
+    __slots__ = ("_recorder", "_name", "_frame", "_subprocess")
+
+    def __init__(self, recorder: PerfRecorder, name: str, subprocess: bool) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._subprocess = subprocess
+
+    def __enter__(self) -> "_Span":
+        self._frame = self._recorder.enter(self._name)
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        elapsed_ms = self._recorder.exit(self._frame)
+        if self._subprocess:
+            # Attribute the child process to the span that is still open.
+            self._recorder.add("subprocesses")
+            self._recorder.add("subprocess_ms", elapsed_ms)
+            self._frame[0].counters["subprocesses"] = self._frame[0].counters.get("subprocesses", 0) + 1
+            self._frame[0].counters["subprocess_ms"] = self._frame[0].counters.get("subprocess_ms", 0) + elapsed_ms
+
+
+def span(name: str):
+    """Time a block as a nested span; a shared no-op when tracing is off."""
+
+    recorder = _active
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name, False)
+
+
+def subprocess_span(name: str):
+    """Like :func:`span`, additionally counting one child process and its wall time."""
+
+    recorder = _active
+    if recorder is None:
+        return _NULL_SPAN
+    return _Span(recorder, name, True)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a function so each call is recorded as span ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _active
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Span(recorder, name, False):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def count_read(nbytes: int) -> None:
+    recorder = _active
+    if recorder is not None:
+        recorder.add("file_reads")
+        recorder.add("read_bytes", nbytes)
+
+
+def count_write(nbytes: int) -> None:
+    recorder = _active
+    if recorder is not None:
+        recorder.add("file_writes")
+        recorder.add("write_bytes", nbytes)
+
+
+def count_fsync() -> None:
+    recorder = _active
+    if recorder is not None:
+        recorder.add("fsyncs")
+
+
+def count_parse(kind: str) -> None:
+    """Count one parse of ``kind`` (``"json"`` or ``"yaml"``)."""
+
+    recorder = _active
+    if recorder is not None:
+        recorder.add(f"{kind}_parses")
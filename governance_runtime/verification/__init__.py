@@ -2,6 +2,7 @@
 
 from governance_runtime.verification.builder_contract import validate_builder_result
 from governance_runtime.verification.behavioral_verifier import run_behavioral_verification
+from governance_runtime.verification.change_impact import requirement_fingerprint, select_requirements
 from governance_runtime.verification.completion_matrix import build_completion_matrix, is_merge_allowed
 from governance_runtime.verification.live_flow_verifier import run_live_flow_verification
 from governance_runtime.verification.pipeline import run_verifier_pipeline
@@ -19,4 +20,6 @@ __all__ = [
     "run_behavioral_verification",
     "run_user_surface_verification",
     "run_live_flow_verification",
+    "requirement_fingerprint",
+    "select_requirements",
 ]
@@ -0,0 +1,136 @@
+"""Change-impact selection for incremental contract verification.
+
+Each requirement gets a fingerprint over its contract text, the contents of
+its ``code_hotspots``, the files backing its acceptance tests and the
+registry test nodes configured for it. A requirement whose fingerprint is
+unchanged since a previous PASS row is carried forward instead of being
+re-verified; everything else is verified again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+FINGERPRINT_VERSION = "change-impact.v1"
+_METHODS = (
+    "static_verification",
+    "behavioral_verification",
+    "user_surface_verification",
+    "live_flow_verification",
+    "receipts_verification",
+)
+
+
+@dataclass(frozen=True)
+class ChangeImpactSelection:
+    to_verify: tuple[Mapping[str, object], ...]
+    carried_forward: dict[str, dict[str, object]]
+    fingerprints: dict[str, str]
+
+
+def _req_id(contract: Mapping[str, object]) -> str:
+    return str(contract.get("id") or "").strip()
+
+
+def _registry_tests(contract: Mapping[str, object], registry: Mapping[str, object]) -> dict[str, list[str]]:
+    requirements = registry.get("requirements")
+    req_cfg = requirements.get(_req_id(contract)) if isinstance(requirements, dict) else None
+    if not isinstance(req_cfg, dict):
+        return {}
+    out: dict[str, list[str]] = {}
+    for method in _METHODS:
+        tests = req_cfg.get(method)
+        if isinstance(tests, list):
+            out[method] = [str(node).strip() for node in tests]
+    return out
+
+
+def evidence_refs(contract: Mapping[str, object], registry: Mapping[str, object]) -> list[str]:
+    """Test node ids that back a requirement's verification result."""
+
+    refs: set[str] = set()
+    acceptance = contract.get("acceptance_tests")
+    if isinstance(acceptance, list):
+        refs.update(str(node).strip() for node in acceptance if str(node).strip())
+    for tests in _registry_tests(contract, registry).values():
+        refs.update(node for node in tests if node)
+    return sorted(refs)
+
+
+def _file_digest(repo_root: Path, rel: str, cache: dict[str, str]) -> str:
+    if rel not in cache:
+        path = repo_root / rel
+        try:
+            cache[rel] = hashlib.sha256(path.read_bytes()).hexdigest() if path.is_file() else "missing"
+        except OSError:
+            cache[rel] = "unreadable"
+    return cache[rel]
+
+
+def requirement_fingerprint(
+    contract: Mapping[str, object],
+    *,
+    registry: Mapping[str, object],
+    repo_root: Path,
+    file_digests: dict[str, str] | None = None,
+) -> str:
+    """Return the change-impact fingerprint for one requirement."""
+
+    digests = file_digests if file_digests is not None else {}
+    hotspots = contract.get("code_hotspots")
+    hotspot_paths = sorted({str(item) for item in hotspots}) if isinstance(hotspots, list) else []
+    refs = evidence_refs(contract, registry)
+    test_files = sorted({ref.split("::", 1)[0] for ref in refs})
+    payload = {
+        "version": FINGERPRINT_VERSION,
+        "contract": contract,
+        "registry": _registry_tests(contract, registry),
+        "hotspots": {rel: _file_digest(repo_root, rel, digests) for rel in hotspot_paths},
+        "tests": {rel: _file_digest(repo_root, rel, digests) for rel in test_files},
+    }
+    blob = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def select_requirements(
+    *,
+    requirements: tuple[Mapping[str, object], ...],
+    registry: Mapping[str, object],
+    repo_root: Path,
+    previous_matrix: Mapping[str, object] | None,
+) -> ChangeImpactSelection:
+    """Split requirements into those to re-verify and PASS rows to carry forward."""
+
+    file_digests: dict[str, str] = {}
+    fingerprints = {
+        _req_id(contract): requirement_fingerprint(
+            contract, registry=registry, repo_root=repo_root, file_digests=file_digests
+        )
+        for contract in requirements
+    }
+
+    previous_rows: dict[str, Mapping[str, object]] = {}
+    rows = previous_matrix.get("completion_matrix") if isinstance(previous_matrix, Mapping) else None
+    if isinstance(rows, list):
+        for row in rows:
+            if isinstance(row, Mapping) and row.get("id"):
+                previous_rows[str(row["id"])] = row
+
+    to_verify: list[Mapping[str, object]] = []
+    carried: dict[str, dict[str, object]] = {}
+    for contract in requirements:
+        req_id = _req_id(contract)
+        prior = previous_rows.get(req_id)
+        if (
+            prior is not None
+            and str(prior.get("overall") or "").upper() == "PASS"
+            and prior.get("fingerprint") == fingerprints[req_id]
+        ):
+            carried[req_id] = dict(prior)
+        else:
+            to_verify.append(contract)
+    return ChangeImpactSelection(to_verify=tuple(to_verify), carried_forward=carried, fingerprints=fingerprints)
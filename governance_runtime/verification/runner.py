@@ -14,6 +14,7 @@ from governance_runtime.verification.behavioral_verifier import (
     run_receipts_verification,
     run_user_surface_verification,
 )
+from governance_runtime.verification.change_impact import evidence_refs, select_requirements
 from governance_runtime.verification.completion_matrix import is_merge_allowed
 from governance_runtime.verification.live_flow_verifier import run_live_flow_verification
 from governance_runtime.verification.pipeline import run_verifier_pipeline
@@ -45,7 +46,22 @@ def _run_node(python_bin: str, repo_root: Path, nodeid: str) -> bool:
     return _run_pytest_node(python_bin, repo_root, nodeid)
 
 
-def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executable) -> dict[str, object]:
+def _carried_statuses(carried: Mapping[str, Mapping[str, object]], method: str) -> dict[str, str]:
+    return {req_id: str(row.get(method) or "UNVERIFIED") for req_id, row in carried.items()}
+
+
+def run_contract_verification(
+    *,
+    repo_root: Path,
+    python_bin: str = sys.executable,
+    previous_matrix: Mapping[str, object] | None = None,
+) -> dict[str, object]:
+    """Verify all contract requirements and return the completion matrix payload.
+
+    With ``previous_matrix`` the run is incremental: requirements whose
+    change-impact fingerprint matches a previous PASS row are carried forward
+    (``carried_forward: true``) and only the rest are re-verified.
+    """
     try:
         loaded = load_and_validate_contracts(repo_root)
     except Exception as exc:
@@ -70,17 +86,26 @@ def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executab
         }
     cache: dict[str, bool] = {}
 
-    static_results = run_static_verification(requirements=loaded.contracts, repo_root=repo_root)
-    behavioral_results = run_behavioral_verification(
+    selection = select_requirements(
         requirements=loaded.contracts,
         registry=registry,
+        repo_root=repo_root,
+        previous_matrix=previous_matrix,
+    )
+    carried = selection.carried_forward
+    to_verify = selection.to_verify
+
+    static_results = run_static_verification(requirements=to_verify, repo_root=repo_root)
+    behavioral_results = run_behavioral_verification(
+        requirements=to_verify,
+        registry=registry,
         python_bin=python_bin,
         repo_root=repo_root,
         cache=cache,
         run_pytest_node=_run_node,
     )
     user_surface_results = run_user_surface_verification(
-        requirements=loaded.contracts,
+        requirements=to_verify,
         registry=registry,
         python_bin=python_bin,
         repo_root=repo_root,
@@ -88,7 +113,7 @@ def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executab
         run_pytest_node=_run_node,
     )
     live_flow_results = run_live_flow_verification(
-        requirements=loaded.contracts,
+        requirements=to_verify,
         registry=registry,
         python_bin=python_bin,
         repo_root=repo_root,
@@ -96,7 +121,7 @@ def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executab
         run_pytest_node=_run_node,
     )
     receipts_results = run_receipts_verification(
-        requirements=loaded.contracts,
+        requirements=to_verify,
         registry=registry,
         python_bin=python_bin,
         repo_root=repo_root,
@@ -106,13 +131,23 @@ def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executab
 
     verifier_result = run_verifier_pipeline(
         requirements=loaded.contracts,
-        static_results=static_results,
-        behavioral_results=behavioral_results,
-        user_surface_results=user_surface_results,
-        live_flow_results=live_flow_results,
-        receipts_results=receipts_results,
+        static_results={**_carried_statuses(carried, "static_verification"), **static_results},
+        behavioral_results={**_carried_statuses(carried, "behavioral_verification"), **behavioral_results},
+        user_surface_results={**_carried_statuses(carried, "user_surface_verification"), **user_surface_results},
+        live_flow_results={**_carried_statuses(carried, "live_flow_verification"), **live_flow_results},
+        receipts_results={**_carried_statuses(carried, "receipts_verification"), **receipts_results},
     )
     matrix_payload = verifier_result.matrix.to_dict()
+    contracts_by_id = {str(contract.get("id") or "").strip(): contract for contract in loaded.contracts}
+    for row in matrix_payload["completion_matrix"]:
+        req_id = row["id"]
+        prior = carried.get(req_id)
+        row["fingerprint"] = selection.fingerprints.get(req_id, "")
+        row["carried_forward"] = prior is not None
+        refs = prior.get("evidence_refs") if prior is not None else None
+        row["evidence_refs"] = (
+            list(refs) if isinstance(refs, list) else evidence_refs(contracts_by_id.get(req_id, {}), registry)
+        )
     merge_allowed, reason = is_merge_allowed(matrix_payload)
     status = str(matrix_payload.get("overall_status") or ("PASS" if merge_allowed else "FAIL")).upper()
     return {
@@ -120,4 +155,6 @@ def run_contract_verification(*, repo_root: Path, python_bin: str = sys.executab
         "merge_allowed": merge_allowed,
         "merge_reason": reason,
         "matrix": matrix_payload,
+        "verification_mode": "incremental" if previous_matrix is not None else "full",
+        "carried_forward": sorted(carried),
     }
@@ -5,6 +5,7 @@ Usage:
     python scripts/audit_explain.py --last
     python scripts/audit_explain.py --run <run_id>
     python scripts/audit_explain.py --list --limit 20
+    python scripts/audit_explain.py --run <run_id> --events [--since ISO] [--until ISO]
 """
 
 from __future__ import annotations
@@ -15,6 +16,9 @@ import sys
 from pathlib import Path
 from typing import Any
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
 
 def _find_workspaces_home() -> Path:
     """Find workspaces home directory."""
@@ -120,6 +124,31 @@ def explain_run(summary: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def explain_run_events(workspace_dir: Path, run_id: str, *, since: str = "", until: str = "") -> str:
+    """List the logged events of one run.
+
+    Only log segments whose index overlaps the run id / time window are read.
+    """
+    from governance_runtime.infrastructure.adapters.logging.log_segments import (
+        event_timestamp,
+        load_segment_index,
+        read_log_events,
+        verify_segment_chain,
+    )
+
+    events_path = workspace_dir / "logs" / "events.jsonl"
+    events = list(read_log_events(events_path, since=since, until=until, run_id=run_id))
+    sealed = load_segment_index(events_path)
+    problems = verify_segment_chain(events_path)
+    lines = ["-" * 60, f"EVENTS ({len(events)})", "-" * 60]
+    for event in events:
+        lines.append(f"{_format_timestamp(event_timestamp(event) or 'unknown'):<22} {event.get('event', 'unknown')}")
+    lines.append("")
+    chain = "intact" if not problems else "BROKEN: " + ", ".join(problems)
+    lines.append(f"Log segments: {len(sealed)} sealed, hash chain {chain}")
+    return "\n".join(lines)
+
+
 def find_latest_run(workspaces_home: Path) -> Path | None:
     """Find the latest run summary."""
     if not workspaces_home.exists():
@@ -180,6 +209,13 @@ Examples:
         help="List recent runs",
     )
     
+    parser.add_argument(
+        "--events",
+        action="store_true",
+        help="Also list the run's logged events (segment-aware)",
+    )
+    parser.add_argument("--since", default="", help="Only events at or after this ISO timestamp")
+    parser.add_argument("--until", default="", help="Only events at or before this ISO timestamp")
     parser.add_argument(
         "--limit",
         type=int,
@@ -227,6 +263,10 @@ Examples:
         return 1
     
     print(explain_run(summary))
+    if args.events:
+        workspace_dir = run_path.parents[2]
+        run_id = str(summary.get("run_id") or args.run or "")
+        print(explain_run_events(workspace_dir, run_id, since=args.since, until=args.until))
     return 0
 
 
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Audit Warehouse CLI - Query governance runs across all workspaces.
+
+Ingests run summaries, run archive metadata, events logs and plan-record
+versions into a local SQLite database (incrementally: only files that are new
+or changed since the last ingest are read) and answers fleet-wide questions
+from it.
+
+Usage:
+    python scripts/audit_warehouse.py ingest
+    python scripts/audit_warehouse.py report blocked-by-reason [--since ISO] [--until ISO] [--reason CODE]
+    python scripts/audit_warehouse.py report phase6-iterations
+    python scripts/audit_warehouse.py report runs-per-repo
+    python scripts/audit_warehouse.py report event-counts --since 2026-10-01
+    python scripts/audit_warehouse.py query "SELECT COUNT(*) AS n FROM events"
+
+``--ingest`` on ``report``/``query`` refreshes the warehouse first. Output is
+JSON on stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+import json
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from governance_runtime.infrastructure.audit_warehouse import (
+    REPORTS,
+    default_db_path,
+    ingest_workspaces,
+    open_warehouse_readonly,
+    run_query,
+)
+
+
+def _find_workspaces_home() -> Path:
+    """Find workspaces home directory."""
+    import os
+    config_root = os.environ.get("OPENCODE_CONFIG_ROOT", "")
+    if config_root:
+        return Path(config_root) / "workspaces"
+    return Path.home() / ".config" / "opencode" / "workspaces"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit Warehouse - fleet-wide governance run queries")
+    parser.add_argument("--workspaces-home", default="", help="Workspaces directory (default: OPENCODE_CONFIG_ROOT/workspaces)")
+    parser.add_argument("--db", default="", help="Warehouse database (default: <workspaces-home>/audit-warehouse.sqlite3)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("ingest", help="Ingest new and changed audit artifacts")
+
+    report = commands.add_parser("report", help="Run a canned report")
+    report.add_argument("name", choices=sorted(REPORTS))
+    report.add_argument("--since", default="", help="Only records at or after this ISO timestamp")
+    report.add_argument("--until", default="", help="Only records at or before this ISO timestamp")
+    report.add_argument("--reason", default="", help="blocked-by-reason: list the runs of this reason code")
+    report.add_argument("--ingest", action="store_true", help="Ingest before reporting")
+
+    query = commands.add_parser("query", help="Run a read-only SQL query")
+    query.add_argument("sql")
+    query.add_argument("--ingest", action="store_true", help="Ingest before querying")
+
+    args = parser.parse_args(argv)
+
+    workspaces_home = Path(args.workspaces_home) if args.workspaces_home else _find_workspaces_home()
+    db_path = Path(args.db) if args.db else default_db_path(workspaces_home)
+
+    if args.command == "ingest" or args.ingest:
+        result = ingest_workspaces(workspaces_home, db_path)
+        if args.command == "ingest":
+            print(json.dumps({"status": "ok", "db": str(db_path), **asdict(result)}, ensure_ascii=True))
+            return 0
+
+    try:
+        with closing(open_warehouse_readonly(db_path)) as conn:
+            if args.command == "report":
+                rows = REPORTS[args.name](conn, since=args.since, until=args.until, reason=args.reason)
+            else:
+                rows = run_query(conn, args.sql)
+    except (FileNotFoundError, sqlite3.Error) as exc:
+        print(json.dumps({"status": "error", "error": str(exc)}, ensure_ascii=True))
+        return 2
+    print(json.dumps({"status": "ok", "rows": rows}, ensure_ascii=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import gzip
 import hashlib
+import io
 import json
 import os
+import queue
 import re
-import shutil
 import sys
 import tarfile
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 FIXED_ZIP_DT = (1980, 1, 1, 0, 0, 0)  # deterministic ZIP timestamps
@@ -649,62 +651,276 @@ def sha256_file(p: Path) -> str:
     return h.hexdigest()
 
 
-def write_zip(out_zip: Path, prefix: str, repo_root: Path, files: list[Path]) -> None:
-    out_zip.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for src in files:
-            rel = src.relative_to(repo_root).as_posix()
-            arc = f"{prefix}/{rel}"
+MANIFEST_NAME = "build-manifest.json"
+MANIFEST_SCHEMA = "governance-build-manifest.v1"
+PIPELINE_DEPTH = 32  # files buffered per format writer
+
+
+@dataclass(frozen=True)
+class ReleaseEntry:
+    arcname: str
+    mode: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class ReleaseBuild:
+    files: list[dict[str, object]]
+    artifact_hashes: dict[str, str]
+
+
+class HashingWriter:
+    """Seekable binary sink that hashes bytes as they reach the output file.
+
+    zipfile seeks back once per member to patch its local header, so bytes only
+    enter the digest once they are final: a seek to offset ``p`` finalizes
+    everything before ``p``. A seek behind already-hashed bytes invalidates the
+    streaming digest and ``hexdigest`` returns None (caller re-reads the file).
+    """
+
+    def __init__(self, raw) -> None:
+        self._raw = raw
+        self.name = getattr(raw, "name", "")  # gzip embeds the basename in its header
+        self._hash = hashlib.sha256()
+        self._hashed = 0
+        self._pending = bytearray()
+        self._pos = 0
+        self._valid = True
+
+    def write(self, data) -> int:
+        view = memoryview(data).cast("B")
+        self._raw.write(view)
+        if self._valid:
+            start = self._pos - self._hashed
+            self._pending[start:start + len(view)] = view
+        self._pos += len(view)
+        return len(view)
+
+    def _finalize(self, upto: int) -> None:
+        count = upto - self._hashed
+        if count > 0:
+            self._hash.update(self._pending[:count])
+            del self._pending[:count]
+            self._hashed = upto
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        pos = self._raw.seek(offset, whence)
+        if self._valid:
+            if pos < self._hashed:
+                self._valid = False
+                self._pending.clear()
+            else:
+                self._finalize(min(pos, self._hashed + len(self._pending)))
+        self._pos = pos
+        return pos
 
-            zi = zipfile.ZipInfo(arc)
+    def tell(self) -> int:
+        return self._pos
+
+    def seekable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+    def hexdigest(self) -> str | None:
+        if not self._valid:
+            return None
+        self._finalize(self._hashed + len(self._pending))
+        return self._hash.hexdigest()
+
+
+def _release_mode(src: Path) -> int:
+    # Deterministic, minimal permission model:
+    # - install.py executable
+    # - everything else 0644
+    return 0o755 if src.name == "install.py" else 0o644
+
+
+def _write_zip_entries(fileobj, entries: Iterable[ReleaseEntry]) -> None:
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for entry in entries:
+            zi = zipfile.ZipInfo(entry.arcname)
             zi.date_time = FIXED_ZIP_DT
             zi.compress_type = zipfile.ZIP_DEFLATED
+            zi.external_attr = (entry.mode & 0xFFFF) << 16
+
+            with zf.open(zi, "w") as fdst:
+                fdst.write(entry.data)
+
+
+def _write_tar_gz_entries(fileobj, entries: Iterable[ReleaseEntry]) -> None:
+    with gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=FIXED_MTIME) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.GNU_FORMAT) as tf:
+            for entry in entries:
+                ti = tarfile.TarInfo(entry.arcname)
+                ti.size = len(entry.data)
+                ti.mtime = FIXED_MTIME
+                ti.uid = 0
+                ti.gid = 0
+                ti.uname = ""
+                ti.gname = ""
+                ti.mode = entry.mode
+                tf.addfile(ti, fileobj=io.BytesIO(entry.data))
+
+
+FORMAT_WRITERS = {
+    "zip": _write_zip_entries,
+    "tar.gz": _write_tar_gz_entries,
+}
 
-            # Deterministic, minimal permission model:
-            # - install.py executable
-            # - everything else 0644
-            mode = 0o755 if src.name == "install.py" else 0o644
-            zi.external_attr = (mode & 0xFFFF) << 16
 
-            with src.open("rb") as fsrc, zf.open(zi, "w") as fdst:
-                shutil.copyfileobj(fsrc, fdst)
+def _drain(channel: queue.Queue) -> Iterator[ReleaseEntry]:
+    while True:
+        entry = channel.get()
+        if entry is None:
+            return
+        yield entry
+
+
+def _run_format_writer(format_name: str, out_path: Path, channel: queue.Queue) -> str:
+    entries = _drain(channel)
+    try:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with out_path.open("wb") as raw:
+            sink = HashingWriter(raw)
+            FORMAT_WRITERS[format_name](sink, entries)
+    except BaseException:
+        # Keep consuming so the reader never blocks on a dead writer; the
+        # shared generator stops at once if the end marker was already seen.
+        for _ in entries:
+            pass
+        raise
+    digest = sink.hexdigest()
+    return digest if digest is not None else sha256_file(out_path)
+
+
+def build_release_archives(outputs: dict[str, Path], *, prefix: str, repo_root: Path, files: list[Path]) -> ReleaseBuild:
+    """Write all requested archive formats from a single read of every source file.
+
+    Each file is read once, hashed for the content manifest, and handed to one
+    writer thread per format; output archives are hashed as they are written.
+    """
+
+    unknown = sorted(set(outputs) - set(FORMAT_WRITERS))
+    if unknown:
+        raise ValueError(f"unsupported artifact format: {', '.join(unknown)}")
+
+    channels = {fmt: queue.Queue(maxsize=PIPELINE_DEPTH) for fmt in outputs}
+    manifest: list[dict[str, object]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(outputs))) as pool:
+        futures = {
+            fmt: pool.submit(_run_format_writer, fmt, out_path, channels[fmt])
+            for fmt, out_path in outputs.items()
+        }
+        try:
+            for src in files:
+                rel = src.relative_to(repo_root).as_posix()
+                data = src.read_bytes()
+                entry = ReleaseEntry(arcname=f"{prefix}/{rel}", mode=_release_mode(src), data=data)
+                manifest.append(
+                    {
+                        "path": rel,
+                        "size": len(data),
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                        "mode": f"{entry.mode:04o}",
+                    }
+                )
+                for channel in channels.values():
+                    channel.put(entry)
+        finally:
+            for channel in channels.values():
+                channel.put(None)
+        artifact_hashes = {outputs[fmt].name: future.result() for fmt, future in futures.items()}
+    return ReleaseBuild(files=manifest, artifact_hashes=artifact_hashes)
+
+
+def write_zip(out_zip: Path, prefix: str, repo_root: Path, files: list[Path]) -> None:
+    build_release_archives({"zip": out_zip}, prefix=prefix, repo_root=repo_root, files=files)
 
 
 def write_tar_gz(out_tgz: Path, prefix: str, repo_root: Path, files: list[Path]) -> None:
-    out_tgz.parent.mkdir(parents=True, exist_ok=True)
-    with out_tgz.open("wb") as raw:
-        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=FIXED_MTIME) as gz:
-            with tarfile.open(fileobj=gz, mode="w", format=tarfile.GNU_FORMAT) as tf:
-                for src in files:
-                    rel = src.relative_to(repo_root).as_posix()
-                    arc = f"{prefix}/{rel}"
-
-                    ti = tf.gettarinfo(str(src), arcname=arc)
-                    ti.mtime = FIXED_MTIME
-                    ti.uid = 0
-                    ti.gid = 0
-                    ti.uname = ""
-                    ti.gname = ""
-                    ti.mode = 0o755 if src.name == "install.py" else 0o644
-
-                    with src.open("rb") as f:
-                        tf.addfile(ti, fileobj=f)
-
-
-def write_sha256sums(dist_dir: Path, artifacts: list[Path]) -> Path:
+    build_release_archives({"tar.gz": out_tgz}, prefix=prefix, repo_root=repo_root, files=files)
+
+
+def _source_manifest(prefix: str, repo_root: Path, files: list[Path]) -> list[dict[str, object]]:
+    manifest: list[dict[str, object]] = []
+    for src in files:
+        data = src.read_bytes()
+        manifest.append(
+            {
+                "path": src.relative_to(repo_root).as_posix(),
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "mode": f"{_release_mode(src):04o}",
+            }
+        )
+    return manifest
+
+
+def _reusable_artifact_hashes(
+    dist_dir: Path,
+    outputs: dict[str, Path],
+    *,
+    prefix: str,
+    repo_root: Path,
+    files: list[Path],
+) -> dict[str, str] | None:
+    """Return recorded artifact hashes when the previous build is still current."""
+
+    manifest_path = dist_dir / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(previous, dict) or previous.get("schema") != MANIFEST_SCHEMA:
+        return None
+    if previous.get("prefix") != prefix:
+        return None
+    if previous.get("files") != _source_manifest(prefix, repo_root, files):
+        return None
+    recorded = previous.get("artifacts")
+    if not isinstance(recorded, dict):
+        return None
+    hashes: dict[str, str] = {}
+    for out_path in outputs.values():
+        expected = recorded.get(out_path.name)
+        if not isinstance(expected, str) or not out_path.is_file() or sha256_file(out_path) != expected:
+            return None
+        hashes[out_path.name] = expected
+    return hashes
+
+
+def write_build_manifest(dist_dir: Path, *, prefix: str, files: list[dict[str, object]], artifact_hashes: dict[str, str]) -> Path:
+    """Write the per-file content manifest used by ``--incremental`` rebuilds."""
+
+    payload = {
+        "schema": MANIFEST_SCHEMA,
+        "prefix": prefix,
+        "files": files,
+        "artifacts": artifact_hashes,
+    }
+    out = dist_dir / MANIFEST_NAME
+    out.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    return out
+
+
+def write_sha256sums(dist_dir: Path, artifacts: list[Path], hashes: dict[str, str] | None = None) -> Path:
     out = dist_dir / "SHA256SUMS.txt"
     lines = []
     for a in artifacts:
-        h = sha256_file(a)
+        h = (hashes or {}).get(a.name) or sha256_file(a)
         lines.append(f"{h}  {a.name}")
     out.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return out
 
 
-def write_verification_report(dist_dir: Path, artifacts: list[Path]) -> Path:
+def write_verification_report(dist_dir: Path, artifacts: list[Path], hashes: dict[str, str] | None = None) -> Path:
     """Write machine-readable verification report sidecar for release artifacts."""
 
-    artifact_hashes = {a.name: sha256_file(a) for a in artifacts}
+    artifact_hashes = {a.name: (hashes or {}).get(a.name) or sha256_file(a) for a in artifacts}
     report = {
         "schema": "governance-verification-report.v1",
         "pytest_summary": os.environ.get("OPENCODE_PYTEST_SUMMARY", "not_provided"),
@@ -724,6 +940,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Build deterministic release artifacts (zip + tar.gz).")
     p.add_argument("--out-dir", default="dist", help="Output directory (default: dist)")
     p.add_argument("--formats", default="zip,tar.gz", help="Comma-separated: zip, tar.gz (default: zip,tar.gz)")
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Reuse existing artifacts when {MANIFEST_NAME} shows unchanged release content",
+    )
     return p.parse_args(argv)
 
 
@@ -753,22 +974,33 @@ def main(argv: list[str]) -> int:
     )
 
     formats = [s.strip().lower() for s in str(args.formats).split(",") if s.strip()]
-    artifacts: list[Path] = []
-
+    outputs: dict[str, Path] = {}
     if "zip" in formats:
-        out_zip = bp.dist_dir / f"{prefix}.zip"
-        write_zip(out_zip, prefix=prefix, repo_root=bp.repo_root, files=files)
-        _enforce_metadata_hygiene_on_archive(out_zip, format_name="zip")
-        artifacts.append(out_zip)
-
+        outputs["zip"] = bp.dist_dir / f"{prefix}.zip"
     if "tar.gz" in formats or "tgz" in formats:
-        out_tgz = bp.dist_dir / f"{prefix}.tar.gz"
-        write_tar_gz(out_tgz, prefix=prefix, repo_root=bp.repo_root, files=files)
-        _enforce_metadata_hygiene_on_archive(out_tgz, format_name="tar.gz")
-        artifacts.append(out_tgz)
+        outputs["tar.gz"] = bp.dist_dir / f"{prefix}.tar.gz"
+
+    artifact_hashes = None
+    if args.incremental:
+        artifact_hashes = _reusable_artifact_hashes(
+            bp.dist_dir, outputs, prefix=prefix, repo_root=bp.repo_root, files=files
+        )
+    if artifact_hashes is None:
+        build = build_release_archives(outputs, prefix=prefix, repo_root=bp.repo_root, files=files)
+        for format_name, out_path in outputs.items():
+            _enforce_metadata_hygiene_on_archive(out_path, format_name=format_name)
+        artifact_hashes = build.artifact_hashes
+        bp.dist_dir.mkdir(parents=True, exist_ok=True)
+        manifest = write_build_manifest(
+            bp.dist_dir, prefix=prefix, files=build.files, artifact_hashes=artifact_hashes
+        )
+    else:
+        manifest = bp.dist_dir / MANIFEST_NAME
+        print("Release content unchanged; reusing existing artifacts.")
+    artifacts = list(outputs.values())
 
-    sums = write_sha256sums(bp.dist_dir, artifacts)
-    verification = write_verification_report(bp.dist_dir, artifacts)
+    sums = write_sha256sums(bp.dist_dir, artifacts, artifact_hashes)
+    verification = write_verification_report(bp.dist_dir, artifacts, artifact_hashes)
     
     def _pretty(p: Path) -> str:
         """Pretty-print artifact paths without assuming they live under repo_root."""
@@ -782,6 +1014,7 @@ def main(argv: list[str]) -> int:
         print(f"  - {_pretty(a)}")
     print(f"  - {_pretty(sums)}")
     print(f"  - {_pretty(verification)}")
+    print(f"  - {_pretty(manifest)}")
 
     return 0
 
@@ -1,10 +1,17 @@
-"""Build deterministic ruleset manifest/lock/hash artifacts from repository sources."""
+"""Build deterministic ruleset manifest/lock/hash artifacts from repository sources.
+
+Each rulebook and addon manifest is compiled (parsed and, for rulebooks,
+schema-validated) into a cache entry keyed by its content hash, the rulebook
+schema hash and ``COMPILER_VERSION``; unchanged sources are reused from the
+cache.
+"""
 
 from __future__ import annotations
 
 import argparse
 import hashlib
 import json
+import os
 from pathlib import Path
 import re
 import sys
@@ -12,6 +19,10 @@ import yaml
 import jsonschema
 
 
+COMPILER_VERSION = "1"
+CACHE_DIRNAME = ".compile-cache"
+
+
 def _resolve_rulesets_dir(repo_root: Path) -> Path:
     candidates = [repo_root / "governance_spec" / "rulesets", repo_root / "rulesets"]
     for candidate in candidates:
@@ -48,7 +59,10 @@ def validate_against_schema(rulebook_path: Path, schema_path: Path) -> list[str]
     rulebook = yaml.safe_load(rulebook_path.read_text(encoding="utf-8"))
     
     from jsonschema import Draft202012Validator
-    validator = Draft202012Validator(schema)
+    return _validate_document(rulebook, schema, Draft202012Validator(schema))
+
+
+def _validate_document(rulebook: object, schema: dict, validator: object) -> list[str]:
     errors = list(validator.iter_errors(rulebook))
     
     if errors:
@@ -69,8 +83,84 @@ def validate_against_schema(rulebook_path: Path, schema_path: Path) -> list[str]
     return []
 
 
-def build_ruleset_artifacts_v2(*, repo_root: Path, ruleset_id: str, version: str, output_root: Path) -> dict[str, str]:
-    """Build artifacts using YAML/JSON rulebooks (v2 schema)."""
+class RulebookCompileCache:
+    """On-disk cache of compiled rulebooks keyed by source, schema and compiler hash.
+
+    A schema change changes the key of every rulebook validated against it, so
+    exactly the changed sources and their dependents are recompiled.
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source_sha256: str, schema_sha256: str) -> str:
+        return hashlib.sha256(f"{COMPILER_VERSION}\0{schema_sha256}\0{source_sha256}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            entry = json.loads((self.cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("compiler_version") != COMPILER_VERSION:
+            return None
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        target = self.cache_dir / f"{key}.json"
+        # Per-process temp name: concurrent builds may share the cache directory.
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=True, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(target)
+
+
+def _compile_source(
+    path: Path,
+    *,
+    source_sha256: str,
+    schema: dict,
+    schema_sha256: str,
+    validator: object,
+    cache: RulebookCompileCache,
+) -> dict:
+    """Return the compiled entry (``errors``) for one rulebook, from cache when possible."""
+    key = RulebookCompileCache.key(source_sha256, schema_sha256)
+    entry = cache.get(key)
+    if entry is not None:
+        cache.hits += 1
+        return entry
+    cache.misses += 1
+    document = yaml.safe_load(path.read_text(encoding="utf-8"))
+    entry = {
+        "compiler_version": COMPILER_VERSION,
+        "source_sha256": source_sha256,
+        "schema_sha256": schema_sha256,
+        "errors": _validate_document(document, schema, validator),
+    }
+    cache.put(key, entry)
+    return entry
+
+
+def build_ruleset_artifacts_v2(
+    *,
+    repo_root: Path,
+    ruleset_id: str,
+    version: str,
+    output_root: Path,
+    cache: RulebookCompileCache | None = None,
+) -> dict[str, str]:
+    """Build artifacts using YAML/JSON rulebooks (v2 schema).
+
+    With a ``cache`` backed by a directory, unchanged rulebooks are not
+    re-parsed or re-validated.
+    """
     
     schema_path = repo_root / "schemas" / "rulebook.schema.json"
     if not schema_path.exists():
@@ -88,11 +178,27 @@ def build_ruleset_artifacts_v2(*, repo_root: Path, ruleset_id: str, version: str
     if not profile_rulebooks:
         raise ValueError("no profile rulebooks found under rulesets/profiles/*.yml")
     
+    schema_data = json.loads(schema_path.read_text(encoding="utf-8"))
+    schema_sha256 = _sha256(schema_path)
+    from jsonschema import Draft202012Validator
+    validator = Draft202012Validator(schema_data)
+    if cache is None:
+        cache = RulebookCompileCache(None)
+    source_sha256 = {path: _sha256(path) for path in core_rulebooks + profile_rulebooks}
+    
     validation_errors = []
     validated_rulebooks = []
     
     for rb_path in core_rulebooks + profile_rulebooks:
-        errors = validate_against_schema(rb_path, schema_path)
+        entry = _compile_source(
+            rb_path,
+            source_sha256=source_sha256[rb_path],
+            schema=schema_data,
+            schema_sha256=schema_sha256,
+            validator=validator,
+            cache=cache,
+        )
+        errors = entry["errors"]
         if errors:
             validation_errors.extend([f"{rb_path.name}: {e}" for e in errors])
         else:
@@ -102,19 +208,19 @@ def build_ruleset_artifacts_v2(*, repo_root: Path, ruleset_id: str, version: str
         raise ValueError(f"schema validation failed:\n" + "\n".join(validation_errors))
     
     # Extract schema version from schema file for manifest
-    schema_data = json.loads(schema_path.read_text(encoding="utf-8"))
     rulebook_schema_version = schema_data.get("version", "unknown")
     
     addons_dir = _resolve_addons_dir(repo_root)
     addons = _collect_files(addons_dir, "*.addon.yml")
     if not addons:
         raise ValueError(f"no addon manifests found under {addons_dir.relative_to(repo_root)}/*.addon.yml")
+    source_sha256.update({path: _sha256(path) for path in addons})
     
     source_files = sorted(validated_rulebooks + addons)
     source_entries = [
         {
             "path": _relative_posix(path, repo_root),
-            "sha256": _sha256(path),
+            "sha256": source_sha256[path],
         }
         for path in source_files
     ]
@@ -180,6 +286,12 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--version", required=True)
     parser.add_argument("--repo-root", default="", help="Repository root containing rulesets/profiles YAML rulebooks.")
     parser.add_argument("--output-root", default="rulesets")
+    parser.add_argument(
+        "--cache-dir",
+        default="",
+        help=f"Compile cache directory (default: <output-root>/{CACHE_DIRNAME}).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Recompile every rulebook without reading or writing the cache.")
     args = parser.parse_args(argv)
 
     if not re.fullmatch(r"[A-Za-z0-9._-]+", args.ruleset_id):
@@ -191,14 +303,30 @@ def main(argv: list[str] | None = None) -> int:
 
     repo_root = Path(args.repo_root).resolve() if args.repo_root else Path(__file__).resolve().parents[1]
 
+    output_root = Path(args.output_root)
+    cache_dir = None if args.no_cache else Path(args.cache_dir) if args.cache_dir else output_root / CACHE_DIRNAME
+    cache = RulebookCompileCache(cache_dir)
+
     try:
         hashes = build_ruleset_artifacts_v2(
             repo_root=repo_root,
             ruleset_id=args.ruleset_id,
             version=args.version,
-            output_root=Path(args.output_root),
+            output_root=output_root,
+            cache=cache,
+        )
+        print(
+            json.dumps(
+                {
+                    "status": "OK",
+                    "ruleset_hash": hashes["ruleset_hash"],
+                    "mode": "v2-yaml",
+                    "compiled": cache.misses,
+                    "cached": cache.hits,
+                },
+                ensure_ascii=True,
+            )
         )
-        print(json.dumps({"status": "OK", "ruleset_hash": hashes["ruleset_hash"], "mode": "v2-yaml"}, ensure_ascii=True))
         return 0
     except Exception as e:
         print(json.dumps({"status": "BLOCKED", "message": str(e)}, ensure_ascii=True))
@@ -17,6 +17,12 @@ import re
 import sys
 from pathlib import Path
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.lint_md_python import iter_md_files
+from scripts.repo_file_index import RepoFileIndex
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -124,8 +130,7 @@ def main() -> int:
     else:
         print("APPLYING FIXES\n")
     
-    md_files = list(REPO_ROOT.glob("**/*.md"))
-    md_files = [f for f in md_files if "node_modules" not in str(f) and ".git" not in str(f)]
+    md_files = [REPO_ROOT / rel for rel in iter_md_files(RepoFileIndex.build(REPO_ROOT))]
     
     total_fixes = 0
     files_with_fixes = []
@@ -6,6 +6,11 @@ import re
 import sys
 from pathlib import Path
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.repo_file_index import RepoFileIndex
+
 
 DEFAULT_ALLOWED_PREFIXES = (
     "docs/archive/",
@@ -91,32 +96,29 @@ def _is_allowed(rel_posix: str, allowed_prefixes: tuple[str, ...]) -> bool:
     return any(rel_posix.startswith(prefix) for prefix in allowed_prefixes)
 
 
-def _iter_candidate_files(repo_root: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
-        if any(part in SKIP_DIRS for part in path.parts):
-            continue
-        if path.suffix.lower() not in SCANNED_EXTENSIONS:
-            continue
-        files.append(path)
-    return files
+def _iter_candidate_files(index: RepoFileIndex) -> list[Path]:
+    return [Path(entry.rel) for entry in index.select(suffixes=SCANNED_EXTENSIONS, skip_dirs=SKIP_DIRS)]
 
 
 def _in_roots(rel_posix: str, roots: tuple[str, ...]) -> bool:
     return any(rel_posix == root or rel_posix.startswith(root + "/") for root in roots)
 
 
-def scan_legacy_surface(repo_root: Path, *, allowed_prefixes: tuple[str, ...]) -> list[str]:
+def scan_legacy_surface(
+    repo_root: Path,
+    *,
+    allowed_prefixes: tuple[str, ...],
+    index: RepoFileIndex | None = None,
+) -> list[str]:
+    if index is None:
+        index = RepoFileIndex.build(repo_root)
     violations: list[str] = []
-    for path in _iter_candidate_files(repo_root):
-        rel = path.relative_to(repo_root)
+    for rel in _iter_candidate_files(index):
         rel_posix = _to_posix(rel)
         if _is_allowed(rel_posix, allowed_prefixes):
             continue
 
-        scan_python = path.suffix.lower() == ".py" and (
+        scan_python = rel.suffix.lower() == ".py" and (
             _in_roots(rel_posix, PYTHON_PRODUCTIVE_ROOTS) or rel_posix in EXPLICIT_PRODUCTIVE_PYTHON_FILES
         )
         scan_path_tokens = _in_roots(rel_posix, PATH_SCAN_ROOTS) or rel_posix in EXPLICIT_NORMATIVE_FILES
@@ -126,7 +128,7 @@ def scan_legacy_surface(repo_root: Path, *, allowed_prefixes: tuple[str, ...]) -
         if not scan_python and not scan_path_tokens:
             continue
 
-        text = path.read_text(encoding="utf-8", errors="replace")
+        text = index.read_text(rel_posix, errors="replace")
         lines = text.splitlines()
 
         for idx, line in enumerate(lines, start=1):
@@ -23,6 +23,11 @@ import re
 import sys
 from pathlib import Path
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.repo_file_index import RepoFileIndex
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -93,6 +98,17 @@ def is_in_fenced_code_block(lines: list[str], line_idx: int) -> bool:
     return in_block
 
 
+def _fenced_line_mask(lines: list[str]) -> list[bool]:
+    """``is_in_fenced_code_block`` for every line in one pass."""
+    mask: list[bool] = []
+    in_block = False
+    for line in lines:
+        if re.match(r"^```\w*$", line):
+            in_block = not in_block
+        mask.append(in_block)
+    return mask
+
+
 def is_in_example_block(lines: list[str], line_idx: int) -> bool:
     """Check if line is inside a fenced code block marked as example."""
     in_block = False
@@ -136,9 +152,11 @@ def is_dangerous_execution(line: str) -> bool:
     return False
 
 
-def lint_md_file(path: Path) -> tuple[list[tuple[int, str, str]], list[tuple[int, str, str]]]:
+def lint_md_file(path: Path, text: str | None = None) -> tuple[list[tuple[int, str, str]], list[tuple[int, str, str]]]:
     """Lint a single MD file for forbidden patterns.
     
+    ``text`` is the file content when the caller already has it (file index).
+    
     Returns:
         Tuple of (errors, warnings)
     """
@@ -150,10 +168,11 @@ def lint_md_file(path: Path) -> tuple[list[tuple[int, str, str]], list[tuple[int
         return errors, warnings
     
     try:
-        content = path.read_text(encoding="utf-8")
+        content = path.read_text(encoding="utf-8") if text is None else text
         lines = content.splitlines()
     except (OSError, UnicodeDecodeError):
         return errors, warnings
+    fenced = _fenced_line_mask(lines)
     
     for line_idx, line in enumerate(lines, start=1):
         # Check for dangerous patterns - these are ALWAYS forbidden
@@ -162,7 +181,7 @@ def lint_md_file(path: Path) -> tuple[list[tuple[int, str, str]], list[tuple[int
             continue
         
         # Skip if in fenced code block (it's an example)
-        if is_in_fenced_code_block(lines, line_idx - 1):
+        if fenced[line_idx - 1]:
             continue
         
         # Check for forbidden patterns (errors)
@@ -183,20 +202,40 @@ def lint_md_file(path: Path) -> tuple[list[tuple[int, str, str]], list[tuple[int
     return errors, warnings
 
 
-def main() -> int:
-    """Lint all MD files in repository."""
-    md_files = list(REPO_ROOT.glob("**/*.md"))
-    md_files = [f for f in md_files if "node_modules" not in str(f) and ".git" not in str(f)]
-    
+def iter_md_files(index: RepoFileIndex) -> list[str]:
+    """Repo-relative MD files to lint (node_modules and .git* paths excluded)."""
+    return [
+        entry.rel
+        for entry in index.select(suffixes={".md"})
+        if "node_modules" not in entry.rel and ".git" not in entry.rel
+    ]
+
+
+def collect_md_lint(
+    index: RepoFileIndex | None = None,
+) -> tuple[list[tuple[Path, list[tuple[int, str, str]]]], list[tuple[Path, list[tuple[int, str, str]]]]]:
+    """Lint every MD file of the index; returns ``(all_errors, all_warnings)``."""
+    index = index or RepoFileIndex.build(REPO_ROOT)
     all_errors: list[tuple[Path, list[tuple[int, str, str]]]] = []
     all_warnings: list[tuple[Path, list[tuple[int, str, str]]]] = []
     
-    for md_file in md_files:
-        errors, warnings = lint_md_file(md_file)
+    for rel in iter_md_files(index):
+        md_file = REPO_ROOT / rel
+        try:
+            text = index.read_text(rel)
+        except (OSError, UnicodeDecodeError):
+            continue
+        errors, warnings = lint_md_file(md_file, text)
         if errors:
             all_errors.append((md_file, errors))
         if warnings:
             all_warnings.append((md_file, warnings))
+    return all_errors, all_warnings
+
+
+def main() -> int:
+    """Lint all MD files in repository."""
+    all_errors, all_warnings = collect_md_lint()
     
     if not all_errors and not all_warnings:
         print("✓ All MD files compliant (no forbidden patterns)")
@@ -4,15 +4,25 @@ This tool is intentionally non-destructive:
 - it creates a `.backup` copy before the first canonicalizing write
 - it never deletes backups
 - it exits with machine-readable codes (`0=ok`, `2=blocked`)
+
+Bulk mode (`--all`) migrates every `<workspaces-root>/<fingerprint>/SESSION_STATE.json`
+on a bounded process pool. Each file is migrated under its workspace lock, and
+every outcome is appended to a JSONL ledger (path, pre/post hash, status) so an
+interrupted run resumes where it stopped: files whose current hash matches the
+ledger's post-migration hash are skipped without being parsed.
 """
 
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+from datetime import datetime, timezone
+import hashlib
 import json
+import os
 from pathlib import Path
 import sys
-from typing import Any
+from typing import Any, Iterable
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -20,10 +30,20 @@ if str(REPO_ROOT) not in sys.path:
 
 from governance_runtime.engine.reason_codes import BLOCKED_STATE_OUTDATED, REASON_CODE_NONE
 from governance_runtime.engine.session_state_repository import SessionStateRepository, _canonicalize_for_write
+from governance_runtime.entrypoints.workspace_lock import acquire_workspace_lock
 
 EXIT_OK = 0
 EXIT_BLOCKED = 2
 
+SESSION_STATE_FILENAME = "SESSION_STATE.json"
+DEFAULT_LEDGER_NAME = ".session-state-migration.jsonl"
+DEFAULT_LOCK_TIMEOUT_SECONDS = 10
+
+# Ledger statuses that mean "this file is done" when its hash still matches.
+_COMPLETED_STATUSES = frozenset({"migrated", "unchanged"})
+# Statuses that fail the bulk run (locked files are retried on the next run).
+_FAILED_STATUSES = frozenset({"blocked", "locked"})
+
 
 def _resolve_target_path(*, workspace: str | None, workspaces_root: Path, file_path: Path | None) -> Path:
     """Resolve SESSION_STATE target path from CLI arguments."""
@@ -96,6 +116,183 @@ def migrate_session_state_file(path: Path, *, engine_version: str = "1.2.0") ->
         )
 
 
+def discover_session_state_files(workspaces_root: Path) -> list[Path]:
+    """Return `<workspaces_root>/<fingerprint>/SESSION_STATE.json` files in sorted order."""
+
+    try:
+        entries = sorted(os.scandir(workspaces_root), key=lambda entry: entry.name)
+    except OSError:
+        return []
+    found: list[Path] = []
+    for entry in entries:
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        candidate = Path(entry.path) / SESSION_STATE_FILENAME
+        if candidate.is_file():
+            found.append(candidate)
+    return found
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the SHA-256 of the raw file bytes, or empty string if unreadable."""
+
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def read_migration_ledger(ledger_path: Path) -> dict[str, dict[str, Any]]:
+    """Return the last ledger entry per path; malformed lines are ignored."""
+
+    latest: dict[str, dict[str, Any]] = {}
+    try:
+        lines = ledger_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return latest
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict) and isinstance(entry.get("path"), str):
+            latest[entry["path"]] = entry
+    return latest
+
+
+def _needs_rewrite(path: Path) -> bool:
+    """Whether saving would change the file (legacy aliases or non-canonical formatting)."""
+
+    text = path.read_text(encoding="utf-8")
+    payload = json.loads(text)
+    if not isinstance(payload, dict):
+        raise ValueError("SESSION_STATE payload must be a JSON object")
+    canonical, changed = _canonicalize_for_write(payload)
+    return changed or text != json.dumps(canonical, indent=2, ensure_ascii=True) + "\n"
+
+
+def _migrate_workspace_file(
+    path: Path, engine_version: str, dry_run: bool, lock_timeout: float
+) -> dict[str, Any]:
+    """Migrate one discovered file under its workspace lock (process-pool worker)."""
+
+    result: dict[str, Any] = {"path": str(path), "pre_hash": _file_sha256(path), "post_hash": "", "message": ""}
+    try:
+        if dry_run:
+            rewrite = _needs_rewrite(path)
+            result.update(status="would_migrate" if rewrite else "unchanged", post_hash="" if rewrite else result["pre_hash"])
+            return result
+        try:
+            lock = acquire_workspace_lock(
+                workspaces_home=path.parent.parent,
+                repo_fingerprint=path.parent.name,
+                timeout_seconds=lock_timeout,
+            )
+        except TimeoutError:
+            result.update(status="locked", message="workspace lock held by another process")
+            return result
+        try:
+            # Hash again under the lock: a live session may have written meanwhile.
+            result["pre_hash"] = _file_sha256(path)
+            if not _needs_rewrite(path):
+                result.update(status="unchanged", post_hash=result["pre_hash"], message="SESSION_STATE already canonical")
+                return result
+            code, payload = migrate_session_state_file(path, engine_version=engine_version)
+        finally:
+            lock.release()
+    except (OSError, ValueError, json.JSONDecodeError) as exc:
+        result.update(status="blocked", message=str(exc))
+        return result
+    result["message"] = str(payload.get("message", ""))
+    if code != EXIT_OK:
+        result["status"] = "blocked"
+        return result
+    result.update(status="migrated", post_hash=_file_sha256(path))
+    return result
+
+
+def migrate_workspaces(
+    workspaces_root: Path,
+    *,
+    ledger_path: Path | None = None,
+    jobs: int = 1,
+    dry_run: bool = False,
+    engine_version: str = "1.2.0",
+    lock_timeout: float = DEFAULT_LOCK_TIMEOUT_SECONDS,
+) -> tuple[int, dict[str, Any]]:
+    """Migrate every SESSION_STATE file under `workspaces_root`.
+
+    Dry runs neither write files, take locks, nor append to the ledger.
+    Returns `(exit_code, summary)`; the exit code is `2` if any file was
+    blocked or locked.
+    """
+
+    ledger = ledger_path if ledger_path is not None else workspaces_root / DEFAULT_LEDGER_NAME
+    previous = read_migration_ledger(ledger)
+    pending: list[Path] = []
+    counts: dict[str, int] = {"skipped": 0}
+    problems: list[dict[str, Any]] = []
+
+    for path in discover_session_state_files(workspaces_root):
+        entry = previous.get(str(path))
+        if (
+            entry is not None
+            and entry.get("status") in _COMPLETED_STATUSES
+            and entry.get("post_hash")
+            and entry.get("post_hash") == _file_sha256(path)
+        ):
+            counts["skipped"] += 1
+            continue
+        pending.append(path)
+
+    def record(results: Iterable[dict[str, Any]]) -> None:
+        handle = None if dry_run else _open_ledger(ledger)
+        try:
+            for result in results:
+                status = str(result["status"])
+                counts[status] = counts.get(status, 0) + 1
+                if status in _FAILED_STATUSES:
+                    problems.append({"path": result["path"], "status": status, "message": result["message"]})
+                if handle is not None:
+                    result["recorded_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+                    handle.write(json.dumps(result, sort_keys=True, ensure_ascii=True) + "\n")
+                    handle.flush()
+        finally:
+            if handle is not None:
+                handle.close()
+
+    count = len(pending)
+    if jobs > 1 and count > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            record(pool.map(
+                _migrate_workspace_file,
+                pending,
+                [engine_version] * count,
+                [dry_run] * count,
+                [lock_timeout] * count,
+            ))
+    else:
+        record(_migrate_workspace_file(path, engine_version, dry_run, lock_timeout) for path in pending)
+
+    failed = bool(problems)
+    summary: dict[str, Any] = {
+        "status": "blocked" if failed else "ok",
+        "reason_code": BLOCKED_STATE_OUTDATED if failed else REASON_CODE_NONE,
+        "dry_run": dry_run,
+        "workspaces_root": str(workspaces_root),
+        "ledger_path": "" if dry_run else str(ledger),
+        "discovered": counts["skipped"] + count,
+        "counts": dict(sorted(counts.items())),
+        "problems": problems,
+    }
+    return (EXIT_BLOCKED if failed else EXIT_OK), summary
+
+
+def _open_ledger(ledger_path: Path):
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    return ledger_path.open("a", encoding="utf-8")
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint for deterministic SESSION_STATE migration."""
 
@@ -108,9 +305,35 @@ def main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument("--file", default=None, help="Explicit SESSION_STATE file path.")
     parser.add_argument("--engine-version", default="1.2.0", help="Engine version recorded in migration metadata.")
+    parser.add_argument("--all", action="store_true", help="Migrate every workspace under --workspaces-root.")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for --all (default: 1).")
+    parser.add_argument(
+        "--ledger",
+        default=None,
+        help=f"Resumable JSONL progress ledger for --all (default: <workspaces-root>/{DEFAULT_LEDGER_NAME}).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="With --all: report what would change, write nothing.")
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=DEFAULT_LOCK_TIMEOUT_SECONDS,
+        help="Seconds to wait for each workspace lock with --all.",
+    )
 
     args = parser.parse_args(argv)
 
+    if args.all:
+        code, summary = migrate_workspaces(
+            Path(args.workspaces_root),
+            ledger_path=Path(args.ledger) if args.ledger is not None else None,
+            jobs=max(1, args.jobs),
+            dry_run=args.dry_run,
+            engine_version=args.engine_version,
+            lock_timeout=args.lock_timeout,
+        )
+        print(json.dumps(summary, ensure_ascii=True))
+        return code
+
     try:
         path = _resolve_target_path(
             workspace=args.workspace,
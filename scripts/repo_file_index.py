@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Shared repository file index for the guard scripts.
+
+One ``os.scandir`` walk records every file's repo-relative path, size and
+mtime. Guards filter that list instead of running their own ``rglob`` walks,
+and read file content through the index, which caches it in memory so a file
+read by several guards is read once. When enabled (``run_repo_guards.py``),
+SHA-256 digests are also persisted in a cache file (default
+``.git/guard-file-index.json``), keyed by size and mtime, so unchanged files
+are not re-hashed on the next run. The standalone guards build an index
+without the cache and never write to ``.git``.
+
+Only ``.git`` and ``__pycache__`` are pruned during the walk; every guard
+still applies its own skip rules to the indexed paths, so guard results are
+the same as with the guard's own walk.
+
+Usage:
+    python scripts/repo_file_index.py --repo-root .   # print index summary
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+INDEX_CACHE_SCHEMA = "governance-guard-file-index.v1"
+INDEX_CACHE_FILENAME = "guard-file-index.json"
+PRUNED_DIRS = frozenset({".git", "__pycache__"})
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """One regular file under the repository root."""
+    rel: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        return tuple(self.rel.split("/"))
+
+    @property
+    def name(self) -> str:
+        return self.rel.rsplit("/", 1)[-1]
+
+    @property
+    def suffix(self) -> str:
+        return os.path.splitext(self.name)[1]
+
+
+def default_cache_path(repo_root: Path) -> Path | None:
+    """Keep the index cache inside ``.git`` so it is never scanned or committed."""
+    git_dir = repo_root / ".git"
+    return git_dir / INDEX_CACHE_FILENAME if git_dir.is_dir() else None
+
+
+def _under(rel: str, roots: tuple[str, ...]) -> bool:
+    return any(rel == root or rel.startswith(root + "/") for root in roots)
+
+
+class RepoFileIndex:
+    """File list of one repository walk plus lazily cached content and digests."""
+
+    def __init__(self, repo_root: Path, files: list[IndexedFile], dirs: list[str], *, cache_path: Path | None = None) -> None:
+        self.repo_root = repo_root
+        self.files: tuple[IndexedFile, ...] = tuple(sorted(files, key=lambda entry: entry.rel))
+        self.dirs: tuple[str, ...] = tuple(sorted(dirs))
+        self.cache_path = cache_path
+        self._by_rel = {entry.rel: entry for entry in self.files}
+        self._bytes: dict[str, bytes] = {}
+        self._digests: dict[str, str] = {}
+        self._stored_digests: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.hashed = 0
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def build(cls, repo_root: Path, *, cache_path: Path | None | bool = False) -> "RepoFileIndex":
+        """Walk ``repo_root`` once.
+
+        The digest cache is opt-in: ``cache_path=True`` uses
+        ``default_cache_path``, a path uses that file, ``False``/``None``
+        neither reads nor writes one.
+        """
+        root = repo_root.absolute()
+        resolved_cache = default_cache_path(root) if cache_path is True else cache_path or None
+        files: list[IndexedFile] = []
+        dirs: list[str] = []
+        pending = [(root, "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{prefix}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in PRUNED_DIRS:
+                            dirs.append(rel)
+                            pending.append((Path(entry.path), rel + "/"))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files.append(IndexedFile(rel=rel, size=stat.st_size, mtime_ns=stat.st_mtime_ns))
+                except OSError:
+                    continue
+        index = cls(root, files, dirs, cache_path=resolved_cache)
+        index._load_digest_cache()
+        return index
+
+    def _load_digest_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("schema") != INDEX_CACHE_SCHEMA:
+            return
+        for rel, value in (payload.get("digests") or {}).items():
+            if isinstance(value, list) and len(value) == 3:
+                self._stored_digests[str(rel)] = (int(value[0]), int(value[1]), str(value[2]))
+
+    def save(self) -> None:
+        """Persist digests of unchanged and newly hashed files to the cache file."""
+        if self.cache_path is None:
+            return
+        digests: dict[str, list[object]] = {}
+        for entry in self.files:
+            digest = self._digests.get(entry.rel)
+            stored = self._stored_digests.get(entry.rel)
+            if digest is None and stored is not None and stored[:2] == (entry.size, entry.mtime_ns):
+                digest = stored[2]
+            if digest is not None:
+                digests[entry.rel] = [entry.size, entry.mtime_ns, digest]
+        payload = {"schema": INDEX_CACHE_SCHEMA, "digests": digests}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n", encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            return
+
+    # -- queries ------------------------------------------------------------
+
+    def select(
+        self,
+        *,
+        roots: Iterable[str] = (),
+        suffixes: Iterable[str] | None = None,
+        names: Iterable[str] | None = None,
+        skip_dirs: Iterable[str] = (),
+    ) -> list[IndexedFile]:
+        """Files under ``roots`` (all when empty) filtered by suffix, name and skipped dir parts."""
+        root_tuple = tuple(roots)
+        suffix_set = {suffix.lower() for suffix in suffixes} if suffixes is not None else None
+        name_set = set(names) if names is not None else None
+        skip_set = set(skip_dirs)
+        selected: list[IndexedFile] = []
+        for entry in self.files:
+            if root_tuple and not _under(entry.rel, root_tuple):
+                continue
+            if suffix_set is not None and entry.suffix.lower() not in suffix_set:
+                continue
+            if name_set is not None and entry.name not in name_set:
+                continue
+            if skip_set and any(part in skip_set for part in entry.parts):
+                continue
+            selected.append(entry)
+        return selected
+
+    def select_dirs(self, *, roots: Iterable[str] = ()) -> list[str]:
+        root_tuple = tuple(roots)
+        return [rel for rel in self.dirs if not root_tuple or _under(rel, root_tuple)]
+
+    def contains(self, rel: str) -> bool:
+        return rel in self._by_rel
+
+    def path(self, rel: str) -> Path:
+        return self.repo_root / rel
+
+    # -- content ------------------------------------------------------------
+
+    def read_bytes(self, rel: str) -> bytes:
+        data = self._bytes.get(rel)
+        if data is None:
+            data = self.path(rel).read_bytes()
+            with self._lock:
+                self._bytes.setdefault(rel, data)
+        return data
+
+    def read_text(self, rel: str, *, errors: str = "strict") -> str:
+        """Decode like ``Path.read_text(encoding="utf-8")``, including newline translation."""
+        text = self.read_bytes(rel).decode("utf-8", errors=errors)
+        return text.replace("\r\n", "\n").replace("\r", "\n") if "\r" in text else text
+
+    def sha256(self, rel: str) -> str:
+        digest = self._digests.get(rel)
+        if digest is not None:
+            return digest
+        entry = self._by_rel.get(rel)
+        stored = self._stored_digests.get(rel)
+        if entry is not None and stored is not None and stored[:2] == (entry.size, entry.mtime_ns):
+            digest = stored[2]
+        else:
+            digest = hashlib.sha256(self.read_bytes(rel)).hexdigest()
+            self.hashed += 1
+        with self._lock:
+            self._digests.setdefault(rel, digest)
+        return digest
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Build the shared guard file index and print a summary.")
+    parser.add_argument("--repo-root", default=".", help="Repository root")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the digest cache file")
+    args = parser.parse_args(argv)
+    index = RepoFileIndex.build(Path(args.repo_root), cache_path=not args.no_cache)
+    print(
+        json.dumps(
+            {
+                "files": len(index.files),
+                "dirs": len(index.dirs),
+                "bytes": sum(entry.size for entry in index.files),
+                "cache": str(index.cache_path) if index.cache_path else None,
+            },
+            ensure_ascii=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import sys
 from pathlib import Path
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.repo_file_index import IndexedFile, RepoFileIndex
+
 
 PRODUCTIVE_ROOTS = (
     "bin",
@@ -58,8 +62,8 @@ SKIP_DIRS = {
 }
 
 
-def _is_marker_init(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8", errors="replace").strip()
+def _is_marker_init_text(text: str) -> bool:
+    text = text.strip()
     if not text:
         return True
     if text in {"__all__ = []", "__all__=[]"}:
@@ -71,31 +75,19 @@ def _is_marker_init(path: Path) -> bool:
     return False
 
 
-def _iter_files(repo_root: Path) -> list[Path]:
-    files: list[Path] = []
-    for root_name in PRODUCTIVE_ROOTS:
-        root = repo_root / root_name
-        if not root.exists():
-            continue
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if any(part in SKIP_DIRS for part in path.parts):
-                continue
-            files.append(path)
-    return files
+def _iter_files(index: RepoFileIndex) -> list[IndexedFile]:
+    return index.select(roots=PRODUCTIVE_ROOTS, skip_dirs=SKIP_DIRS)
 
 
-def _scan_byte_duplicates(repo_root: Path) -> set[frozenset[str]]:
+def _scan_byte_duplicates(index: RepoFileIndex) -> set[frozenset[str]]:
     buckets: dict[tuple[int, str], list[str]] = {}
-    for path in _iter_files(repo_root):
-        rel = path.relative_to(repo_root).as_posix()
+    for entry in _iter_files(index):
+        rel = entry.rel
         if rel.endswith("/__init__.py"):
             continue
         if rel.endswith("/.gitkeep"):
             continue
-        data = path.read_bytes()
-        key = (len(data), hashlib.sha256(data).hexdigest())
+        key = (entry.size, index.sha256(rel))
         buckets.setdefault(key, []).append(rel)
 
     groups: set[frozenset[str]] = set()
@@ -106,20 +98,18 @@ def _scan_byte_duplicates(repo_root: Path) -> set[frozenset[str]]:
     return groups
 
 
-def _scan_archives(repo_root: Path) -> set[str]:
+def _scan_archives(index: RepoFileIndex) -> set[str]:
     found: set[str] = set()
-    for root_name in ("governance_content", "governance_spec", "governance_runtime"):
-        root = repo_root / root_name
-        if not root.exists():
-            continue
-        for path in root.rglob("*"):
-            if "archived" in path.parts and path.is_file():
-                found.add(path.relative_to(repo_root).as_posix())
+    for entry in index.select(roots=("governance_content", "governance_spec", "governance_runtime")):
+        if "archived" in entry.parts:
+            found.add(entry.rel)
     return found
 
 
-def _scan_archive_references(repo_root: Path) -> list[str]:
+def _scan_archive_references(index: RepoFileIndex) -> list[str]:
     offenders: list[str] = []
+    if not ARCHIVE_REFERENCE_PATTERNS:
+        return offenders
     # Narrow exception policy: only cleanup/inventory records may reference
     # historical archive paths as evidence breadcrumbs.
     allowed_reference_files = {
@@ -127,86 +117,63 @@ def _scan_archive_references(repo_root: Path) -> list[str]:
         "governance_spec/migrations/REPO_CLEANUP_POLICY.md",
         "governance_spec/migrations/CLEANUP_DECISION_LOG.md",
     }
-    for root_name in PRODUCTIVE_ROOTS:
-        root = repo_root / root_name
-        if not root.exists() or not root.is_dir():
+    for entry in index.select(roots=PRODUCTIVE_ROOTS, suffixes={".md", ".py", ".yml", ".yaml", ".json"}):
+        rel = entry.rel
+        if rel in allowed_reference_files:
             continue
-        for path in root.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.suffix.lower() not in {".md", ".py", ".yml", ".yaml", ".json"}:
-                continue
-            rel = path.relative_to(repo_root).as_posix()
-            if rel in allowed_reference_files:
-                continue
-            text = path.read_text(encoding="utf-8", errors="replace")
-            for pattern in ARCHIVE_REFERENCE_PATTERNS:
-                if pattern in text:
-                    offenders.append(f"{rel} -> {pattern}")
+        text = index.read_text(rel, errors="replace")
+        for pattern in ARCHIVE_REFERENCE_PATTERNS:
+            if pattern in text:
+                offenders.append(f"{rel} -> {pattern}")
     return sorted(offenders)
 
 
-def _scan_readme_duplicates(repo_root: Path) -> set[str]:
+def _scan_readme_duplicates(index: RepoFileIndex) -> set[str]:
     found: set[str] = set()
     for rel in README_BASELINE:
-        if (repo_root / rel).exists():
+        if index.contains(rel):
             found.add(rel)
-    for path in repo_root.rglob("README-OPENCODE.md"):
-        if path.is_file():
-            found.add(path.relative_to(repo_root).as_posix())
-    for path in repo_root.rglob("README-RULES.md"):
-        if path.is_file():
-            found.add(path.relative_to(repo_root).as_posix())
+    for entry in index.select(names={"README-OPENCODE.md", "README-RULES.md"}):
+        found.add(entry.rel)
     return found
 
 
-def _scan_marker_inits(repo_root: Path) -> set[str]:
+def _scan_marker_inits(index: RepoFileIndex) -> set[str]:
     found: set[str] = set()
-    for path in repo_root.rglob("__init__.py"):
-        if any(part in SKIP_DIRS for part in path.parts):
-            continue
-        rel = path.relative_to(repo_root).as_posix()
-        if _is_marker_init(path):
-            found.add(rel)
+    for entry in index.select(names={"__init__.py"}, skip_dirs=SKIP_DIRS):
+        if _is_marker_init_text(index.read_text(entry.rel, errors="replace")):
+            found.add(entry.rel)
     return found
 
 
-def _is_pseudo_empty_dir(path: Path) -> bool:
-    if not path.exists() or not path.is_dir():
-        return False
-    files = [entry for entry in path.rglob("*") if entry.is_file()]
+def _is_pseudo_empty_dir(index: RepoFileIndex, rel: str) -> bool:
+    files = index.select(roots=(rel,))
     if not files:
         return True
-    for file_path in files:
-        if file_path.name in MARKER_FILE_NAMES:
+    for entry in files:
+        if entry.name in MARKER_FILE_NAMES:
             continue
         return False
     return True
 
 
-def _scan_pseudo_empty_dirs(repo_root: Path) -> set[str]:
+def _scan_pseudo_empty_dirs(index: RepoFileIndex) -> set[str]:
     found: set[str] = set()
-    opencode_root = repo_root / "opencode"
-    if not opencode_root.exists() or not opencode_root.is_dir():
-        return found
-    for path in opencode_root.rglob("*"):
-        if not path.is_dir():
+    for rel in index.select_dirs(roots=("opencode",)):
+        if rel == "opencode":
             continue
-        rel = path.relative_to(repo_root).as_posix()
-        if _is_pseudo_empty_dir(path):
+        if _is_pseudo_empty_dir(index, rel):
             found.add(rel)
     return found
 
 
-def main(argv: list[str]) -> int:
-    parser = argparse.ArgumentParser(description="Block 9 hygiene regression guard")
-    parser.add_argument("--repo-root", default=".", help="Repository root")
-    args = parser.parse_args(argv)
-    repo_root = Path(args.repo_root).resolve()
-
+def collect_hygiene_issues(repo_root: Path, *, index: RepoFileIndex | None = None) -> list[str]:
+    """Run every hygiene check against ``index`` (built from ``repo_root`` when omitted)."""
+    if index is None:
+        index = RepoFileIndex.build(repo_root)
     issues: list[str] = []
 
-    duplicate_groups = _scan_byte_duplicates(repo_root)
+    duplicate_groups = _scan_byte_duplicates(index)
     unknown_duplicates = sorted(group for group in duplicate_groups if group not in DUPLICATE_BASELINE_GROUPS)
     missing_baseline_duplicates = sorted(group for group in DUPLICATE_BASELINE_GROUPS if group not in duplicate_groups)
     if unknown_duplicates:
@@ -216,7 +183,7 @@ def main(argv: list[str]) -> int:
         for group in missing_baseline_duplicates:
             issues.append("dedup baseline changed (update after consolidation): " + ", ".join(sorted(group)))
 
-    archives = _scan_archives(repo_root)
+    archives = _scan_archives(index)
     unknown_archives = sorted(archives - ARCHIVE_BASELINE)
     missing_archive_baseline = sorted(ARCHIVE_BASELINE - archives)
     if unknown_archives:
@@ -226,11 +193,11 @@ def main(argv: list[str]) -> int:
         for rel in missing_archive_baseline:
             issues.append(f"archive baseline changed (update after eviction): {rel}")
 
-    archive_refs = _scan_archive_references(repo_root)
+    archive_refs = _scan_archive_references(index)
     for offender in archive_refs:
         issues.append(f"archive reference violation: {offender}")
 
-    readme_files = _scan_readme_duplicates(repo_root)
+    readme_files = _scan_readme_duplicates(index)
     unknown_readmes = sorted(readme_files - README_BASELINE)
     missing_readmes = sorted(README_BASELINE - readme_files)
     if unknown_readmes:
@@ -240,7 +207,7 @@ def main(argv: list[str]) -> int:
         for rel in missing_readmes:
             issues.append(f"README baseline changed (update after SSOT consolidation): {rel}")
 
-    marker_inits = _scan_marker_inits(repo_root)
+    marker_inits = _scan_marker_inits(index)
     unknown_marker_inits = sorted(marker_inits - INIT_MARKER_BASELINE)
     missing_marker_inits = sorted(INIT_MARKER_BASELINE - marker_inits)
     if unknown_marker_inits:
@@ -250,7 +217,7 @@ def main(argv: list[str]) -> int:
         for rel in missing_marker_inits:
             issues.append(f"init baseline changed (update after marker cleanup): {rel}")
 
-    pseudo_empty_dirs = _scan_pseudo_empty_dirs(repo_root)
+    pseudo_empty_dirs = _scan_pseudo_empty_dirs(index)
     unknown_pseudo_empty_dirs = sorted(pseudo_empty_dirs - PSEUDO_EMPTY_DIR_BASELINE)
     missing_pseudo_empty_dirs = sorted(PSEUDO_EMPTY_DIR_BASELINE - pseudo_empty_dirs)
     if unknown_pseudo_empty_dirs:
@@ -260,6 +227,17 @@ def main(argv: list[str]) -> int:
         for rel in missing_pseudo_empty_dirs:
             issues.append(f"pseudo-empty baseline changed (update after cleanup): {rel}")
 
+    return issues
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Block 9 hygiene regression guard")
+    parser.add_argument("--repo-root", default=".", help="Repository root")
+    args = parser.parse_args(argv)
+    repo_root = Path(args.repo_root).resolve()
+
+    issues = collect_hygiene_issues(repo_root)
+
     if issues:
         print("❌ Repo hygiene guard failed")
         for item in issues:
@@ -16,12 +16,31 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run governance contract verification")
     parser.add_argument("--repo-root", default=".", help="Repository root path")
     parser.add_argument("--out", default="artifacts/governance_completion_matrix.json", help="Output JSON file")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Carry forward unchanged PASS requirements from the matrix already stored in --out",
+    )
     args = parser.parse_args(argv)
 
     repo_root = Path(args.repo_root).resolve()
+    out_path = Path(args.out)
+    if not out_path.is_absolute():
+        out_path = repo_root / out_path
     from governance_runtime.verification.runner import run_contract_verification
 
-    payload = run_contract_verification(repo_root=repo_root, python_bin=sys.executable)
+    previous_matrix = None
+    if args.incremental and out_path.is_file():
+        try:
+            previous = json.loads(out_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous = None
+        if isinstance(previous, dict) and isinstance(previous.get("matrix"), dict):
+            previous_matrix = previous["matrix"]
+
+    payload = run_contract_verification(
+        repo_root=repo_root, python_bin=sys.executable, previous_matrix=previous_matrix
+    )
     status = str(payload.get("status") or "FAIL").strip().lower()
     is_pass = status in {"ok", "pass"}
     matrix = payload.get("matrix")
@@ -37,11 +56,9 @@ def main(argv: list[str] | None = None) -> int:
         "merge_allowed": is_pass,
         "merge_reason": str(payload.get("merge_reason") or payload.get("message") or "verification failed"),
         "matrix": matrix,
+        "verification_mode": str(payload.get("verification_mode") or "full"),
     }
 
-    out_path = Path(args.out)
-    if not out_path.is_absolute():
-        out_path = repo_root / out_path
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(json.dumps(result, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
 
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""Run governance runtime performance benchmarks against synthetic inputs.
+
+Usage:
+    python scripts/run_perf_benchmarks.py --scale small --output perf-results.json
+    python scripts/run_perf_benchmarks.py --scale medium --baseline perf-baseline.json
+    python scripts/run_perf_benchmarks.py --compare perf-baseline.json perf-results.json
+
+Generated fixtures (deterministic for a given scale):
+- a source repo with business-rule patterns (1k / 10k / 50k files)
+- a SESSION_STATE document padded to the scale's size
+- ``logs/events.jsonl`` with 10^5 - 10^6 events, rolled into log segments
+- ``plan-record.json`` with hundreds of versions
+- a ``governance-records`` tree with hundreds to thousands of archived runs
+
+Benchmarks cover business-rule extraction, kernel ``execute``,
+``read_session_snapshot``, ``build_audit_readout``, ``verify_run_archive`` and
+``build_effective_llm_policy``. A benchmark whose optional dependency is
+missing is reported as ``skipped`` instead of failing the run.
+
+Exit codes:
+- 0: ok (no regression against the baseline, if one was given)
+- 3: regression detected
+- 4: blocked (invalid input)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+RESULT_SCHEMA = "opencode.perf-benchmark.v1"
+COMPARE_SCHEMA = "opencode.perf-benchmark-compare.v1"
+FIXTURE_MARKER = "benchmark-fixture.json"
+
+EXIT_OK = 0
+EXIT_REGRESSION = 3
+EXIT_BLOCKED = 4
+
+FINGERPRINT = "0123456789abcdef01234567"
+SPEC_FILES = ("phase_api.yaml", "topology.yaml", "command_policy.yaml", "guards.yaml", "messages.yaml")
+
+SCALES: dict[str, dict[str, int]] = {
+    "smoke": {"repo_files": 40, "state_entries": 20, "events": 2_000, "plan_versions": 10, "runs": 5},
+    "small": {"repo_files": 1_000, "state_entries": 200, "events": 100_000, "plan_versions": 100, "runs": 200},
+    "medium": {"repo_files": 10_000, "state_entries": 1_000, "events": 300_000, "plan_versions": 300, "runs": 1_000},
+    "large": {"repo_files": 50_000, "state_entries": 5_000, "events": 1_000_000, "plan_versions": 500, "runs": 3_000},
+}
+
+_RULE_TEMPLATES = (
+    "def approve_{i}(order, user):\n"
+    "    if not user.has_permission('orders.approve'):\n"
+    "        raise PermissionError('unauthorized approval denied')\n"
+    "    if order.status == 'cancelled':\n"
+    "        raise ValueError('invalid status transition from cancelled')\n"
+    "    return order\n",
+    "def validate_customer_{i}(payload):\n"
+    "    if not payload.get('email'):\n"
+    "        raise ValueError('email is a required field')\n"
+    "    if payload.get('id') in _EXISTING:\n"
+    "        raise ValueError('duplicate customer already exists')\n"
+    "    return payload\n",
+    "def purge_{i}(record, now):\n"
+    "    # Retention policy must purge records older than the ttl.\n"
+    "    if record.age(now) > RETENTION_TTL:\n"
+    "        audit_log('purge', record.id)\n"
+    "        return archive(record)\n"
+    "    return None\n",
+    "def total_{i}(items):\n"
+    "    return sum(item.price for item in items)\n",
+)
+
+
+# ---------------------------------------------------------------------------
+# Generators
+# ---------------------------------------------------------------------------
+
+def generate_repo(root: Path, files: int) -> Path:
+    """Write ``files`` Python modules, most of them carrying rule-like code."""
+
+    for i in range(files):
+        module = root / "src" / f"pkg_{i // 100:03d}" / f"module_{i:05d}.py"
+        module.parent.mkdir(parents=True, exist_ok=True)
+        body = "".join(_RULE_TEMPLATES[(i + k) % len(_RULE_TEMPLATES)].format(i=f"{i}_{k}") for k in range(3))
+        module.write_text(f'"""Synthetic module {i}."""\n\n_EXISTING = set()\nRETENTION_TTL = 30\n\n\n{body}', encoding="utf-8")
+    return root
+
+
+def _base_state(entries: int) -> dict[str, Any]:
+    return {
+        "RepoFingerprint": FINGERPRINT,
+        "session_run_id": "bench-run",
+        "phase": "4",
+        "Next": "4",
+        "active_gate": "Ticket Input Gate",
+        "status": "OK",
+        "PersistenceCommitted": True,
+        "WorkspaceReadyGateCommitted": True,
+        "WorkspaceArtifactsCommitted": True,
+        "PointerVerified": True,
+        "ActiveProfile": "profile.fallback-minimum",
+        "LoadedRulebooks": {
+            "core": str(REPO_ROOT / "governance_content" / "reference" / "rules.md"),
+            "master": str(REPO_ROOT / "governance_content" / "reference" / "master.md"),
+            "profile": str(REPO_ROOT / "governance_content" / "profiles" / "rules.fallback-minimum.md"),
+            "addons": {"riskTiering": str(REPO_ROOT / "governance_content" / "profiles" / "rules.risk-tiering.md")},
+        },
+        "RulebookLoadEvidence": {
+            "core": str(REPO_ROOT / "governance_content" / "reference" / "rules.md"),
+            "profile": str(REPO_ROOT / "governance_content" / "profiles" / "rules.fallback-minimum.md"),
+        },
+        "AddonsEvidence": {"riskTiering": {"status": "loaded"}},
+        "BenchmarkPadding": [
+            {"id": f"entry-{i:05d}", "note": "synthetic padding " * 4, "values": list(range(i % 10))}
+            for i in range(entries)
+        ],
+    }
+
+
+def generate_session_state(path: Path, entries: int) -> dict[str, Any]:
+    document = {"SESSION_STATE": _base_state(entries)}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+    return document
+
+
+def generate_events(path: Path, count: int, *, chunk: int = 10_000) -> None:
+    """Write ``count`` events, sealing segments exactly like live writers do."""
+
+    from governance_runtime.infrastructure.adapters.logging.log_segments import rotate_if_needed, segment_max_bytes
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    max_bytes = segment_max_bytes()
+    written = 0
+    while written < count:
+        stop = min(written + chunk, count)
+        with path.open("a", encoding="utf-8") as handle:
+            for i in range(written, stop):
+                ts = f"2026-01-{1 + (i // 86_400) % 28:02d}T{(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d}Z"
+                handle.write(
+                    json.dumps(
+                        {
+                            "schema": "opencode.phase-flow.v1",
+                            "event": "PHASE_COMPLETED" if i % 2 else "PHASE_STARTED",
+                            "event_id": f"evt-{i:08d}",
+                            "ts_utc": ts,
+                            "run_id": f"run-{i // 1000:05d}",
+                            "phase": "4",
+                        },
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+        written = stop
+        if max_bytes > 0:
+            rotate_if_needed(path, max_bytes=max_bytes)
+
+
+def generate_plan_record(path: Path, versions: int) -> None:
+    from artifacts.writers.plan_record import new_plan_record_document, render_plan_record, stamp_version
+
+    document = new_plan_record_document(FINGERPRINT)
+    rows = []
+    for number in range(1, versions + 1):
+        rows.append(
+            stamp_version(
+                {
+                    "version": number,
+                    "supersedes": number - 1 if number > 1 else None,
+                    "timestamp": "2026-01-01T00:00:00Z",
+                    "phase": "5",
+                    "session_run_id": "bench-run",
+                    "trigger": "phase5-revision",
+                    "plan_summary": f"Synthetic plan revision {number}",
+                    "plan_body": "step\n" * 50,
+                }
+            )
+        )
+    document["versions"] = rows
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_plan_record(document), encoding="utf-8")
+
+
+def generate_runs(workspaces_home: Path, count: int) -> list[Path]:
+    """Archive ``count`` runs into the governance-records tree."""
+
+    from governance_runtime.infrastructure.work_run_archive import archive_active_run
+
+    roots: list[Path] = []
+    for i in range(count):
+        run_id = f"bench-run-{i:05d}"
+        state = {"session_run_id": run_id, "phase": "6-PostFlight", "active_gate": "Post Flight", "next": "6"}
+        result = archive_active_run(
+            workspaces_home=workspaces_home,
+            repo_fingerprint=FINGERPRINT,
+            run_id=run_id,
+            observed_at=f"2026-{1 + (i // 28) % 12:02d}-{1 + i % 28:02d}T10:00:00Z",
+            session_state_document={"SESSION_STATE": state},
+            state_view=state,
+        )
+        roots.append(result.snapshot_path.parent)
+    return roots
+
+
+def build_fixture(work_dir: Path, params: dict[str, int]) -> dict[str, Any]:
+    """Create (or reuse) the synthetic install, workspace and repo under ``work_dir``."""
+
+    marker = work_dir / FIXTURE_MARKER
+    try:
+        existing = json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        existing = None
+    if isinstance(existing, dict) and existing.get("params") == params:
+        return existing
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+
+    config_root = work_dir / "config"
+    commands_home = config_root / "commands"
+    workspaces_home = config_root / "workspaces"
+    workspace = workspaces_home / FINGERPRINT
+    spec_home = work_dir / "local" / "governance_spec"
+    commands_home.mkdir(parents=True)
+    spec_home.mkdir(parents=True)
+    for name in SPEC_FILES:
+        shutil.copyfile(REPO_ROOT / "governance_spec" / name, spec_home / name)
+    (config_root / "governance.paths.json").write_text(
+        json.dumps(
+            {
+                "schema": "opencode-governance.paths.v1",
+                "paths": {
+                    "commandsHome": str(commands_home),
+                    "workspacesHome": str(workspaces_home),
+                    "configRoot": str(config_root),
+                    "specHome": str(spec_home),
+                    "pythonCommand": sys.executable,
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    session_path = workspace / "SESSION_STATE.json"
+    generate_session_state(session_path, params["state_entries"])
+    (config_root / "SESSION_STATE.json").write_text(
+        json.dumps({"schema": "opencode-session-pointer.v1", "activeSessionStateFile": str(session_path)}),
+        encoding="utf-8",
+    )
+    generate_events(workspace / "logs" / "events.jsonl", params["events"])
+    generate_plan_record(workspace / "plan-record.json", params["plan_versions"])
+    run_roots = generate_runs(workspaces_home, params["runs"])
+    repo_root = generate_repo(work_dir / "repo", params["repo_files"])
+
+    fixture = {
+        "params": params,
+        "config_root": str(config_root),
+        "commands_home": str(commands_home),
+        "workspaces_home": str(workspaces_home),
+        "session_path": str(session_path),
+        "repo_root": str(repo_root),
+        "run_roots": [str(root) for root in run_roots],
+    }
+    marker.write_text(json.dumps(fixture, indent=2) + "\n", encoding="utf-8")
+    return fixture
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class BenchmarkSkipped(Exception):
+    pass
+
+
+def _bench_business_rules(fixture: dict[str, Any]) -> Callable[[], object]:
+    from governance_runtime.engine.business_rules_code_extraction import (
+        extract_code_rule_candidates_with_diagnostics,
+    )
+
+    repo_root = Path(fixture["repo_root"])
+    return lambda: extract_code_rule_candidates_with_diagnostics(repo_root)
+
+
+def _bench_kernel_execute(fixture: dict[str, Any]) -> Callable[[], object]:
+    from governance_runtime.kernel.phase_kernel import RuntimeContext, execute
+
+    document = json.loads(Path(fixture["session_path"]).read_text(encoding="utf-8"))
+    ctx = RuntimeContext(
+        requested_active_gate="Ticket Input Gate",
+        requested_next_gate_condition="Continue",
+        repo_is_git_root=True,
+        live_repo_fingerprint=FINGERPRINT,
+        commands_home=Path(fixture["commands_home"]),
+        workspaces_home=Path(fixture["workspaces_home"]),
+        config_root=Path(fixture["config_root"]),
+    )
+    return lambda: execute(current_token="4", session_state_doc=document, runtime_ctx=ctx, readonly=True)
+
+
+def _bench_read_session_snapshot(fixture: dict[str, Any]) -> Callable[[], object]:
+    from governance_runtime.entrypoints.session_reader import read_session_snapshot
+
+    commands_home = Path(fixture["commands_home"])
+    return lambda: read_session_snapshot(commands_home=commands_home)
+
+
+def _bench_audit_readout(fixture: dict[str, Any]) -> Callable[[], object]:
+    from governance_runtime.application.use_cases.audit_readout_builder import build_audit_readout
+
+    commands_home = Path(fixture["commands_home"])
+    return lambda: build_audit_readout(commands_home=commands_home, tail_count=25)
+
+
+def _bench_verify_run_archive(fixture: dict[str, Any]) -> Callable[[], object]:
+    from governance_runtime.infrastructure.io_verify import verify_run_archive
+
+    roots = [Path(root) for root in fixture["run_roots"]]
+
+    def _verify_all() -> int:
+        failures = sum(1 for root in roots if not verify_run_archive(root)[0])
+        if failures:
+            raise RuntimeError(f"{failures} synthetic run archives failed verification")
+        return len(roots)
+
+    return _verify_all
+
+
+def _bench_effective_llm_policy(fixture: dict[str, Any]) -> Callable[[], object]:
+    try:
+        from governance_runtime.application.use_cases.build_effective_llm_policy import (
+            EffectivePolicyInput,
+            build_effective_llm_policy,
+        )
+    except ImportError as exc:
+        raise BenchmarkSkipped(f"dependency unavailable: {exc}") from exc
+
+    state = json.loads(Path(fixture["session_path"]).read_text(encoding="utf-8"))["SESSION_STATE"]
+    policy_input = EffectivePolicyInput(
+        active_profile=state["ActiveProfile"],
+        loaded_rulebooks=state["LoadedRulebooks"],
+        addons_evidence=state["AddonsEvidence"],
+        commands_home=Path(fixture["commands_home"]),
+        schema_path=REPO_ROOT / "governance_runtime" / "assets" / "schemas" / "effective_llm_policy.v1.schema.json",
+        compiled_at="2026-01-01T00:00:00Z",
+    )
+    return lambda: build_effective_llm_policy(policy_input)
+
+
+BENCHMARKS: dict[str, Callable[[dict[str, Any]], Callable[[], object]]] = {
+    "business_rules_extraction": _bench_business_rules,
+    "kernel_execute": _bench_kernel_execute,
+    "read_session_snapshot": _bench_read_session_snapshot,
+    "build_audit_readout": _bench_audit_readout,
+    "verify_run_archive": _bench_verify_run_archive,
+    "build_effective_llm_policy": _bench_effective_llm_policy,
+}
+
+
+@contextlib.contextmanager
+def _bound_environment(fixture: dict[str, Any]) -> Iterator[None]:
+    overrides = {
+        "OPENCODE_CONFIG_ROOT": fixture["config_root"],
+        "COMMANDS_HOME": fixture["commands_home"],
+        "OPENCODE_PROFILE": "",
+    }
+    from governance_runtime.kernel.spec_registry import SpecRegistry
+
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    SpecRegistry.reset()
+    try:
+        yield
+    finally:
+        SpecRegistry.reset()
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def run_benchmark(name: str, fixture: dict[str, Any], *, repeat: int) -> dict[str, Any]:
+    from governance_runtime.shared import perf_trace
+
+    try:
+        call = BENCHMARKS[name](fixture)
+    except BenchmarkSkipped as exc:
+        return {"status": "skipped", "detail": str(exc)}
+    timings: list[float] = []
+    counters: dict[str, object] = {}
+    try:
+        call()  # warm-up: imports, module caches
+        for index in range(repeat):
+            recorder = perf_trace.activate(name) if index == 0 else None
+            started = time.perf_counter()
+            try:
+                call()
+            finally:
+                if recorder is not None:
+                    perf_trace.deactivate()
+                    counters = dict(recorder.to_record()["counters"])  # type: ignore[arg-type]
+            timings.append((time.perf_counter() - started) * 1000.0)
+    except Exception as exc:
+        return {"status": "error", "detail": f"{type(exc).__name__}: {exc}"}
+    return {
+        "status": "ok",
+        "runs": len(timings),
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "counters": {key: value for key, value in counters.items() if value},
+    }
+
+
+def run_suite(
+    *,
+    scale: str,
+    work_dir: Path,
+    repeat: int = 3,
+    only: list[str] | None = None,
+) -> dict[str, Any]:
+    params = dict(SCALES[scale])
+    started = time.perf_counter()
+    fixture = build_fixture(work_dir, params)
+    generation_ms = round((time.perf_counter() - started) * 1000.0, 3)
+    names = [name for name in BENCHMARKS if not only or name in only]
+    results: dict[str, Any] = {}
+    with _bound_environment(fixture):
+        for name in names:
+            results[name] = run_benchmark(name, fixture, repeat=repeat)
+    return {
+        "schema": RESULT_SCHEMA,
+        "scale": scale,
+        "params": params,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixture_generation_ms": generation_ms,
+        "benchmarks": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = 0.25,
+    min_delta_ms: float = 5.0,
+) -> dict[str, Any]:
+    """Flag benchmarks whose median grew by more than ``threshold`` (and ``min_delta_ms``)."""
+
+    rows: dict[str, Any] = {}
+    regressions: list[str] = []
+    base_rows = baseline.get("benchmarks") if isinstance(baseline.get("benchmarks"), dict) else {}
+    for name, row in sorted((current.get("benchmarks") or {}).items()):
+        base = base_rows.get(name) if isinstance(base_rows, dict) else None
+        if not isinstance(base, dict) or base.get("status") != "ok" or row.get("status") != "ok":
+            rows[name] = {"status": "not_comparable"}
+            continue
+        before = float(base["median_ms"])
+        after = float(row["median_ms"])
+        ratio = after / before if before > 0 else 1.0
+        regressed = ratio > 1.0 + threshold and after - before > min_delta_ms
+        rows[name] = {
+            "status": "regression" if regressed else "ok",
+            "baseline_median_ms": before,
+            "current_median_ms": after,
+            "ratio": round(ratio, 3),
+        }
+        if regressed:
+            regressions.append(name)
+    return {
+        "schema": COMPARE_SCHEMA,
+        "threshold": threshold,
+        "min_delta_ms": min_delta_ms,
+        "scale_mismatch": baseline.get("scale") != current.get("scale"),
+        "regressions": regressions,
+        "benchmarks": rows,
+    }
+
+
+def _load_result(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("schema") != RESULT_SCHEMA:
+        raise ValueError(f"{path} is not a {RESULT_SCHEMA} result")
+    return payload
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run governance performance benchmarks on synthetic inputs")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Run only this benchmark (repeatable)")
+    parser.add_argument("--work-dir", type=Path, help="Fixture directory; reused across runs with the same scale")
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Compare the new results against this stored result")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASELINE", "CURRENT"), help="Compare two stored results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed median slowdown ratio (default 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        print("error: --repeat must be >= 1", file=sys.stderr)
+        return EXIT_BLOCKED
+
+    try:
+        if args.compare:
+            baseline, current = (_load_result(path) for path in args.compare)
+        else:
+            baseline = _load_result(args.baseline) if args.baseline else None
+            if args.work_dir is not None:
+                current = run_suite(scale=args.scale, work_dir=args.work_dir, repeat=args.repeat, only=args.only)
+            else:
+                with tempfile.TemporaryDirectory(prefix="governance-bench-") as tmp:
+                    current = run_suite(scale=args.scale, work_dir=Path(tmp), repeat=args.repeat, only=args.only)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return EXIT_BLOCKED
+
+    report: dict[str, Any] = current
+    exit_code = EXIT_OK
+    if baseline is not None:
+        comparison = compare_results(baseline, current, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+        report = comparison if args.compare else {**current, "comparison": comparison}
+        if comparison["regressions"]:
+            exit_code = EXIT_REGRESSION
+
+    text = json.dumps(report, indent=2, ensure_ascii=True) + "\n"
+    if args.output is not None and not args.compare:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
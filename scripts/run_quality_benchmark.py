@@ -1,6 +1,12 @@
-"""Run one governance quality benchmark pack deterministically.
+"""Run governance quality benchmark packs deterministically.
 
-Exit codes:
+Single mode scores one pack against one claim set. Matrix mode (`--matrix`)
+scores every `*_QUALITY_BENCHMARK_PACK.json` under `--pack-dir` (or the
+`--profile` subset) against every `--evidence-dir` in parallel and writes a
+consolidated matrix, optionally with deltas against a `--previous` matrix.
+Evidence claims are derived once per evidence content hash.
+
+Exit codes (matrix mode: the worst cell, or fail on any regression):
 - 0: pass
 - 2: not_verified (missing/stale required evidence)
 - 3: fail (scored below pass threshold)
@@ -10,9 +16,12 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import hashlib
 import json
 from pathlib import Path
 import sys
+import threading
 from typing import Any
 
 
@@ -21,6 +30,17 @@ EXIT_NOT_VERIFIED = 2
 EXIT_FAIL = 3
 EXIT_BLOCKED = 4
 
+RESULT_SCHEMA = "governance-quality-benchmark-result.v1"
+MATRIX_SCHEMA = "governance-quality-benchmark-matrix.v1"
+PACK_GLOB = "*_QUALITY_BENCHMARK_PACK.json"
+DEFAULT_PACK_DIR = Path(__file__).absolute().parents[1] / "governance_runtime" / "assets" / "catalogs"
+
+EVIDENCE_FILES = ("pytest.exitcode", "governance_lint.exitcode", "drift.txt")
+# Optional per-evidence-dir criterion scores ({"CRITERION_ID": 0.9}); override --criterion-score.
+EVIDENCE_SCORES_FILE = "criterion_scores.json"
+
+_STATUS_EXIT = {"PASS": EXIT_PASS, "NOT_VERIFIED": EXIT_NOT_VERIFIED, "FAIL": EXIT_FAIL, "BLOCKED": EXIT_BLOCKED}
+
 
 def _load_json(path: Path) -> dict[str, Any]:
     payload = json.loads(path.read_text(encoding="utf-8"))
@@ -57,22 +77,67 @@ def _parse_criterion_scores(values: list[str]) -> dict[str, float]:
     return scores
 
 
-def _derive_observed_claims_from_evidence_dir(evidence_dir: Path) -> set[str]:
-    required = ("pytest.exitcode", "governance_lint.exitcode", "drift.txt")
-    missing = [name for name in required if not (evidence_dir / name).exists()]
-    if missing:
-        raise ValueError(f"evidence dir missing required files: {', '.join(missing)}")
-
+def _claims_from_evidence_texts(texts: dict[str, str]) -> set[str]:
     observed: set[str] = set()
-    if (evidence_dir / "pytest.exitcode").read_text(encoding="utf-8").strip() == "0":
+    if texts["pytest.exitcode"].strip() == "0":
         observed.add("claim/tests-green")
-    if (evidence_dir / "governance_lint.exitcode").read_text(encoding="utf-8").strip() == "0":
+    if texts["governance_lint.exitcode"].strip() == "0":
         observed.add("claim/static-clean")
-    if not (evidence_dir / "drift.txt").read_text(encoding="utf-8").strip():
+    if not texts["drift.txt"].strip():
         observed.add("claim/no-drift")
     return observed
 
 
+def _read_evidence_texts(evidence_dir: Path) -> dict[str, str]:
+    missing = [name for name in EVIDENCE_FILES if not (evidence_dir / name).exists()]
+    if missing:
+        raise ValueError(f"evidence dir missing required files: {', '.join(missing)}")
+    return {name: (evidence_dir / name).read_text(encoding="utf-8") for name in EVIDENCE_FILES}
+
+
+def _derive_observed_claims_from_evidence_dir(evidence_dir: Path) -> set[str]:
+    return _claims_from_evidence_texts(_read_evidence_texts(evidence_dir))
+
+
+class EvidenceClaimCache:
+    """Observed claims and criterion scores per evidence content hash.
+
+    Each evidence directory is read once per run; directories with identical
+    evidence content share one derived entry.
+    """
+
+    def __init__(self) -> None:
+        self._by_hash: dict[str, tuple[frozenset[str], dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self.derivations = 0
+
+    def load(self, evidence_dir: Path) -> tuple[str, frozenset[str], dict[str, float]]:
+        """Return `(content_hash, observed_claims, criterion_scores)` for one directory."""
+
+        texts = _read_evidence_texts(evidence_dir)
+        scores_path = evidence_dir / EVIDENCE_SCORES_FILE
+        scores_text = scores_path.read_text(encoding="utf-8") if scores_path.is_file() else ""
+        digest = hashlib.sha256()
+        for name in (*EVIDENCE_FILES, EVIDENCE_SCORES_FILE):
+            content = texts.get(name, scores_text if name == EVIDENCE_SCORES_FILE else "")
+            digest.update(f"{name}\0{len(content)}\0{content}".encode("utf-8"))
+        content_hash = digest.hexdigest()
+        with self._lock:
+            cached = self._by_hash.get(content_hash)
+        if cached is None:
+            scores: dict[str, float] = {}
+            if scores_text:
+                payload = json.loads(scores_text)
+                if not isinstance(payload, dict):
+                    raise ValueError(f"{scores_path} must contain a JSON object")
+                scores = _parse_criterion_scores([f"{key}={value}" for key, value in payload.items()])
+            cached = (frozenset(_claims_from_evidence_texts(texts)), scores)
+            with self._lock:
+                self._by_hash.setdefault(content_hash, cached)
+                self.derivations += 1
+        return content_hash, cached[0], cached[1]
+
+
 def run_benchmark(
     *,
     pack: dict[str, Any],
@@ -151,7 +216,7 @@ def run_benchmark(
 
     confidence = "HIGH" if ratio >= high_conf_ratio else ("MEDIUM" if ratio >= pass_ratio else "LOW")
     result = {
-        "schema": "governance-quality-benchmark-result.v1",
+        "schema": RESULT_SCHEMA,
         "pack_profile": str(pack.get("profile", "unknown")),
         "status": status,
         "confidence": confidence,
@@ -169,9 +234,169 @@ def run_benchmark(
     return exit_code, result
 
 
+def discover_benchmark_packs(pack_dir: Path, profiles: set[str] | None = None) -> list[tuple[Path, dict[str, Any]]]:
+    """Load benchmark packs under `pack_dir`, optionally restricted to profile names."""
+
+    packs: list[tuple[Path, dict[str, Any]]] = []
+    for path in sorted(pack_dir.glob(PACK_GLOB)):
+        pack = _load_json(path)
+        if profiles and str(pack.get("profile", "")) not in profiles:
+            continue
+        packs.append((path, pack))
+    if profiles:
+        unknown = sorted(profiles - {str(pack.get("profile", "")) for _, pack in packs})
+        if unknown:
+            raise ValueError(f"unknown benchmark profile(s): {', '.join(unknown)}")
+    if not packs:
+        raise ValueError(f"no benchmark packs found under {pack_dir}")
+    return packs
+
+
+def _cell_key(cell: dict[str, Any]) -> tuple[str, str]:
+    return str(cell.get("pack_profile", "")), str(cell.get("evidence_dir", ""))
+
+
+def compute_matrix_deltas(previous: dict[str, Any], cells: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Compare cells with a previous matrix; regressions are worse status or lower score."""
+
+    before = {_cell_key(cell): cell for cell in previous.get("cells", []) if isinstance(cell, dict)}
+    deltas: list[dict[str, Any]] = []
+    for cell in cells:
+        old = before.pop(_cell_key(cell), None)
+        if old is None:
+            deltas.append({"pack_profile": cell["pack_profile"], "evidence_dir": cell["evidence_dir"], "change": "new"})
+            continue
+        old_exit = _STATUS_EXIT.get(str(old.get("status")), EXIT_BLOCKED)
+        new_exit = _STATUS_EXIT.get(str(cell["status"]), EXIT_BLOCKED)
+        old_ratio = float(old.get("score_ratio") or 0.0)
+        score_delta = round(float(cell.get("score_ratio") or 0.0) - old_ratio, 6)
+        if old.get("status") == cell["status"] and score_delta == 0:
+            continue
+        deltas.append(
+            {
+                "pack_profile": cell["pack_profile"],
+                "evidence_dir": cell["evidence_dir"],
+                "change": "changed",
+                "previous_status": old.get("status"),
+                "status": cell["status"],
+                "score_delta": score_delta,
+                "regression": new_exit > old_exit or (new_exit == old_exit and score_delta < 0),
+            }
+        )
+    for profile, evidence_dir in sorted(before):
+        deltas.append({"pack_profile": profile, "evidence_dir": evidence_dir, "change": "removed"})
+    return deltas
+
+
+def run_benchmark_matrix(
+    *,
+    packs: list[tuple[Path, dict[str, Any]]],
+    evidence_dirs: list[Path],
+    stale_claim_ids: set[str],
+    criterion_scores: dict[str, float],
+    previous: dict[str, Any] | None = None,
+    jobs: int = 4,
+    cache: EvidenceClaimCache | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Score every pack against every evidence directory."""
+
+    claim_cache = cache if cache is not None else EvidenceClaimCache()
+    workers = max(1, jobs)
+
+    def load_evidence(evidence_dir: Path) -> dict[str, Any]:
+        try:
+            content_hash, claims, scores = claim_cache.load(evidence_dir)
+        except (OSError, ValueError, json.JSONDecodeError) as exc:
+            return {"evidence_dir": str(evidence_dir), "error": str(exc)}
+        return {"evidence_dir": str(evidence_dir), "content_hash": content_hash, "claims": claims, "scores": scores}
+
+    def score(pack_path: Path, pack: dict[str, Any], evidence: dict[str, Any]) -> dict[str, Any]:
+        cell: dict[str, Any] = {
+            "pack_profile": str(pack.get("profile", pack_path.stem)),
+            "pack_path": str(pack_path),
+            "evidence_dir": evidence["evidence_dir"],
+        }
+        if "error" in evidence:
+            return {**cell, "status": "BLOCKED", "message": evidence["error"]}
+        try:
+            _, result = run_benchmark(
+                pack=pack,
+                observed_claim_ids=set(evidence["claims"]),
+                stale_claim_ids=stale_claim_ids,
+                criterion_scores={**criterion_scores, **evidence["scores"]},
+            )
+        except ValueError as exc:
+            return {**cell, "status": "BLOCKED", "message": str(exc)}
+        return {
+            **cell,
+            "status": result["status"],
+            "confidence": result["confidence"],
+            "score_ratio": result["score_ratio"],
+            "missing_required_claim_ids": result["missing_required_claim_ids"],
+            "stale_required_claim_ids": result["stale_required_claim_ids"],
+        }
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        evidence = list(pool.map(load_evidence, evidence_dirs))
+        cells = list(
+            pool.map(
+                lambda job: score(*job),
+                [(path, pack, item) for path, pack in packs for item in evidence],
+            )
+        )
+
+    counts: dict[str, int] = {}
+    for cell in cells:
+        counts[cell["status"]] = counts.get(cell["status"], 0) + 1
+    report: dict[str, Any] = {
+        "schema": MATRIX_SCHEMA,
+        "packs": [str(pack.get("profile", path.stem)) for path, pack in packs],
+        "evidence": [
+            {
+                "evidence_dir": item["evidence_dir"],
+                "content_hash": item.get("content_hash", ""),
+                "observed_claim_ids": sorted(item.get("claims", ())),
+                **({"error": item["error"]} if "error" in item else {}),
+            }
+            for item in evidence
+        ],
+        "cells": cells,
+        "summary": dict(sorted(counts.items())),
+    }
+    exit_code = max((_STATUS_EXIT[cell["status"]] for cell in cells), default=EXIT_PASS)
+    if previous is not None:
+        deltas = compute_matrix_deltas(previous, cells)
+        report["deltas"] = deltas
+        report["regressions"] = sum(1 for delta in deltas if delta.get("regression"))
+        if report["regressions"] and exit_code < EXIT_FAIL:
+            exit_code = EXIT_FAIL
+    return exit_code, report
+
+
+def _main_matrix(args: argparse.Namespace) -> tuple[int, dict[str, Any]]:
+    if not args.evidence_dir:
+        raise ValueError("--matrix requires at least one --evidence-dir")
+    if args.observed_claim:
+        raise ValueError("--matrix derives claims from --evidence-dir; --observed-claim is not allowed")
+    packs = (
+        [(Path(args.pack), _load_json(Path(args.pack)))]
+        if args.pack
+        else discover_benchmark_packs(Path(args.pack_dir), set(args.profile) or None)
+    )
+    previous = _load_json(Path(args.previous)) if args.previous else None
+    return run_benchmark_matrix(
+        packs=packs,
+        evidence_dirs=[Path(value) for value in args.evidence_dir],
+        stale_claim_ids=_parse_claim_list(args.stale_claim),
+        criterion_scores=_parse_criterion_scores(args.criterion_score),
+        previous=previous,
+        jobs=args.jobs,
+    )
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run deterministic governance quality benchmark pack.")
-    parser.add_argument("--pack", required=True, help="Path to benchmark pack JSON.")
+    parser.add_argument("--pack", default="", help="Path to benchmark pack JSON (required unless --matrix).")
     parser.add_argument(
         "--observed-claim",
         action="append",
@@ -192,9 +417,16 @@ def main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument(
         "--evidence-dir",
-        default="",
-        help="Optional evidence directory with pytest.exitcode/governance_lint.exitcode/drift.txt.",
+        action="append",
+        default=[],
+        help="Evidence directory with pytest.exitcode/governance_lint.exitcode/drift.txt "
+        "(once in single mode, repeatable with --matrix).",
     )
+    parser.add_argument("--matrix", action="store_true", help="Score many packs against many evidence dirs.")
+    parser.add_argument("--pack-dir", default=str(DEFAULT_PACK_DIR), help="Directory of benchmark packs for --matrix.")
+    parser.add_argument("--profile", action="append", default=[], help="Restrict --matrix to a pack profile (repeatable).")
+    parser.add_argument("--previous", default="", help="Previous matrix JSON to report deltas against (--matrix).")
+    parser.add_argument("--jobs", type=int, default=4, help="Parallel workers for --matrix (default: 4).")
     parser.add_argument(
         "--review-mode",
         action="store_true",
@@ -208,9 +440,35 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
 
+    if args.matrix:
+        try:
+            code, result = _main_matrix(args)
+        except (OSError, ValueError, json.JSONDecodeError) as exc:
+            print(json.dumps({"schema": MATRIX_SCHEMA, "status": "BLOCKED", "message": str(exc)}, ensure_ascii=True))
+            return EXIT_BLOCKED
+    else:
+        code, result = _main_single(args)
+        if code == EXIT_BLOCKED and result.get("status") == "BLOCKED":
+            print(json.dumps(result, ensure_ascii=True))
+            return code
+
+    encoded = json.dumps(result, ensure_ascii=True)
+    print(encoded)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(encoded + "\n", encoding="utf-8")
+    return code
+
+
+def _main_single(args: argparse.Namespace) -> tuple[int, dict[str, Any]]:
     try:
+        if not args.pack:
+            raise ValueError("--pack is required unless --matrix is given")
+        if len(args.evidence_dir) > 1:
+            raise ValueError("multiple --evidence-dir values require --matrix")
         pack = _load_json(Path(args.pack))
-        evidence_dir = Path(args.evidence_dir) if args.evidence_dir else None
+        evidence_dir = Path(args.evidence_dir[0]) if args.evidence_dir else None
         if args.review_mode and evidence_dir is None:
             raise ValueError("--review-mode requires --evidence-dir")
         if evidence_dir is not None and args.observed_claim:
@@ -231,25 +489,8 @@ def main(argv: list[str] | None = None) -> int:
             criterion_scores=criterion_scores,
         )
     except (OSError, ValueError, json.JSONDecodeError) as exc:
-        print(
-            json.dumps(
-                {
-                    "schema": "governance-quality-benchmark-result.v1",
-                    "status": "BLOCKED",
-                    "message": str(exc),
-                },
-                ensure_ascii=True,
-            )
-        )
-        return EXIT_BLOCKED
-
-    encoded = json.dumps(result, ensure_ascii=True)
-    print(encoded)
-    if args.output:
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(encoded + "\n", encoding="utf-8")
-    return code
+        return EXIT_BLOCKED, {"schema": RESULT_SCHEMA, "status": "BLOCKED", "message": str(exc)}
+    return code, result
 
 
 if __name__ == "__main__":
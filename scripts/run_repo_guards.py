@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Run the repository guards against one shared file index.
+
+Builds a single ``RepoFileIndex`` (one directory walk, file content read at
+most once, digests reused from the index cache) and runs the selected guards
+against it in one process, optionally on a thread pool.
+
+Guards:
+    hygiene         scripts/repo_hygiene_guard.py
+    legacy-surface  scripts/legacy_surface_guard.py
+    ssot            scripts/ssot_guard.py
+    md-lint         scripts/lint_md_python.py (warnings do not fail)
+
+Usage:
+    python scripts/run_repo_guards.py
+    python scripts/run_repo_guards.py --jobs 4 --only hygiene --only ssot
+
+Exit codes: 0 = all selected guards passed, 1 = at least one guard failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.legacy_surface_guard import DEFAULT_ALLOWED_PREFIXES, scan_legacy_surface
+from scripts.lint_md_python import collect_md_lint
+from scripts.repo_file_index import RepoFileIndex
+from scripts.repo_hygiene_guard import collect_hygiene_issues
+from scripts.ssot_guard import collect_ssot_issues
+
+REPO_ROOT = Path(__file__).absolute().parents[1]
+
+
+@dataclass(frozen=True)
+class GuardResult:
+    name: str
+    issues: tuple[str, ...]
+    warnings: int
+    seconds: float
+
+    @property
+    def passed(self) -> bool:
+        return not self.issues
+
+
+def _md_lint(repo_root: Path, index: RepoFileIndex) -> tuple[list[str], int]:
+    errors, warnings = collect_md_lint(index)
+    issues = [
+        f"{path.relative_to(repo_root).as_posix()}:L{line_no}: {description}"
+        for path, file_errors in errors
+        for line_no, description, _ in file_errors
+    ]
+    return issues, sum(len(file_warnings) for _, file_warnings in warnings)
+
+
+GUARDS: dict[str, Callable[[Path, RepoFileIndex], tuple[list[str], int]]] = {
+    "hygiene": lambda root, index: (collect_hygiene_issues(root, index=index), 0),
+    "legacy-surface": lambda root, index: (
+        scan_legacy_surface(root, allowed_prefixes=tuple(DEFAULT_ALLOWED_PREFIXES), index=index),
+        0,
+    ),
+    "ssot": lambda root, index: (collect_ssot_issues(index), 0),
+    "md-lint": _md_lint,
+}
+
+
+def run_guards(
+    names: list[str],
+    *,
+    repo_root: Path = REPO_ROOT,
+    index: RepoFileIndex | None = None,
+    jobs: int = 1,
+) -> list[GuardResult]:
+    """Run ``names`` against one index; results keep the order of ``names``."""
+    if index is None:
+        index = RepoFileIndex.build(repo_root)
+
+    def run(name: str) -> GuardResult:
+        started = time.perf_counter()
+        issues, warnings = GUARDS[name](repo_root, index)
+        return GuardResult(name=name, issues=tuple(issues), warnings=warnings, seconds=time.perf_counter() - started)
+
+    if jobs > 1 and len(names) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(run, names))
+    return [run(name) for name in names]
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run repository guards against one shared file index.")
+    parser.add_argument("--only", action="append", choices=sorted(GUARDS), default=[], help="Run only this guard (repeatable)")
+    parser.add_argument("--jobs", type=int, default=1, help="Run guards on this many threads (default: 1)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the index digest cache")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = RepoFileIndex.build(REPO_ROOT, cache_path=not args.no_cache)
+    walk_seconds = time.perf_counter() - started
+    results = run_guards(args.only or list(GUARDS), index=index, jobs=args.jobs)
+    index.save()
+
+    print(f"Indexed {len(index.files)} files in {walk_seconds:.2f}s ({index.hashed} hashed)")
+    for result in results:
+        suffix = f", {result.warnings} warning(s)" if result.warnings else ""
+        if result.passed:
+            print(f"✅ {result.name} passed ({result.seconds:.2f}s{suffix})")
+            continue
+        print(f"❌ {result.name} failed ({result.seconds:.2f}s{suffix})")
+        for item in result.issues:
+            print(f" - {item}")
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
-import hashlib
 import sys
 from pathlib import Path
 
+if __package__ in {None, ""}:
+    sys.path.insert(0, str(Path(__file__).absolute().parents[1]))
+
+from scripts.repo_file_index import RepoFileIndex
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -145,27 +149,19 @@ def _is_allowed_archive(rel_posix: str) -> bool:
     return any(rel_posix.startswith(prefix) for prefix in ALLOWED_ARCHIVE_PREFIXES)
 
 
-def _iter_normative_files() -> list[Path]:
-    files: list[Path] = []
-    for root_name in NORMATIVE_SCAN_ROOTS:
-        root = REPO_ROOT / root_name
-        if not root.exists():
-            continue
-        for path in root.rglob("*"):
-            if path.is_file() and path.suffix.lower() in NORMATIVE_EXTENSIONS:
-                files.append(path)
+def _iter_normative_files(index: RepoFileIndex) -> list[str]:
+    files = [entry.rel for entry in index.select(roots=NORMATIVE_SCAN_ROOTS, suffixes=NORMATIVE_EXTENSIONS)]
     for name in ("README.md", "QUICKSTART.md"):
-        path = REPO_ROOT / name
-        if path.exists():
-            files.append(path)
+        if index.contains(name):
+            files.append(name)
     return files
 
 
-def _validate_canonical_uniqueness(issues: list[str]) -> None:
-    files = _iter_normative_files()
-    by_name: dict[str, list[Path]] = {}
-    for path in files:
-        by_name.setdefault(path.name, []).append(path)
+def _validate_canonical_uniqueness(issues: list[str], index: RepoFileIndex | None = None) -> None:
+    files = _iter_normative_files(index or RepoFileIndex.build(REPO_ROOT))
+    by_name: dict[str, list[str]] = {}
+    for rel_posix in files:
+        by_name.setdefault(rel_posix.rsplit("/", 1)[-1], []).append(rel_posix)
 
     for name, canonical_rel in CANONICAL_DOCS.items():
         canonical_path = REPO_ROOT / canonical_rel
@@ -173,8 +169,7 @@ def _validate_canonical_uniqueness(issues: list[str]) -> None:
         if not canonical_path.exists():
             issues.append(f"canonical missing: {canonical_rel}")
             continue
-        for path in matches:
-            rel_posix = path.relative_to(REPO_ROOT).as_posix()
+        for rel_posix in matches:
             if rel_posix == canonical_rel:
                 continue
             if _is_allowed_archive(rel_posix):
@@ -184,16 +179,13 @@ def _validate_canonical_uniqueness(issues: list[str]) -> None:
             )
 
 
-def _validate_byte_identical_duplicates(issues: list[str]) -> None:
-    files = _iter_normative_files()
+def _validate_byte_identical_duplicates(issues: list[str], index: RepoFileIndex | None = None) -> None:
+    index = index or RepoFileIndex.build(REPO_ROOT)
     digest_map: dict[str, list[str]] = {}
-    for path in files:
-        rel_posix = path.relative_to(REPO_ROOT).as_posix()
+    for rel_posix in _iter_normative_files(index):
         if _is_allowed_archive(rel_posix):
             continue
-        data = path.read_bytes()
-        digest = hashlib.sha256(data).hexdigest()
-        digest_map.setdefault(digest, []).append(rel_posix)
+        digest_map.setdefault(index.sha256(rel_posix), []).append(rel_posix)
 
     for paths in digest_map.values():
         if len(paths) <= 1:
@@ -202,23 +194,35 @@ def _validate_byte_identical_duplicates(issues: list[str]) -> None:
         issues.append("byte-identical normative duplicates: " + ", ".join(sorted_paths))
 
 
-def main() -> int:
+def collect_ssot_issues(index: RepoFileIndex | None = None) -> list[str]:
+    """Run every SSOT check; duplicate scans use ``index`` (built from ``REPO_ROOT`` when omitted)."""
     issues: list[str] = []
     payload = _load_catalog()
     guards = payload.get("guards")
     if not isinstance(guards, list) or not guards:
-        return _fail("SSOT guard catalog guards must be a non-empty array")
+        return ["SSOT guard catalog guards must be a non-empty array"]
 
+    index = index or RepoFileIndex.build(REPO_ROOT)
     _validate_guard_sources(issues, guards)
     _validate_guard_references(issues, guards)
     _validate_field_ownership_exists(issues)
-    _validate_canonical_uniqueness(issues)
-    _validate_byte_identical_duplicates(issues)
+    _validate_canonical_uniqueness(issues, index)
+    _validate_byte_identical_duplicates(issues, index)
 
     matrix_rows = _load_kernel_matrix()
     if not matrix_rows:
         issues.append("kernel_vs_docs_matrix.csv empty")
     _validate_matrix_alignment(issues, guards, matrix_rows)
+    return issues
+
+
+def main() -> int:
+    payload = _load_catalog()
+    guards = payload.get("guards")
+    if not isinstance(guards, list) or not guards:
+        return _fail("SSOT guard catalog guards must be a non-empty array")
+
+    issues = collect_ssot_issues()
 
     if issues:
         for issue in issues:
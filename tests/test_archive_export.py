@@ -30,7 +30,9 @@ from governance_runtime.infrastructure.archive_export import (
     LEGAL_HOLD_SCHEMA,
     OPTIONAL_EXPORT_FILES,
     REQUIRED_EXPORT_FILES,
+    BundleExportRequest,
     export_finalized_bundle,
+    export_finalized_bundles,
     load_legal_holds,
     restore_from_bundle,
     validate_archive_for_export,
@@ -630,6 +632,80 @@ class TestExportRestoreRoundtripCorner:
             assert (restore_path / filename).is_file()
 
 
+class TestSingleFileBundleCorner:
+    """Corner: zip/tar bundles carry the same members as directory bundles."""
+
+    @pytest.mark.parametrize("fmt", [ArchiveFormat.ZIP, ArchiveFormat.TAR_GZ])
+    def test_single_file_export_validates_and_restores_in_place(self, tmp_path: Path, fmt: ArchiveFormat):
+        archive = _create_finalized_archive_with_optionals(tmp_path)
+        directory = export_finalized_bundle(
+            archive_path=archive, export_path=tmp_path / "dir-bundle",
+            repo_fingerprint=_FINGERPRINT, run_id=_RUN_ID,
+            exported_at=_EXPORTED_AT, exported_by=_EXPORTED_BY,
+        )
+        bundle_file = tmp_path / f"bundle.{fmt.value}"
+        manifest = export_finalized_bundle(
+            archive_path=archive, export_path=bundle_file,
+            repo_fingerprint=_FINGERPRINT, run_id=_RUN_ID,
+            exported_at=_EXPORTED_AT, exported_by=_EXPORTED_BY,
+            export_format=fmt,
+        )
+
+        assert bundle_file.is_file()
+        assert manifest.export_format == fmt.value
+        assert manifest.files_included == directory.files_included
+        assert manifest.bundle_manifest_hash == directory.bundle_manifest_hash
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+        validation = validate_restored_bundle(bundle_file)
+        assert validation.is_valid is True
+        assert validation.manifest_present is True
+
+        restore_path = tmp_path / "restored"
+        assert restore_from_bundle(bundle_path=bundle_file, restore_path=restore_path).is_valid is True
+        for name in manifest.files_included:
+            assert (restore_path / name).read_bytes() == (tmp_path / "dir-bundle" / name).read_bytes()
+
+    def test_unsupported_format_leaves_nothing_behind(self, tmp_path: Path):
+        import tarfile
+
+        if hasattr(tarfile.TarFile, "zstopen"):
+            pytest.skip("tarfile supports zstd on this Python")
+        archive = _create_finalized_archive(tmp_path)
+        with pytest.raises(RuntimeError, match="not supported"):
+            export_finalized_bundle(
+                archive_path=archive, export_path=tmp_path / "bundle.tar.zst",
+                repo_fingerprint=_FINGERPRINT, run_id=_RUN_ID,
+                exported_at=_EXPORTED_AT, exported_by=_EXPORTED_BY,
+                export_format=ArchiveFormat.TAR_ZST,
+            )
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["archive"]
+
+    def test_batch_export_is_ordered_and_isolates_failures(self, tmp_path: Path):
+        requests = []
+        for index in range(4):
+            archive = _create_finalized_archive(tmp_path / f"run{index}")
+            requests.append(BundleExportRequest(
+                archive_path=archive,
+                export_path=tmp_path / "out" / f"run{index}.zip",
+                repo_fingerprint=_FINGERPRINT,
+                run_id=f"run-{index}",
+            ))
+        (requests[2].archive_path / "checksums.json").unlink()
+
+        results = export_finalized_bundles(
+            requests, exported_at=_EXPORTED_AT, exported_by=_EXPORTED_BY,
+            export_format=ArchiveFormat.ZIP, max_workers=2,
+        )
+
+        assert [r.run_id for r in results] == ["run-0", "run-1", "run-2", "run-3"]
+        assert results[2].manifest is None
+        assert "checksums.json" in results[2].error
+        for index in (0, 1, 3):
+            assert results[index].manifest is not None
+            assert validate_restored_bundle(results[index].export_path).is_valid is True
+
+
 class TestLegalHoldRoundtripCorner:
     """Corner: legal hold write → load roundtrip."""
 
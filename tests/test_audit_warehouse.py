@@ -0,0 +1,140 @@
+"""Tests for the incremental audit warehouse and its CLI."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.infrastructure.adapters.logging.log_segments import rotate_if_needed
+from governance_runtime.infrastructure.audit_warehouse import (
+    connect_warehouse,
+    default_db_path,
+    ingest_workspaces,
+    open_warehouse_readonly,
+    report_blocked_by_reason,
+    report_phase6_iterations,
+)
+
+FP = "a1b2c3d4e5f6a1b2c3d4e5f6"
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _event(name: str, ts: str) -> str:
+    return json.dumps({"event": name, "ts_utc": ts, "run_id": "run-1"}) + "\n"
+
+
+def _archive_run(home: Path, run_id: str, iterations: int, phase: str = "6-PostFlight") -> None:
+    run_root = home / "governance-records" / FP / "runs" / "repo" / "2026" / "2026-10" / "2026-10-03" / run_id
+    _write_json(
+        run_root / "metadata.json",
+        {"run_id": run_id, "archived_at": "2026-10-03T10:00:00Z", "archive_status": "finalized", "source_phase": phase},
+    )
+    _write_json(run_root / "SESSION_STATE.json", {"SESSION_STATE": {"phase6_review_iterations": iterations}})
+
+
+def _fleet(tmp_path: Path) -> Path:
+    home = tmp_path / "workspaces"
+    runs = home / FP / "evidence" / "runs"
+    _write_json(runs / "r1.json", {"run_id": "r1", "timestamp": "2026-10-02T09:00:00Z", "result": "BLOCKED", "reason": {"code": "BLOCKED-X"}})
+    _write_json(runs / "r2.json", {"run_id": "r2", "timestamp": "2026-10-02T10:00:00Z", "result": "OK", "reason": {"code": "OK"}})
+    _write_json(runs / "latest.json", {"run_id": "r2"})
+    log = home / FP / "logs" / "events.jsonl"
+    log.parent.mkdir(parents=True)
+    log.write_text(_event("session_start", "2026-10-02T09:00:00Z") + _event("gate_eval", "2026-10-02T09:01:00Z"), encoding="utf-8")
+    _write_json(home / FP / "plan-record.json", {"status": "active", "versions": [{"version": 1}, {"version": 2, "supersedes": 1}]})
+    _archive_run(home, "run-a", 3)
+    _archive_run(home, "run-b", 5)
+    _archive_run(home, "run-c", 9, phase="4")
+    return home
+
+
+def _count(home: Path, table: str) -> int:
+    conn = open_warehouse_readonly(default_db_path(home))
+    try:
+        return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+    finally:
+        conn.close()
+
+
+@pytest.mark.governance
+def test_ingest_loads_every_source_and_answers_canned_reports(tmp_path: Path):
+    home = _fleet(tmp_path)
+    result = ingest_workspaces(home)
+
+    assert result.rows == {"run_summaries": 2, "events": 2, "plan_versions": 2, "archived_runs": 3}
+    conn = open_warehouse_readonly(default_db_path(home))
+    try:
+        assert report_blocked_by_reason(conn, since="2026-10-01") == [
+            {"reason_code": "BLOCKED-X", "runs": 1, "repos": 1, "first_seen": "2026-10-02T09:00:00Z", "last_seen": "2026-10-02T09:00:00Z"}
+        ]
+        assert [row["run_id"] for row in report_blocked_by_reason(conn, reason="BLOCKED-X")] == ["r1"]
+        assert report_blocked_by_reason(conn, since="2026-11-01") == []
+        assert report_phase6_iterations(conn) == [
+            {"repo_fingerprint": FP, "runs": 2, "median_iterations": 4, "max_iterations": 5}
+        ]
+    finally:
+        conn.close()
+
+
+@pytest.mark.governance
+def test_ingest_is_incremental_and_survives_log_rotation(tmp_path: Path):
+    home = _fleet(tmp_path)
+    ingest_workspaces(home)
+
+    again = ingest_workspaces(home)
+    assert again.files_ingested == 0
+
+    log = home / FP / "logs" / "events.jsonl"
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(_event("gate_eval", "2026-10-02T09:02:00Z"))
+        handle.write('{"event": "partial"')
+    appended = ingest_workspaces(home)
+    assert appended.files_ingested == 1
+    assert appended.rows == {"events": 1}
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(', "ts_utc": "2026-10-02T09:03:00Z"}\n')
+    assert rotate_if_needed(log, max_bytes=1, compress=True) is not None
+    log.write_text(_event("session_end", "2026-10-02T09:04:00Z"), encoding="utf-8")
+    rotated = ingest_workspaces(home)
+    assert rotated.rows == {"events": 2}
+    assert _count(home, "events") == 5
+
+
+@pytest.mark.governance
+def test_schema_version_change_rebuilds_the_warehouse(tmp_path: Path):
+    home = _fleet(tmp_path)
+    ingest_workspaces(home)
+    conn = connect_warehouse(default_db_path(home))
+    with conn:
+        conn.execute("UPDATE meta SET value = '0' WHERE key = 'schema_version'")
+    conn.close()
+
+    result = ingest_workspaces(home)
+    assert result.rows["run_summaries"] == 2
+    assert _count(home, "run_summaries") == 2
+
+
+@pytest.mark.governance
+def test_cli_reports_and_rejects_writes(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    from scripts.audit_warehouse import main
+
+    home = _fleet(tmp_path)
+    assert main(["--workspaces-home", str(home), "report", "runs-per-repo", "--ingest"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["rows"] == [
+        {"repo_fingerprint": FP, "runs": 2, "ok": 1, "blocked": 1, "last_run": "2026-10-02T10:00:00Z"}
+    ]
+
+    assert main(["--workspaces-home", str(home), "query", "SELECT COUNT(*) AS n FROM plan_versions"]) == 0
+    assert json.loads(capsys.readouterr().out)["rows"] == [{"n": 2}]
+
+    assert main(["--workspaces-home", str(home), "query", "DELETE FROM events"]) == 2
+    assert json.loads(capsys.readouterr().out)["status"] == "error"
+    assert _count(home, "events") == 2
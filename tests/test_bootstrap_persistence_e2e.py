@@ -394,6 +394,156 @@ def test_bootstrap_preflight_blocks_when_force_read_only(tmp_path: Path) -> None
     assert entries == []
 
 
+@pytest.mark.e2e_governance
+@pytest.mark.skipif(not HAS_PYYAML_IN_SUBPROCESS, reason="pyyaml required in subprocess Python for E2E persistence test")
+def test_bootstrap_isolated_mode_matches_inprocess_contract(tmp_path: Path) -> None:
+    """
+    The default in-process pipeline and --isolated (one interpreter per stage)
+    must persist the same workspace and emit the same stdout JSON contract.
+    """
+    checkout_root = Path(__file__).resolve().parents[1]
+    launcher = _bootstrap_launcher(checkout_root)
+    continuations: dict[str, dict[str, object]] = {}
+
+    for mode, extra_args in (("inprocess", []), ("isolated", ["--isolated"])):
+        home = tmp_path / mode / "home"
+        config_root = home / ".config" / "opencode"
+        commands_home = config_root / "commands"
+        workspaces_home = config_root / "workspaces"
+        workspaces_home.mkdir(parents=True, exist_ok=True)
+
+        _materialize_commands_bundle_from_checkout(checkout_root=checkout_root, commands_home=commands_home)
+        _write_governance_paths(commands_home, workspaces_home, config_root, checkout_root)
+        inject_session_reader_path(
+            commands_home, python_command=sys.executable, bin_dir=str(checkout_root / "bin"), dry_run=False
+        )
+
+        repo = tmp_path / mode / "repo"
+        _git_init_repo(repo)
+
+        env = dict(os.environ)
+        env["HOME"] = str(home)
+        env["USERPROFILE"] = str(home)
+        env["CI"] = ""
+        env["OPENCODE_CONFIG_ROOT"] = str(config_root)
+        env["COMMANDS_HOME"] = str(commands_home)
+        env["OPENCODE_LOCAL_ROOT"] = str(checkout_root)
+        env["OPENCODE_PYTHON"] = sys.executable
+        env.pop("OPENCODE_FORCE_READ_ONLY", None)
+        env.pop("OPENCODE_BOOTSTRAP_ISOLATION", None)
+
+        proc = _run(
+            launcher + ["--repo-root", str(repo), "--config-root", str(config_root), *extra_args],
+            cwd=repo,
+            env=env,
+        )
+        assert proc.returncode == 0, proc.stdout + "\n" + proc.stderr
+
+        payloads = _read_json_lines(proc.stdout)
+        hook = next((p for p in payloads if "workspacePersistenceHook" in p), None)
+        assert hook is not None and hook.get("workspacePersistenceHook") == "ok", proc.stdout
+        continuation = next((p for p in payloads if "kernelContinuation" in p), None)
+        assert continuation is not None, proc.stdout
+        repo_fp = str(continuation.get("repo_fingerprint") or "")
+        state = json.loads((workspaces_home / repo_fp / "SESSION_STATE.json").read_text(encoding="utf-8"))
+        assert state["SESSION_STATE"].get("PersistenceCommitted") is True
+        continuations[mode] = {
+            key: value for key, value in continuation.items() if key not in {"session_state_path"}
+        }
+
+    assert continuations["inprocess"] == continuations["isolated"]
+
+
+_PREFLIGHT_STAGE_DRIVER = """
+import subprocess
+import sys
+from pathlib import Path
+
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import ExecutionContext, InProcessRunner
+
+mode, config_root, repo_root = sys.argv[1:4]
+context = ExecutionContext(
+    env_overrides={
+        "OPENCODE_CONFIG_ROOT": config_root,
+        "COMMANDS_HOME": str(Path(config_root) / "commands"),
+        "OPENCODE_REPO_ROOT": repo_root,
+        "OPENCODE_BOOTSTRAP_ISOLATION": mode,
+        "OPENCODE_BOOTSTRAP_VERBOSE": "1",
+        "OPENCODE_BOOTSTRAP_OUTPUT": "full",
+    },
+    cwd=Path(repo_root),
+)
+argv = [sys.executable, "-m", "governance_runtime.entrypoints.bootstrap_preflight_readonly"]
+if mode == "inprocess":
+    result = InProcessRunner().run_with_context(argv, context)
+else:
+    result = subprocess.run(argv, env=context.environment(), cwd=repo_root, text=True, capture_output=True)
+sys.stdout.write(result.stdout)
+sys.stderr.write(result.stderr)
+raise SystemExit(result.returncode)
+"""
+
+
+@pytest.mark.e2e_governance
+@pytest.mark.skipif(not HAS_PYYAML_IN_SUBPROCESS, reason="pyyaml required in subprocess Python for E2E persistence test")
+def test_verbose_inprocess_stage_matches_isolated_without_parent_overrides(tmp_path: Path) -> None:
+    """
+    The executor passes --config-root and --verbose to the preflight stage as
+    overrides only. In-process stages must see them exactly like a child
+    process does, even when the parent shell exports neither.
+    """
+    checkout_root = Path(__file__).resolve().parents[1]
+    events: dict[str, list[list[str]]] = {}
+
+    for mode in ("inprocess", "process"):
+        home = tmp_path / mode / "home"
+        home.mkdir(parents=True)
+        config_root = tmp_path / mode / "cfg"
+        commands_home = config_root / "commands"
+        workspaces_home = config_root / "workspaces"
+        workspaces_home.mkdir(parents=True, exist_ok=True)
+        _materialize_commands_bundle_from_checkout(checkout_root=checkout_root, commands_home=commands_home)
+        _write_governance_paths(commands_home, workspaces_home, config_root, checkout_root)
+
+        repo = tmp_path / mode / "repo"
+        _git_init_repo(repo)
+
+        env = dict(os.environ)
+        env["HOME"] = str(home)
+        env["USERPROFILE"] = str(home)
+        env["CI"] = ""
+        env["PYTHONPATH"] = str(checkout_root)
+        for key in (
+            "OPENCODE_CONFIG_ROOT",
+            "COMMANDS_HOME",
+            "OPENCODE_BOOTSTRAP_OUTPUT",
+            "OPENCODE_BOOTSTRAP_VERBOSE",
+            "OPENCODE_BOOTSTRAP_ISOLATION",
+            "OPENCODE_FORCE_READ_ONLY",
+            "OPENCODE_REPO_ROOT",
+        ):
+            env.pop(key, None)
+
+        proc = _run(
+            [sys.executable, "-c", _PREFLIGHT_STAGE_DRIVER, mode, str(config_root), str(repo)],
+            cwd=repo,
+            env=env,
+        )
+        assert proc.returncode == 0, proc.stdout + "\n" + proc.stderr
+
+        payloads = _read_json_lines(proc.stdout)
+        events[mode] = [sorted(payload) for payload in payloads]
+        assert any("preflight" in payload for payload in payloads), proc.stdout
+        assert any("permissionProbes" in payload for payload in payloads), proc.stdout
+        hook = next(p for p in payloads if "workspacePersistenceHook" in p)
+        assert hook.get("workspacePersistenceHook") == "ok", proc.stdout
+        repo_fp = str(hook.get("repo_fingerprint") or "")
+        assert (workspaces_home / repo_fp / "logs").is_dir()
+        assert not (home / ".config" / "opencode").exists()
+
+    assert events["inprocess"] == events["process"]
+
+
 @pytest.mark.e2e_governance
 @pytest.mark.skipif(not HAS_PYYAML_IN_SUBPROCESS, reason="pyyaml required in subprocess Python for E2E persistence test")
 def test_continue_first_step_executes_after_bootstrap(tmp_path: Path) -> None:
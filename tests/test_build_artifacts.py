@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import io
 import json
 import re
+import sys
 import tarfile
 import zipfile
 from pathlib import Path
@@ -217,3 +221,108 @@ def test_artifacts_contents_follow_policy(tmp_path: Path):
                 assert m.mode == 0o755, f"install.py should be 0755 in TAR, got {oct(m.mode)}"
             else:
                 assert m.mode == 0o644, f"Unexpected mode for {m.name}: {oct(m.mode)}"
+
+
+def _load_build_module():
+    spec = importlib.util.spec_from_file_location("release_build_script", REPO_ROOT / "scripts" / "build.py")
+    if spec is None or spec.loader is None:
+        raise RuntimeError("failed to load scripts/build.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.build
+def test_hashing_writer_digest_matches_zip_with_header_rewrites():
+    build = _load_build_module()
+    raw = io.BytesIO()
+    sink = build.HashingWriter(raw)
+    entries = [
+        build.ReleaseEntry(arcname=f"p/{idx}.txt", mode=0o644, data=(f"payload-{idx}\n" * 500).encode())
+        for idx in range(5)
+    ]
+    build._write_zip_entries(sink, entries)
+
+    assert sink.hexdigest() == hashlib.sha256(raw.getvalue()).hexdigest()
+    with zipfile.ZipFile(io.BytesIO(raw.getvalue())) as zf:
+        assert zf.read("p/3.txt") == entries[3].data
+
+
+@pytest.mark.build
+def test_hashing_writer_reports_invalid_digest_after_rewinding_hashed_bytes():
+    build = _load_build_module()
+    sink = build.HashingWriter(io.BytesIO())
+    sink.write(b"abcdef")
+    sink.seek(4)
+    sink.write(b"EF")
+    sink.seek(0)
+    sink.write(b"A")
+
+    assert sink.hexdigest() is None
+
+
+@pytest.mark.build
+def test_failing_writer_setup_does_not_block_the_reader(tmp_path: Path):
+    build = _load_build_module()
+    src_root = tmp_path / "src"
+    src_root.mkdir()
+    files = []
+    for idx in range(build.PIPELINE_DEPTH * 3):
+        path = src_root / f"{idx}.txt"
+        path.write_text(f"payload-{idx}\n", encoding="utf-8")
+        files.append(path)
+    blocker = tmp_path / "dist"
+    blocker.write_text("not a directory", encoding="utf-8")
+
+    with pytest.raises(OSError):
+        build.build_release_archives(
+            {"zip": tmp_path / "ok" / "out.zip", "tar.gz": blocker / "out.tar.gz"},
+            prefix="p",
+            repo_root=src_root,
+            files=files,
+        )
+
+
+@pytest.mark.build
+def test_build_manifest_records_every_payload_file(tmp_path: Path):
+    ver = _governance_version()
+    prefix = f"governance-{ver}"
+    dist = tmp_path / "dist"
+    r = run_build(["--out-dir", str(dist), "--formats", "zip,tar.gz"])
+    assert r.returncode == 0, f"build failed:\n{r.stderr}\n{r.stdout}"
+
+    manifest = json.loads((dist / "build-manifest.json").read_text(encoding="utf-8"))
+    assert manifest["schema"] == "governance-build-manifest.v1"
+    assert manifest["prefix"] == prefix
+    assert manifest["artifacts"] == {
+        f"{prefix}.zip": sha256_file(dist / f"{prefix}.zip"),
+        f"{prefix}.tar.gz": sha256_file(dist / f"{prefix}.tar.gz"),
+    }
+
+    with zipfile.ZipFile(dist / f"{prefix}.zip") as zf:
+        names = sorted(n[len(prefix) + 1:] for n in zf.namelist() if not n.endswith("/"))
+        assert [entry["path"] for entry in manifest["files"]] == names
+        sample = manifest["files"][0]
+        assert hashlib.sha256(zf.read(f"{prefix}/{sample['path']}")).hexdigest() == sample["sha256"]
+
+
+@pytest.mark.build
+def test_incremental_build_reuses_unchanged_artifacts(tmp_path: Path):
+    ver = _governance_version()
+    dist = tmp_path / "dist"
+    r = run_build(["--out-dir", str(dist), "--formats", "zip"])
+    assert r.returncode == 0, f"build failed:\n{r.stderr}\n{r.stdout}"
+    zip_path = dist / f"governance-{ver}.zip"
+    first_mtime = zip_path.stat().st_mtime_ns
+
+    r = run_build(["--out-dir", str(dist), "--formats", "zip", "--incremental"])
+    assert r.returncode == 0, f"build failed:\n{r.stderr}\n{r.stdout}"
+    assert "reusing existing artifacts" in r.stdout
+    assert zip_path.stat().st_mtime_ns == first_mtime
+
+    zip_path.write_bytes(b"tampered")
+    r = run_build(["--out-dir", str(dist), "--formats", "zip", "--incremental"])
+    assert r.returncode == 0, f"build failed:\n{r.stderr}\n{r.stdout}"
+    assert "reusing existing artifacts" not in r.stdout
+    assert zipfile.is_zipfile(zip_path)
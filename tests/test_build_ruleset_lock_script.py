@@ -322,3 +322,32 @@ def test_positive_isolated_repo_succeeds(tmp_path: Path):
     payload = json.loads(result.stdout)
     assert payload["status"] == "OK"
     assert payload["ruleset_hash"]
+
+
+@pytest.mark.governance
+def test_compile_cache_rebuilds_only_changed_rulebooks_and_schema_dependents(tmp_path: Path):
+    """Second build reuses the cache; a rulebook edit recompiles it, a schema edit recompiles all rulebooks."""
+    repo = _build_isolated_repo(tmp_path)
+    first = json.loads(_run_isolated(repo, tmp_path).stdout)
+    assert (first["compiled"], first["cached"]) == (2, 0)
+    cache_dir = tmp_path / "output" / ".compile-cache"
+    assert len(list(cache_dir.glob("*.json"))) == 2
+    assert not list(cache_dir.glob("*.tmp"))
+
+    again = json.loads(_run_isolated(repo, tmp_path).stdout)
+    assert (again["compiled"], again["cached"]) == (0, 2)
+    assert again["ruleset_hash"] == first["ruleset_hash"]
+
+    core = repo / "rulesets" / "core" / "rules.yml"
+    core.write_text(core.read_text() + "extra: true\n")
+    edited = json.loads(_run_isolated(repo, tmp_path).stdout)
+    assert (edited["compiled"], edited["cached"]) == (1, 1)
+
+    schema = repo / "schemas" / "rulebook.schema.json"
+    schema.write_text(schema.read_text().replace("Governance Rulebook", "Governance Rulebook v1"))
+    rebuilt = json.loads(_run_isolated(repo, tmp_path).stdout)
+    assert (rebuilt["compiled"], rebuilt["cached"]) == (2, 0)
+
+    uncached = json.loads(_run_isolated(repo, tmp_path, ["--no-cache"]).stdout)
+    assert (uncached["compiled"], uncached["cached"]) == (2, 0)
+    assert uncached["ruleset_hash"] == rebuilt["ruleset_hash"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from governance_runtime.verification import runner
+
+_METHODS = [
+    "static_verification",
+    "behavioral_verification",
+    "user_surface_verification",
+    "live_flow_verification",
+    "receipts_verification",
+]
+
+
+def _contract(req_id: str, hotspot: str) -> dict[str, object]:
+    return {
+        "id": req_id,
+        "title": req_id,
+        "criticality": "release_blocking",
+        "owner_test": f"tests/test_{req_id.lower()}.py::test_owner",
+        "live_proof_key": f"LP-{req_id}",
+        "required_behavior": ["x"],
+        "forbidden_behavior": ["no decision without x"],
+        "user_visible_expectation": ["x"],
+        "state_expectation": ["x"],
+        "code_hotspots": [hotspot],
+        "verification_methods": list(_METHODS),
+        "acceptance_tests": [f"tests/test_{req_id.lower()}.py::test_owner"],
+        "done_rule": {
+            "require_all_verifications_pass": True,
+            "fail_closed_on_missing_evidence": True,
+            "fail_on_forbidden_observation": True,
+        },
+    }
+
+
+def _repo(tmp_path: Path) -> Path:
+    contracts = tmp_path / "governance_runtime" / "contracts"
+    (contracts / "requirements").mkdir(parents=True)
+    registry: dict[str, object] = {"schema": "governance-verification-registry.v1", "requirements": {}}
+    for req_id, hotspot in (("R-A", "a.py"), ("R-B", "b.py")):
+        (tmp_path / hotspot).write_text(f"# {req_id}\n", encoding="utf-8")
+        (contracts / "requirements" / f"{req_id}.json").write_text(
+            json.dumps(_contract(req_id, hotspot), ensure_ascii=True), encoding="utf-8"
+        )
+        registry["requirements"][req_id] = {  # type: ignore[index]
+            method: [f"tests/test_{req_id.lower()}.py::test_{method}"] for method in _METHODS
+        }
+    (contracts / "verification_registry.json").write_text(json.dumps(registry, ensure_ascii=True), encoding="utf-8")
+    return tmp_path
+
+
+def _counting(monkeypatch) -> list[str]:
+    calls: list[str] = []
+
+    def _run(python_bin: str, repo_root: Path, nodeid: str) -> bool:
+        calls.append(nodeid)
+        return True
+
+    monkeypatch.setattr(runner, "_run_pytest_node", _run)
+    return calls
+
+
+def _rows(result: dict[str, object]) -> dict[str, dict[str, object]]:
+    matrix = result["matrix"]
+    assert isinstance(matrix, dict)
+    return {row["id"]: row for row in matrix["completion_matrix"]}
+
+
+def test_unchanged_requirements_are_carried_forward(tmp_path: Path, monkeypatch) -> None:
+    repo = _repo(tmp_path)
+    calls = _counting(monkeypatch)
+
+    first = runner.run_contract_verification(repo_root=repo)
+    assert first["status"] == "PASS"
+    assert first["verification_mode"] == "full"
+    assert calls
+    rows = _rows(first)
+    assert all(row["carried_forward"] is False and row["fingerprint"] for row in rows.values())
+    assert "tests/test_r-a.py::test_owner" in rows["R-A"]["evidence_refs"]
+
+    calls.clear()
+    second = runner.run_contract_verification(repo_root=repo, previous_matrix=first["matrix"])
+    assert second["status"] == "PASS"
+    assert second["merge_allowed"] is True
+    assert second["carried_forward"] == ["R-A", "R-B"]
+    assert calls == []
+    assert _rows(second)["R-A"]["evidence_refs"] == rows["R-A"]["evidence_refs"]
+
+
+def test_hotspot_edit_reverifies_only_the_affected_requirement(tmp_path: Path, monkeypatch) -> None:
+    repo = _repo(tmp_path)
+    calls = _counting(monkeypatch)
+    first = runner.run_contract_verification(repo_root=repo)
+
+    (repo / "b.py").write_text("# R-B changed\n", encoding="utf-8")
+    calls.clear()
+    second = runner.run_contract_verification(repo_root=repo, previous_matrix=first["matrix"])
+
+    assert second["carried_forward"] == ["R-A"]
+    assert calls and all("test_r-b.py" in nodeid for nodeid in calls)
+    rows = _rows(second)
+    assert rows["R-B"]["carried_forward"] is False
+    assert rows["R-B"]["fingerprint"] != _rows(first)["R-B"]["fingerprint"]
+
+
+def test_failed_rows_are_never_carried_forward(tmp_path: Path, monkeypatch) -> None:
+    repo = _repo(tmp_path)
+    monkeypatch.setattr(runner, "_run_pytest_node", lambda python_bin, repo_root, nodeid: "r-b" not in nodeid)
+    first = runner.run_contract_verification(repo_root=repo)
+    assert first["status"] == "FAIL"
+
+    calls = _counting(monkeypatch)
+    second = runner.run_contract_verification(repo_root=repo, previous_matrix=first["matrix"])
+
+    assert second["status"] == "PASS"
+    assert second["carried_forward"] == ["R-A"]
+    assert calls and all("test_r-b.py" in nodeid for nodeid in calls)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.application.use_cases.diff_signals import collect_signals_from_diff
+from governance_runtime.infrastructure.adapters.git import diff_stats
+
+_DIFF = """\
+3\t1\tsrc/api/routes.py
+10\t0\tdb/migrations/0002_add_user.sql
+-\t-\tassets/logo.png
+1\t1\ttests/test_auth.py
+
+diff --git a/src/api/routes.py b/src/api/routes.py
+index 1..2 100644
+--- a/src/api/routes.py
++++ b/src/api/routes.py
+@@ -4 +4,3 @@
+-def list_users():
++def list_users(limit):
++    return requests.get(URL)
++    _helper()
+diff --git a/db/migrations/0002_add_user.sql b/db/migrations/0002_add_user.sql
+new file mode 100644
+--- /dev/null
++++ b/db/migrations/0002_add_user.sql
+@@ -0,0 +1,10 @@
++CREATE TABLE users (id int);
+diff --git a/assets/logo.png b/assets/logo.png
+Binary files a/assets/logo.png and b/assets/logo.png differ
+diff --git a/tests/test_auth.py b/tests/test_auth.py
+--- a/tests/test_auth.py
++++ b/tests/test_auth.py
+@@ -1 +1 @@
+-import hashlib
++import hmac
+"""
+
+
+def test_collector_derives_all_signals_in_one_pass() -> None:
+    report = collect_signals_from_diff(_DIFF.splitlines())
+    signals = report.signals
+
+    assert signals.files_changed == 4
+    assert signals.loc_changed == 16
+    assert signals.public_api_changed is True
+    assert signals.schema_migration is True
+    assert signals.network_io_changed is True
+    assert signals.security_paths_touched is False
+    assert signals.permissions_changed is False
+    assert report.evidence["public_api_changed"] == ("src/api/routes.py",)
+    assert report.evidence["schema_migration"] == ("db/migrations/0002_add_user.sql",)
+    assert report.complexity_class == "COMPLEX"
+
+
+def test_small_plain_change_is_simple_crud() -> None:
+    diff = [
+        "2\t1\tsrc/service/orders.py",
+        "",
+        "diff --git a/src/service/orders.py b/src/service/orders.py",
+        "--- a/src/service/orders.py",
+        "+++ b/src/service/orders.py",
+        "@@ -3 +3,2 @@",
+        "-    total = 0",
+        "+    total = sum(items)",
+        "+    return total",
+    ]
+    report = collect_signals_from_diff(diff)
+
+    assert report.signals.files_changed == 1
+    assert report.signals.loc_changed == 3
+    assert report.evidence == {}
+    assert report.complexity_class == "SIMPLE-CRUD"
+
+
+def test_mode_change_and_coverage_delta() -> None:
+    diff = [
+        "0\t0\tbin/run.sh",
+        "",
+        "diff --git a/bin/run.sh b/bin/run.sh",
+        "old mode 100644",
+        "new mode 100755",
+    ]
+    report = collect_signals_from_diff(diff, coverage_delta=-7.5)
+
+    assert report.signals.permissions_changed is True
+    assert report.signals.test_coverage_delta == -7.5
+    assert report.to_dict()["evidence"] == {"permissions_changed": ["bin/run.sh"]}
+
+
+def _git(repo: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        cwd=str(repo),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip()
+
+
+@pytest.fixture
+def two_commit_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    (repo / "app.py").write_text("x = 1\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "base")
+    (repo / "auth").mkdir()
+    (repo / "auth" / "tokens.py").write_text("import secrets\n", encoding="utf-8")
+    (repo / "app.py").write_text("x = 2\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "head")
+    return repo
+
+
+def test_git_collector_caches_per_commit_pair(two_commit_repo: Path, tmp_path: Path, monkeypatch) -> None:
+    diff_stats.clear_diff_signal_cache()
+    cache_dir = tmp_path / "cache"
+
+    report = diff_stats.collect_diff_signals(two_commit_repo, "HEAD~1", "HEAD", cache_dir=cache_dir)
+    assert report is not None
+    assert report.signals.files_changed == 2
+    assert report.signals.loc_changed == 3
+    assert report.signals.security_paths_touched is True
+    cached = list(cache_dir.glob("*.json"))
+    assert len(cached) == 1
+    assert json.loads(cached[0].read_text(encoding="utf-8"))["security_paths_touched"] is True
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("diff must come from cache")
+
+    monkeypatch.setattr(diff_stats, "_stream_diff", _fail)
+    assert diff_stats.collect_diff_signals(two_commit_repo, "HEAD~1", "HEAD", cache_dir=cache_dir) == report
+    diff_stats.clear_diff_signal_cache()
+    assert diff_stats.collect_diff_signals(two_commit_repo, "HEAD~1", "HEAD", cache_dir=cache_dir) == report
+
+
+def test_git_collector_returns_none_for_unknown_refs(two_commit_repo: Path) -> None:
+    assert diff_stats.collect_diff_signals(two_commit_repo, "does-not-exist", "HEAD") is None
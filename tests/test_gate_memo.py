@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.engine import gate_evaluator as ge
+from governance_runtime.engine import gate_memo
+from governance_runtime.infrastructure import gate_memo_store
+from governance_runtime.infrastructure.gate_memo_store import (
+    gate_logic_digest,
+    gate_memo_path,
+    load_gate_memo,
+    workspace_gate_memo,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_active_memo():
+    gate_memo.deactivate()
+    yield
+    gate_memo.deactivate()
+
+
+def _state() -> dict:
+    return {
+        "TicketRecordDigest": "Plan with Test Strategy",
+        "TouchedSurface": {"SchemaPlanned": ["db/schema.sql"], "ContractsPlanned": []},
+        "RollbackStrategy": {"DataMigrationReversible": True},
+        "TechnicalDebtProposed": True,
+        "BusinessRules": {
+            "Outcome": "extracted",
+            "ExecutionEvidence": True,
+            "ExtractedCount": 2,
+            "ValidationReport": {"is_compliant": True, "missing_code_surfaces": ["a.py"]},
+            "Rules": ["BR-1: keep totals", "BR-2: keep order"],
+        },
+        "Gates": {
+            "P5-Architecture": "approved",
+            "P5.3-TestQuality": "pass",
+            "P5.4-BusinessRules": "compliant",
+            "P5.5-TechnicalDebt": "approved",
+            "P5.6-RollbackSafety": "pending",
+        },
+        "Unrelated": 1,
+    }
+
+
+def _evaluate_all(state: dict) -> tuple:
+    return (
+        ge.evaluate_p53_test_quality_gate(session_state=state),
+        ge.evaluate_p54_business_rules_gate(session_state=state, phase_1_5_executed=True),
+        ge.evaluate_p55_technical_debt_gate(session_state=state),
+        ge.evaluate_p56_rollback_safety_gate(session_state=state),
+        ge.evaluate_p6_prerequisites(session_state=state, phase_1_5_executed=True, rollback_safety_applies=True),
+        ge.evaluate_p6_plan_compliance(plan_record=None, actual_files_changed=["a.py"]),
+    )
+
+
+def test_memo_reuses_results_until_the_gate_slice_changes() -> None:
+    state = _state()
+    memo = gate_memo.activate(gate_memo.GateMemo())
+
+    first = _evaluate_all(state)
+    misses = memo.misses
+    state["Unrelated"] = 2
+    state["Gates"]["P5.6-RollbackSafety"] = "pending"
+    assert _evaluate_all(state) == first
+    assert memo.misses == misses and memo.hits >= 6
+
+    state["Gates"]["P5.6-RollbackSafety"] = "approved"
+    p56 = ge.evaluate_p56_rollback_safety_gate(session_state=state)
+    assert p56.status == "approved"
+    assert ge.evaluate_p53_test_quality_gate(session_state=state) is first[0]
+
+
+def test_memoized_results_match_direct_evaluation_across_state_edits() -> None:
+    variants = [_state()]
+    edited = _state()
+    del edited["TechnicalDebtProposed"]
+    edited["Gates"]["P5.5-TechnicalDebt"] = "rejected"
+    edited["BusinessRules"]["ValidationReport"]["is_compliant"] = False
+    variants.append(edited)
+    bare = _state()
+    bare.pop("Gates")
+    bare["TouchedSurface"] = {}
+    variants.append(bare)
+
+    expected = [_evaluate_all(copy.deepcopy(state)) for state in variants]
+    gate_memo.activate(gate_memo.GateMemo())
+    for _ in range(2):
+        assert [_evaluate_all(copy.deepcopy(state)) for state in variants] == expected
+
+
+def test_workspace_memo_persists_and_decodes_results(tmp_path: Path) -> None:
+    state = _state()
+    with workspace_gate_memo(tmp_path, persist=False):
+        expected = _evaluate_all(state)
+    assert not gate_memo_path(tmp_path).exists()
+
+    with workspace_gate_memo(tmp_path, persist=True):
+        _evaluate_all(state)
+    assert gate_memo.active_memo() is None
+
+    with workspace_gate_memo(tmp_path, persist=True) as memo:
+        restored = _evaluate_all(state)
+    assert memo.misses == 0 and not memo.dirty
+    assert restored == expected
+    assert isinstance(restored[1].missing_code_surfaces, tuple)
+    assert isinstance(restored[5].report.files_actual, tuple)
+
+    document = json.loads(gate_memo_path(tmp_path).read_text(encoding="utf-8"))
+    document["version"] = gate_memo.GATE_MEMO_VERSION + 1
+    gate_memo_path(tmp_path).write_text(json.dumps(document), encoding="utf-8")
+    stale = gate_memo.activate(load_gate_memo(tmp_path))
+    _evaluate_all(state)
+    assert stale.misses == 6
+
+
+def test_gate_logic_digest_change_discards_persisted_results(tmp_path: Path, monkeypatch) -> None:
+    assert "governance_runtime.engine.gate_evaluator" in gate_memo_store._gate_logic_modules()
+    assert "governance_runtime.domain.strict_exit_evaluator" in gate_memo_store._gate_logic_modules()
+
+    state = _state()
+    with workspace_gate_memo(tmp_path, persist=True):
+        _evaluate_all(state)
+    document = json.loads(gate_memo_path(tmp_path).read_text(encoding="utf-8"))
+    assert document["logic_digest"] == gate_logic_digest()
+
+    monkeypatch.setattr(gate_memo_store, "gate_logic_digest", lambda: "upgraded-runtime")
+    with workspace_gate_memo(tmp_path, persist=False) as memo:
+        _evaluate_all(state)
+    assert memo.misses == 6
+
+    # Results from another logic digest are not reused even when loaded in-process.
+    other = gate_memo.activate(gate_memo.GateMemo.from_document(document, logic_digest="upgraded-runtime"))
+    _evaluate_all(state)
+    assert other.misses == 6
+
+
+def test_read_sets_are_declared_for_every_session_state_gate() -> None:
+    for func in (
+        ge.evaluate_p53_test_quality_gate,
+        ge.evaluate_p54_business_rules_gate,
+        ge.evaluate_p55_technical_debt_gate,
+        ge.evaluate_p56_rollback_safety_gate,
+        ge.evaluate_p6_prerequisites,
+    ):
+        assert func.read_set, func.__name__
+    assert ge.evaluate_p6_plan_compliance.read_set is None
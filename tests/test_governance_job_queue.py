@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.entrypoints import governance_worker
+from governance_runtime.infrastructure import governance_job_queue as queue
+from governance_runtime.infrastructure.governance_hooks import GovernanceHookResult
+
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _enqueue(queue_dir: Path, run_id: str = "work-1", **overrides: object) -> queue.EnqueueResult:
+    params: dict[str, object] = {
+        "archive_path": queue_dir.parent / "runs" / run_id,
+        "repo_fingerprint": "abc123def456abc123def456",
+        "run_id": run_id,
+        "observed_at": "2026-01-01T00:00:00Z",
+        "workspace_root": queue_dir.parent,
+    }
+    params.update(overrides)
+    return queue.enqueue_post_archive_governance(queue_dir, **params)  # type: ignore[arg-type]
+
+
+def _job(result: queue.EnqueueResult) -> dict:
+    return json.loads(result.job_path.read_text(encoding="utf-8"))
+
+
+class _Runner:
+    def __init__(self, *outcomes: object) -> None:
+        self.outcomes = list(outcomes)
+        self.calls: list[dict] = []
+
+    def __call__(self, **kwargs: object) -> GovernanceHookResult:
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0) if self.outcomes else True
+        if isinstance(outcome, Exception):
+            raise outcome
+        if outcome is True:
+            return GovernanceHookResult(executed=True, governance_passed=True, summary_path=Path("s.json"), error="")
+        return GovernanceHookResult(executed=False, governance_passed=False, summary_path=None, error=str(outcome))
+
+
+def test_enqueue_is_idempotent_per_run_and_pipeline_version(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "governance-jobs"
+    first = _enqueue(queue_dir)
+    again = _enqueue(queue_dir)
+    bumped = _enqueue(queue_dir, pipeline_version=queue.GOVERNANCE_PIPELINE_VERSION + 1)
+
+    assert first.enqueued and not again.enqueued
+    assert first.job_key == again.job_key == queue.job_key("work-1")
+    assert bumped.enqueued and bumped.job_key != first.job_key
+    assert queue.job_key("../evil run") == ".._evil_run--v1"
+    assert _job(first)["status"] == queue.STATUS_PENDING
+
+
+def test_drain_runs_due_jobs_and_marks_them_done(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "governance-jobs"
+    first = _enqueue(queue_dir, "work-1")
+    _enqueue(queue_dir, "work-2", events_path=tmp_path / "events.jsonl")
+    runner = _Runner()
+
+    result = queue.drain_governance_jobs(queue_dir, now=_NOW, runner=runner, max_jobs=1)
+    assert (result.processed, result.succeeded) == (1, 1)
+    assert _job(first)["status"] == queue.STATUS_DONE
+    assert _job(first)["governance_passed"] is True
+    assert runner.calls[0]["events_path"] is None
+
+    result = queue.drain_governance_jobs(queue_dir, now=_NOW, runner=runner)
+    assert result.processed == 1
+    assert runner.calls[1]["events_path"] == tmp_path / "events.jsonl"
+    assert queue.drain_governance_jobs(queue_dir, now=_NOW, runner=runner).processed == 0
+    assert not list(queue_dir.glob("*.lock"))
+
+
+def test_failures_back_off_and_give_up_after_max_attempts(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "governance-jobs"
+    job = _enqueue(queue_dir)
+    runner = _Runner(*(["pipeline exploded", RuntimeError("boom")] * queue.MAX_ATTEMPTS))
+
+    now = _NOW
+    assert queue.drain_governance_jobs(queue_dir, now=now, runner=runner).retried == 1
+    payload = _job(job)
+    assert payload["attempts"] == 1 and payload["last_error"] == "pipeline exploded"
+    assert payload["next_attempt_at"] == "2026-01-01T00:00:30Z"
+    assert queue.drain_governance_jobs(queue_dir, now=now, runner=runner).processed == 0
+
+    for attempt in range(2, queue.MAX_ATTEMPTS + 1):
+        now = now + timedelta(seconds=queue.retry_delay_seconds(attempt - 1))
+        queue.drain_governance_jobs(queue_dir, now=now, runner=runner)
+    payload = _job(job)
+    assert payload["status"] == queue.STATUS_FAILED
+    assert payload["attempts"] == queue.MAX_ATTEMPTS
+
+    status = queue.governance_queue_status(queue_dir, now=now)
+    assert status["counts"] == {"pending": 0, "done": 0, "failed": 1}
+    assert status["errors"][0]["job_key"] == job.job_key
+
+
+def test_locked_job_is_skipped_and_reported_running(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "governance-jobs"
+    job = _enqueue(queue_dir)
+    job.job_path.with_suffix(".lock").write_text("1", encoding="utf-8")
+    runner = _Runner()
+
+    result = queue.drain_governance_jobs(queue_dir, now=_NOW, runner=runner)
+    assert (result.processed, result.skipped_locked) == (0, 1)
+    assert runner.calls == []
+    status = queue.governance_queue_status(queue_dir, now=_NOW)
+    assert status["running"] == 1 and status["due"] == 1
+    assert queue.has_due_jobs(queue_dir, now=_NOW)
+
+
+def test_worker_entrypoint_reports_status(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    workspace = tmp_path / "workspaces" / "abc123def456abc123def456"
+    _enqueue(workspace / "governance-jobs")
+
+    assert governance_worker.main(["--workspace", str(workspace), "--status"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert "drain" not in payload
+    assert payload["queue"]["counts"]["pending"] == 1
@@ -506,7 +506,7 @@ def test_happy_desktop_binding_resolves_callable_bridge_executor(
     monkeypatch.setattr(
         entrypoint,
         "_resolve_desktop_executor_bridge_cmd",
-        lambda **_kwargs: "python3 -c \"print('{\\\"result\\\":\\\"ok\\\"}')\"",
+        lambda **_kwargs: "python3 -c \"from pathlib import Path; Path('src').mkdir(exist_ok=True); Path('src/service.py').write_text('x = 1\\n', encoding='utf-8'); print('{\\\"result\\\":\\\"ok\\\"}')\"",
     )
     states = iter([[], ["src/service.py"]])
     monkeypatch.setattr(entrypoint, "_parse_changed_files_from_git_status", lambda _repo: next(states))
@@ -660,7 +660,12 @@ def test_happy_changed_files_use_executor_delta_not_preexisting_noise(
     tmp_path: Path,
 ) -> None:
     repo_root = tmp_path
-    execution_cmd = "python3 -c \"print('{\\\"result\\\":\\\"ok\\\"}')\""
+    execution_cmd = (
+        "python3 -c \"from pathlib import Path; "
+        "Path('src').mkdir(exist_ok=True); "
+        "Path('src/service.py').write_text('x = 1\\n', encoding='utf-8'); "
+        "print('{\\\"result\\\":\\\"ok\\\"}')\""
+    )
 
     states = iter([
         ["docs/already_dirty.md"],
@@ -1072,3 +1077,61 @@ def test_workspace_authority_prefers_active_session_workspace_for_binding_resolu
     assert rc == 2
     assert out["status"] == "blocked"
     assert observed["workspace_root"] == tmp_path
+
+
+@pytest.mark.parametrize("tracker_mode", ["git-status", "inotify"])
+def test_changed_files_match_between_git_status_and_watcher_modes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    tracker_mode: str,
+) -> None:
+    repo_root = tmp_path
+    if tracker_mode == "inotify":
+        from governance_runtime.infrastructure.workspace_change_tracker import InotifyChangeWatcher
+
+        probe = InotifyChangeWatcher.open(repo_root)
+        if probe is None:
+            pytest.skip("inotify not available on this platform")
+        probe.close()
+        monkeypatch.setenv("OPENCODE_CHANGE_TRACKER", "inotify")
+    else:
+        monkeypatch.delenv("OPENCODE_CHANGE_TRACKER", raising=False)
+
+    (repo_root / "src").mkdir()
+    (repo_root / "docs").mkdir()
+    (repo_root / "src" / "service.py").write_text("x = 0\n", encoding="utf-8")
+    (repo_root / "src" / "untouched.py").write_text("y = 0\n", encoding="utf-8")
+    (repo_root / "docs" / "readme.md").write_text("# readme\n", encoding="utf-8")
+    (repo_root / ".gitignore").write_text("build/\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=str(repo_root), check=True)
+    subprocess.run(["git", "add", "-A"], cwd=str(repo_root), check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.invalid", "commit", "-q", "-m", "init"],
+        cwd=str(repo_root),
+        check=True,
+    )
+
+    execution_cmd = (
+        "python3 -c \"import os; from pathlib import Path; "
+        "Path('docs/readme.md').write_text('# readme\\n', encoding='utf-8'); "
+        "os.utime('src/untouched.py'); "
+        "Path('build').mkdir(); Path('build/out.log').write_text('log\\n', encoding='utf-8'); "
+        "Path('src/service.py').write_text('x = 1\\n', encoding='utf-8'); "
+        "Path('src/new_module.py').write_text('z = 1\\n', encoding='utf-8'); "
+        "print('{\\\"result\\\":\\\"ok\\\"}')\""
+    )
+
+    result = _ORIGINAL_RUN_LLM_EDIT_STEP(
+        repo_root=repo_root,
+        state={"phase": "6-PostFlight", "active_gate": "Workflow Complete"},
+        ticket_text="t",
+        task_text="task",
+        plan_text="plan",
+        required_hotspots=["src/service.py"],
+        pipeline_mode=True,
+        execution_binding=execution_cmd,
+    )
+
+    assert result["executor_invoked"] is True
+    assert result["changed_files"] == ["src/new_module.py", "src/service.py"]
+    assert result["change_stats"]["src/service.py"]["status"] == "modified"
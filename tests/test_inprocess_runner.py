@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import governance_runtime.entrypoints as entrypoints_pkg
+from governance_runtime.infrastructure.adapters.process.inprocess_runner import (
+    ISOLATION_ENV_KEY,
+    ExecutionContext,
+    InProcessRunner,
+    inprocess_enabled,
+    resolve_entry_module,
+)
+
+_PROBE = '''
+import json
+import os
+import sys
+
+IMPORTS = globals().get("IMPORTS", 0) + 1
+
+
+def main(env=None):
+    env = os.environ if env is None else env
+    mode = env.get("PROBE_MODE", "")
+    if mode == "raise":
+        raise RuntimeError("probe exploded")
+    if mode == "exit":
+        raise SystemExit(int(env.get("PROBE_RC", "0")))
+    print(json.dumps({
+        "argv": sys.argv[1:],
+        "cwd": os.getcwd(),
+        "marker": env.get("PROBE_MARKER"),
+        "unset_present": "PROBE_UNSET" in env,
+        "process_marker": os.environ.get("PROBE_MARKER"),
+        "imports": IMPORTS,
+    }))
+    print("probe-stderr", file=sys.stderr)
+    return int(env.get("PROBE_RC", "0"))
+'''
+
+_LEGACY_PROBE = '''
+import os
+
+
+def main():
+    print(os.environ.get("PROBE_MARKER"))
+    print("pid", os.getpid())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+'''
+
+
+@pytest.fixture
+def probe_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    probe_dir = tmp_path / "probe_pkg"
+    probe_dir.mkdir()
+    script = probe_dir / "_inprocess_probe.py"
+    script.write_text(_PROBE, encoding="utf-8")
+    monkeypatch.setattr(entrypoints_pkg, "__path__", [*entrypoints_pkg.__path__, str(probe_dir)])
+    monkeypatch.delitem(sys.modules, "governance_runtime.entrypoints._inprocess_probe", raising=False)
+    return script
+
+
+def test_resolve_entry_module_accepts_dash_m_governance_modules() -> None:
+    resolved = resolve_entry_module(["python", "-m", "governance_runtime.entrypoints.session_reader", "--x"])
+    assert resolved == ("governance_runtime.entrypoints.session_reader", ["--x"])
+
+
+def test_resolve_entry_module_rejects_foreign_modules_and_scripts(tmp_path: Path) -> None:
+    assert resolve_entry_module(["python", "-m", "json.tool"]) is None
+    foreign = tmp_path / "bootstrap_session_state.py"
+    foreign.write_text("", encoding="utf-8")
+    assert resolve_entry_module(["python", str(foreign)]) is None
+    assert resolve_entry_module(["git", "status"]) is None
+
+
+def test_resolve_entry_module_maps_script_backing_the_module(probe_module: Path) -> None:
+    resolved = resolve_entry_module(["py", "-3", str(probe_module), "--flag"])
+    assert resolved == ("governance_runtime.entrypoints._inprocess_probe", ["--flag"])
+
+
+def test_run_with_context_captures_stdout_and_passes_environment(
+    probe_module: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PROBE_UNSET", "1")
+    monkeypatch.delenv("PROBE_MARKER", raising=False)
+    cwd_before = os.getcwd()
+    argv_before = list(sys.argv)
+
+    result = InProcessRunner().run_with_context(
+        [sys.executable, str(probe_module), "--alpha"],
+        ExecutionContext(
+            env_overrides={"PROBE_MARKER": "m1", "PROBE_UNSET": None, "PROBE_RC": "3"},
+            cwd=tmp_path,
+        ),
+    )
+
+    assert result.returncode == 3
+    payload = json.loads(result.stdout.strip())
+    assert payload == {
+        "argv": ["--alpha"],
+        "cwd": str(tmp_path),
+        "marker": "m1",
+        "unset_present": False,
+        "process_marker": None,
+        "imports": 1,
+    }
+    assert result.stderr.strip() == "probe-stderr"
+    assert os.getcwd() == cwd_before
+    assert sys.argv == argv_before
+    assert "PROBE_MARKER" not in os.environ
+    assert os.environ["PROBE_UNSET"] == "1"
+
+
+def test_repeated_stages_reuse_the_imported_module(probe_module: Path) -> None:
+    runner = InProcessRunner()
+    markers = []
+    for marker in ("first", "second"):
+        result = runner.run_with_context(
+            [sys.executable, str(probe_module)],
+            ExecutionContext(env_overrides={"PROBE_MARKER": marker}),
+        )
+        payload = json.loads(result.stdout.strip())
+        assert payload["imports"] == 1
+        markers.append(payload["marker"])
+    assert markers == ["first", "second"]
+
+
+def test_base_env_is_inherited_by_nested_stages(probe_module: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PROBE_MARKER", raising=False)
+    runner = InProcessRunner(base_env={"PROBE_MARKER": "outer", "PROBE_RC": "0"})
+
+    result = runner.run_with_context([sys.executable, str(probe_module)], ExecutionContext())
+
+    assert json.loads(result.stdout.strip())["marker"] == "outer"
+
+
+def test_entrypoint_without_env_parameter_runs_as_subprocess(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    probe_dir = tmp_path / "legacy_pkg"
+    probe_dir.mkdir()
+    script = probe_dir / "_inprocess_legacy_probe.py"
+    script.write_text(_LEGACY_PROBE, encoding="utf-8")
+    monkeypatch.setattr(entrypoints_pkg, "__path__", [*entrypoints_pkg.__path__, str(probe_dir)])
+    monkeypatch.delitem(sys.modules, "governance_runtime.entrypoints._inprocess_legacy_probe", raising=False)
+
+    result = InProcessRunner().run_with_context(
+        [sys.executable, str(script)],
+        ExecutionContext(env_overrides={"PROBE_MARKER": "child"}),
+    )
+
+    marker, pid_line = result.stdout.strip().splitlines()
+    assert marker == "child"
+    assert pid_line != f"pid {os.getpid()}"
+    assert "PROBE_MARKER" not in os.environ
+
+
+def test_run_maps_system_exit_and_exceptions_to_returncodes(probe_module: Path) -> None:
+    runner = InProcessRunner()
+    exited = runner.run_with_context(
+        [sys.executable, str(probe_module)],
+        ExecutionContext(env_overrides={"PROBE_MODE": "exit", "PROBE_RC": "7"}),
+    )
+    assert exited.returncode == 7
+
+    crashed = runner.run_with_context(
+        [sys.executable, str(probe_module)],
+        ExecutionContext(env_overrides={"PROBE_MODE": "raise"}),
+    )
+    assert crashed.returncode == 1
+    assert "probe exploded" in crashed.stderr
+
+
+def test_port_run_translates_full_env_into_overrides(probe_module: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PROBE_UNSET", "1")
+    env = {key: value for key, value in os.environ.items() if key != "PROBE_UNSET"}
+    env["PROBE_MARKER"] = "from-env"
+
+    result = InProcessRunner().run([sys.executable, str(probe_module)], env)
+
+    payload = json.loads(result.stdout.strip())
+    assert payload["marker"] == "from-env"
+    assert payload["unset_present"] is False
+    assert os.environ["PROBE_UNSET"] == "1"
+
+
+def test_unresolvable_argv_falls_back_to_subprocess() -> None:
+    result = InProcessRunner().run_with_context(
+        [sys.executable, "-c", "import os; print(os.environ['PROBE_MARKER'])"],
+        ExecutionContext(env_overrides={"PROBE_MARKER": "child"}),
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "child"
+
+
+def test_inprocess_enabled_reads_isolation_flag() -> None:
+    assert inprocess_enabled({ISOLATION_ENV_KEY: "inprocess"}) is True
+    assert inprocess_enabled({ISOLATION_ENV_KEY: "process"}) is False
+    assert inprocess_enabled({}) is False
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import governance_runtime.install.install as installer
+
+from .util import read_text, run_install, sha256_file
+
+
+def _manifest(config_root: Path) -> dict:
+    return json.loads(read_text(config_root / "INSTALL_MANIFEST.json"))
+
+
+@pytest.mark.installer
+def test_batch_copy_skips_files_recorded_unchanged(tmp_path: Path):
+    src_dir = tmp_path / "src"
+    dst_dir = tmp_path / "dst"
+    src_dir.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (src_dir / name).write_text(f"content {name}\n", encoding="utf-8")
+    pairs = [(src_dir / name, dst_dir / name) for name in ("a.txt", "b.txt", "c.txt")]
+
+    first = installer.copy_files_with_optional_backup(
+        pairs, backup_enabled=False, backup_root=tmp_path / "bk", dry_run=False, overwrite=True
+    )
+    assert [entry["status"] for entry in first] == ["copied", "copied", "copied"]
+    assert [entry["sha256"] for entry in first] == [sha256_file(dst) for _, dst in pairs]
+
+    (src_dir / "b.txt").write_text("changed\n", encoding="utf-8")
+    previous = installer.ManifestHashIndex.from_manifest({"files": first})
+    second = installer.copy_files_with_optional_backup(
+        pairs,
+        backup_enabled=False,
+        backup_root=tmp_path / "bk",
+        dry_run=False,
+        overwrite=True,
+        previous=previous,
+    )
+    assert [entry["status"] for entry in second] == ["unchanged", "copied", "unchanged"]
+    assert read_text(dst_dir / "b.txt") == "changed\n"
+
+
+@pytest.mark.installer
+def test_manifest_index_requires_installed_copy_to_match(tmp_path: Path):
+    dst = tmp_path / "installed.txt"
+    dst.write_text("payload", encoding="utf-8")
+    digest = sha256_file(dst)
+    st = dst.stat()
+    index = installer.ManifestHashIndex.from_manifest(
+        {"files": [{"dst": str(dst), "sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}]}
+    )
+
+    assert index.unchanged(dst, digest) is True
+    assert index.unchanged(dst, "0" * 64) is False
+    dst.write_text("payload grown", encoding="utf-8")
+    assert index.unchanged(dst, digest) is False
+    dst.unlink()
+    assert index.unchanged(dst, digest) is False
+    assert index.missing() == [str(dst)]
+
+
+@pytest.mark.installer
+def test_manifest_index_rehashes_when_stat_signature_differs_or_is_missing(tmp_path: Path):
+    dst = tmp_path / "installed.txt"
+    dst.write_text("payload", encoding="utf-8")
+    digest = sha256_file(dst)
+    st = dst.stat()
+    recorded = {"dst": str(dst), "sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    legacy = installer.ManifestHashIndex.from_manifest({"files": [{"dst": str(dst), "sha256": digest}]})
+    index = installer.ManifestHashIndex.from_manifest({"files": [recorded]})
+
+    assert legacy.unchanged(dst, digest) is True
+    dst.write_text("PAYLOAD", encoding="utf-8")
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert legacy.unchanged(dst, digest) is False
+    assert index.unchanged(dst, digest) is False
+
+    dst.write_text("payload", encoding="utf-8")
+    assert index.unchanged(dst, digest) is True
+
+
+@pytest.mark.installer
+def test_batch_copy_keeps_repeated_destinations_sequential(tmp_path: Path):
+    src = tmp_path / "src.txt"
+    src.write_text("x", encoding="utf-8")
+    dst = tmp_path / "out" / "dst.txt"
+
+    entries = installer.copy_files_with_optional_backup(
+        [(src, dst), (src, dst)],
+        backup_enabled=False,
+        backup_root=tmp_path / "bk",
+        dry_run=False,
+        overwrite=False,
+        workers=4,
+    )
+    assert [entry["status"] for entry in entries] == ["copied", "skipped-exists"]
+
+
+@pytest.mark.installer
+def test_incremental_reinstall_skips_unchanged_payload(tmp_path: Path):
+    config_root = tmp_path / "opencode-config"
+    r = run_install(["--force", "--no-backup", "--config-root", str(config_root)])
+    assert r.returncode == 0, f"install failed:\n{r.stderr}\n{r.stdout}"
+    first = _manifest(config_root)
+
+    r = run_install(["--force", "--no-backup", "--incremental", "--config-root", str(config_root)])
+    assert r.returncode == 0, f"incremental install failed:\n{r.stderr}\n{r.stdout}"
+    second = _manifest(config_root)
+
+    statuses = {entry["status"] for entry in second["files"]}
+    assert "unchanged" in statuses
+    assert {entry["dst"] for entry in second["files"]} == {entry["dst"] for entry in first["files"]}
+    local_runtime = [e for e in second["files"] if e.get("rel_base") == "local"]
+    assert local_runtime and all(e["status"] == "unchanged" for e in local_runtime)
+    for entry in local_runtime[:50]:
+        assert entry["sha256"] == sha256_file(Path(entry["dst"]))
+
+    r = run_install(["--status", "--config-root", str(config_root)])
+    assert r.returncode == 0, f"status failed:\n{r.stderr}\n{r.stdout}"
+    assert "Missing Installed Files" not in r.stdout
+
+    r = run_install(["--uninstall", "--force", "--config-root", str(config_root)])
+    assert r.returncode == 0, f"uninstall failed:\n{r.stderr}\n{r.stdout}"
+    assert not (config_root / "INSTALL_MANIFEST.json").exists()
+    assert not any(Path(e["dst"]).exists() for e in local_runtime)
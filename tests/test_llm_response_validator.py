@@ -16,6 +16,7 @@ Test categories:
 
 from __future__ import annotations
 
+import copy
 import json
 import sys
 from pathlib import Path
@@ -24,7 +25,11 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "governance_runtime" / "application" / "validators"))
 from llm_response_validator import (
+    SchemaValidatorRegistry,
+    _validate_without_library,
+    default_validator_registry,
     validate_developer_response,
+    validate_response_batch,
     validate_review_response,
 )
 
@@ -364,3 +369,64 @@ class TestEdgeCases:
         }
         r = validate_developer_response(data, MANDATES_SCHEMA)
         assert r.valid is True
+
+
+# ============================================================================
+# 7. Compiled validator registry and batch validation
+# ============================================================================
+
+
+class TestValidatorRegistry:
+    def test_schema_compiled_once_per_content(self):
+        registry = SchemaValidatorRegistry()
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}, "required": ["a"]}
+        first = registry.compile(schema)
+        assert registry.compile(schema) is first
+        assert registry.compile(copy.deepcopy(schema)) is first
+        assert registry.compilations == 1
+        assert first.validate({"a": "x"}) == []
+        assert first.validate({"a": 1}) != []
+
+    @pytest.mark.skipif(MANDATES_SCHEMA is None, reason="mandates schema missing")
+    def test_repeated_validation_reuses_default_registry(self):
+        registry = default_validator_registry()
+        validate_review_response(VALID_APPROVE, MANDATES_SCHEMA)
+        compilations = registry.compilations
+        for _ in range(5):
+            assert validate_review_response(VALID_APPROVE, MANDATES_SCHEMA).valid is True
+        assert registry.compilations == compilations
+
+    def test_fallback_tree_reports_nested_errors(self):
+        schema = {
+            "type": "object",
+            "required": ["name", "items"],
+            "properties": {
+                "name": {"type": "string", "minLength": 3},
+                "kind": {"type": "string", "enum": ["a", "b"]},
+                "items": {"type": "array", "items": {"type": "number"}},
+            },
+        }
+        errors = _validate_without_library({"name": "ab", "kind": "c", "items": [1, "x"]}, schema)
+        assert errors == [
+            "$root.name: string too short (min 3, got 2)",
+            "$root.kind: value 'c' not in allowed set ['a', 'b']",
+            "$root.items[1]: expected number, got str",
+        ]
+        assert _validate_without_library({}, schema) == [
+            "$root.name: required field missing",
+            "$root.items: required field missing",
+        ]
+
+
+class TestValidateResponseBatch:
+    def test_batch_matches_individual_results_in_order(self):
+        bad = dict(VALID_APPROVE)
+        bad["findings"] = [{"severity": "high", "type": "defect"}]
+        batch = validate_response_batch("review", [VALID_APPROVE, bad, "text"], MANDATES_SCHEMA)
+        individual = [validate_review_response(item, MANDATES_SCHEMA) for item in (VALID_APPROVE, bad, "text")]
+        assert [r.valid for r in batch] == [r.valid for r in individual] == [True, False, False]
+        assert [r.raw_violations for r in batch] == [r.raw_violations for r in individual]
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError):
+            validate_response_batch("summary", [])
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.infrastructure.adapters.logging import log_segments
+from governance_runtime.infrastructure.adapters.logging.event_sink import write_jsonl_event
+from governance_runtime.infrastructure.json_store import append_jsonl
+
+
+def _event(i: int, run_id: str = "run-a") -> dict[str, object]:
+    return {"event": f"E{i:03d}", "ts_utc": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z", "run_id": run_id}
+
+
+def _fill(path: Path, count: int, *, run_id: str = "run-a", start: int = 0) -> None:
+    for i in range(start, start + count):
+        write_jsonl_event(path, _event(i, run_id), append=True)
+
+
+@pytest.fixture
+def small_segments(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(log_segments.SEGMENT_MAX_BYTES_ENV, "400")
+
+
+def test_active_log_rolls_into_gzipped_indexed_segments(tmp_path: Path, small_segments: None) -> None:
+    path = tmp_path / "logs" / "events.jsonl"
+    _fill(path, 30)
+
+    index = log_segments.load_segment_index(path)
+    assert len(index) >= 3
+    assert [entry["seq"] for entry in index] == list(range(1, len(index) + 1))
+    first = index[0]
+    assert first["segment"] == "events.000001.jsonl.gz"
+    assert first["first_ts"] == "2026-01-01T00:00:00Z"
+    assert first["run_ids"] == ["run-a"]
+    assert first["prev_chain"] == log_segments.GENESIS_HASH
+    assert index[1]["prev_chain"] == first["chain"]
+    with gzip.open(path.parent / "segments" / first["segment"], "rt", encoding="utf-8") as handle:
+        assert sum(1 for _ in handle) == first["events"]
+
+    events = list(log_segments.read_log_events(path))
+    assert [event["event"] for event in events] == [f"E{i:03d}" for i in range(30)]
+    assert log_segments.verify_segment_chain(path) == []
+
+
+def test_non_log_jsonl_files_are_never_rotated(tmp_path: Path, small_segments: None) -> None:
+    path = tmp_path / "custom.jsonl"
+    _fill(path, 30)
+    assert not (tmp_path / "segments").exists()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 30
+
+
+def test_window_reads_only_overlapping_segments(tmp_path: Path, small_segments: None, monkeypatch) -> None:
+    path = tmp_path / "logs" / "events.jsonl"
+    _fill(path, 20, run_id="run-a")
+    _fill(path, 20, run_id="run-b", start=20)
+    index = log_segments.load_segment_index(path)
+
+    opened: list[str] = []
+    original = log_segments._iter_file_events
+
+    def _spy(source: Path):
+        opened.append(source.name)
+        return original(source)
+
+    monkeypatch.setattr(log_segments, "_iter_file_events", _spy)
+    events = list(log_segments.read_log_events(path, run_id="run-b"))
+
+    assert [event["event"] for event in events] == [f"E{i:03d}" for i in range(20, 40)]
+    skipped = [entry["segment"] for entry in index if entry["run_ids"] == ["run-a"]]
+    assert skipped and not set(skipped) & set(opened)
+
+    opened.clear()
+    late = list(log_segments.read_log_events(path, since="2026-01-01T00:00:35Z"))
+    assert [event["event"] for event in late] == [f"E{i:03d}" for i in range(35, 40)]
+    assert len(opened) < len(index) + 1
+
+
+def test_tail_opens_newest_segments_only(tmp_path: Path, small_segments: None, monkeypatch) -> None:
+    path = tmp_path / "logs" / "events.jsonl"
+    _fill(path, 40)
+    opened: list[str] = []
+    original = log_segments._iter_file_events
+    monkeypatch.setattr(log_segments, "_iter_file_events", lambda source: (opened.append(source.name), original(source))[1])
+
+    tail = log_segments.tail_log_events(path, 3)
+
+    assert [event["event"] for event in tail] == ["E037", "E038", "E039"]
+    assert len(opened) <= 2
+
+
+def test_tampered_segment_breaks_hash_chain(tmp_path: Path, small_segments: None) -> None:
+    path = tmp_path / "logs" / "flow.log.jsonl"
+    _fill(path, 20)
+    first = log_segments.load_segment_index(path)[0]
+    segment = path.parent / "segments" / first["segment"]
+    with gzip.open(segment, "wb") as handle:
+        handle.write(json.dumps(_event(999)).encode("utf-8") + b"\n")
+
+    assert log_segments.verify_segment_chain(path) == [f"segment-hash-mismatch:{first['segment']}"]
+
+
+def test_append_jsonl_rotates_and_writer_reopens_after_rotation(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv(log_segments.SEGMENT_MAX_BYTES_ENV, "0")
+    path = tmp_path / "logs" / "events.jsonl"
+    for i in range(10):
+        append_jsonl(path, _event(i))
+    stale = path.open("a+", encoding="utf-8")
+    entry = log_segments.rotate_if_needed(path, max_bytes=1, compress=False)
+    assert entry is not None and entry["segment"] == "events.000001.jsonl"
+    assert log_segments.handle_is_stale(stale, path) is True
+    stale.close()
+
+    append_jsonl(path, _event(10))
+    assert [json.loads(line)["event"] for line in path.read_text(encoding="utf-8").splitlines()] == ["E010"]
+    assert len(list(log_segments.read_log_events(path))) == 11
+
+
+@pytest.mark.parametrize("crash_point", ["_seal_segment", "_write_index"])
+def test_rotation_recovers_segment_orphaned_by_crash(tmp_path: Path, monkeypatch, crash_point: str) -> None:
+    monkeypatch.setenv(log_segments.SEGMENT_MAX_BYTES_ENV, "0")
+    path = tmp_path / "logs" / "events.jsonl"
+    for i in range(5):
+        append_jsonl(path, _event(i))
+    assert log_segments.rotate_if_needed(path, max_bytes=1) is not None
+
+    for i in range(5, 10):
+        append_jsonl(path, _event(i))
+    original = getattr(log_segments, crash_point)
+
+    def crash(*args, **kwargs):
+        raise OSError("simulated crash")
+
+    monkeypatch.setattr(log_segments, crash_point, crash)
+    with pytest.raises(OSError):
+        log_segments.rotate_if_needed(path, max_bytes=1)
+    monkeypatch.setattr(log_segments, crash_point, original)
+    assert [entry["seq"] for entry in log_segments.load_segment_index(path)] == [1]
+
+    for i in range(10, 15):
+        append_jsonl(path, _event(i))
+    entry = log_segments.rotate_if_needed(path, max_bytes=1)
+
+    assert entry is not None and entry["seq"] == 3
+    index = log_segments.load_segment_index(path)
+    assert [item["seq"] for item in index] == [1, 2, 3]
+    assert sorted(p.name for p in (path.parent / "segments").glob("events.*.jsonl*")) == [
+        "events.000001.jsonl.gz",
+        "events.000002.jsonl.gz",
+        "events.000003.jsonl.gz",
+    ]
+    assert [event["event"] for event in log_segments.read_log_events(path)] == [f"E{i:03d}" for i in range(15)]
+    assert log_segments.verify_segment_chain(path) == []
@@ -40,3 +40,94 @@ def test_md_lint_runs_in_ci_mode_and_reports_json():
     payload = json.loads(proc.stdout or "{}")
     assert "files_checked" in payload
     assert "findings_count" in payload
+
+
+def _reference_findings(path: Path) -> list[tuple[str, int, int, str]]:
+    """Straightforward rule -> line -> pattern evaluation used as oracle."""
+
+    import re
+
+    from governance_runtime.entrypoints import md_lint
+
+    text = md_lint.remove_html_comments(md_lint.remove_fenced_blocks(path.read_text(encoding="utf-8")))
+    out: list[tuple[str, int, int, str]] = []
+    lines = text.split("\n")
+    for rule in md_lint.RULES:
+        for idx, line in enumerate(lines):
+            for pattern in rule.patterns:
+                match = re.search(pattern, line, re.IGNORECASE)
+                if not match:
+                    continue
+                if any(re.search(exc, line, re.IGNORECASE) for exc in rule.exceptions):
+                    continue
+                out.append((rule.rule_id, idx + 1, match.start() + 1, match.group()))
+    return out
+
+
+_SAMPLE_MD = """# Sample
+
+Then retry until success and keep going.
+The workflow must execute phase 2 and must route to the next step.
+Output must include the summary.
+TRIGGER: something
+```
+must execute inside fence
+```
+Mode = BLOCKED and host executes the script.
+"""
+
+
+@pytest.mark.governance
+def test_md_lint_compiled_engine_matches_reference_order(tmp_path: Path):
+    from governance_runtime.entrypoints import md_lint
+
+    sample = tmp_path / "sample.md"
+    sample.write_text(_SAMPLE_MD, encoding="utf-8")
+    findings = md_lint.lint_file(sample)
+
+    assert findings
+    assert [(f.rule_id, f.line, f.column, f.match) for f in findings] == _reference_findings(sample)
+
+
+@pytest.mark.governance
+def test_md_lint_cache_reuses_unchanged_files_and_invalidates_on_edit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    from governance_runtime.entrypoints import md_lint
+
+    sample = tmp_path / "doc.md"
+    sample.write_text(_SAMPLE_MD, encoding="utf-8")
+    cache_path = tmp_path / "cache.json"
+    digest = md_lint.ruleset_hash(md_lint.RULES)
+
+    first = md_lint.lint_files([sample], cache=md_lint.LintCache(cache_path, digest))
+    assert cache_path.exists()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("cached file must not be re-linted")
+
+    monkeypatch.setattr(md_lint, "lint_text", _fail)
+    second = md_lint.lint_files([sample], cache=md_lint.LintCache(cache_path, digest))
+    assert second == first
+    monkeypatch.undo()
+
+    sample.write_text("Nothing to see here.\n", encoding="utf-8")
+    third = md_lint.lint_files([sample], cache=md_lint.LintCache(cache_path, digest))
+    assert third == []
+
+    stale = md_lint.LintCache(cache_path, "other-ruleset")
+    assert stale.get(sample) is None
+
+
+@pytest.mark.governance
+def test_md_lint_parallel_jobs_and_discovery_preserve_output(tmp_path: Path):
+    from governance_runtime.entrypoints import md_lint
+
+    for name in ("a", "b", "c"):
+        (tmp_path / "docs" / name).mkdir(parents=True)
+        (tmp_path / "docs" / name / f"{name}.md").write_text(_SAMPLE_MD, encoding="utf-8")
+    (tmp_path / "skip" / "deep").mkdir(parents=True)
+    (tmp_path / "skip" / "deep" / "x.md").write_text(_SAMPLE_MD, encoding="utf-8")
+
+    files = md_lint.discover_md_files(tmp_path, exclude=["skip"])
+    assert files == sorted(p for p in tmp_path.rglob("*.md") if "skip" not in str(p.relative_to(tmp_path)))
+
+    assert md_lint.lint_files(files, jobs=2) == md_lint.lint_files(files)
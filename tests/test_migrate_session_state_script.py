@@ -107,3 +107,80 @@ def test_script_returns_blocked_for_malformed_json(tmp_path: Path):
     payload = json.loads(result.stdout)
     assert result.returncode == 2
     assert payload["status"] == "blocked"
+
+
+def _write_workspace(workspaces: Path, name: str, document: dict[str, object]) -> Path:
+    target = workspaces / name / "SESSION_STATE.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(document), encoding="utf-8")
+    return target
+
+
+@pytest.mark.governance
+def test_bulk_dry_run_reports_summary_without_writing(tmp_path: Path):
+    """--all --dry-run should classify every workspace and leave files and ledger untouched."""
+
+    workspaces = tmp_path / "workspaces"
+    legacy = _write_workspace(workspaces, "repo-a", _legacy_document())
+    before = legacy.read_text(encoding="utf-8")
+
+    result = _run(["--all", "--dry-run", "--workspaces-root", str(workspaces)])
+    summary = json.loads(result.stdout)
+
+    assert result.returncode == 0
+    assert summary["dry_run"] is True
+    assert summary["counts"]["would_migrate"] == 1
+    assert legacy.read_text(encoding="utf-8") == before
+    assert not (workspaces / ".session-state-migration.jsonl").exists()
+
+
+@pytest.mark.governance
+def test_bulk_migration_is_parallel_and_resumable(tmp_path: Path):
+    """--all should migrate every workspace, record a ledger and skip done files on rerun."""
+
+    workspaces = tmp_path / "workspaces"
+    targets = [_write_workspace(workspaces, f"repo-{index}", _legacy_document()) for index in range(3)]
+
+    first = _run(["--all", "--jobs", "2", "--workspaces-root", str(workspaces)])
+    summary = json.loads(first.stdout)
+    assert first.returncode == 0
+    assert summary["counts"]["migrated"] == 3
+    for target in targets:
+        assert "RepoModel" not in json.loads(target.read_text(encoding="utf-8"))["SESSION_STATE"]
+        assert target.with_suffix(".json.backup").exists()
+
+    ledger = workspaces / ".session-state-migration.jsonl"
+    entries = [json.loads(line) for line in ledger.read_text(encoding="utf-8").splitlines()]
+    assert {entry["path"] for entry in entries} == {str(target) for target in targets}
+    assert all(entry["pre_hash"] != entry["post_hash"] for entry in entries)
+
+    second = _run(["--all", "--workspaces-root", str(workspaces)])
+    assert json.loads(second.stdout)["counts"] == {"skipped": 3}
+    assert len(ledger.read_text(encoding="utf-8").splitlines()) == 3
+
+
+@pytest.mark.governance
+def test_bulk_migration_honours_workspace_lock(tmp_path: Path):
+    """A workspace held by a live session is reported as locked and retried next run."""
+
+    workspaces = tmp_path / "workspaces"
+    target = _write_workspace(workspaces, "repo-live", _legacy_document())
+    lock_dir = workspaces / "repo-live" / ".lock"
+    lock_dir.mkdir()
+    (lock_dir / "owner.json").write_text(
+        json.dumps({"lock_id": "live", "pid": 1, "acquired_at": "2999-01-01T00:00:00+00:00"}),
+        encoding="utf-8",
+    )
+    before = target.read_text(encoding="utf-8")
+
+    locked = _run(["--all", "--lock-timeout", "0", "--workspaces-root", str(workspaces)])
+    summary = json.loads(locked.stdout)
+    assert locked.returncode == 2
+    assert summary["counts"]["locked"] == 1
+    assert target.read_text(encoding="utf-8") == before
+
+    (lock_dir / "owner.json").unlink()
+    lock_dir.rmdir()
+    retried = _run(["--all", "--workspaces-root", str(workspaces)])
+    assert retried.returncode == 0
+    assert json.loads(retried.stdout)["counts"]["migrated"] == 1
@@ -406,3 +406,20 @@ class TestNewWorkSessionEntrypoint:
         assert (workspace / "decision-pack.md").exists()
         assert (workspace / "notes.tmp").exists()
         assert (run_dir(workspace.parent, workspace.name, "run-old-001") / "run-manifest.json").is_file()
+
+
+def test_archive_enqueues_governance_job_instead_of_running_pipeline(
+    short_tmp: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    config_root, session_path, _ = _setup_workspace(short_tmp)
+    monkeypatch.setenv("OPENCODE_CONFIG_ROOT", str(config_root))
+
+    assert new_work_session.main(["--trigger-source", "cli", "--session-id", "sess-q", "--reason", "next", "--quiet"]) == 0
+    capsys.readouterr()
+
+    jobs = list((session_path.parent / "governance-jobs").glob("*.json"))
+    assert [path.name for path in jobs] == ["run-old-001--v1.json"]
+    job = json.loads(jobs[0].read_text(encoding="utf-8"))
+    assert job["status"] == "pending"
+    assert job["params"]["archive_path"] == str(_run_archive_dir(session_path, "run-old-001"))
+    assert not (_run_archive_dir(session_path, "run-old-001") / "governance-summary.json").exists()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.entrypoints import session_reader
+from governance_runtime.infrastructure import perf_profile
+from governance_runtime.infrastructure.json_store import append_jsonl, load_json, write_json_atomic
+from governance_runtime.shared import perf_trace
+
+
+@pytest.fixture(autouse=True)
+def _no_active_recorder():
+    perf_trace.deactivate()
+    yield
+    perf_trace.deactivate()
+
+
+def test_disabled_tracing_is_a_pass_through() -> None:
+    calls: list[int] = []
+
+    @perf_trace.traced("unit.work")
+    def work(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    assert perf_trace.span("unit.block") is perf_trace.span("other.block")
+    with perf_trace.span("unit.block"):
+        assert work(3) == 6
+    perf_trace.count_read(10)
+    perf_trace.count_parse("json")
+    assert calls == [3]
+    assert perf_trace.active_recorder() is None
+
+
+def test_spans_nest_aggregate_and_attribute_counters(tmp_path: Path) -> None:
+    @perf_trace.traced("gate.sample")
+    def gate() -> None:
+        load_json(tmp_path / "state.json")
+
+    write_json_atomic(tmp_path / "state.json", {"a": 1})
+    recorder = perf_trace.activate("unit")
+    with perf_trace.span("kernel.execute"):
+        for _ in range(3):
+            gate()
+        append_jsonl(tmp_path / "events.jsonl", {"event": "x"})
+        with perf_trace.subprocess_span("executor"):
+            pass
+    perf_trace.deactivate()
+
+    record = recorder.to_record()
+    assert record["schema"] == perf_trace.PERF_RECORD_SCHEMA
+    counters = record["counters"]
+    assert counters["file_reads"] == 3
+    assert counters["json_parses"] == 3
+    assert counters["file_writes"] == 1
+    assert counters["subprocesses"] == 1
+    (kernel,) = record["spans"]
+    assert kernel["name"] == "kernel.execute" and kernel["calls"] == 1
+    gate_node, executor = kernel["children"]
+    assert gate_node["name"] == "gate.sample" and gate_node["calls"] == 3
+    assert gate_node["counters"]["json_parses"] == 3
+    assert executor["counters"]["subprocesses"] == 1
+    assert kernel["counters"]["file_writes"] == 1
+
+
+def test_run_profiled_appends_record_and_summary_aggregates(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+
+    def command() -> int:
+        with perf_trace.span("kernel.load_phase_api"):
+            perf_trace.count_parse("yaml")
+        return 0
+
+    assert perf_profile.run_profiled("unit", command, env={}, workspace_dir=workspace) == 0
+    assert not perf_profile.perf_log_path(workspace).exists()
+
+    env = {perf_profile.PROFILE_ENV: "1"}
+    for _ in range(2):
+        assert perf_profile.run_profiled("unit", command, env=env, workspace_dir=workspace) == 0
+    rows = [json.loads(line) for line in perf_profile.perf_log_path(workspace).read_text(encoding="utf-8").splitlines()]
+    assert [row["exit_code"] for row in rows] == [0, 0]
+
+    summary = perf_profile.summarize_perf_log(workspace, last=5)
+    assert summary["records"] == 2
+    assert summary["commands"]["unit"]["runs"] == 2
+    assert summary["counters"]["yaml_parses"] == 2
+    assert summary["hot_spans"][0]["name"] == "kernel.load_phase_api"
+    assert summary["hot_spans"][0]["calls"] == 2
+    assert perf_trace.active_recorder() is None
+
+
+def test_session_reader_perf_summary(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    config_root = tmp_path / "config_root"
+    (config_root / "commands").mkdir(parents=True)
+    workspace = config_root / "workspaces" / "abc123"
+    workspace.mkdir(parents=True)
+    (workspace / "SESSION_STATE.json").write_text(json.dumps({"SESSION_STATE": {}}), encoding="utf-8")
+    (config_root / "SESSION_STATE.json").write_text(
+        json.dumps(
+            {
+                "schema": session_reader.POINTER_SCHEMA,
+                "activeSessionStateFile": str(workspace / "SESSION_STATE.json"),
+            }
+        ),
+        encoding="utf-8",
+    )
+    env = {perf_profile.PROFILE_ENV: "1"}
+    for name in ("a", "b", "b"):
+        perf_profile.run_profiled(name, lambda: 0, env=env, workspace_dir=workspace)
+
+    rc = session_reader.main(
+        ["--commands-home", str(config_root / "commands"), "--perf-summary", "--tail-count", "2"]
+    )
+
+    assert rc == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["records"] == 2
+    assert list(payload["commands"]) == ["b"]
+    assert payload["commands"]["b"]["runs"] == 2
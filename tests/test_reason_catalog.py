@@ -0,0 +1,129 @@
+"""Tests for the compiled blocked-reason catalog."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.infrastructure import reason_catalog
+from governance_runtime.infrastructure.reason_catalog import (
+    COMPILED_FILENAME,
+    catalog_path_for_runtime_home,
+    clear_reason_catalog_cache,
+    load_reason_catalog,
+    write_compiled_reason_catalog,
+)
+
+REPO_ROOT = Path(__file__).absolute().parents[1]
+SOURCE_CATALOG = REPO_ROOT / "governance_runtime" / "assets" / "config" / "blocked_reason_catalog.yaml"
+
+
+@pytest.fixture()
+def catalog_path(tmp_path: Path) -> Path:
+    clear_reason_catalog_cache()
+    target = tmp_path / "governance_runtime" / "assets" / "config" / "blocked_reason_catalog.yaml"
+    target.parent.mkdir(parents=True)
+    shutil.copyfile(SOURCE_CATALOG, target)
+    yield target
+    clear_reason_catalog_cache()
+
+
+@pytest.mark.governance
+def test_compiled_catalog_exposes_remediation_and_schema(catalog_path: Path):
+    catalog = load_reason_catalog(catalog_path)
+    assert catalog is not None
+
+    entry = catalog.get("BLOCKED-BOOTSTRAP-NOT-SATISFIED")
+    assert entry is not None
+    assert entry.next_command_pointer == "opencode-governance-bootstrap"
+    assert entry.schema_ref == "governance_runtime/assets/schemas/reason_payload_blocked_core.v1.json"
+    assert catalog.remediation("BLOCKED-BOOTSTRAP-NOT-SATISFIED") == {
+        "summary": "Bootstrap not satisfied. Please restate bootstrap declaration.",
+        "how_to_fix": "Restate the bootstrap declaration explicitly",
+        "copy_paste_command": "opencode-governance-bootstrap",
+        "docs_link": None,
+    }
+    assert catalog.remediation("UNKNOWN-CODE")["summary"] == "UNKNOWN-CODE"
+    with pytest.raises(TypeError):
+        catalog.entries["X"] = entry  # type: ignore[index]
+
+
+@pytest.mark.governance
+def test_catalog_is_parsed_once_per_content_hash(catalog_path: Path, monkeypatch: pytest.MonkeyPatch):
+    calls: list[int] = []
+    real_safe_load = reason_catalog.yaml.safe_load
+    monkeypatch.setattr(reason_catalog.yaml, "safe_load", lambda text: calls.append(1) or real_safe_load(text))
+
+    first = load_reason_catalog(catalog_path)
+    assert load_reason_catalog(catalog_path) is first
+    copy = catalog_path.with_name("copy.yaml")
+    shutil.copyfile(catalog_path, copy)
+    assert load_reason_catalog(copy) is first
+    assert calls == [1]
+
+    catalog_path.write_text(catalog_path.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    edited = load_reason_catalog(catalog_path)
+    assert edited is not first and edited.content_hash != first.content_hash
+    assert calls == [1, 1]
+
+
+@pytest.mark.governance
+def test_precompiled_artifact_skips_yaml_until_catalog_changes(catalog_path: Path, monkeypatch: pytest.MonkeyPatch):
+    out_path = write_compiled_reason_catalog(catalog_path)
+    assert out_path == catalog_path.parent / COMPILED_FILENAME
+    document = json.loads(out_path.read_text(encoding="utf-8"))
+    expected = load_reason_catalog(catalog_path)
+    assert document["source_sha256"] == expected.content_hash
+
+    clear_reason_catalog_cache()
+    monkeypatch.setattr(reason_catalog.yaml, "safe_load", lambda text: pytest.fail("YAML parsed"))
+    assert load_reason_catalog(catalog_path) == expected
+
+    clear_reason_catalog_cache()
+    catalog_path.write_text(catalog_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    with pytest.raises(pytest.fail.Exception):
+        load_reason_catalog(catalog_path)
+
+
+@pytest.mark.governance
+def test_catalog_path_prefers_assets_config(catalog_path: Path, tmp_path: Path):
+    runtime_home = tmp_path / "governance_runtime"
+    assert catalog_path_for_runtime_home(runtime_home) == catalog_path
+    assert catalog_path_for_runtime_home(tmp_path / "missing") is None
+
+
+@pytest.mark.installer
+def test_installer_emits_compiled_catalog_manifest_entry(catalog_path: Path, tmp_path: Path):
+    import governance_runtime.install.install as installer
+
+    helper = tmp_path / "governance_runtime" / "infrastructure" / "reason_catalog.py"
+    helper.parent.mkdir(parents=True)
+    shutil.copyfile(Path(reason_catalog.__file__), helper)
+
+    first = installer.emit_compiled_reason_catalog(tmp_path)
+    assert first is not None
+    assert first["status"] == "copied"
+    assert first["rel"] == "governance_runtime/assets/config/" + COMPILED_FILENAME
+    assert Path(first["dst"]).is_file()
+
+    second = installer.emit_compiled_reason_catalog(tmp_path)
+    assert second is not None and second["status"] == "unchanged"
+    assert installer.emit_compiled_reason_catalog(tmp_path / "missing") is None
+
+
+@pytest.mark.installer
+def test_installer_reports_expected_compile_failures_and_raises_others(catalog_path: Path, tmp_path: Path, capsys):
+    import governance_runtime.install.install as installer
+
+    helper = tmp_path / "governance_runtime" / "infrastructure" / "reason_catalog.py"
+    helper.parent.mkdir(parents=True)
+    helper.write_text("def write_compiled_reason_catalog(path):\n    raise OSError('disk full')\n", encoding="utf-8")
+    assert installer.emit_compiled_reason_catalog(tmp_path) is None
+    assert "OSError: disk full" in capsys.readouterr().out
+
+    helper.write_text("def write_compiled_reason_catalog(path):\n    raise KeyError('bug')\n", encoding="utf-8")
+    with pytest.raises(KeyError):
+        installer.emit_compiled_reason_catalog(tmp_path)
@@ -10,9 +10,15 @@ import hashlib
 import pytest
 
 from governance_runtime.domain.classification import (
+    DEFAULT_CLASSIFICATION,
+    FIELD_CLASSIFICATIONS,
     ClassificationLevel,
+    FieldClassification,
     RedactionStrategy,
+    compile_classification_trie,
 )
+from governance_runtime.engine.sanitization import sanitize_for_output
+from governance_runtime.infrastructure import redaction as redaction_module
 from governance_runtime.infrastructure.redaction import (
     apply_redaction,
     redact_document,
@@ -315,3 +321,82 @@ class TestRedactDocumentBad:
         redact_document("metadata.json", original,
                         max_level=ClassificationLevel.PUBLIC)
         assert original == doc_copy
+
+
+# ===================================================================
+# Classification trie / single-pass export redaction
+# ===================================================================
+
+_RANK = {"public": 0, "internal": 1, "confidential": 2, "restricted": 3}
+
+
+def _reference_redact(catalog, artifact, document, max_level, override=None, prefix=""):
+    """Per-key lookup semantics the trie walk must reproduce."""
+    result = {}
+    for key, value in document.items():
+        path = f"{prefix}.{key}" if prefix else key
+        classification = catalog.get(f"{artifact}::{path}", DEFAULT_CLASSIFICATION)
+        if _RANK[classification.level.value] > _RANK[max_level.value]:
+            result[key] = apply_redaction(value, override or classification.redaction)
+        elif isinstance(value, dict):
+            result[key] = _reference_redact(catalog, artifact, value, max_level, override, path)
+        else:
+            result[key] = value
+    return result
+
+
+_NESTED_CATALOG = {
+    **FIELD_CLASSIFICATIONS,
+    "metadata.json::review.reviewer": FieldClassification(
+        field_path="review.reviewer", artifact="metadata.json",
+        level=ClassificationLevel.CONFIDENTIAL, redaction=RedactionStrategy.MASK,
+        description="nested test field",
+    ),
+    "metadata.json::review.summary.public_note": FieldClassification(
+        field_path="review.summary.public_note", artifact="metadata.json",
+        level=ClassificationLevel.PUBLIC, redaction=RedactionStrategy.NONE,
+        description="nested public test field",
+    ),
+}
+
+_NESTED_DOC = {
+    "snapshot_digest": "sha256:abc",
+    "failure_reason": "disk full at /home/dev/repo",
+    "review": {
+        "reviewer": "alice@example.com",
+        "summary": {"public_note": "ok", "private_note": "secret plan"},
+        "api_token": {"value": "t0k3n"},
+    },
+    "unclassified": {"deep": {"deeper": ["x", {"y": "https://u:p@host/x"}]}},
+    "items": [1, 2, 3],
+}
+
+
+class TestClassificationTrie:
+    """The trie walk is output-identical to per-key classification."""
+
+    @pytest.mark.parametrize("max_level", list(ClassificationLevel))
+    @pytest.mark.parametrize("override", [None, RedactionStrategy.REMOVE])
+    def test_nested_redaction_matches_per_key_lookup(self, monkeypatch, max_level, override):
+        monkeypatch.setattr(redaction_module, "CLASSIFICATION_TRIE", compile_classification_trie(_NESTED_CATALOG))
+        expected = _reference_redact(_NESTED_CATALOG, "metadata.json", _NESTED_DOC, max_level, override)
+        assert redact_document(
+            "metadata.json", _NESTED_DOC, max_level=max_level, override_strategy=override
+        ) == expected
+
+    @pytest.mark.parametrize("max_level", list(ClassificationLevel))
+    def test_single_pass_export_matches_sanitize_then_redact(self, monkeypatch, max_level):
+        monkeypatch.setattr(redaction_module, "CLASSIFICATION_TRIE", compile_classification_trie(_NESTED_CATALOG))
+        for artifact in ("metadata.json", "SESSION_STATE.json", "unknown.json"):
+            expected = redact_document(artifact, sanitize_for_output(_NESTED_DOC), max_level=max_level)
+            assert redaction_module.sanitize_and_redact_document(
+                artifact, _NESTED_DOC, max_level=max_level
+            ) == expected
+
+    def test_trie_only_holds_catalogued_paths(self):
+        trie = compile_classification_trie(_NESTED_CATALOG)
+        review = trie["metadata.json"].children["review"]
+        assert review.classification is None
+        assert set(review.children) == {"reviewer", "summary"}
+        assert review.children["summary"].children["public_note"].classification.level == ClassificationLevel.PUBLIC
+        assert "unclassified" not in trie["metadata.json"].children
@@ -0,0 +1,102 @@
+"""Tests for the shared guard file index and the combined guard runner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.repo_file_index import INDEX_CACHE_FILENAME, RepoFileIndex
+from scripts.repo_hygiene_guard import collect_hygiene_issues
+from scripts.run_repo_guards import run_guards
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.mark.governance
+def test_index_walks_once_prunes_git_and_filters_like_rglob(tmp_path: Path):
+    _write(tmp_path / "governance_runtime" / "a.py", "print('a')\r\n")
+    _write(tmp_path / "governance_runtime" / "__pycache__" / "a.cpython-311.pyc", "x")
+    _write(tmp_path / "governance_content" / "node_modules" / "pkg" / "README.md", "vendored")
+    _write(tmp_path / "governance_content" / "docs" / "guide.md", "guide")
+    _write(tmp_path / ".git" / "HEAD", "ref: refs/heads/main")
+
+    index = RepoFileIndex.build(tmp_path, cache_path=False)
+
+    assert [entry.rel for entry in index.files] == [
+        "governance_content/docs/guide.md",
+        "governance_content/node_modules/pkg/README.md",
+        "governance_runtime/a.py",
+    ]
+    assert [entry.rel for entry in index.select(suffixes={".md"}, skip_dirs={"node_modules"})] == [
+        "governance_content/docs/guide.md"
+    ]
+    assert index.select(roots=("governance_runtime",), names={"a.py"})[0].size == len("print('a')\r\n")
+    assert index.read_text("governance_runtime/a.py") == "print('a')\n"
+    assert "governance_content/docs" in index.select_dirs(roots=("governance_content",))
+
+
+@pytest.mark.governance
+def test_digest_cache_skips_rehashing_unchanged_files(tmp_path: Path):
+    _write(tmp_path / "one.txt", "one")
+    _write(tmp_path / "two.txt", "two")
+    cache = tmp_path / "cache" / INDEX_CACHE_FILENAME
+
+    first = RepoFileIndex.build(tmp_path, cache_path=cache)
+    digests = {entry.rel: first.sha256(entry.rel) for entry in first.files}
+    assert first.hashed == 2
+    first.save()
+    assert set(json.loads(cache.read_text(encoding="utf-8"))["digests"]) == {"one.txt", "two.txt"}
+
+    _write(tmp_path / "two.txt", "changed")
+    second = RepoFileIndex.build(tmp_path, cache_path=cache)
+    assert second.sha256("one.txt") == digests["one.txt"]
+    assert second.sha256("two.txt") != digests["two.txt"]
+    assert second.hashed == 1
+
+
+@pytest.mark.governance
+def test_hygiene_checks_run_against_the_shared_index(tmp_path: Path):
+    _write(tmp_path / "README-OPENCODE.md", "readme")
+    _write(tmp_path / "README-RULES.md", "rules")
+    _write(tmp_path / "governance_runtime" / "x.py", "same\n")
+    _write(tmp_path / "governance_content" / "y.py", "same\n")
+    _write(tmp_path / "governance_runtime" / "pkg" / "__init__.py", "")
+    _write(tmp_path / "opencode" / "empty" / ".gitkeep", "")
+
+    issues = collect_hygiene_issues(tmp_path, index=RepoFileIndex.build(tmp_path, cache_path=False))
+
+    assert "dedup unknown byte-identical group: governance_content/y.py, governance_runtime/x.py" in issues
+    assert "init policy violation: unexpected marker __init__.py governance_runtime/pkg/__init__.py" in issues
+    assert "pseudo-empty dir violation: unexpected marker-only directory opencode/empty" in issues
+    assert not any("README" in item for item in issues)
+
+
+@pytest.mark.governance
+def test_runner_shares_one_index_across_guards_in_parallel(tmp_path: Path):
+    _write(tmp_path / "cli" / "start.py", "from governance.entrypoints import main\n")
+    index = RepoFileIndex.build(tmp_path, cache_path=False)
+
+    results = run_guards(["hygiene", "legacy-surface"], repo_root=tmp_path, index=index, jobs=2)
+
+    assert [result.name for result in results] == ["hygiene", "legacy-surface"]
+    assert any("forbidden governance import" in item for item in results[1].issues)
+    assert not results[1].passed
+
+
+@pytest.mark.governance
+def test_standalone_guards_do_not_touch_the_index_cache(tmp_path: Path):
+    from scripts import legacy_surface_guard, repo_hygiene_guard
+
+    (tmp_path / ".git").mkdir()
+    _write(tmp_path / "governance_runtime" / "a.py", "print('a')\n")
+
+    assert RepoFileIndex.build(tmp_path).cache_path is None
+    repo_hygiene_guard.main(["--repo-root", str(tmp_path)])
+    assert legacy_surface_guard.main(["--repo-root", str(tmp_path)]) == 0
+    assert not (tmp_path / ".git" / INDEX_CACHE_FILENAME).exists()
+    assert RepoFileIndex.build(tmp_path, cache_path=True).cache_path == tmp_path / ".git" / INDEX_CACHE_FILENAME
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from governance_runtime.domain.retention import (
+    DeletionDecision,
+    LegalHold,
+    LegalHoldStatus,
+    _hold_applies,
+    index_legal_holds,
+)
+from governance_runtime.infrastructure import governance_retention_guard
+from governance_runtime.infrastructure.retention_sweep import (
+    DELETION_PLAN_SCHEMA,
+    execute_deletion_plan,
+    iter_archived_runs,
+    plan_retention_sweep,
+)
+
+_NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _hold(hold_id: str, scope_type: str, scope_value: str, status: LegalHoldStatus = LegalHoldStatus.ACTIVE) -> LegalHold:
+    return LegalHold(
+        hold_id=hold_id,
+        scope_type=scope_type,
+        scope_value=scope_value,
+        reason="litigation",
+        status=status,
+        created_at="2026-01-01T00:00:00Z",
+        created_by="legal",
+    )
+
+
+def _archive_run(root: Path, fingerprint: str, run_id: str, *, days_ago: int, legacy: bool = False) -> Path:
+    archived_at = (_NOW - timedelta(days=days_ago)).isoformat().replace("+00:00", "Z")
+    runs = root / fingerprint / "runs"
+    path = runs / run_id if legacy else runs / "repo" / archived_at[:4] / archived_at[:7] / archived_at[:10] / run_id
+    path.mkdir(parents=True)
+    metadata = {"run_id": run_id, "repo_fingerprint": fingerprint, "archived_at": archived_at}
+    (path / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+    (path / "SESSION_STATE.json").write_text("x" * 100, encoding="utf-8")
+    return path
+
+
+def test_hold_index_matches_linear_scan() -> None:
+    holds = [
+        _hold("released", "all", "*", LegalHoldStatus.RELEASED),
+        _hold("run-hold", "run", "r2"),
+        _hold("repo-hold", "repo", "fpA"),
+        _hold("global", "all", "*"),
+        _hold("repo-hold-2", "repo", "fpB"),
+    ]
+    index = index_legal_holds(holds)
+    for run_id in ("r1", "r2", "r3"):
+        for fingerprint in ("fpA", "fpB", "fpC"):
+            expected = next(
+                (
+                    h for h in holds
+                    if h.status == LegalHoldStatus.ACTIVE
+                    and _hold_applies(h, run_id=run_id, repo_fingerprint=fingerprint)
+                ),
+                None,
+            )
+            assert index.blocking_hold(run_id=run_id, repo_fingerprint=fingerprint) == expected
+    assert index_legal_holds([]).blocking_hold(run_id="r1", repo_fingerprint="fpA") is None
+
+
+def test_hold_files_are_reparsed_only_when_changed(tmp_path: Path, monkeypatch) -> None:
+    holds_dir = tmp_path / "holds"
+    holds_dir.mkdir()
+    record = {"hold_id": "H1", "scope_type": "run", "scope_value": "r1", "reason": "x", "status": "active"}
+    (holds_dir / "H1.json").write_text(json.dumps(record), encoding="utf-8")
+    parses: list[Path] = []
+    original = governance_retention_guard._parse_legal_hold_file
+
+    def counting(path: Path):
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(governance_retention_guard, "_parse_legal_hold_file", counting)
+    for _ in range(3):
+        assert [h.hold_id for h in governance_retention_guard.load_legal_holds_from_dir(holds_dir)] == ["H1"]
+    assert len(parses) == 1
+
+    record["status"] = "released"
+    (holds_dir / "H1.json").write_text(json.dumps(record) + " ", encoding="utf-8")
+    (hold,) = governance_retention_guard.load_legal_holds_from_dir(holds_dir)
+    assert hold.status == LegalHoldStatus.RELEASED
+    assert len(parses) == 2
+
+
+def test_sweep_plans_streams_and_executes_approved_deletions(tmp_path: Path) -> None:
+    root = tmp_path / "governance-records"
+    expired = _archive_run(root, "fpA", "run-expired", days_ago=4000)
+    legacy = _archive_run(root, "fpA", "run-legacy", days_ago=4000, legacy=True)
+    recent = _archive_run(root, "fpA", "run-recent", days_ago=10)
+    held = _archive_run(root, "fpB", "run-held", days_ago=4000)
+    holds_dir = tmp_path / "holds"
+    holds_dir.mkdir()
+    (holds_dir / "H1.json").write_text(
+        json.dumps({"hold_id": "H1", "scope_type": "repo", "scope_value": "fpB", "reason": "audit", "status": "active"}),
+        encoding="utf-8",
+    )
+
+    assert {run.run_id for run in iter_archived_runs(root)} == {"run-expired", "run-legacy", "run-recent", "run-held"}
+
+    plan = tmp_path / "plan.jsonl"
+    summary = plan_retention_sweep(root, plan, holds_dir=holds_dir, now=_NOW)
+
+    lines = [json.loads(line) for line in plan.read_text(encoding="utf-8").splitlines()]
+    decisions = {line["run_id"]: line["decision"] for line in lines}
+    assert all(line["schema"] == DELETION_PLAN_SCHEMA for line in lines)
+    assert decisions == {
+        "run-expired": DeletionDecision.ALLOWED.value,
+        "run-legacy": DeletionDecision.ALLOWED.value,
+        "run-recent": DeletionDecision.BLOCKED_RETENTION.value,
+        "run-held": DeletionDecision.BLOCKED_LEGAL_HOLD.value,
+    }
+    assert summary["dry_run"] is True
+    assert summary["runs"] == 4
+    assert summary["by_decision"][DeletionDecision.ALLOWED.value] == 2
+    assert summary["bytes_reclaimable"] > 0
+    assert summary["bytes_total"] > summary["bytes_reclaimable"]
+    assert expired.is_dir() and legacy.is_dir()
+
+    result = execute_deletion_plan(plan, records_root=root, max_workers=2)
+
+    assert sorted(result["deleted"]) == ["run-expired", "run-legacy"]
+    assert result["bytes_deleted"] == summary["bytes_reclaimable"]
+    assert not expired.exists() and not legacy.exists()
+    assert recent.is_dir() and held.is_dir()
+
+
+def test_execute_refuses_paths_outside_records_root(tmp_path: Path) -> None:
+    root = tmp_path / "governance-records"
+    root.mkdir()
+    outside = _archive_run(tmp_path / "elsewhere", "fpA", "run-x", days_ago=4000)
+    plan = tmp_path / "plan.jsonl"
+    plan.write_text(
+        json.dumps({"schema": DELETION_PLAN_SCHEMA, "run_id": "run-x", "path": str(outside), "decision": "allowed"}) + "\n",
+        encoding="utf-8",
+    )
+
+    result = execute_deletion_plan(plan, records_root=root)
+
+    assert result["deleted"] == []
+    assert result["skipped"] == {str(outside): "outside records root"}
+    assert outside.is_dir()
+
+
+def test_execute_rechecks_holds_placed_after_planning(tmp_path: Path) -> None:
+    root = tmp_path / "governance-records"
+    first = _archive_run(root, "fpA", "run-1", days_ago=4000)
+    held = _archive_run(root, "fpB", "run-1", days_ago=4000)
+    holds_dir = tmp_path / "holds"
+    holds_dir.mkdir()
+    plan = tmp_path / "plan.jsonl"
+    summary = plan_retention_sweep(root, plan, holds_dir=holds_dir, now=_NOW)
+    assert summary["by_decision"][DeletionDecision.ALLOWED.value] == 2
+
+    (holds_dir / "H2.json").write_text(
+        json.dumps({"hold_id": "H2", "scope_type": "repo", "scope_value": "fpB", "reason": "audit", "status": "active"}),
+        encoding="utf-8",
+    )
+    result = execute_deletion_plan(plan, records_root=root, holds_dir=holds_dir, now=_NOW)
+
+    assert result["deleted"] == ["run-1"]
+    assert list(result["skipped"]) == [str(held)]
+    assert DeletionDecision.BLOCKED_LEGAL_HOLD.value in result["skipped"][str(held)]
+    assert not first.exists()
+    assert held.is_dir()
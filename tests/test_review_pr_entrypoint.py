@@ -60,23 +60,24 @@ def test_review_pr_bad_remote_fetch_fails(monkeypatch, tmp_path: Path) -> None:
 
 def test_review_pr_corner_remote_unavailable_uses_isolated_local(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(review_pr, "require_complete_contracts", lambda repo_root, required_ids: _EnforcementOk())
+    calls: list[str] = []
+
     def fake_run(args: list[str], *, cwd: Path):
         joined = " ".join(args)
+        calls.append(joined)
         if joined.startswith("ls-remote"):
             return _cp(2, stderr="offline")
-        if joined.startswith("worktree add"):
-            return _cp(0)
         if joined.startswith("fetch"):
             return _cp(0)
-        if joined.startswith("rev-parse refs/remotes/origin/main"):
+        if joined.startswith("rev-parse refs/governance/review/") and joined.endswith("/base"):
             return _cp(0, "a" * 40)
-        if joined.startswith("rev-parse refs/remotes/origin/_review_head_fallback"):
+        if joined.startswith("rev-parse refs/governance/review/") and joined.endswith("/head"):
             return _cp(0, "b" * 40)
         if joined.startswith("merge-base"):
             return _cp(0, "c" * 40)
         if joined.startswith("diff --name-only"):
             return _cp(0, "x.py\n")
-        if joined.startswith("worktree remove"):
+        if joined.startswith("update-ref -d"):
             return _cp(0)
         return _cp(1, stderr="unexpected")
 
@@ -84,6 +85,11 @@ def test_review_pr_corner_remote_unavailable_uses_isolated_local(monkeypatch, tm
     result = review_pr.analyze_pr(repo_root=tmp_path, remote="origin", base_branch="main", head_ref="refs/heads/feat/x")
     assert result.status == "ok"
     assert result.mode == "isolated-local"
+    assert result.files_changed == 1
+    assert not any(call.startswith("worktree") for call in calls)
+    deleted = [call.split()[-1] for call in calls if call.startswith("update-ref -d")]
+    assert len(deleted) == 2
+    assert all(ref.startswith(review_pr.REVIEW_REF_NAMESPACE + "/") for ref in deleted)
 
 
 def test_review_pr_edge_merge_base_unresolved_blocks(monkeypatch, tmp_path: Path) -> None:
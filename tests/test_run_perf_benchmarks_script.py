@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "run_perf_benchmarks.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("run_perf_benchmarks", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args],
+        check=False,
+        text=True,
+        capture_output=True,
+        cwd=str(SCRIPT.parents[1]),
+    )
+
+
+def _result(**medians: float) -> dict:
+    return {
+        "schema": "opencode.perf-benchmark.v1",
+        "scale": "small",
+        "benchmarks": {name: {"status": "ok", "median_ms": value} for name, value in medians.items()},
+    }
+
+
+def test_smoke_suite_runs_every_benchmark_on_generated_fixtures(tmp_path: Path) -> None:
+    bench = _load_script()
+    result = bench.run_suite(scale="smoke", work_dir=tmp_path / "fixture", repeat=1)
+
+    assert result["schema"] == bench.RESULT_SCHEMA
+    assert set(result["benchmarks"]) == set(bench.BENCHMARKS)
+    for name, row in result["benchmarks"].items():
+        assert row["status"] in {"ok", "skipped"}, (name, row)
+    assert result["benchmarks"]["kernel_execute"]["status"] == "ok"
+
+    fixture = json.loads((tmp_path / "fixture" / bench.FIXTURE_MARKER).read_text(encoding="utf-8"))
+    assert len(fixture["run_roots"]) == bench.SCALES["smoke"]["runs"]
+    assert len(list((tmp_path / "fixture" / "repo").rglob("*.py"))) == bench.SCALES["smoke"]["repo_files"]
+    plan = json.loads((Path(fixture["session_path"]).parent / "plan-record.json").read_text(encoding="utf-8"))
+    assert len(plan["versions"]) == bench.SCALES["smoke"]["plan_versions"]
+
+
+def test_compare_flags_only_significant_slowdowns() -> None:
+    bench = _load_script()
+    baseline = _result(kernel_execute=100.0, verify_run_archive=10.0, build_audit_readout=50.0)
+    current = _result(kernel_execute=140.0, verify_run_archive=14.0, build_audit_readout=51.0)
+
+    comparison = bench.compare_results(baseline, current, threshold=0.25, min_delta_ms=5.0)
+
+    assert comparison["regressions"] == ["kernel_execute"]
+    assert comparison["benchmarks"]["verify_run_archive"]["status"] == "ok"
+    assert comparison["benchmarks"]["kernel_execute"]["ratio"] == 1.4
+
+
+@pytest.mark.governance
+def test_cli_compare_exit_codes(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_result(kernel_execute=100.0)), encoding="utf-8")
+    current.write_text(json.dumps(_result(kernel_execute=300.0)), encoding="utf-8")
+
+    regressed = _run(["--compare", str(baseline), str(current)])
+    assert regressed.returncode == 3
+    assert json.loads(regressed.stdout)["regressions"] == ["kernel_execute"]
+
+    assert _run(["--compare", str(baseline), str(baseline)]).returncode == 0
+    current.write_text("{}", encoding="utf-8")
+    assert _run(["--compare", str(baseline), str(current)]).returncode == 4
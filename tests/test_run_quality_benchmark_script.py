@@ -163,3 +163,80 @@ def test_runner_blocks_review_mode_without_evidence_dir():
     assert result.returncode == 4
     assert payload["status"] == "BLOCKED"
     assert "requires --evidence-dir" in payload["message"]
+
+
+def _evidence(root: Path, name: str, *, tests_exit: str = "0", drift: str = "", scores: dict | None = None) -> Path:
+    evidence = root / name
+    evidence.mkdir(parents=True)
+    (evidence / "pytest.exitcode").write_text(f"{tests_exit}\n", encoding="utf-8")
+    (evidence / "governance_lint.exitcode").write_text("0\n", encoding="utf-8")
+    (evidence / "drift.txt").write_text(drift, encoding="utf-8")
+    if scores is not None:
+        (evidence / "criterion_scores.json").write_text(json.dumps(scores), encoding="utf-8")
+    return evidence
+
+
+_PYR_SCORES = {f"PYR-{index}": 0.9 for index in range(1, 6)}
+
+
+@pytest.mark.governance
+def test_matrix_scores_profiles_against_evidence_dirs_and_reuses_claims(tmp_path: Path):
+    from scripts.run_quality_benchmark import EvidenceClaimCache, discover_benchmark_packs, run_benchmark_matrix
+
+    green = _evidence(tmp_path, "green", scores=_PYR_SCORES)
+    same = _evidence(tmp_path, "same", scores=_PYR_SCORES)
+    drifted = _evidence(tmp_path, "drifted", drift="M src/app.py\n", scores=_PYR_SCORES)
+    packs = discover_benchmark_packs(PACK.parent, {"backend-python", "docs-governance"})
+    assert sorted(pack["profile"] for _, pack in packs) == ["backend-python", "docs-governance"]
+
+    cache = EvidenceClaimCache()
+    code, matrix = run_benchmark_matrix(
+        packs=packs,
+        evidence_dirs=[green, same, drifted],
+        stale_claim_ids=set(),
+        criterion_scores={},
+        jobs=3,
+        cache=cache,
+    )
+
+    assert matrix["schema"] == "governance-quality-benchmark-matrix.v1"
+    assert cache.derivations == 2
+    assert matrix["evidence"][0]["content_hash"] == matrix["evidence"][1]["content_hash"]
+    cells = {(cell["pack_profile"], Path(cell["evidence_dir"]).name): cell["status"] for cell in matrix["cells"]}
+    assert len(cells) == 6
+    assert cells[("backend-python", "green")] == "PASS"
+    assert cells[("backend-python", "drifted")] == "NOT_VERIFIED"
+    assert code == max({"PASS": 0, "NOT_VERIFIED": 2, "FAIL": 3}[status] for status in cells.values())
+    assert sum(matrix["summary"].values()) == 6
+
+    with pytest.raises(ValueError, match="unknown benchmark profile"):
+        discover_benchmark_packs(PACK.parent, {"no-such-profile"})
+
+
+@pytest.mark.governance
+def test_matrix_cli_reports_regressions_against_previous_run(tmp_path: Path):
+    evidence = _evidence(tmp_path, "run", scores=_PYR_SCORES)
+    previous = tmp_path / "previous.json"
+    args = ["--matrix", "--profile", "backend-python", "--evidence-dir", str(evidence), "--jobs", "2"]
+
+    first = _run([*args, "--output", str(previous)])
+    assert first.returncode == 0, first.stdout
+    assert json.loads(previous.read_text(encoding="utf-8"))["summary"] == {"PASS": 1}
+
+    (evidence / "pytest.exitcode").write_text("1\n", encoding="utf-8")
+    second = _run([*args, "--previous", str(previous)])
+    payload = json.loads(second.stdout)
+    assert second.returncode == 3
+    assert payload["regressions"] == 1
+    assert payload["deltas"][0]["previous_status"] == "PASS"
+    assert payload["deltas"][0]["status"] == "NOT_VERIFIED"
+
+
+@pytest.mark.governance
+def test_single_mode_rejects_multiple_evidence_dirs(tmp_path: Path):
+    first = _evidence(tmp_path, "a")
+    second = _evidence(tmp_path, "b")
+    result = _run(["--pack", str(PACK), "--evidence-dir", str(first), "--evidence-dir", str(second)])
+    payload = json.loads(result.stdout)
+    assert result.returncode == 4
+    assert "require --matrix" in payload["message"]
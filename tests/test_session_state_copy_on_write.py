@@ -0,0 +1,70 @@
+"""Copy-on-write canonical normalization of SESSION_STATE documents."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from governance_runtime.domain.canonical_json import (
+    canonical_json_clone,
+    canonical_json_hash,
+    canonical_json_normalized,
+)
+from governance_runtime.engine.session_state_repository import (
+    CURRENT_SESSION_STATE_VERSION,
+    migrate_session_state_document,
+    session_state_hash,
+)
+
+
+def _document() -> dict:
+    return {
+        "SESSION_STATE": {
+            "session_state_version": CURRENT_SESSION_STATE_VERSION,
+            "ruleset_hash": "hash-a",
+            "phase": "4",
+            "Gates": {"P5-Architecture": "approved"},
+            "history": [{"event": "a"}, {"event": "b"}],
+        }
+    }
+
+
+@pytest.mark.governance
+def test_canonical_normalized_shares_unchanged_subtrees():
+    doc = _document()
+    doc["SESSION_STATE"]["note"] = "line1\r\nline2"
+
+    normalized = canonical_json_normalized(doc)
+
+    assert normalized == canonical_json_clone(doc)
+    assert normalized["SESSION_STATE"]["note"] == "line1\nline2"
+    assert normalized["SESSION_STATE"]["Gates"] is doc["SESSION_STATE"]["Gates"]
+    assert doc["SESSION_STATE"]["note"] == "line1\r\nline2"
+    assert canonical_json_normalized(_document()) == _document()
+
+
+@pytest.mark.governance
+def test_hashing_shares_structure_without_changing_the_digest():
+    doc = _document()
+    doc["SESSION_STATE"]["note"] = "line1\r\nline2"
+
+    assert canonical_json_hash(doc) == canonical_json_hash(canonical_json_clone(doc))
+    assert session_state_hash(doc) == session_state_hash(copy.deepcopy(doc))
+    assert doc["SESSION_STATE"]["note"] == "line1\r\nline2"
+
+
+@pytest.mark.governance
+def test_migration_does_not_mutate_caller_document():
+    doc = _document()
+    snapshot = copy.deepcopy(doc)
+
+    result = migrate_session_state_document(
+        doc,
+        target_version=CURRENT_SESSION_STATE_VERSION,
+        target_ruleset_hash="hash-b",
+    )
+
+    assert result.success is True
+    assert result.document["SESSION_STATE"]["ruleset_hash"] == "hash-b"
+    assert doc == snapshot
@@ -442,3 +442,66 @@ def test_phase3_legacy_removed_blocks_even_when_compat_mode_is_enabled(tmp_path:
     assert "legacy-removed mode" in exc_info.value.detail
     assert "deterministic SESSION_STATE migration" in exc_info.value.primary_action
     assert exc_info.value.next_command == "${PYTHON_COMMAND} scripts/migrate_session_state.py --workspace <id>"
+
+
+@pytest.mark.governance
+def test_session_state_repository_checks_invariants_incrementally(tmp_path: Path):
+    """Validated loads leave a checkpoint that save() persists next to SESSION_STATE."""
+
+    path = tmp_path / "workspaces" / "abc" / "SESSION_STATE.json"
+    repo = SessionStateRepository(path)
+    doc = _session_state_doc()
+    doc["SESSION_STATE"]["Mode"] = "BLOCKED"
+    repo.save(doc)
+    assert not repo.invariant_checkpoint_path.exists()
+
+    first = repo.load_with_result()
+    assert "blocked_next_missing_prefix" in first.invariant_errors
+    repo.save(first.document)
+    assert repo.invariant_checkpoint_path.is_file()
+
+    fresh = SessionStateRepository(path)
+    assert fresh.load_with_result().invariant_errors == first.invariant_errors
+    assert fresh.load_with_result(full_validation=True).invariant_errors == first.invariant_errors
+
+    doc["SESSION_STATE"]["next"] = "BLOCKED-STATE-OUTDATED"
+    fresh.save(doc)
+    assert "blocked_next_missing_prefix" not in SessionStateRepository(path).load_with_result().invariant_errors
+
+
+@pytest.mark.governance
+def test_invariant_checkpoint_is_keyed_to_the_saved_revision(tmp_path: Path):
+    """Stale or edited sidecars are ignored; save() persists the checkpoint of what it wrote."""
+
+    import json
+
+    from governance_runtime.engine.session_state_invariants import InvariantCheckpoint, subtree_digests
+
+    path = tmp_path / "workspaces" / "abc" / "SESSION_STATE.json"
+    repo = SessionStateRepository(path)
+    repo.save(_session_state_doc())
+    loaded = repo.load_with_result()
+    assert loaded.invariant_errors == ()
+    loaded.document["SESSION_STATE"]["Mode"] = "BLOCKED"
+    repo.save(loaded.document)
+
+    sidecar = json.loads(repo.invariant_checkpoint_path.read_text(encoding="utf-8"))
+    stored = InvariantCheckpoint.from_document(sidecar)
+    saved_state = json.loads(path.read_text(encoding="utf-8"))["SESSION_STATE"]
+    assert stored is not None and dict(stored.digests) == subtree_digests(saved_state)
+    assert "blocked_next_missing_prefix" in SessionStateRepository(path).load_with_result().invariant_errors
+
+    # An edited sidecar that hides the violation is rejected by its seal.
+    sidecar["results"] = {name: [] for name in sidecar["results"]}
+    repo.invariant_checkpoint_path.write_text(json.dumps(sidecar), encoding="utf-8")
+    assert "blocked_next_missing_prefix" in SessionStateRepository(path).load_with_result().invariant_errors
+
+    # A sidecar left behind by another revision is not reused.
+    clean_repo = SessionStateRepository(path)
+    clean_repo.save(_session_state_doc())
+    clean_repo.load_with_result()
+    clean_repo.save(_session_state_doc())
+    blocked = _session_state_doc()
+    blocked["SESSION_STATE"]["Mode"] = "BLOCKED"
+    path.write_text(json.dumps(blocked, indent=2) + "\n", encoding="utf-8")
+    assert "blocked_next_missing_prefix" in SessionStateRepository(path).load_with_result().invariant_errors
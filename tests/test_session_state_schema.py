@@ -26,7 +26,9 @@ from governance_runtime.engine.session_state_invariants import (
     validate_gate_artifacts_integrity,
     validate_ticket_intake_ready_invariant,
     validate_session_state_invariants,
+    validate_session_state_invariants_incremental,
     validate_next_field_sync,
+    InvariantCheckpoint,
 )
 
 
@@ -692,3 +694,97 @@ class TestGateArtifactsIntegrityInvariant:
         state: dict[str, object] = {"Gates": {"P5-Architecture": "approved"}}
         errors = validate_gate_artifacts_integrity(state)
         assert errors == ()
+
+
+class TestIncrementalInvariantValidation:
+    @staticmethod
+    def _base() -> dict:
+        return {
+            "SESSION_STATE": {
+                "phase": "6-PostFlight",
+                "Mode": "BLOCKED",
+                "next": "BLOCKED-X",
+                "Next": "BLOCKED-X",
+                "ConfidenceLevel": 80,
+                "OutputMode": "ARCHITECT",
+                "DecisionSurface": {},
+                "Gates": {"P5-Architecture": "approved", "P5.3-TestQuality": "pass"},
+                "ArchitectureDecisions": [{"Status": "approved"}],
+                "GateArtifacts": {"P5-Architecture": {"Provided": {"DecisionPack": "present"}}},
+                "LoadedRulebooks": {"core": "${COMMANDS_HOME}/rules.md", "addons": {"python": "x"}},
+                "RulebookLoadEvidence": {"core": "ok"},
+                "AddonsEvidence": {"python": {}},
+                "Diagnostics": {"ReasonPayloads": [{"code": "BLOCKED-X"}]},
+                "Workspace": {"TargetPath": "${REPO_HOME}/out", "Nested": {"SourcePath": "${REPO_HOME}/src"}},
+            }
+        }
+
+    _MUTATIONS = (
+        ("Mode", "NORMAL"),
+        ("next", "Continue"),
+        ("Next", None),
+        ("ConfidenceLevel", 10),
+        ("ProfileSource", "ambiguous"),
+        ("DecisionSurface", None),
+        ("Gates", {"P5-Architecture": "pending"}),
+        ("ArchitectureDecisions", []),
+        ("GateArtifacts", {"P5-Architecture": {"Provided": {"DecisionPack": "missing"}}}),
+        ("RulebookLoadEvidence", {}),
+        ("AddonsEvidence", {}),
+        ("Diagnostics", {}),
+        ("Workspace", {"TargetPath": "C:\\out", "Nested": {"SourcePath": "../src"}}),
+        ("ExportPath", "single"),
+        ("phase", "4"),
+        ("ticket_intake_ready", True),
+        ("PhaseRouterFacts", {"next_action_class": "code_producing"}),
+    )
+
+    def test_incremental_matches_full_validation_for_every_mutation(self):
+        base = self._base()
+        _, checkpoint = validate_session_state_invariants_incremental(base)
+        assert checkpoint is not None
+        for key, value in self._MUTATIONS:
+            mutated = json.loads(json.dumps(base))
+            if value is None:
+                mutated["SESSION_STATE"].pop(key, None)
+            else:
+                mutated["SESSION_STATE"][key] = value
+            errors, _ = validate_session_state_invariants_incremental(mutated, checkpoint)
+            assert errors == validate_session_state_invariants(mutated), key
+
+    def test_unchanged_inputs_reuse_stored_results(self, monkeypatch: pytest.MonkeyPatch):
+        from governance_runtime.engine import session_state_invariants as module
+
+        base = self._base()
+        _, checkpoint = validate_session_state_invariants_incremental(base)
+        calls: list[str] = []
+        original = module._canonical_path_errors_for_subtree
+
+        def counting(key, value):
+            calls.append(key)
+            return original(key, value)
+
+        monkeypatch.setattr(module, "_canonical_path_errors_for_subtree", counting)
+        base["SESSION_STATE"]["Workspace"]["TargetPath"] = "C:\\moved"
+        errors, _ = validate_session_state_invariants_incremental(base, checkpoint)
+        assert calls == ["Workspace"]
+        assert errors == validate_session_state_invariants(base)
+
+    def test_checkpoint_document_roundtrip_and_version_guard(self):
+        _, checkpoint = validate_session_state_invariants_incremental(self._base())
+        assert checkpoint is not None
+        document = json.loads(json.dumps(checkpoint.to_document()))
+        assert InvariantCheckpoint.from_document(document) == checkpoint
+        document["version"] = -1
+        assert InvariantCheckpoint.from_document(document) is None
+        assert validate_session_state_invariants_incremental({}) == (("missing_session_state_key",), None)
+
+    def test_checkpoint_document_rejects_edits(self):
+        _, checkpoint = validate_session_state_invariants_incremental(self._base())
+        assert checkpoint is not None
+        document = json.loads(json.dumps(checkpoint.to_document()))
+        assert document["document_digest"] == checkpoint.document_digest
+        edited = {**document, "results": {name: ["forged"] for name in document["results"]}}
+        assert InvariantCheckpoint.from_document(edited) is None
+        moved = {**document, "digests": {**document["digests"], "phase": "0" * 32}}
+        assert InvariantCheckpoint.from_document(moved) is None
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from governance_runtime.infrastructure.workspace_change_tracker import (
+    InotifyChangeWatcher,
+    WorkspaceChangeTracker,
+    normalize_rel_path,
+    open_change_watcher,
+)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_snapshot_hashes_only_files_whose_stat_changed(tmp_path: Path) -> None:
+    _write(tmp_path / "src" / "a.py", "a\nb\n")
+    _write(tmp_path / "src" / "b.py", "x\n")
+    tracker = WorkspaceChangeTracker(tmp_path)
+
+    before = tracker.snapshot(["src/a.py", "src/b.py", "src/missing.py"])
+    assert tracker.files_hashed == 2
+    assert before.entries["src/missing.py"] is None
+
+    _write(tmp_path / "src" / "a.py", "a\nb\nc\nd\n")
+    after = tracker.snapshot(["src/a.py", "src/b.py", "src/missing.py"])
+    assert tracker.files_hashed == 3
+
+    changes = tracker.diff(before, after)
+    assert [change.path for change in changes] == ["src/a.py"]
+    assert changes[0].status == "modified"
+    assert (changes[0].lines_before, changes[0].lines_after, changes[0].line_delta) == (2, 4, 2)
+
+
+def test_touch_without_content_change_is_not_reported(tmp_path: Path) -> None:
+    target = tmp_path / "a.txt"
+    _write(target, "same")
+    tracker = WorkspaceChangeTracker(tmp_path)
+    before = tracker.snapshot(["a.txt"])
+
+    stamp = time.time() + 5
+    os.utime(target, (stamp, stamp))
+    after = tracker.snapshot(["a.txt"])
+
+    assert tracker.files_hashed == 2
+    assert tracker.diff(before, after) == ()
+
+
+def test_diff_reports_added_deleted_and_discovered_paths(tmp_path: Path) -> None:
+    _write(tmp_path / "gone.txt", "1\n2\n")
+    tracker = WorkspaceChangeTracker(tmp_path)
+    before = tracker.snapshot(["gone.txt", "new.txt"])
+
+    (tmp_path / "gone.txt").unlink()
+    _write(tmp_path / "new.txt", "n\n")
+    _write(tmp_path / "other.txt", "o\no\no")
+    after = tracker.snapshot(["gone.txt", "new.txt", "other.txt", "vanished.txt"])
+
+    stats = {change.path: change.to_dict() for change in tracker.diff(before, after)}
+    assert stats["gone.txt"]["status"] == "deleted"
+    assert stats["gone.txt"]["line_delta"] == -2
+    assert stats["new.txt"]["status"] == "added"
+    assert stats["other.txt"] == {
+        "status": "changed",
+        "lines_before": None,
+        "lines_after": 3,
+        "line_delta": None,
+        "size_before": None,
+        "size_after": 5,
+    }
+    assert stats["vanished.txt"]["status"] == "deleted"
+    assert stats["vanished.txt"]["line_delta"] is None
+
+
+def test_persisted_cache_skips_rehash_on_next_run(tmp_path: Path) -> None:
+    _write(tmp_path / "a.py", "a\n")
+    cache = tmp_path / ".governance" / "cache.json"
+    first = WorkspaceChangeTracker(tmp_path, cache_path=cache)
+    first.snapshot(["a.py"])
+    first.save()
+
+    second = WorkspaceChangeTracker(tmp_path, cache_path=cache)
+    second.snapshot(["a.py"])
+    assert second.files_hashed == 0
+
+
+def test_normalize_rel_path_rejects_escaping_paths() -> None:
+    assert normalize_rel_path(".\\src\\a.py") == "src/a.py"
+    assert normalize_rel_path("../etc/passwd") == ""
+    assert normalize_rel_path("a/../../b") == ""
+    assert normalize_rel_path("/abs") == ""
+
+
+def test_watcher_is_opt_in(tmp_path: Path) -> None:
+    assert open_change_watcher(tmp_path, {}) is None
+
+
+def test_inotify_watcher_collects_written_paths(tmp_path: Path) -> None:
+    watcher = InotifyChangeWatcher.open(tmp_path)
+    if watcher is None:
+        pytest.skip("inotify not available on this platform")
+    _write(tmp_path / "src" / "nested" / "new.py", "x\n")
+    _write(tmp_path / "top.txt", "y\n")
+    _write(tmp_path / ".git" / "index", "ignored")
+
+    changed = watcher.close()
+
+    assert watcher.complete is True
+    assert {"src/nested/new.py", "top.txt"} <= changed
+    assert not any(path.startswith(".git") for path in changed)